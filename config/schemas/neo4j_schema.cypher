@@ -10,17 +10,21 @@ CREATE CONSTRAINT document_id IF NOT EXISTS FOR (d:Document) REQUIRE d.id IS UNI
 CREATE INDEX document_title IF NOT EXISTS FOR (d:Document) ON (d.title);
 CREATE INDEX document_author IF NOT EXISTS FOR (d:Document) ON (d.author);
 CREATE INDEX document_created_at IF NOT EXISTS FOR (d:Document) ON (d.created_at);
+CREATE INDEX document_created_at_id IF NOT EXISTS FOR (d:Document) ON (d.created_at, d.id);
 CREATE TEXT INDEX document_content_text IF NOT EXISTS FOR (d:Document) ON (d.content);
+CREATE TEXT INDEX document_title_text IF NOT EXISTS FOR (d:Document) ON (d.title);
 
 // Entity constraints and indexes  
 CREATE CONSTRAINT entity_id IF NOT EXISTS FOR (e:Entity) REQUIRE e.id IS UNIQUE;
 CREATE INDEX entity_name IF NOT EXISTS FOR (e:Entity) ON (e.name);
 CREATE INDEX entity_type IF NOT EXISTS FOR (e:Entity) ON (e.type);
+CREATE INDEX entity_created_at_id IF NOT EXISTS FOR (e:Entity) ON (e.created_at, e.id);
 CREATE TEXT INDEX entity_description_text IF NOT EXISTS FOR (e:Entity) ON (e.description);
 
 // Chunk constraints and indexes
 CREATE CONSTRAINT chunk_id IF NOT EXISTS FOR (c:Chunk) REQUIRE c.id IS UNIQUE;
 CREATE INDEX chunk_document_id IF NOT EXISTS FOR (c:Chunk) ON (c.document_id);
+CREATE INDEX chunk_created_at_id IF NOT EXISTS FOR (c:Chunk) ON (c.created_at, c.id);
 CREATE INDEX chunk_position IF NOT EXISTS FOR (c:Chunk) ON (c.position);
 CREATE TEXT INDEX chunk_text_content IF NOT EXISTS FOR (c:Chunk) ON (c.text);
 
@@ -78,6 +78,8 @@ from arete.database.client import Neo4jClient
 from arete.database.weaviate_client import WeaviateClient
 from arete.repositories.document import DocumentRepository
 from arete.repositories.entity import EntityRepository
+from arete.processing.entity_mentions import EntityMentionIndex
+from arete.services.historical_development_service import HistoricalDevelopmentService
 
 # Import LLM Graph Transformer for enhanced entity/relationship extraction
 from arete.services.llm_graph_transformer_service import LLMGraphTransformerService
@@ -1313,11 +1315,36 @@ async def store_in_databases(result_data: Dict[str, Any], logger: Optional[loggi
         else:
             print(f"   SKIPPED: No entities to create relationships between")
         
+        # Index entity mentions so graph-to-chunk expansion is a lookup at query time
+        print(f"5. Indexing entity mentions across {len(chunks)} chunks...")
+        mentions_stored = 0
+        if entities and chunks:
+            try:
+                mention_index = EntityMentionIndex.build(entities, chunks)
+                mentions_stored = await entity_repository.save_chunk_mentions(mention_index)
+                print(f"   SUCCESS: {mentions_stored} MENTIONS edges stored")
+            except Exception as e:
+                print(f"   Warning: Entity mention indexing failed: {e}")
+        else:
+            print(f"   SKIPPED: No entities or chunks to index")
+        
+        # Historical data only changes at ingest, so precompute timeline views now
+        print(f"6. Materializing historical timelines...")
+        try:
+            historical_service = HistoricalDevelopmentService(neo4j_client=neo4j_client)
+            materialization = await historical_service.materialize_timelines()
+            print(f"   SUCCESS: {len(materialization.events)} events, "
+                  f"{len(materialization.concept_developments)} concept chains "
+                  f"(graph version {materialization.graph_version})")
+        except Exception as e:
+            print(f"   Warning: Timeline materialization failed: {e}")
+        
         print(f"\nSUCCESS: SUCCESS: AI-Restructured text stored in production databases!")
         print(f"   Document: {document.title} ({document.word_count:,} words)")
         print(f"   Semantic chunks: {chunks_stored} with embeddings")
         print(f"   Enhanced entities: {entities_stored}")
         print(f"   AI relationships: {relationships_stored}")
+        print(f"   Entity mentions: {mentions_stored}")
         print(f"   Ready for superior RAG queries!")
         
         return True
@@ -134,6 +134,34 @@ class Settings(BaseSettings):
         description="Maximum number of worker threads"
     )
     
+    # Cache Configuration
+    shared_cache_path: str = Field(
+        default="",
+        description="Local SQLite file for caches shared across worker processes (disabled if empty)"
+    )
+    graph_cache_max_size: int = Field(
+        default=256,
+        ge=1,
+        le=10000,
+        description="Maximum number of cached graph traversal results"
+    )
+    graph_cache_ttl_seconds: int = Field(
+        default=300,
+        ge=1,
+        le=86400,
+        description="Time-to-live for cached graph traversal results in seconds"
+    )
+    graph_version_refresh_seconds: float = Field(
+        default=2.0,
+        ge=0.0,
+        le=300.0,
+        description="Seconds the knowledge graph version read from Neo4j is reused before re-reading it"
+    )
+    duplicate_signature_store_path: str = Field(
+        default="",
+        description="Local SQLite file persisting duplicate-detection signatures (disabled if empty)"
+    )
+    
     # LLM Provider Configuration
     ollama_api_key: str = Field(
         default="",
@@ -209,6 +237,166 @@ class Settings(BaseSettings):
         le=10,
         description="Number of retry attempts for failed LLM requests"
     )
+    llm_circuit_failure_rate: float = Field(
+        default=0.5,
+        ge=0.0,
+        le=1.0,
+        description="Rolling error rate at which a provider's circuit breaker opens"
+    )
+    llm_circuit_minimum_calls: int = Field(
+        default=5,
+        ge=1,
+        le=1000,
+        description="Calls in the window before the error rate can open a circuit"
+    )
+    llm_circuit_consecutive_failures: int = Field(
+        default=3,
+        ge=1,
+        le=100,
+        description="Consecutive failures or timeouts that open a provider's circuit"
+    )
+    llm_circuit_window_seconds: float = Field(
+        default=60.0,
+        ge=1.0,
+        le=3600.0,
+        description="Length of the rolling window of provider call outcomes in seconds"
+    )
+    llm_circuit_open_seconds: float = Field(
+        default=30.0,
+        ge=1.0,
+        le=3600.0,
+        description="Seconds an open circuit rejects calls before admitting a probe"
+    )
+    llm_health_probe_interval_seconds: float = Field(
+        default=10.0,
+        ge=1.0,
+        le=3600.0,
+        description="Interval between background probes of half-open providers in seconds"
+    )
+    llm_request_deadline_seconds: float = Field(
+        default=60.0,
+        ge=1.0,
+        le=600.0,
+        description="Overall deadline for one LLM request across failover and hedging"
+    )
+    llm_stream_idle_timeout_seconds: float = Field(
+        default=60.0,
+        ge=1.0,
+        le=600.0,
+        description="Longest wait for the first or next chunk of a streamed LLM response"
+    )
+    llm_hedging_enabled: bool = Field(
+        default=True,
+        description="Send a backup request to the next provider when the primary is slow"
+    )
+    llm_hedge_delay_percentile: float = Field(
+        default=0.95,
+        ge=0.5,
+        le=0.999,
+        description="Latency percentile of the primary provider after which a request is hedged"
+    )
+    llm_hedge_budget_ratio: float = Field(
+        default=0.1,
+        ge=0.0,
+        le=1.0,
+        description="Maximum fraction of LLM requests that may be hedged"
+    )
+    llm_routing_exploration_rate: float = Field(
+        default=0.05,
+        ge=0.0,
+        le=0.5,
+        description="Fraction of routed requests sent to a less-observed provider to refresh its telemetry"
+    )
+    llm_routing_min_samples: int = Field(
+        default=20,
+        ge=1,
+        description="Observed calls after which live telemetry carries half the weight of static provider scores"
+    )
+    llm_response_cache_enabled: bool = Field(
+        default=True,
+        description="Cache complete LLM responses for deterministic (temperature 0) or opted-in requests"
+    )
+    llm_response_cache_size: int = Field(
+        default=1024,
+        ge=1,
+        description="Maximum number of LLM responses cached in memory"
+    )
+    llm_response_cache_ttl_seconds: int = Field(
+        default=3600,
+        ge=0,
+        description="Lifetime of cached LLM responses in seconds (0 for no expiry)"
+    )
+    llm_response_cache_persist: bool = Field(
+        default=True,
+        description="Persist cached LLM responses to the shared cache file when one is configured"
+    )
+    llm_rate_limit_requests_per_minute: int = Field(
+        default=0,
+        ge=0,
+        description="Default requests per minute allowed per LLM provider (0 for unlimited)"
+    )
+    llm_rate_limit_tokens_per_minute: int = Field(
+        default=0,
+        ge=0,
+        description="Default tokens per minute allowed per LLM provider (0 for unlimited)"
+    )
+    llm_provider_rate_limits: dict[str, dict[str, int]] = Field(
+        default_factory=dict,
+        description='Per-provider rate limits, e.g. {"openai": {"requests_per_minute": 500, "tokens_per_minute": 30000}}'
+    )
+    llm_interactive_reserve_ratio: float = Field(
+        default=0.2,
+        ge=0.0,
+        le=0.9,
+        description="Fraction of each provider's rate limit that batch requests leave free for interactive traffic"
+    )
+    llm_rate_limit_max_retries: int = Field(
+        default=3,
+        ge=0,
+        le=10,
+        description="Times a rate-limited request is requeued after the provider's retry-after delay"
+    )
+    llm_batch_max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=256,
+        description="Maximum concurrent LLM requests of one batch generation job"
+    )
+    llm_consensus_quorum: int = Field(
+        default=2,
+        ge=1,
+        le=10,
+        description="Agreeing provider responses after which consensus generation stops early"
+    )
+    llm_consensus_agreement_threshold: float = Field(
+        default=0.6,
+        ge=0.0,
+        le=1.0,
+        description="Claim agreement at which two provider responses count as agreeing"
+    )
+    llm_context_window_tokens: int = Field(
+        default=0,
+        ge=0,
+        description="Context window of the LLM in tokens used for prompt packing (0 for the provider default)"
+    )
+    llm_http_max_connections: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="Maximum open connections of the pooled HTTP client shared by LLM providers"
+    )
+    llm_http_max_keepalive_connections: int = Field(
+        default=20,
+        ge=0,
+        le=1000,
+        description="Idle connections the pooled LLM HTTP client keeps alive for reuse"
+    )
+    llm_http_keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        le=600.0,
+        description="Seconds an idle pooled LLM connection is kept alive"
+    )
     
     # Security Configuration
     api_key_header: str = Field(
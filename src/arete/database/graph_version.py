@@ -0,0 +1,131 @@
+"""Knowledge graph version tracking for Arete Graph-RAG system.
+
+Keeps a monotonically increasing version number for the knowledge graph so
+that derived caches can tell when the graph they were computed from has
+changed. Repositories bump the version on every write; readers include the
+current version in their cache keys.
+
+The version is stored in the graph itself, on a single ``(:GraphVersion)``
+node, so the application sees bumps made by ingest and every other process
+writing to the same database. Trackers without a Neo4j client keep the
+version in memory, which only suits single-process use such as tests.
+"""
+
+import logging
+import threading
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+from ..config import get_settings
+
+if TYPE_CHECKING:
+    from .client import Neo4jClient
+
+logger = logging.getLogger(__name__)
+
+GRAPH_VERSION_NODE_ID = "knowledge_graph"
+
+BUMP_GRAPH_VERSION_QUERY = """
+    MERGE (v:GraphVersion {id: $version_id})
+    SET v.version = coalesce(v.version, 0) + 1
+    RETURN v.version AS version
+"""
+
+READ_GRAPH_VERSION_QUERY = """
+    MATCH (v:GraphVersion {id: $version_id})
+    RETURN v.version AS version
+"""
+
+
+class GraphVersionTracker:
+    """Monotonic version counter for the knowledge graph."""
+
+    def __init__(
+        self,
+        neo4j_client: Optional["Neo4jClient"] = None,
+        refresh_interval: float = 0.0
+    ) -> None:
+        """Initialize graph version tracker.
+
+        Args:
+            neo4j_client: Client of the graph holding the shared version node.
+                If None, the version is kept in memory.
+            refresh_interval: Seconds a version read from Neo4j is reused
+                before the node is read again
+        """
+        self.neo4j_client = neo4j_client
+        self.refresh_interval = refresh_interval
+        self._version = 0
+        self._read_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _run(self, query: str) -> Optional[int]:
+        """Run a version query against Neo4j, connecting on first use."""
+        if not self.neo4j_client.is_connected:
+            self.neo4j_client.connect()
+        with self.neo4j_client.session() as session:
+            record = session.run(query, version_id=GRAPH_VERSION_NODE_ID).single()
+        return record["version"] if record else None
+
+    @property
+    def current(self) -> int:
+        """Get the current graph version."""
+        if self.neo4j_client is None:
+            return self._version
+
+        now = time.monotonic()
+        if self._read_at is not None and now - self._read_at < self.refresh_interval:
+            return self._version
+
+        try:
+            stored = self._run(READ_GRAPH_VERSION_QUERY) or 0
+            with self._lock:
+                self._version = max(self._version, stored)
+        except Exception as e:
+            logger.warning(f"Failed to read graph version, using last known: {e}")
+        self._read_at = now
+
+        return self._version
+
+    def observe(self, version: int) -> None:
+        """Record a version returned by a write made through another session.
+
+        Args:
+            version: Graph version stored by the write
+        """
+        with self._lock:
+            self._version = max(self._version, version)
+
+    def bump(self) -> int:
+        """Increment the graph version after a write.
+
+        Returns:
+            The new graph version
+        """
+        if self.neo4j_client is None:
+            with self._lock:
+                self._version += 1
+                return self._version
+
+        try:
+            stored = self._run(BUMP_GRAPH_VERSION_QUERY)
+        except Exception as e:
+            logger.error(f"Failed to persist graph version bump, other processes will serve stale caches: {e}")
+            stored = None
+
+        with self._lock:
+            self._version = stored if stored is not None else self._version + 1
+            return self._version
+
+
+@lru_cache(maxsize=1)
+def get_graph_version_tracker() -> GraphVersionTracker:
+    """Get the process-wide graph version tracker, backed by the knowledge graph."""
+    from .client import Neo4jClient
+
+    settings = get_settings()
+    return GraphVersionTracker(
+        neo4j_client=Neo4jClient(),
+        refresh_interval=settings.graph_version_refresh_seconds
+    )
@@ -2,6 +2,7 @@
 
 from .extractors import PDFExtractor, PDFMetadata, TEIXMLExtractor, EntityExtractor, RelationshipExtractor, TripleValidator
 from .chunker import ChunkingStrategy
+from .entity_mentions import EntityMentionIndex, MultiPatternMatcher
 
 __all__ = [
     'PDFExtractor',
@@ -10,5 +11,7 @@ __all__ = [
     'EntityExtractor',
     'RelationshipExtractor',
     'TripleValidator',
-    'ChunkingStrategy'
+    'ChunkingStrategy',
+    'EntityMentionIndex',
+    'MultiPatternMatcher'
 ]
\ No newline at end of file
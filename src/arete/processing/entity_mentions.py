@@ -0,0 +1,297 @@
+"""
+Entity mention indexing for Arete Graph-RAG system.
+
+Builds an inverted index from entities to the chunks that mention them. All
+entity names and aliases are matched in a single pass over each chunk using
+an Aho-Corasick automaton, so indexing cost is linear in the corpus size
+regardless of how many entities are known. The index is built once at ingest
+and persisted as Chunk-[:MENTIONS]->Entity edges, turning graph-to-chunk
+expansion at query time into a dictionary lookup.
+"""
+
+import logging
+from collections import defaultdict, deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Reads the stored Chunk-[:MENTIONS]->Entity edges back as mention rows
+LOAD_MENTIONS_QUERY = """
+    MATCH (c:Chunk)-[m:MENTIONS]->(e:Entity)
+    RETURN e.id as entity_id, e.name as entity_name, c.id as chunk_id,
+           m.starts as starts, m.ends as ends
+"""
+
+
+def normalize_mention(text: str) -> str:
+    """Normalize entity text for matching."""
+    return " ".join(text.lower().split())
+
+
+class MultiPatternMatcher:
+    """
+    Case-insensitive multi-pattern matcher based on the Aho-Corasick automaton.
+
+    Matches are restricted to whole words: a match is only reported when it is
+    not directly preceded or followed by an alphanumeric character.
+    """
+
+    def __init__(self, patterns: Dict[str, Iterable[str]]):
+        """
+        Build matcher from patterns.
+
+        Args:
+            patterns: Mapping of pattern text to the keys it identifies
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[int, str]]] = [[]]
+
+        for pattern, keys in patterns.items():
+            normalized = normalize_mention(pattern)
+            if normalized:
+                self._add_pattern(normalized, keys)
+
+        self._build_failure_links()
+
+    @property
+    def state_count(self) -> int:
+        """Number of automaton states."""
+        return len(self._goto)
+
+    def _add_pattern(self, pattern: str, keys: Iterable[str]) -> None:
+        """Insert a pattern into the trie."""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            state = next_state
+
+        for key in keys:
+            self._output[state].append((len(pattern), key))
+
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first."""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state].extend(self._output[self._fail[next_state]])
+
+    def find_all(self, text: str) -> Iterator[Tuple[str, int, int]]:
+        """
+        Find all whole-word pattern occurrences in text.
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            Tuples of (key, start offset, end offset)
+        """
+        state = 0
+        previous_space = False
+
+        for position, raw_char in enumerate(text):
+            char = raw_char.lower()
+            if len(char) != 1:
+                char = raw_char
+            if char.isspace():
+                # Collapse whitespace runs to match normalized patterns
+                if previous_space:
+                    continue
+                char = " "
+                previous_space = True
+            else:
+                previous_space = False
+
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+
+            for length, key in self._output[state]:
+                end = position + 1
+                start = self._match_start(text, end, length)
+                if self._is_word_boundary(text, start, end):
+                    yield key, start, end
+
+    @staticmethod
+    def _match_start(text: str, end: int, length: int) -> int:
+        """Recover the start offset of a match, accounting for collapsed whitespace."""
+        start = end
+        remaining = length
+        while remaining > 0 and start > 0:
+            start -= 1
+            if text[start].isspace():
+                while start > 0 and text[start - 1].isspace():
+                    start -= 1
+            remaining -= 1
+        return start
+
+    @staticmethod
+    def _is_word_boundary(text: str, start: int, end: int) -> bool:
+        """Check that a match is not part of a larger word."""
+        before_ok = start == 0 or not text[start - 1].isalnum()
+        after_ok = end >= len(text) or not text[end].isalnum()
+        return before_ok and after_ok
+
+
+class EntityMentionIndex:
+    """Inverted index from entity IDs to the chunks that mention them."""
+
+    def __init__(self):
+        """Initialize empty index."""
+        # entity_id -> chunk_id -> [(start, end), ...]
+        self._mentions: Dict[str, Dict[str, List[Tuple[int, int]]]] = defaultdict(dict)
+        # normalized name or alias -> entity ids
+        self._entity_ids_by_name: Dict[str, Set[str]] = defaultdict(set)
+        self._matcher: Optional[MultiPatternMatcher] = None
+
+    def __len__(self) -> int:
+        return sum(len(chunks) for chunks in self._mentions.values())
+
+    @classmethod
+    def build(cls, entities: Iterable[Any], chunks: Iterable[Any]) -> "EntityMentionIndex":
+        """
+        Build an index for entities over chunks.
+
+        Args:
+            entities: Entities with ``id``, ``name`` and optional ``aliases``
+            chunks: Chunks with ``id`` and ``text``
+
+        Returns:
+            Populated mention index
+        """
+        index = cls()
+        index.register_entities(entities)
+        index.add_chunks(chunks)
+        return index
+
+    @classmethod
+    def from_mention_rows(cls, rows: Iterable[Dict[str, Any]]) -> "EntityMentionIndex":
+        """
+        Build an index from stored mention rows.
+
+        Args:
+            rows: Rows of LOAD_MENTIONS_QUERY with entity_id, entity_name,
+                chunk_id, starts and ends
+
+        Returns:
+            Populated mention index
+        """
+        index = cls()
+        for row in rows:
+            offsets = list(zip(row.get("starts") or [], row.get("ends") or []))
+            index.add_mention(row["entity_id"], row["entity_name"], row["chunk_id"], offsets)
+        return index
+
+    def register_entities(self, entities: Iterable[Any]) -> None:
+        """
+        Register entity names and aliases to be matched.
+
+        Args:
+            entities: Entities with ``id``, ``name`` and optional ``aliases``
+        """
+        for entity in entities:
+            entity_id = str(entity.id)
+            names = [entity.name] + list(getattr(entity, "aliases", None) or [])
+            for name in names:
+                normalized = normalize_mention(name or "")
+                if normalized:
+                    self._entity_ids_by_name[normalized].add(entity_id)
+        self._matcher = None
+
+    def add_chunks(self, chunks: Iterable[Any]) -> int:
+        """
+        Scan chunks for mentions of registered entities.
+
+        Args:
+            chunks: Chunks with ``id`` and ``text``
+
+        Returns:
+            Number of mentions found
+        """
+        if self._matcher is None:
+            self._matcher = MultiPatternMatcher(self._entity_ids_by_name)
+
+        mention_count = 0
+        for chunk in chunks:
+            chunk_id = str(chunk.id)
+            for entity_id, start, end in self._matcher.find_all(chunk.text or ""):
+                self._mentions[entity_id].setdefault(chunk_id, []).append((start, end))
+                mention_count += 1
+
+        logger.debug(f"Indexed {mention_count} entity mentions")
+        return mention_count
+
+    def add_mention(self, entity_id: str, entity_name: str, chunk_id: str,
+                    offsets: Optional[List[Tuple[int, int]]] = None) -> None:
+        """Add a precomputed mention, e.g. when loading from storage."""
+        entity_id = str(entity_id)
+        normalized = normalize_mention(entity_name or "")
+        if normalized:
+            self._entity_ids_by_name[normalized].add(entity_id)
+        self._mentions[entity_id].setdefault(str(chunk_id), []).extend(offsets or [])
+
+    def knows_entity(self, entity: Any) -> bool:
+        """Check whether the index covers an entity by ID or name."""
+        return (
+            str(entity.id) in self._mentions
+            or normalize_mention(entity.name) in self._entity_ids_by_name
+        )
+
+    def get_chunk_ids(self, entity: Any) -> Set[str]:
+        """
+        Get IDs of chunks mentioning an entity.
+
+        The entity is resolved by ID and by normalized name, so synthetic
+        entities reconstructed from search metadata still resolve.
+
+        Args:
+            entity: Entity with ``id`` and ``name``
+
+        Returns:
+            Set of chunk IDs (as strings)
+        """
+        entity_ids = {str(entity.id)}
+        entity_ids.update(self._entity_ids_by_name.get(normalize_mention(entity.name), ()))
+
+        chunk_ids: Set[str] = set()
+        for entity_id in entity_ids:
+            chunk_ids.update(self._mentions.get(entity_id, {}).keys())
+        return chunk_ids
+
+    def get_offsets(self, entity_id: str, chunk_id: str) -> List[Tuple[int, int]]:
+        """Get mention offsets of an entity within a chunk."""
+        return list(self._mentions.get(str(entity_id), {}).get(str(chunk_id), []))
+
+    def to_mention_records(self) -> List[Dict[str, Any]]:
+        """
+        Export mentions as records for MENTIONS edge storage.
+
+        Returns:
+            List of dicts with entity_id, chunk_id, starts, ends and count
+        """
+        records = []
+        for entity_id, chunks in self._mentions.items():
+            for chunk_id, offsets in chunks.items():
+                records.append({
+                    "entity_id": entity_id,
+                    "chunk_id": chunk_id,
+                    "starts": [start for start, _ in offsets],
+                    "ends": [end for _, end in offsets],
+                    "count": len(offsets),
+                })
+        return records
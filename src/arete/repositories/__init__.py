@@ -16,6 +16,9 @@ from .base import (
     EntityNotFoundError,
     DuplicateEntityError,
     ValidationError,
+    Page,
+    encode_page_token,
+    decode_page_token,
 )
 from .document import DocumentRepository
 from .entity import EntityRepository
@@ -37,6 +40,10 @@ __all__ = [
     "EntityNotFoundError",
     "DuplicateEntityError",
     "ValidationError",
+    # Pagination
+    "Page",
+    "encode_page_token",
+    "decode_page_token",
     # Repository implementations
     "DocumentRepository",
     "EntityRepository",
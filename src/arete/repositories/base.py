@@ -5,8 +5,13 @@ Provides abstract base classes that define the repository pattern contracts
 for all data access operations. Enables clean architecture with dependency
 inversion and testability through interface segregation.
 """
+import base64
+import binascii
+import json
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, TypeVar, Generic, Union
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, TypeVar, Generic, Union
 from uuid import UUID
 
 from arete.models.base import BaseModel
@@ -36,6 +41,110 @@ class ValidationError(RepositoryError):
     pass
 
 
+# (created_at, id) of the last item of the previous page
+PageCursor = Tuple[float, str]
+
+
+@dataclass
+class Page(Generic[ModelType]):
+    """One page of a keyset-paginated listing."""
+    
+    items: List[ModelType] = field(default_factory=list)
+    next_page_token: Optional[str] = None
+    
+    @property
+    def has_more(self) -> bool:
+        """Whether another page follows this one."""
+        return self.next_page_token is not None
+
+
+def encode_page_token(created_at: Union[datetime, float], entity_id: Union[UUID, str]) -> str:
+    """
+    Encode the position after an item as an opaque continuation token.
+    
+    Args:
+        created_at: Creation time of the last item on the page
+        entity_id: ID of the last item on the page
+        
+    Returns:
+        URL-safe continuation token
+    """
+    if isinstance(created_at, datetime):
+        created_at = created_at.timestamp()
+    payload = json.dumps([float(created_at), str(entity_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_page_token(page_token: str) -> PageCursor:
+    """
+    Decode a continuation token produced by encode_page_token.
+    
+    Args:
+        page_token: Continuation token
+        
+    Returns:
+        Tuple of (created_at timestamp, entity ID)
+        
+    Raises:
+        ValidationError: If the token is malformed
+    """
+    try:
+        padded = page_token + "=" * (-len(page_token) % 4)
+        created_at, entity_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return float(created_at), str(entity_id)
+    except (binascii.Error, ValueError, TypeError, UnicodeError) as e:
+        raise ValidationError(f"Invalid page token: {page_token!r}") from e
+
+
+def build_keyset_query(
+    label: str,
+    alias: str,
+    limit: int,
+    cursor: Optional[PageCursor] = None,
+    filters: Optional[Dict[str, Any]] = None
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Build a Cypher listing that seeks past a cursor instead of skipping rows.
+    
+    Rows are ordered newest first by (created_at, id), so the seek predicate
+    and ordering are served by a composite index on those properties.
+    
+    Args:
+        label: Node label to list
+        alias: Cypher variable bound to the node and returned
+        limit: Maximum number of rows
+        cursor: Position after which to continue, or None for the first page
+        filters: Optional equality filters on node properties
+        
+    Returns:
+        Tuple of (Cypher query, parameters)
+    """
+    conditions = []
+    params: Dict[str, Any] = {"limit": limit}
+    
+    for key, value in (filters or {}).items():
+        param_key = f"filter_{key}"
+        conditions.append(f"{alias}.{key} = ${param_key}")
+        params[param_key] = value
+    
+    if cursor is not None:
+        conditions.append(
+            f"({alias}.created_at < $cursor_created_at OR "
+            f"({alias}.created_at = $cursor_created_at AND {alias}.id < $cursor_id))"
+        )
+        params["cursor_created_at"], params["cursor_id"] = cursor
+    
+    where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+    query = f"""
+        MATCH ({alias}:{label})
+        {where_clause}
+        RETURN {alias}
+        ORDER BY {alias}.created_at DESC, {alias}.id DESC
+        LIMIT $limit
+    """
+    return query, params
+
+
 class BaseRepository(ABC, Generic[ModelType]):
     """
     Abstract base repository defining core CRUD operations.
@@ -167,6 +276,67 @@ class BaseRepository(ABC, Generic[ModelType]):
             RepositoryError: For repository errors
         """
         pass
+    
+    async def list_page(
+        self,
+        limit: int = 100,
+        page_token: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None
+    ) -> Page[ModelType]:
+        """
+        List entities newest first using keyset pagination.
+        
+        Unlike list_all with an offset, each page seeks directly to its
+        position, so fetching a page costs the same at any depth.
+        
+        Args:
+            limit: Maximum number of entities to return
+            page_token: Continuation token from the previous page, or None
+            filters: Optional filters to apply
+            
+        Returns:
+            Page of entities with the token of the next page, if any
+            
+        Raises:
+            ValidationError: If the page token is malformed
+            RepositoryError: For repository errors
+        """
+        cursor = decode_page_token(page_token) if page_token else None
+        
+        # Fetch one extra row to learn whether another page exists
+        items = await self._list_after(limit + 1, cursor, filters)
+        if len(items) <= limit:
+            return Page(items=items)
+        
+        items = items[:limit]
+        last = items[-1]
+        return Page(items=items, next_page_token=encode_page_token(last.created_at, last.id))
+    
+    @abstractmethod
+    async def _list_after(
+        self,
+        limit: int,
+        cursor: Optional[PageCursor],
+        filters: Optional[Dict[str, Any]]
+    ) -> List[ModelType]:
+        """
+        Fetch entities ordered by (created_at, id) descending after a cursor.
+        
+        Backs list_page; implementations usually build the query with
+        build_keyset_query.
+        
+        Args:
+            limit: Maximum number of entities to return
+            cursor: Position after which to continue, or None for the first page
+            filters: Optional filters to apply
+            
+        Returns:
+            List of entities, newest first
+            
+        Raises:
+            RepositoryError: For repository errors
+        """
+        pass
 
 
 class SearchableRepository(BaseRepository[ModelType]):
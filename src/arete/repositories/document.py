@@ -7,8 +7,10 @@ Provides dual persistence strategy for Document entities:
 
 Implements SearchableRepository interface for enhanced search capabilities.
 """
+import asyncio
 import logging
-from typing import List, Optional, Dict, Any, Union
+import re
+from typing import List, Optional, Dict, Any, Tuple, Union
 from uuid import UUID
 
 from arete.repositories.base import (
@@ -17,6 +19,8 @@ from arete.repositories.base import (
     DuplicateEntityError,
     ValidationError,
     RepositoryError,
+    PageCursor,
+    build_keyset_query,
 )
 from arete.models.document import Document
 from arete.database.client import Neo4jClient
@@ -24,6 +28,25 @@ from arete.database.weaviate_client import WeaviateClient
 
 logger = logging.getLogger(__name__)
 
+# Must match config/schemas/neo4j_schema.cypher
+DOCUMENT_FULLTEXT_INDEX = "document_fulltext"
+SEARCH_INDEX_STATEMENTS = (
+    f"CREATE FULLTEXT INDEX {DOCUMENT_FULLTEXT_INDEX} IF NOT EXISTS "
+    "FOR (d:Document) ON EACH [d.title, d.content, d.author]",
+    "CREATE TEXT INDEX document_title_text IF NOT EXISTS FOR (d:Document) ON (d.title)",
+)
+
+_LUCENE_SPECIAL = re.compile(r'([+\-!(){}\[\]^"~*?:\\/&|])')
+_LUCENE_OPERATORS = re.compile(r"\b(AND|OR|NOT)\b")
+_SCORE_KEYS = ("_additional", "certainty", "distance", "score")
+
+
+def _escape_lucene(query: str) -> str:
+    """Escape Lucene operators so user text is matched as plain terms."""
+    escaped = _LUCENE_SPECIAL.sub(r"\\\1", query)
+    # Boolean keywords are operators only in upper case; the analyzer lowercases terms anyway
+    return _LUCENE_OPERATORS.sub(lambda match: match.group(1).lower(), escaped)
+
 
 class DocumentRepository(SearchableRepository[Document]):
     """
@@ -46,6 +69,7 @@ class DocumentRepository(SearchableRepository[Document]):
         """
         self._neo4j_client = neo4j_client
         self._weaviate_client = weaviate_client
+        self._search_indexes_ready = False
     
     async def create(self, entity: Document) -> Document:
         """
@@ -227,6 +251,22 @@ class DocumentRepository(SearchableRepository[Document]):
             logger.error(f"Failed to list documents: {str(e)}")
             raise RepositoryError(f"Failed to list documents: {str(e)}")
     
+    async def _list_after(
+        self,
+        limit: int,
+        cursor: Optional[PageCursor],
+        filters: Optional[Dict[str, Any]]
+    ) -> List[Document]:
+        """Fetch documents after a keyset cursor, newest first."""
+        try:
+            query, params = build_keyset_query("Document", "d", limit, cursor, filters)
+            results = await self._neo4j_client.query(query, params)
+            return [Document(**result["d"]) for result in results]
+            
+        except Exception as e:
+            logger.error(f"Failed to list documents page: {str(e)}")
+            raise RepositoryError(f"Failed to list documents: {str(e)}")
+    
     async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """
         Count documents matching optional filters.
@@ -370,6 +410,9 @@ class DocumentRepository(SearchableRepository[Document]):
         """
         Get documents by title using Neo4j.
         
+        The substring match is served by the ``document_title_text`` TEXT
+        index created by ``ensure_search_indexes``.
+        
         Args:
             title: The document title to search for
             
@@ -422,6 +465,86 @@ class DocumentRepository(SearchableRepository[Document]):
             logger.error(f"Failed to search documents by author: {str(e)}")
             raise RepositoryError(f"Failed to search by author: {str(e)}")
     
+    async def ensure_search_indexes(self) -> None:
+        """
+        Create the keyword search indexes in Neo4j if they do not exist.
+        
+        Raises:
+            RepositoryError: For database errors
+        """
+        if self._search_indexes_ready:
+            return
+        
+        try:
+            for statement in SEARCH_INDEX_STATEMENTS:
+                await self._neo4j_client.query(statement, {})
+            self._search_indexes_ready = True
+            logger.info("Ensured document search indexes")
+            
+        except Exception as e:
+            logger.error(f"Failed to create document search indexes: {str(e)}")
+            raise RepositoryError(f"Failed to create search indexes: {str(e)}")
+    
+    async def search_keywords(
+        self,
+        query: str,
+        limit: int = 10
+    ) -> List[Tuple[Document, float]]:
+        """
+        Keyword search over title, content and author using the Neo4j full-text index.
+        
+        If the index does not exist yet, it is created and this call falls
+        back to a substring scan, with every match scored 1.0.
+        
+        Args:
+            query: The search query
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of (document, relevance score) tuples, best first
+            
+        Raises:
+            RepositoryError: For database errors
+        """
+        try:
+            fulltext_query = f"""
+                CALL db.index.fulltext.queryNodes('{DOCUMENT_FULLTEXT_INDEX}', $query)
+                YIELD node AS d, score
+                RETURN d, score
+                ORDER BY score DESC
+                LIMIT $limit
+            """
+            
+            try:
+                results = await self._neo4j_client.query(
+                    fulltext_query, {"query": _escape_lucene(query), "limit": limit}
+                )
+            except Exception as e:
+                if DOCUMENT_FULLTEXT_INDEX not in str(e) and "fulltext" not in str(e).lower():
+                    raise
+                logger.warning(f"Document full-text index unavailable, bootstrapping: {str(e)}")
+                await self.ensure_search_indexes()
+                results = await self._neo4j_client.query(
+                    """
+                    MATCH (d:Document)
+                    WHERE d.content CONTAINS $query OR d.title CONTAINS $query
+                    RETURN d, 1.0 AS score
+                    LIMIT $limit
+                    """,
+                    {"query": query, "limit": limit}
+                )
+            
+            return [
+                (Document(**result["d"]), float(result.get("score", 1.0)))
+                for result in results
+            ]
+            
+        except RepositoryError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to search documents by keyword: {str(e)}")
+            raise RepositoryError(f"Failed to search by keyword: {str(e)}")
+    
     async def search_content(
         self,
         query: str,
@@ -431,6 +554,10 @@ class DocumentRepository(SearchableRepository[Document]):
         """
         Hybrid search combining Neo4j keyword search and Weaviate semantic search.
         
+        Both legs run concurrently. Keyword scores are normalized by the best
+        keyword score, semantic scores are Weaviate certainties (or rank-based
+        when absent), and documents are ranked by their weighted sum.
+        
         Args:
             query: The search query
             limit: Maximum number of results to return
@@ -443,46 +570,60 @@ class DocumentRepository(SearchableRepository[Document]):
             RepositoryError: For database errors
         """
         try:
-            # Keyword search in Neo4j
-            neo4j_query = """
-                MATCH (d:Document)
-                WHERE d.content CONTAINS $query OR d.title CONTAINS $query
-                RETURN d
-                LIMIT $limit
-            """
-            
-            neo4j_results = await self._neo4j_client.query(
-                neo4j_query, {"query": query, "limit": limit}
+            keyword_results, weaviate_results = await asyncio.gather(
+                self.search_keywords(query, limit=limit),
+                self._weaviate_client.search_near_text(
+                    collection='Document',
+                    query=query,
+                    limit=limit,
+                    certainty=0.6
+                )
             )
             
-            # Semantic search in Weaviate
-            weaviate_results = await self._weaviate_client.search_near_text(
-                collection='Document',
-                query=query,
-                limit=limit,
-                certainty=0.6
+            fused = self._fuse_scores(
+                keyword_results,
+                [self._split_semantic_result(result, rank) for rank, result in enumerate(weaviate_results)],
+                hybrid_weight
             )
+            return fused[:limit]
             
-            # Combine results (simple merge for now - can be enhanced with scoring)
-            combined_results = []
-            seen_ids = set()
-            
-            # Add Neo4j results
-            for result in neo4j_results:
-                doc = Document(**result["d"])
-                if doc.id not in seen_ids:
-                    combined_results.append(doc)
-                    seen_ids.add(doc.id)
-            
-            # Add Weaviate results
-            for result in weaviate_results:
-                doc = Document(**result)
-                if doc.id not in seen_ids:
-                    combined_results.append(doc)
-                    seen_ids.add(doc.id)
-            
-            return combined_results[:limit]
-            
+        except RepositoryError:
+            raise
         except Exception as e:
             logger.error(f"Failed to perform hybrid search: {str(e)}")
-            raise RepositoryError(f"Failed to perform hybrid search: {str(e)}")
\ No newline at end of file
+            raise RepositoryError(f"Failed to perform hybrid search: {str(e)}")
+    
+    @staticmethod
+    def _split_semantic_result(result: Dict[str, Any], rank: int) -> Tuple[Document, float]:
+        """Separate a Weaviate result into its document and certainty."""
+        additional = result.get("_additional") or {}
+        certainty = additional.get("certainty", result.get("certainty"))
+        if certainty is None:
+            certainty = 1.0 / (rank + 1)
+        
+        fields = {key: value for key, value in result.items() if key not in _SCORE_KEYS}
+        return Document(**fields), float(certainty)
+    
+    @staticmethod
+    def _fuse_scores(
+        keyword_results: List[Tuple[Document, float]],
+        semantic_results: List[Tuple[Document, float]],
+        hybrid_weight: float
+    ) -> List[Document]:
+        """Rank documents by weighted normalized keyword and semantic scores."""
+        best_keyword = max((score for _, score in keyword_results), default=0.0)
+        documents: Dict[Any, Document] = {}
+        scores: Dict[Any, float] = {}
+        
+        for doc, score in keyword_results:
+            normalized = score / best_keyword if best_keyword > 0 else 0.0
+            documents.setdefault(doc.id, doc)
+            scores[doc.id] = scores.get(doc.id, 0.0) + (1.0 - hybrid_weight) * normalized
+        
+        for doc, score in semantic_results:
+            documents.setdefault(doc.id, doc)
+            scores[doc.id] = scores.get(doc.id, 0.0) + hybrid_weight * score
+        
+        # Stable sort keeps keyword order for ties
+        ranked = sorted(scores, key=lambda doc_id: scores[doc_id], reverse=True)
+        return [documents[doc_id] for doc_id in ranked]
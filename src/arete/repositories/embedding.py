@@ -12,7 +12,7 @@ import asyncio
 from contextlib import contextmanager
 from dataclasses import dataclass
 
-from .base import SearchableRepository, RepositoryError
+from .base import SearchableRepository, RepositoryError, PageCursor, build_keyset_query
 from ..models.chunk import Chunk
 from ..database.client import Neo4jClient
 from ..database.weaviate_client import WeaviateClient
@@ -592,6 +592,25 @@ class EmbeddingRepository(SearchableRepository[Chunk]):
         logger.warning("list_all not fully implemented")
         return []
     
+    async def _list_after(
+        self,
+        limit: int,
+        cursor: Optional[PageCursor],
+        filters: Optional[Dict[str, Any]]
+    ) -> List[Chunk]:
+        """Fetch chunks after a keyset cursor, newest first."""
+        if self.neo4j_client is None:
+            raise RepositoryError("Listing chunks requires a Neo4j client")
+        
+        try:
+            query, params = build_keyset_query("Chunk", "c", limit, cursor, filters)
+            results = await self.neo4j_client.query(query, params)
+            return [Chunk(**result["c"]) for result in results]
+            
+        except Exception as e:
+            logger.error(f"Failed to list chunks page: {e}")
+            raise RepositoryError(f"Failed to list chunks: {e}") from e
+    
     async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Count chunks matching filters."""
         logger.warning("count not fully implemented")
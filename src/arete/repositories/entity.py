@@ -20,10 +20,18 @@ from arete.repositories.base import (
     DuplicateEntityError,
     ValidationError,
     RepositoryError,
+    PageCursor,
+    build_keyset_query,
 )
 from arete.models.entity import Entity, EntityType
 from arete.database.client import Neo4jClient
+from arete.database.graph_version import (
+    BUMP_GRAPH_VERSION_QUERY,
+    GRAPH_VERSION_NODE_ID,
+    get_graph_version_tracker,
+)
 from arete.database.weaviate_client import WeaviateClient
+from arete.processing.entity_mentions import LOAD_MENTIONS_QUERY, EntityMentionIndex
 
 logger = logging.getLogger(__name__)
 
@@ -56,6 +64,18 @@ class EntityRepository(GraphRepository[Entity], SearchableRepository[Entity]):
             result = await session.run(query, params or {})
             return await result.data()
     
+    async def _mark_graph_changed(self) -> None:
+        """Bump the graph version stored in Neo4j so every process's derived caches stop serving stale results."""
+        try:
+            records = await self._run_query_and_get_data(
+                BUMP_GRAPH_VERSION_QUERY, {"version_id": GRAPH_VERSION_NODE_ID}
+            )
+        except Exception as e:
+            logger.error(f"Failed to bump graph version, derived caches may serve stale results: {e}")
+            return
+        if records:
+            get_graph_version_tracker().observe(records[0]["version"])
+    
     async def create(self, entity: Entity) -> Entity:
         """
         Create a new entity in both Neo4j and Weaviate.
@@ -78,6 +98,7 @@ class EntityRepository(GraphRepository[Entity], SearchableRepository[Entity]):
             # Store in Weaviate for vector search
             weaviate_result = self._weaviate_client.save_entity(entity)
             
+            await self._mark_graph_changed()
             logger.info(f"Created entity: {entity.id}")
             return entity
             
@@ -146,6 +167,7 @@ class EntityRepository(GraphRepository[Entity], SearchableRepository[Entity]):
             # Update in Weaviate
             await self._weaviate_client.save_entity(entity)
             
+            await self._mark_graph_changed()
             logger.info(f"Updated entity: {entity.id}")
             return entity
             
@@ -182,6 +204,7 @@ class EntityRepository(GraphRepository[Entity], SearchableRepository[Entity]):
             )
             
             if neo4j_deleted:
+                await self._mark_graph_changed()
                 logger.info(f"Deleted entity: {entity_id}")
             
             return neo4j_deleted
@@ -241,6 +264,22 @@ class EntityRepository(GraphRepository[Entity], SearchableRepository[Entity]):
             logger.error(f"Failed to list entities: {str(e)}")
             raise RepositoryError(f"Failed to list entities: {str(e)}")
     
+    async def _list_after(
+        self,
+        limit: int,
+        cursor: Optional[PageCursor],
+        filters: Optional[Dict[str, Any]]
+    ) -> List[Entity]:
+        """Fetch entities after a keyset cursor, newest first."""
+        try:
+            query, params = build_keyset_query("Entity", "e", limit, cursor, filters)
+            results = await self._neo4j_client.query(query, params)
+            return [Entity(**result["e"]) for result in results]
+            
+        except Exception as e:
+            logger.error(f"Failed to list entities page: {str(e)}")
+            raise RepositoryError(f"Failed to list entities: {str(e)}")
+    
     async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """
         Count entities matching optional filters.
@@ -709,6 +748,7 @@ class EntityRepository(GraphRepository[Entity], SearchableRepository[Entity]):
             records = await self._run_query_and_get_data(query, params)
             success = len(records) > 0
             if success:
+                await self._mark_graph_changed()
                 logger.info(f"Created relationship: {source_entity_id} -{relationship_type}-> {target_entity_id}")
             
             return success
@@ -904,4 +944,73 @@ class EntityRepository(GraphRepository[Entity], SearchableRepository[Entity]):
             
         except Exception as e:
             logger.error(f"Failed to find or create entities: {str(e)}")
-            raise RepositoryError(f"Failed to find or create entities: {str(e)}")
\ No newline at end of file
+            raise RepositoryError(f"Failed to find or create entities: {str(e)}")
+    
+    # Entity Mention Index Methods
+    
+    async def save_chunk_mentions(
+        self,
+        mention_index: EntityMentionIndex,
+        batch_size: int = 500
+    ) -> int:
+        """
+        Persist an entity mention index as Chunk-[:MENTIONS]->Entity edges.
+        
+        Args:
+            mention_index: Index built over the ingested chunks
+            batch_size: Number of edges written per query
+            
+        Returns:
+            Number of MENTIONS edges written
+            
+        Raises:
+            RepositoryError: For database errors
+        """
+        try:
+            records = mention_index.to_mention_records()
+            query = """
+                UNWIND $mentions AS mention
+                MATCH (c:Chunk {id: mention.chunk_id})
+                MATCH (e:Entity {id: mention.entity_id})
+                MERGE (c)-[m:MENTIONS]->(e)
+                SET m.starts = mention.starts,
+                    m.ends = mention.ends,
+                    m.count = mention.count
+                RETURN count(m) as written
+            """
+            
+            written = 0
+            for start in range(0, len(records), batch_size):
+                batch = records[start:start + batch_size]
+                results = await self._run_query_and_get_data(query, {"mentions": batch})
+                written += results[0]["written"] if results else 0
+            
+            if written:
+                await self._mark_graph_changed()
+            logger.info(f"Stored {written} entity mention edges")
+            return written
+            
+        except Exception as e:
+            logger.error(f"Failed to store entity mentions: {str(e)}")
+            raise RepositoryError(f"Failed to store entity mentions: {str(e)}")
+    
+    async def load_mention_index(self) -> EntityMentionIndex:
+        """
+        Load the entity mention index from stored MENTIONS edges.
+        
+        Returns:
+            Entity mention index for graph-to-chunk expansion
+            
+        Raises:
+            RepositoryError: For database errors
+        """
+        try:
+            results = await self._run_query_and_get_data(LOAD_MENTIONS_QUERY)
+            mention_index = EntityMentionIndex.from_mention_rows(results)
+            
+            logger.info(f"Loaded entity mention index with {len(mention_index)} entries")
+            return mention_index
+            
+        except Exception as e:
+            logger.error(f"Failed to load entity mentions: {str(e)}")
+            raise RepositoryError(f"Failed to load entity mentions: {str(e)}")
@@ -8,7 +8,7 @@ and educational content generation.
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Union
+from typing import AsyncIterator, List, Dict, Any, Optional, Union
 import json
 
 import httpx
@@ -17,13 +17,16 @@ from arete.services.llm_provider import (
     LLMProvider,
     LLMMessage,
     LLMResponse,
+    LLMStreamChunk,
     MessageRole,
     LLMProviderError,
     ProviderUnavailableError,
     RateLimitError,
-    AuthenticationError
+    AuthenticationError,
+    collect_stream
 )
 from arete.config import Settings
+from arete.services.llm_async_core import pooled_http_client
 
 # Setup logger
 logger = logging.getLogger(__name__)
@@ -167,7 +170,7 @@ class AnthropicProvider(LLMProvider):
         # Use defaults if not provided
         model = model or self._get_default_model(self._available_models)
         max_tokens = max_tokens or self.max_tokens
-        temperature = temperature or self.temperature
+        temperature = temperature if temperature is not None else self.temperature
         
         try:
             if stream:
@@ -209,7 +212,7 @@ class AnthropicProvider(LLMProvider):
         
         headers = self._get_headers()
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with pooled_http_client(self.timeout) as client:
             response = await client.post(
                 f"{self.base_url}/messages",
                 json=request_data,
@@ -234,6 +237,52 @@ class AnthropicProvider(LLMProvider):
                 }
             )
 
+    async def stream_response(
+        self,
+        messages: List[LLMMessage],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a response from the Anthropic API as content deltas.
+        
+        Args:
+            messages: Conversation messages
+            model: Model to use (defaults to available model)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional parameters
+            
+        Yields:
+            Response chunks; the last one carries finish reason and usage
+            
+        Raises:
+            LLMProviderError: If generation fails
+            ProviderUnavailableError: If API is unavailable
+        """
+        if not self._initialized:
+            raise LLMProviderError("Provider not initialized. Call initialize() first.")
+        
+        model = model or self._get_default_model(self._available_models)
+        max_tokens = max_tokens or self.max_tokens
+        temperature = temperature if temperature is not None else self.temperature
+        kwargs.pop("stream", None)
+        
+        try:
+            async for chunk in self._stream_chunks(
+                messages, model, max_tokens, temperature, **kwargs
+            ):
+                yield chunk
+        except httpx.ConnectError as e:
+            raise ProviderUnavailableError(
+                f"Anthropic API unavailable: {e}",
+                provider=self.name
+            )
+        except httpx.TimeoutException as e:
+            raise LLMProviderError(f"Request timeout: {e}")
+
     async def _generate_streaming(
         self,
         messages: List[LLMMessage],
@@ -243,6 +292,21 @@ class AnthropicProvider(LLMProvider):
         **kwargs
     ) -> LLMResponse:
         """Generate response using streaming mode."""
+        return await collect_stream(
+            self._stream_chunks(messages, model, max_tokens, temperature, **kwargs),
+            self.name,
+            model
+        )
+
+    async def _stream_chunks(
+        self,
+        messages: List[LLMMessage],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        **kwargs
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Yield text deltas from the Messages API event stream."""
         request_data = self._build_request_params(
             messages=messages,
             model=model,
@@ -253,11 +317,10 @@ class AnthropicProvider(LLMProvider):
         )
         
         headers = self._get_headers()
-        content_parts = []
         final_usage = {"input_tokens": 0, "output_tokens": 0}
         final_finish_reason = None
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with pooled_http_client(self.timeout) as client:
             async with client.stream(
                 "POST",
                 f"{self.base_url}/messages",
@@ -268,54 +331,45 @@ class AnthropicProvider(LLMProvider):
                 await self._handle_api_errors(response)
                 
                 async for line in response.aiter_lines():
-                    if line.strip():
-                        # Parse server-sent events format
-                        if line.startswith("event: "):
-                            event_type = line[7:]  # Remove "event: " prefix
-                        elif line.startswith("data: "):
-                            data_str = line[6:]  # Remove "data: " prefix
-                            
-                            try:
-                                chunk_data = json.loads(data_str)
-                                
-                                # Handle different event types
-                                if chunk_data.get("type") == "message_start":
-                                    message = chunk_data.get("message", {})
-                                    usage = message.get("usage", {})
-                                    if usage:
-                                        final_usage["input_tokens"] = usage.get("input_tokens", 0)
-                                
-                                elif chunk_data.get("type") == "content_block_delta":
-                                    delta = chunk_data.get("delta", {})
-                                    if delta.get("type") == "text_delta":
-                                        content_parts.append(delta.get("text", ""))
-                                
-                                elif chunk_data.get("type") == "message_delta":
-                                    delta = chunk_data.get("delta", {})
-                                    if "stop_reason" in delta:
-                                        final_finish_reason = delta["stop_reason"]
-                                    
-                                    usage = chunk_data.get("usage", {})
-                                    if usage:
-                                        final_usage["output_tokens"] = usage.get("output_tokens", 0)
-                                
-                                elif chunk_data.get("type") == "message_stop":
-                                    break
-                                    
-                            except json.JSONDecodeError:
-                                continue
-        
-        full_content = "".join(content_parts)
-        total_tokens = final_usage["input_tokens"] + final_usage["output_tokens"]
-        
-        return LLMResponse(
-            content=full_content,
-            usage_tokens=total_tokens,
+                    # Parse server-sent events format; event names repeat the data type
+                    if not line.startswith("data: "):
+                        continue
+                    
+                    try:
+                        chunk_data = json.loads(line[6:])
+                    except json.JSONDecodeError:
+                        continue
+                    
+                    # Handle different event types
+                    if chunk_data.get("type") == "message_start":
+                        usage = chunk_data.get("message", {}).get("usage", {})
+                        if usage:
+                            final_usage["input_tokens"] = usage.get("input_tokens", 0)
+                    
+                    elif chunk_data.get("type") == "content_block_delta":
+                        delta = chunk_data.get("delta", {})
+                        if delta.get("type") == "text_delta" and delta.get("text"):
+                            yield LLMStreamChunk(delta=delta["text"], provider=self.name, model=model)
+                    
+                    elif chunk_data.get("type") == "message_delta":
+                        delta = chunk_data.get("delta", {})
+                        if "stop_reason" in delta:
+                            final_finish_reason = delta["stop_reason"]
+                        
+                        usage = chunk_data.get("usage", {})
+                        if usage:
+                            final_usage["output_tokens"] = usage.get("output_tokens", 0)
+                    
+                    elif chunk_data.get("type") == "message_stop":
+                        break
+        
+        yield LLMStreamChunk(
+            delta="",
             provider=self.name,
             model=model,
             finish_reason=self._map_stop_reason(final_finish_reason),
+            usage_tokens=final_usage["input_tokens"] + final_usage["output_tokens"],
             metadata={
-                "streaming": True,
                 "usage": final_usage,
                 "model_info": self._model_info.get(model, {})
             }
@@ -0,0 +1,215 @@
+"""
+Circuit breakers for Arete Graph-RAG external service calls.
+
+A breaker tracks the outcomes of recent calls to one dependency:
+- CLOSED: calls flow; failures and timeouts are recorded in a rolling window
+- OPEN: calls are rejected immediately once the window's error rate (or a
+  run of consecutive failures) crosses the threshold
+- HALF_OPEN: after a cooldown, a limited number of probe calls are let
+  through; a success closes the breaker, a failure opens it again
+
+Rejected calls cost no latency, so a dead dependency stops consuming a full
+timeout per request after the first few failures.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    """States of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Rolling-window circuit breaker for a single dependency."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        minimum_calls: int = 5,
+        consecutive_failure_threshold: int = 3,
+        window_seconds: float = 60.0,
+        open_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize circuit breaker.
+
+        Args:
+            name: Name of the protected dependency
+            failure_rate_threshold: Error rate in the window that opens the breaker
+            minimum_calls: Calls required in the window before the rate is trusted
+            consecutive_failure_threshold: Consecutive failures that open the
+                breaker regardless of the window
+            window_seconds: Length of the rolling outcome window
+            open_seconds: Cooldown before an open breaker admits probes
+            half_open_max_calls: Probe calls allowed at once while half-open
+            clock: Monotonic time source
+        """
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = max(1, minimum_calls)
+        self.consecutive_failure_threshold = max(1, consecutive_failure_threshold)
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = max(1, half_open_max_calls)
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._failures_in_window = 0
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._half_open_in_flight = 0
+
+        self.times_opened = 0
+        self.rejected_calls = 0
+        self.last_failure: Optional[str] = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving an expired open breaker to half-open."""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.open_seconds
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def _transition(self, state: CircuitState) -> None:
+        """Move to a new state; caller holds the lock."""
+        if state == self._state:
+            return
+
+        previous = self._state
+        self._state = state
+        if state == CircuitState.OPEN:
+            self._opened_at = self._clock()
+            self.times_opened += 1
+        elif state == CircuitState.CLOSED:
+            self._outcomes.clear()
+            self._failures_in_window = 0
+            self._consecutive_failures = 0
+            self._opened_at = None
+        self._half_open_in_flight = 0
+
+        log = logger.warning if state == CircuitState.OPEN else logger.info
+        log(f"Circuit breaker {self.name}: {previous.value} -> {state.value}")
+
+    def _prune(self, now: float) -> None:
+        """Drop outcomes that have left the rolling window."""
+        while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+            _, success = self._outcomes.popleft()
+            if not success:
+                self._failures_in_window -= 1
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may proceed, reserving a probe slot when half-open.
+
+        Returns:
+            True if the call may be made; callers must then record its outcome
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == CircuitState.CLOSED:
+                return True
+            if state == CircuitState.HALF_OPEN and self._half_open_in_flight < self.half_open_max_calls:
+                self._half_open_in_flight += 1
+                return True
+            self.rejected_calls += 1
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        with self._lock:
+            if self._current_state() == CircuitState.HALF_OPEN:
+                self._transition(CircuitState.CLOSED)
+                return
+
+            now = self._clock()
+            self._outcomes.append((now, True))
+            self._consecutive_failures = 0
+            self._prune(now)
+
+    def record_failure(self, error: Optional[BaseException] = None) -> None:
+        """
+        Record a failed or timed-out call.
+
+        Args:
+            error: The failure, kept for diagnostics
+        """
+        with self._lock:
+            self.last_failure = repr(error) if error is not None else None
+            state = self._current_state()
+            if state == CircuitState.HALF_OPEN:
+                self._transition(CircuitState.OPEN)
+                return
+            if state == CircuitState.OPEN:
+                return
+
+            now = self._clock()
+            self._outcomes.append((now, False))
+            self._failures_in_window += 1
+            self._consecutive_failures += 1
+            self._prune(now)
+
+            if (
+                self._consecutive_failures >= self.consecutive_failure_threshold
+                or (
+                    len(self._outcomes) >= self.minimum_calls
+                    and self._failure_rate() >= self.failure_rate_threshold
+                )
+            ):
+                self._transition(CircuitState.OPEN)
+
+    def release(self) -> None:
+        """Give back a half-open probe slot for a call that recorded no outcome."""
+        with self._lock:
+            if self._state == CircuitState.HALF_OPEN and self._half_open_in_flight > 0:
+                self._half_open_in_flight -= 1
+
+    def reset(self) -> None:
+        """Force the breaker closed and forget recorded outcomes."""
+        with self._lock:
+            self._transition(CircuitState.CLOSED)
+
+    def _failure_rate(self) -> float:
+        return self._failures_in_window / len(self._outcomes) if self._outcomes else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the breaker state and rolling statistics."""
+        with self._lock:
+            state = self._current_state()
+            self._prune(self._clock())
+            retry_in = None
+            if state == CircuitState.OPEN:
+                retry_in = max(0.0, self.open_seconds - (self._clock() - self._opened_at))
+            return {
+                "name": self.name,
+                "state": state.value,
+                "failure_rate": self._failure_rate(),
+                "calls_in_window": len(self._outcomes),
+                "consecutive_failures": self._consecutive_failures,
+                "times_opened": self.times_opened,
+                "rejected_calls": self.rejected_calls,
+                "retry_in_seconds": retry_in,
+                "last_failure": self.last_failure,
+            }
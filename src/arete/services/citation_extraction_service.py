@@ -14,12 +14,12 @@ import re
 from typing import List, Dict, Any, Optional, Tuple, Set
 from dataclasses import dataclass, field
 from enum import Enum
-import difflib
 from uuid import uuid4, UUID
 
 from ..models.citation import Citation, CitationType, CitationContext
 from ..services.context_composition_service import ContextResult, CitationContext as ComposedCitationContext
 from .base import ServiceError
+from .citation_source_index import get_source_index
 
 logger = logging.getLogger(__name__)
 
@@ -390,15 +390,10 @@ class CitationExtractionService:
         """Create citation from direct quote."""
         quote_text = match.text
         
-        # Find best matching source citation
-        best_match = None
-        best_similarity = 0.0
-        
-        for ctx in context_result.citations:
-            similarity = self._calculate_text_similarity(quote_text, ctx.citation.text)
-            if similarity > best_similarity and similarity >= self.config.similarity_threshold:
-                best_similarity = similarity
-                best_match = ctx.citation
+        # Find best matching source citation among n-gram candidates
+        best_match, best_similarity = get_source_index(context_result).best_text_match(
+            quote_text, threshold=self.config.similarity_threshold
+        )
         
         if not best_match:
             return None
@@ -468,8 +463,11 @@ class CitationExtractionService:
         context_result: ContextResult
     ) -> Optional[Citation]:
         """Find matching citation in context sources."""
-        for ctx in context_result.citations:
-            citation = ctx.citation
+        index = get_source_index(context_result)
+        
+        # Only titles sharing every trigram of the work name can contain it
+        for position in index.title_candidates(work) if work else []:
+            citation = index.citations[position]
             
             # Check work match
             if work and work.lower() in citation.source_title.lower():
@@ -487,11 +485,6 @@ class CitationExtractionService:
         
         return None
     
-    def _calculate_text_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity between two text strings."""
-        # Use difflib for similarity calculation
-        return difflib.SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
-    
     def _calculate_accuracy_score(
         self, 
         citations: List[Citation], 
@@ -0,0 +1,203 @@
+"""
+Citation Source Index for Arete Graph-RAG system.
+
+Per-request inverted index over the source citations of a composed context:
+- Character n-gram postings over passage text, used to pick a handful of
+  candidate passages for a quote before any difflib alignment
+- Character trigram postings over source titles and authors, used to narrow
+  work/author lookups before the exact substring checks
+
+Building the index is linear in the size of the context, and a lookup costs
+time proportional to the length of the probe plus the size of the postings
+it touches, instead of one alignment per source passage.
+"""
+
+import difflib
+import logging
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..models.citation import Citation
+
+logger = logging.getLogger(__name__)
+
+_INDEX_ATTRIBUTE = "_citation_source_index"
+
+
+def _char_ngrams(text: str, size: int) -> Set[str]:
+    """Get the set of character n-grams of lowercased, whitespace-collapsed text."""
+    normalized = " ".join(text.lower().split())
+    if len(normalized) <= size:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+
+
+class CitationSourceIndex:
+    """N-gram index over the source citations available to one response."""
+
+    def __init__(self, citations: Iterable[Citation], ngram_size: int = 4):
+        """
+        Build index over source citations.
+
+        Args:
+            citations: Source citations, in context order
+            ngram_size: Characters per text n-gram
+        """
+        self.citations: List[Citation] = list(citations)
+        self.ngram_size = ngram_size
+
+        self._text_postings: Dict[str, List[int]] = defaultdict(list)
+        self._title_postings: Dict[str, Set[int]] = defaultdict(set)
+        self._author_postings: Dict[str, Set[int]] = defaultdict(set)
+        self._lowered_texts: List[str] = []
+
+        for position, citation in enumerate(self.citations):
+            text = citation.text or ""
+            self._lowered_texts.append(text.lower())
+            for gram in _char_ngrams(text, ngram_size):
+                self._text_postings[gram].append(position)
+            for gram in _char_ngrams(citation.source_title or "", 3):
+                self._title_postings[gram].add(position)
+            for gram in _char_ngrams(citation.source_author or "", 3):
+                self._author_postings[gram].add(position)
+
+    def __len__(self) -> int:
+        return len(self.citations)
+
+    def covers(self, citations: List[Citation]) -> bool:
+        """Check whether the index was built over exactly these citations."""
+        return len(citations) == len(self.citations) and all(
+            indexed is citation for indexed, citation in zip(self.citations, citations)
+        )
+
+    def text_candidates(
+        self,
+        text: str,
+        limit: int = 5,
+        min_overlap: float = 0.2
+    ) -> List[int]:
+        """
+        Get positions of passages sharing the most n-grams with a text.
+
+        Args:
+            text: Probe text, such as a quote from the response
+            limit: Maximum number of candidates
+            min_overlap: Minimum fraction of the probe's n-grams a passage must share
+
+        Returns:
+            Candidate positions, best first
+        """
+        grams = _char_ngrams(text, self.ngram_size)
+        if not grams:
+            return []
+
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(self._text_postings.get(gram, ()))
+
+        required = max(1, int(len(grams) * min_overlap))
+        return [
+            position for position, count in shared.most_common()
+            if count >= required
+        ][:limit]
+
+    def best_text_match(
+        self,
+        text: str,
+        threshold: float = 0.0,
+        limit: int = 5
+    ) -> Tuple[Optional[Citation], float]:
+        """
+        Find the passage most similar to a text using difflib on candidates only.
+
+        Args:
+            text: Probe text
+            threshold: Minimum similarity ratio for a match
+            limit: Maximum number of candidates aligned
+
+        Returns:
+            Tuple of (best citation or None, similarity)
+        """
+        probe = text.lower()
+        best_citation = None
+        best_similarity = 0.0
+
+        for position in self.text_candidates(text, limit=limit):
+            matcher = difflib.SequenceMatcher(None, probe, self._lowered_texts[position])
+            # Cheap upper bounds first; skip alignments that cannot win
+            if matcher.real_quick_ratio() <= best_similarity or matcher.quick_ratio() <= best_similarity:
+                continue
+            similarity = matcher.ratio()
+            if similarity > best_similarity and similarity >= threshold:
+                best_similarity = similarity
+                best_citation = self.citations[position]
+
+        return best_citation, best_similarity
+
+    def text_similarity(self, text: str, position: int) -> float:
+        """Get the difflib similarity between a text and an indexed passage."""
+        return difflib.SequenceMatcher(None, text.lower(), self._lowered_texts[position]).ratio()
+
+    def _substring_candidates(
+        self,
+        needle: str,
+        postings: Dict[str, Set[int]]
+    ) -> Optional[Set[int]]:
+        """Positions whose field may contain the needle, or None if unconstrained."""
+        grams = _char_ngrams(needle, 3)
+        if not grams or len(" ".join(needle.lower().split())) < 3:
+            return None
+
+        candidates: Optional[Set[int]] = None
+        for gram in grams:
+            positions = postings.get(gram, set())
+            candidates = set(positions) if candidates is None else candidates & positions
+            if not candidates:
+                return set()
+        return candidates
+
+    def title_candidates(self, work: str) -> List[int]:
+        """Positions whose source title may contain the work name, in context order."""
+        candidates = self._substring_candidates(work, self._title_postings)
+        if candidates is None:
+            return list(range(len(self.citations)))
+        return sorted(candidates)
+
+    def attribution_candidates(self, author: str, title: str) -> List[int]:
+        """Positions whose source author and title may contain the given values."""
+        author_candidates = self._substring_candidates(author, self._author_postings)
+        title_candidates = self._substring_candidates(title, self._title_postings)
+
+        positions: Optional[Set[int]] = None
+        for candidates in (author_candidates, title_candidates):
+            if candidates is not None:
+                positions = candidates if positions is None else positions & candidates
+        if positions is None:
+            return list(range(len(self.citations)))
+        return sorted(positions)
+
+
+def get_source_index(context_result: Any) -> CitationSourceIndex:
+    """
+    Get the source index of a context, building it on first use.
+
+    The index is memoized on the context object, so extraction and validation
+    of the same response share one index.
+
+    Args:
+        context_result: Composed context whose ``citations`` hold source citations
+
+    Returns:
+        Index over the context's source citations
+    """
+    citations = [ctx.citation for ctx in context_result.citations]
+    index = getattr(context_result, _INDEX_ATTRIBUTE, None)
+
+    if index is None or not index.covers(citations):
+        index = CitationSourceIndex(citations)
+        try:
+            setattr(context_result, _INDEX_ATTRIBUTE, index)
+        except AttributeError:
+            logger.debug("Context object does not accept a memoized source index")
+
+    return index
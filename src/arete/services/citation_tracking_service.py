@@ -9,8 +9,9 @@ This service provides comprehensive citation tracking and provenance management:
 - Support citation impact and usage analytics
 """
 
+import difflib
 import logging
-from typing import List, Dict, Any, Optional, Tuple, Set
+from typing import Callable, List, Dict, Any, Optional, Tuple, Set
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime, timezone, timedelta
@@ -173,6 +174,8 @@ class CitationTrackingConfig:
     enable_automatic_relationship_detection: bool = True
     similarity_threshold_for_relationships: float = 0.7
     max_relationships_per_citation: int = 50
+    relationship_block_size: int = 256  # Larger author/work blocks use LSH candidates
+    relationship_lsh_threshold: float = 0.3
     
     # Performance settings
     batch_size: int = 100
@@ -180,6 +183,211 @@ class CitationTrackingConfig:
     cache_ttl: int = 3600
 
 
+class CitationNetworkBuilder:
+    """
+    Incremental citation network with candidate-pruned relationship detection.
+
+    Automatic relationships are only scored for candidate pairs: citations of
+    the same author and work (blocking), plus pairs whose text shingles
+    collide in an LSH index when the threshold can be met across sources.
+    Adjacency lists, degrees and the edge count are updated as edges arrive,
+    so adding an edge is O(1) and density or centrality is read in O(1).
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.7,
+        relationship_type_fn: Optional[Callable[[Citation, Citation], str]] = None,
+        max_block_size: int = 256,
+        lsh_threshold: float = 0.3,
+        num_perm: int = 64
+    ):
+        """
+        Initialize network builder.
+
+        Args:
+            similarity_threshold: Minimum combined similarity for an automatic relationship
+            relationship_type_fn: Maps a citation pair to a relationship type
+            max_block_size: Author/work block size above which only LSH
+                candidates within the block are scored
+            lsh_threshold: Shingle Jaccard similarity around which LSH candidates collide
+            num_perm: MinHash signature length
+        """
+        self.similarity_threshold = similarity_threshold
+        self.relationship_type_fn = relationship_type_fn or (lambda source, target: "references")
+        self.max_block_size = max_block_size
+        self.lsh_threshold = lsh_threshold
+        self.num_perm = num_perm
+
+        self.citations: List[Citation] = []
+        self.relationships: List[CitationRelationship] = []
+
+        self._positions: Dict[UUID, int] = {}
+        self._lowered_texts: Dict[UUID, str] = {}
+        self._work_blocks: Dict[Tuple[Any, Any], List[Citation]] = {}
+        self._adjacency: Dict[UUID, Set[UUID]] = {}
+        self._degrees: Dict[UUID, int] = {}
+        self._minhasher = None
+        self._lsh = None
+        self.pairs_scored = 0
+
+    @property
+    def total_citations(self) -> int:
+        return len(self.citations)
+
+    @property
+    def total_relationships(self) -> int:
+        return len(self.relationships)
+
+    @property
+    def density(self) -> float:
+        """Relationships over possible citation pairs."""
+        if self.total_citations < 2:
+            return 0.0
+        possible_edges = self.total_citations * (self.total_citations - 1)
+        return (self.total_relationships * 2) / possible_edges
+
+    def degree(self, citation_id: UUID) -> int:
+        """Number of relationships touching a citation."""
+        return self._degrees.get(citation_id, 0)
+
+    def centrality(self, citation_id: UUID) -> float:
+        """Degree centrality of a citation."""
+        return self.degree(citation_id) / max(self.total_citations - 1, 1)
+
+    def neighbors(self, citation_id: UUID) -> Set[UUID]:
+        """Citations related to a citation in either direction."""
+        return set(self._adjacency.get(citation_id, ()))
+
+    def add_relationship(self, relationship: CitationRelationship) -> None:
+        """
+        Add an edge, updating adjacency lists and degrees.
+
+        Args:
+            relationship: Relationship between two citations of the network
+        """
+        source_id = relationship.source_citation_id
+        target_id = relationship.target_citation_id
+
+        self.relationships.append(relationship)
+        self._adjacency.setdefault(source_id, set()).add(target_id)
+        self._adjacency.setdefault(target_id, set()).add(source_id)
+        self._degrees[source_id] = self._degrees.get(source_id, 0) + 1
+        if target_id != source_id:
+            self._degrees[target_id] = self._degrees.get(target_id, 0) + 1
+
+    def add_citation(
+        self,
+        citation: Citation,
+        detect_relationships: bool = True
+    ) -> List[CitationRelationship]:
+        """
+        Add a citation, detecting relationships to citations already present.
+
+        Args:
+            citation: Citation to add
+            detect_relationships: Whether to score candidate pairs
+
+        Returns:
+            Automatic relationships created for the citation
+        """
+        block_key = (citation.source_author, citation.source_title)
+        block = self._work_blocks.setdefault(block_key, [])
+        lowered = citation.text.lower()
+
+        created = []
+        if detect_relationships:
+            for other, source_similarity in self._candidates(citation, block):
+                similarity = self._score(self._lowered_texts[other.id], lowered, source_similarity)
+                if similarity is None:
+                    continue
+                relationship = CitationRelationship(
+                    source_citation_id=other.id,
+                    target_citation_id=citation.id,
+                    relationship_type=self.relationship_type_fn(other, citation),
+                    strength=similarity,
+                    confidence=0.7,  # Lower confidence for automatic detection
+                    created_by="automatic_detection"
+                )
+                self.add_relationship(relationship)
+                created.append(relationship)
+
+        self._positions[citation.id] = len(self.citations)
+        self.citations.append(citation)
+        self._lowered_texts[citation.id] = lowered
+        block.append(citation)
+        if self._lsh is not None:
+            self._lsh.insert(citation.id, self._minhasher.signature(citation.text))
+
+        return created
+
+    def apply_to(self, network: CitationNetwork) -> CitationNetwork:
+        """Copy citations, relationships and metrics into a network."""
+        network.citations = list(self.citations)
+        network.relationships = list(self.relationships)
+        network.total_citations = self.total_citations
+        network.total_relationships = self.total_relationships
+        network.density = self.density
+        network.centrality_scores = {
+            citation.id: self.centrality(citation.id) for citation in self.citations
+        }
+        return network
+
+    def _candidates(
+        self,
+        citation: Citation,
+        block: List[Citation]
+    ) -> List[Tuple[Citation, float]]:
+        """Get (earlier citation, source similarity) pairs worth scoring, in insertion order."""
+        # Pairs from different works score at most half, so they can only
+        # reach thresholds up to 0.5; same-work pairs get the source bonus
+        cross_source = self.similarity_threshold <= 0.5
+        lsh_hits: Set[UUID] = set()
+        if cross_source or len(block) > self.max_block_size:
+            lsh_hits = self._lsh_candidates(citation)
+
+        if len(block) > self.max_block_size:
+            same_work = [other for other in block if other.id in lsh_hits]
+        else:
+            same_work = block
+        candidates = {other.id: (other, 1.0) for other in same_work}
+
+        if cross_source:
+            block_key = (citation.source_author, citation.source_title)
+            for other_id in lsh_hits:
+                other = self.citations[self._positions[other_id]]
+                if (other.source_author, other.source_title) != block_key:
+                    candidates[other_id] = (other, 0.0)
+
+        return sorted(candidates.values(), key=lambda item: self._positions[item[0].id])
+
+    def _lsh_candidates(self, citation: Citation) -> Set[UUID]:
+        """Query the shingle LSH index, building it on first use."""
+        if self._lsh is None:
+            from .data_quality.minhash_lsh import LSHIndex, MinHasher
+
+            self._minhasher = MinHasher(num_perm=self.num_perm)
+            self._lsh = LSHIndex(num_perm=self.num_perm, threshold=self.lsh_threshold)
+            for other in self.citations:
+                self._lsh.insert(other.id, self._minhasher.signature(other.text))
+
+        return self._lsh.query(self._minhasher.signature(citation.text))
+
+    def _score(self, first: str, second: str, source_similarity: float) -> Optional[float]:
+        """Combined similarity of a candidate pair, or None below the threshold."""
+        self.pairs_scored += 1
+        required = 2 * self.similarity_threshold - source_similarity
+        matcher = difflib.SequenceMatcher(None, first, second)
+        # Upper bounds first; most candidates fail without a full alignment
+        if matcher.real_quick_ratio() < required or matcher.quick_ratio() < required:
+            return None
+
+        similarity = (matcher.ratio() + source_similarity) / 2
+        if similarity < self.similarity_threshold:
+            return None
+        return similarity
+
+
 class CitationTrackingService:
     """
     Citation Tracking and Provenance Service for scholarly integrity.
@@ -206,6 +414,7 @@ class CitationTrackingService:
         self._relationships: Dict[UUID, List[CitationRelationship]] = {}
         self._usage_stats: Dict[UUID, CitationUsageStats] = {}
         self._networks: Dict[UUID, CitationNetwork] = {}
+        self._network_builders: Dict[UUID, CitationNetworkBuilder] = {}
         
         # Caching
         self._cache: Dict[str, Any] = {}
@@ -433,18 +642,20 @@ class CitationTrackingService:
                     seen.add(key)
                     unique_relationships.append(rel)
             
-            network.relationships = unique_relationships
-            
+            builder = self._create_network_builder()
+            for rel in unique_relationships:
+                builder.add_relationship(rel)
+
             # Detect additional relationships if enabled
-            if include_automatic_relationships and self.config.enable_automatic_relationship_detection:
-                auto_relationships = self._detect_automatic_relationships(citations)
-                network.relationships.extend(auto_relationships)
-            
-            # Calculate network metrics
-            network = self._calculate_network_metrics(network)
-            
+            detect = include_automatic_relationships and self.config.enable_automatic_relationship_detection
+            for citation in citations:
+                builder.add_citation(citation, detect_relationships=detect)
+
+            network = builder.apply_to(network)
+
             # Store network
             self._networks[network.network_id] = network
+            self._network_builders[network.network_id] = builder
             
             logger.info(
                 f"Built citation network: {len(citations)} citations, "
@@ -457,6 +668,52 @@ class CitationTrackingService:
             logger.error(f"Failed to build citation network: {e}")
             raise CitationTrackingError(f"Network building failed: {e}") from e
     
+    def extend_citation_network(
+        self,
+        network_id: UUID,
+        citations: List[Citation],
+        include_automatic_relationships: bool = True
+    ) -> CitationNetwork:
+        """
+        Add citations to a previously built network.
+
+        Only pairs involving the new citations are scored, and metrics are
+        updated per new edge rather than recomputed over the whole network.
+
+        Args:
+            network_id: ID of a network returned by build_citation_network
+            citations: Citations to add; citations already present are skipped
+            include_automatic_relationships: Whether to detect relationships automatically
+
+        Returns:
+            Updated citation network
+        """
+        network = self._networks.get(network_id)
+        builder = self._network_builders.get(network_id)
+        if network is None or builder is None:
+            raise CitationTrackingError(f"Unknown citation network: {network_id}")
+
+        try:
+            present = {c.id for c in builder.citations}
+            detect = include_automatic_relationships and self.config.enable_automatic_relationship_detection
+            added = 0
+            for citation in citations:
+                if citation.id in present:
+                    continue
+                present.add(citation.id)
+                added += len(builder.add_citation(citation, detect_relationships=detect))
+
+            builder.apply_to(network)
+            logger.info(
+                f"Extended citation network {network_id}: {builder.total_citations} citations, "
+                f"{added} new relationships"
+            )
+            return network
+
+        except Exception as e:
+            logger.error(f"Failed to extend citation network: {e}")
+            raise CitationTrackingError(f"Network extension failed: {e}") from e
+
     def get_citation_usage_stats(self, citation_id: UUID) -> CitationUsageStats:
         """
         Get usage statistics for a citation.
@@ -575,54 +832,15 @@ class CitationTrackingService:
             (stats.average_confidence * (total_events - 1) + citation.confidence) / total_events
         )
     
-    def _detect_automatic_relationships(
-        self,
-        citations: List[Citation]
-    ) -> List[CitationRelationship]:
-        """Detect automatic relationships between citations."""
-        relationships = []
-        
-        # Compare all citation pairs
-        for i, citation1 in enumerate(citations):
-            for citation2 in citations[i+1:]:
-                # Check for potential relationships
-                similarity = self._calculate_citation_similarity(citation1, citation2)
-                
-                if similarity >= self.config.similarity_threshold_for_relationships:
-                    # Determine relationship type
-                    rel_type = self._determine_relationship_type(citation1, citation2)
-                    
-                    relationship = CitationRelationship(
-                        source_citation_id=citation1.id,
-                        target_citation_id=citation2.id,
-                        relationship_type=rel_type,
-                        strength=similarity,
-                        confidence=0.7,  # Lower confidence for automatic detection
-                        created_by="automatic_detection"
-                    )
-                    
-                    relationships.append(relationship)
-        
-        return relationships
-    
-    def _calculate_citation_similarity(self, citation1: Citation, citation2: Citation) -> float:
-        """Calculate similarity between two citations."""
-        import difflib
-        
-        # Text similarity
-        text_sim = difflib.SequenceMatcher(
-            None, citation1.text.lower(), citation2.text.lower()
-        ).ratio()
-        
-        # Source similarity
-        source_sim = 0.0
-        if (citation1.source_author == citation2.source_author and
-            citation1.source_title == citation2.source_title):
-            source_sim = 1.0
-        
-        # Combined similarity
-        return (text_sim + source_sim) / 2
-    
+    def _create_network_builder(self) -> CitationNetworkBuilder:
+        """Create an empty network builder from the tracking configuration."""
+        return CitationNetworkBuilder(
+            similarity_threshold=self.config.similarity_threshold_for_relationships,
+            relationship_type_fn=self._determine_relationship_type,
+            max_block_size=self.config.relationship_block_size,
+            lsh_threshold=self.config.relationship_lsh_threshold
+        )
+
     def _determine_relationship_type(self, citation1: Citation, citation2: Citation) -> str:
         """Determine relationship type between citations."""
         # Simple heuristics for relationship type
@@ -635,29 +853,6 @@ class CitationTrackingService:
             # Different authors - could be supporting or contrasting
             return "references"
     
-    def _calculate_network_metrics(self, network: CitationNetwork) -> CitationNetwork:
-        """Calculate network analysis metrics."""
-        network.total_citations = len(network.citations)
-        network.total_relationships = len(network.relationships)
-        
-        # Calculate density (actual edges / possible edges)
-        if network.total_citations > 1:
-            possible_edges = network.total_citations * (network.total_citations - 1)
-            network.density = (network.total_relationships * 2) / possible_edges
-        
-        # Calculate centrality scores (simplified degree centrality)
-        centrality = {}
-        for citation in network.citations:
-            degree = sum(
-                1 for rel in network.relationships
-                if rel.source_citation_id == citation.id or rel.target_citation_id == citation.id
-            )
-            centrality[citation.id] = degree / max(network.total_citations - 1, 1)
-        
-        network.centrality_scores = centrality
-        
-        return network
-    
     def _calculate_impact_score(
         self,
         citation_id: UUID,
@@ -11,10 +11,9 @@ This service provides comprehensive citation validation and accuracy checking:
 
 import logging
 import re
-from typing import List, Dict, Any, Optional, Tuple, Set
+from typing import List, Dict, Any, Optional, Tuple, Set, AsyncIterator, Callable
 from dataclasses import dataclass, field
 from enum import Enum
-import difflib
 from uuid import UUID
 import asyncio
 
@@ -23,6 +22,7 @@ from ..models.document import Document
 from ..models.chunk import Chunk
 from ..services.context_composition_service import ContextResult
 from .base import ServiceError
+from .citation_source_index import get_source_index
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +86,9 @@ class ValidationResult:
     # Context analysis
     contextual_relevance: float = 0.0
     philosophical_accuracy: float = 0.0
+    
+    # Set when validation did not finish within its time budget
+    timed_out: bool = False
 
 
 @dataclass
@@ -107,6 +110,7 @@ class BatchValidationResult:
     # Processing metadata
     total_citations: int = 0
     valid_citations: int = 0
+    timed_out_citations: int = 0
     processing_time: float = 0.0
     
     # Quality assessment
@@ -137,7 +141,8 @@ class CitationValidationConfig:
     
     # Performance settings
     max_concurrent_validations: int = 5
-    validation_timeout: float = 30.0
+    validation_timeout: float = 30.0  # Deadline for a whole batch
+    per_citation_timeout: Optional[float] = 10.0
     
     # Citation format preferences
     require_classical_format: bool = True
@@ -241,67 +246,51 @@ class CitationValidationService:
         self,
         citations: List[Citation],
         source_context: Optional[ContextResult] = None,
-        original_documents: Optional[List[Document]] = None
+        original_documents: Optional[List[Document]] = None,
+        on_result: Optional[Callable[[ValidationResult], Any]] = None
     ) -> BatchValidationResult:
         """
         Validate multiple citations in batch with parallel processing.
         
+        Results are collected as they complete, so a timeout only affects the
+        citations that were still running; those are returned as timed-out
+        markers alongside every finished validation.
+        
         Args:
             citations: Citations to validate
             source_context: Context from which citations were derived
             original_documents: Original documents for cross-reference
+            on_result: Optional callback (sync or async) invoked with each
+                result as soon as it is available
             
         Returns:
-            Batch validation result with aggregate metrics
+            Batch validation result with aggregate metrics, in citation order
         """
         import time
         start_time = time.time()
         
         try:
-            # Create semaphore for concurrency control
-            semaphore = asyncio.Semaphore(self.config.max_concurrent_validations)
-            
-            # Create validation tasks
-            async def validate_with_semaphore(citation: Citation, doc: Optional[Document] = None):
-                async with semaphore:
-                    return await self.validate_citation(citation, source_context, doc)
-            
-            # Prepare document mapping if provided
-            doc_mapping = {}
-            if original_documents:
-                for doc in original_documents:
-                    doc_mapping[doc.id] = doc
+            results_by_id: Dict[UUID, ValidationResult] = {}
             
-            # Execute validations
-            tasks = []
-            for citation in citations:
-                doc = doc_mapping.get(citation.document_id) if original_documents else None
-                task = validate_with_semaphore(citation, doc)
-                tasks.append(task)
+            async for result in self.iter_citation_validations(
+                citations, source_context, original_documents
+            ):
+                results_by_id[result.citation_id] = result
+                if on_result is not None:
+                    callback_result = on_result(result)
+                    if asyncio.iscoroutine(callback_result):
+                        await callback_result
             
-            # Wait for all validations with timeout
-            try:
-                citation_results = await asyncio.wait_for(
-                    asyncio.gather(*tasks),
-                    timeout=self.config.validation_timeout
-                )
-            except asyncio.TimeoutError:
-                logger.warning("Batch validation timed out, returning partial results")
-                # Handle timeout by creating error results for incomplete validations
-                citation_results = []
-                for citation in citations:
-                    error_result = ValidationResult(
-                        citation_id=citation.id,
-                        is_valid=False,
-                        confidence_score=0.0,
-                        issues=["Validation timed out"]
-                    )
-                    citation_results.append(error_result)
+            citation_results = [
+                results_by_id[citation.id] for citation in citations
+                if citation.id in results_by_id
+            ]
             
             # Create batch result
             batch_result = BatchValidationResult(
                 citation_results=citation_results,
                 total_citations=len(citations),
+                timed_out_citations=sum(1 for r in citation_results if r.timed_out),
                 processing_time=time.time() - start_time
             )
             
@@ -311,8 +300,15 @@ class CitationValidationService:
             # Generate quality assessment
             batch_result = self._assess_batch_quality(batch_result, citations)
             
+            if batch_result.timed_out_citations:
+                batch_result.quality_issues.append(
+                    f"{batch_result.timed_out_citations} of {batch_result.total_citations} "
+                    "citation validations timed out; results are partial"
+                )
+            
             logger.info(
                 f"Batch validation completed: {batch_result.valid_citations}/{batch_result.total_citations} valid, "
+                f"{batch_result.timed_out_citations} timed out, "
                 f"avg confidence: {batch_result.average_confidence:.3f}"
             )
             
@@ -327,6 +323,92 @@ class CitationValidationService:
                 processing_time=time.time() - start_time
             )
     
+    async def iter_citation_validations(
+        self,
+        citations: List[Citation],
+        source_context: Optional[ContextResult] = None,
+        original_documents: Optional[List[Document]] = None
+    ) -> AsyncIterator[ValidationResult]:
+        """
+        Validate citations concurrently, yielding results as they complete.
+        
+        Each validation is bounded by ``per_citation_timeout`` once it starts,
+        and the whole batch by ``validation_timeout``. Citations that miss
+        either budget are yielded as results with ``timed_out`` set.
+        
+        Args:
+            citations: Citations to validate
+            source_context: Context from which citations were derived
+            original_documents: Original documents for cross-reference
+            
+        Yields:
+            Validation results in completion order
+        """
+        semaphore = asyncio.Semaphore(self.config.max_concurrent_validations)
+        per_citation_timeout = self.config.per_citation_timeout
+        
+        # Prepare document mapping if provided
+        doc_mapping = {}
+        if original_documents:
+            for doc in original_documents:
+                doc_mapping[doc.id] = doc
+        
+        async def validate_with_limits(citation: Citation) -> ValidationResult:
+            async with semaphore:
+                try:
+                    return await asyncio.wait_for(
+                        self.validate_citation(
+                            citation, source_context, doc_mapping.get(citation.document_id)
+                        ),
+                        timeout=per_citation_timeout
+                    )
+                except asyncio.TimeoutError:
+                    return self._timed_out_result(citation, "Validation timed out")
+        
+        tasks = {
+            asyncio.create_task(validate_with_limits(citation)): position
+            for position, citation in enumerate(citations)
+        }
+        pending = set(tasks)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.config.validation_timeout
+        
+        try:
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in sorted(done, key=tasks.get):
+                    yield task.result()
+            
+            if pending:
+                logger.warning(
+                    f"Batch validation deadline reached with {len(pending)} citations unfinished"
+                )
+            for task in sorted(pending, key=tasks.get):
+                task.cancel()
+                yield self._timed_out_result(
+                    citations[tasks[task]], "Validation timed out (batch deadline)"
+                )
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    @staticmethod
+    def _timed_out_result(citation: Citation, message: str) -> ValidationResult:
+        """Create the marker result for a citation whose validation timed out."""
+        return ValidationResult(
+            citation_id=citation.id,
+            is_valid=False,
+            confidence_score=0.0,
+            issues=[message],
+            timed_out=True
+        )
+    
     def _create_validation_rules(self) -> List[ValidationRule]:
         """Create default validation rules."""
         rules = []
@@ -405,20 +487,8 @@ class CitationValidationService:
         if not source_context or not source_context.citations:
             return {"passed": True, "score": 0.5, "message": "No source context available"}
         
-        best_similarity = 0.0
-        best_match = None
-        
-        # Find best matching source citation
-        for ctx in source_context.citations:
-            similarity = difflib.SequenceMatcher(
-                None, 
-                citation.text.lower(),
-                ctx.citation.text.lower()
-            ).ratio()
-            
-            if similarity > best_similarity:
-                best_similarity = similarity
-                best_match = ctx.citation
+        # Find best matching source citation among n-gram candidates
+        best_match, best_similarity = get_source_index(source_context).best_text_match(citation.text)
         
         passed = best_similarity >= rule.min_similarity_threshold
         
@@ -446,8 +516,9 @@ class CitationValidationService:
         
         # Check if attribution matches known sources
         if source_context and source_context.citations:
-            for ctx in source_context.citations:
-                source_cit = ctx.citation
+            index = get_source_index(source_context)
+            for position in index.attribution_candidates(citation.source_author, citation.source_title):
+                source_cit = index.citations[position]
                 if (citation.source_author.lower() in source_cit.source_author.lower() and
                     citation.source_title.lower() in source_cit.source_title.lower()):
                     return {
@@ -590,22 +661,24 @@ class CitationValidationService:
             result.source_accuracy = 0.0
             return result
         
-        # Find matching source
+        # Find matching source among passages sharing text or attribution
+        index = get_source_index(source_context)
+        candidates = set(index.text_candidates(citation.text))
+        candidates.update(index.attribution_candidates(citation.source_author, citation.source_title))
+        
         best_match = None
         best_accuracy = 0.0
         
-        for ctx in source_context.citations:
+        for position in sorted(candidates):
+            source_citation = index.citations[position]
+            
             # Check text similarity
-            text_similarity = difflib.SequenceMatcher(
-                None, 
-                citation.text.lower(),
-                ctx.citation.text.lower()
-            ).ratio()
+            text_similarity = index.text_similarity(citation.text, position)
             
             # Check attribution match
             attr_match = 0.0
-            if (citation.source_author.lower() in ctx.citation.source_author.lower() and
-                citation.source_title.lower() in ctx.citation.source_title.lower()):
+            if (citation.source_author.lower() in source_citation.source_author.lower() and
+                citation.source_title.lower() in source_citation.source_title.lower()):
                 attr_match = 1.0
             
             # Combined accuracy
@@ -613,7 +686,7 @@ class CitationValidationService:
             
             if accuracy > best_accuracy:
                 best_accuracy = accuracy
-                best_match = ctx.citation
+                best_match = source_citation
         
         result.source_found = best_match is not None
         result.source_accuracy = best_accuracy
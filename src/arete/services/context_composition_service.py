@@ -14,13 +14,14 @@ import time
 import hashlib
 from typing import List, Dict, Any, Optional, Union, Tuple
 from enum import Enum
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from uuid import UUID
 
 from ..config import Settings, get_settings
 from ..services.dense_retrieval_service import SearchResult
 from ..models.chunk import Chunk
 from ..models.citation import Citation
+from ..services.token_counter import TokenCounter, get_token_counter
 from .base import ServiceError
 
 logger = logging.getLogger(__name__)
@@ -52,7 +53,7 @@ class ContextCompositionConfig:
     
     # Token management
     max_tokens: int = 5000
-    tokens_per_word: float = 1.3  # Rough estimation
+    tokenizer_provider: Optional[str] = None  # Defaults to the active LLM provider
     
     # Composition strategy
     strategy: CompositionStrategy = CompositionStrategy.INTELLIGENT_STITCHING
@@ -94,6 +95,7 @@ class PassageGroup:
     topic: Optional[str] = None
     start_position: Optional[int] = None
     end_position: Optional[int] = None
+    token_counter: Optional[TokenCounter] = field(default=None, repr=False, compare=False)
     token_count: int = field(default=0, init=False)
     
     def __post_init__(self):
@@ -101,10 +103,9 @@ class PassageGroup:
         self.token_count = self._calculate_token_count()
     
     def _calculate_token_count(self) -> int:
-        """Calculate approximate token count for all chunks."""
-        total_text = " ".join(chunk.text for chunk in self.chunks)
-        # Rough estimation: 1.3 tokens per word
-        return int(len(total_text.split()) * 1.3)
+        """Count tokens of all chunks with the group's tokenizer."""
+        counter = self.token_counter or get_token_counter()
+        return counter.count(self.get_composed_text())
     
     def get_composed_text(self, separator: str = " ") -> str:
         """Get composed text from all chunks."""
@@ -175,6 +176,9 @@ class ContextCompositionService:
         """
         self.config = config or ContextCompositionConfig()
         self.settings = settings or get_settings()
+        self.token_counter = get_token_counter(
+            self.config.tokenizer_provider or self.settings.active_llm_provider
+        )
         
         # Caching for performance
         self._composition_cache: Dict[str, ContextResult] = {}
@@ -226,23 +230,30 @@ class ContextCompositionService:
             if not search_results:
                 return self._create_empty_result(query, composition_config.strategy)
             
+            # Pack against the budget net of the tokenizer's safety margin
+            packing_config = replace(
+                composition_config,
+                max_tokens=max(1, self.token_counter.usable(composition_config.max_tokens))
+            )
+            
             # Apply composition strategy
             if composition_config.strategy == CompositionStrategy.INTELLIGENT_STITCHING:
                 result = self._intelligent_stitching_composition(
-                    search_results, query, citations, composition_config
+                    search_results, query, citations, packing_config
                 )
             elif composition_config.strategy == CompositionStrategy.MAP_REDUCE:
                 result = self._map_reduce_composition(
-                    search_results, query, citations, composition_config
+                    search_results, query, citations, packing_config
                 )
             elif composition_config.strategy == CompositionStrategy.SEMANTIC_GROUPING:
                 result = self._semantic_grouping_composition(
-                    search_results, query, citations, composition_config
+                    search_results, query, citations, packing_config
                 )
             else:  # SIMPLE_CONCAT
                 result = self._simple_concat_composition(
-                    search_results, query, citations, composition_config
+                    search_results, query, citations, packing_config
                 )
+            self._fit_to_budget(result, packing_config.max_tokens)
             
             # Calculate performance metrics
             result.composition_time = time.time() - start_time
@@ -303,20 +314,27 @@ class ContextCompositionService:
     
     def count_tokens(self, text: str) -> int:
         """
-        Count approximate tokens in text.
+        Count tokens in text with the configured provider's tokenizer.
         
         Args:
             text: Text to count tokens for
             
         Returns:
-            Approximate number of tokens
+            Number of tokens
         """
         if not text or not text.strip():
             return 0
         
-        # Simple approximation: tokens ≈ words * 1.3
-        word_count = len(text.split())
-        return int(word_count * self.config.tokens_per_word)
+        return self.token_counter.count(text)
+    
+    def _fit_to_budget(self, result: ContextResult, max_tokens: int) -> None:
+        """Count the composed text exactly, truncating it if headers and separators overflow the budget."""
+        total_tokens = self.count_tokens(result.composed_text)
+        if total_tokens > max_tokens:
+            result.composed_text = self.token_counter.truncate(result.composed_text, max_tokens, "...")
+            result.truncated = True
+            total_tokens = self.count_tokens(result.composed_text)
+        result.total_tokens = total_tokens
     
     def _validate_inputs(
         self,
@@ -507,7 +525,8 @@ class ContextCompositionService:
             group = PassageGroup(
                 chunks=chunks,
                 coherence_score=avg_score,
-                topic=self._extract_topic(group_results)
+                topic=self._extract_topic(group_results),
+                token_counter=self.token_counter
             )
             
             # Check token limit
@@ -577,7 +596,8 @@ class ContextCompositionService:
                     
                     group = PassageGroup(
                         chunks=[truncated_chunk],
-                        coherence_score=result.relevance_score
+                        coherence_score=result.relevance_score,
+                        token_counter=self.token_counter
                     )
                     passage_groups.append(group)
                     total_tokens += remaining_tokens
@@ -585,7 +605,8 @@ class ContextCompositionService:
             
             group = PassageGroup(
                 chunks=[chunk],
-                coherence_score=result.relevance_score
+                coherence_score=result.relevance_score,
+                token_counter=self.token_counter
             )
             passage_groups.append(group)
             total_tokens += chunk_tokens
@@ -669,7 +690,8 @@ class ContextCompositionService:
                     group = PassageGroup(
                         chunks=[r.chunk for r in current_group],
                         coherence_score=self._calculate_group_coherence(current_group),
-                        topic=self._extract_topic(current_group)
+                        topic=self._extract_topic(current_group),
+                        token_counter=self.token_counter
                     )
                     groups.append(group)
                 
@@ -680,7 +702,8 @@ class ContextCompositionService:
             group = PassageGroup(
                 chunks=[r.chunk for r in current_group],
                 coherence_score=self._calculate_group_coherence(current_group),
-                topic=self._extract_topic(current_group)
+                topic=self._extract_topic(current_group),
+                token_counter=self.token_counter
             )
             groups.append(group)
         
@@ -802,18 +825,13 @@ class ContextCompositionService:
         return PassageGroup(
             chunks=truncated_chunks,
             coherence_score=group.coherence_score,
-            topic=group.topic
+            topic=group.topic,
+            token_counter=self.token_counter
         )
     
     def _truncate_text(self, text: str, max_tokens: int) -> str:
         """Truncate text to fit within token limit."""
-        words = text.split()
-        max_words = int(max_tokens / self.config.tokens_per_word)
-        
-        if len(words) <= max_words:
-            return text
-        
-        return " ".join(words[:max_words]) + "..."
+        return self.token_counter.truncate(text, max_tokens, "...")
     
     def _compose_text_from_groups(self, groups: List[PassageGroup], config: ContextCompositionConfig) -> str:
         """Compose final text from passage groups."""
@@ -24,6 +24,16 @@ from .duplicate_detection_service import (
     DeduplicationResult,
     DuplicationStrategy
 )
+from .minhash_lsh import (
+    MinHasher,
+    LSHIndex,
+    shingle_text
+)
+from .signature_store import (
+    DuplicateSignatureStore,
+    SignatureMatches
+)
+from .evaluation_executor import EvaluationExecutor
 from .quality_monitor import (
     QualityMonitor,
     QualityAlert,
@@ -52,7 +62,13 @@ __all__ = [
     "SimilarityMetrics",
     "DeduplicationResult",
     "DuplicationStrategy",
+    "MinHasher",
+    "LSHIndex",
+    "shingle_text",
+    "DuplicateSignatureStore",
+    "SignatureMatches",
     # Quality Monitoring
+    "EvaluationExecutor",
     "QualityMonitor",
     "QualityAlert",
     "MonitoringStats",
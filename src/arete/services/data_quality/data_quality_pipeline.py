@@ -14,11 +14,16 @@ Components:
 
 import asyncio
 import logging
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional, Union, Set, Tuple
+from typing import List, Dict, Any, Optional, Union, Set, Tuple, Callable, Awaitable
 from pathlib import Path
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 
 from pydantic import BaseModel, Field, validator, ConfigDict
 
@@ -308,6 +313,19 @@ class QualityPipelineConfig(BaseModel):
     batch_size: int = Field(50, description="Batch size for processing", gt=0)
     max_workers: int = Field(4, description="Maximum number of worker threads", gt=0)
     timeout_seconds: float = Field(600.0, description="Pipeline timeout in seconds")
+    component_timeouts: Dict[str, float] = Field(
+        default_factory=lambda: {
+            "ragas_evaluation": 120.0,
+            "duplicate_detection": 300.0,
+            "deduplication": 300.0,
+            "citation_validation": 60.0,
+            "quality_monitoring": 30.0
+        },
+        description="Per-component timeouts in seconds; missing components use timeout_seconds"
+    )
+    use_process_pool: bool = Field(
+        True, description="Run lexical duplicate detection in a process pool"
+    )
     
     # Output configuration
     save_results: bool = Field(True, description="Save assessment results to file")
@@ -315,12 +333,66 @@ class QualityPipelineConfig(BaseModel):
     generate_report: bool = Field(True, description="Generate detailed quality report")
 
 
+@dataclass
+class AssessmentComponent:
+    """A node in the assessment task graph."""
+    name: str
+    run: Callable[[], Awaitable[None]]
+    depends_on: Tuple[str, ...] = ()
+    timeout: Optional[float] = None
+
+
+@lru_cache(maxsize=1)
+def _get_lexical_duplicate_service() -> DuplicateDetectionService:
+    """Get the lexical duplicate detection service of this process, created on first use."""
+    return DuplicateDetectionService(load_models=False, load_signatures=False)
+
+
+def _detect_lexical_duplicates(
+    item_groups: List[Tuple[List[Any], str]],
+    strategies: List[DuplicationStrategy],
+    fuzzy_threshold: float
+) -> List[DuplicateResult]:
+    """
+    Run exact and fuzzy duplicate detection; executed in a worker process.
+    
+    Args:
+        item_groups: (items, text field) pairs to check independently
+        strategies: Configured duplication strategies
+        fuzzy_threshold: Minimum string similarity for fuzzy duplicates
+        
+    Returns:
+        Duplicate groups found across all item groups
+    """
+    service = _get_lexical_duplicate_service()
+    duplicates = []
+    
+    for items, text_field in item_groups:
+        if DuplicationStrategy.EXACT_MATCH in strategies:
+            duplicates.extend(service.find_exact_duplicates(items, field=text_field))
+        if DuplicationStrategy.FUZZY_MATCHING in strategies:
+            duplicates.extend(service.find_fuzzy_duplicates(
+                items, field=text_field, fuzzy_threshold=fuzzy_threshold
+            ))
+    
+    return duplicates
+
+
+def _call_with_pickled_args(function: Callable[..., Any], payload: bytes) -> Any:
+    """Call a function with arguments pickled by the parent process."""
+    return function(*pickle.loads(payload))
+
+
 class DataQualityPipeline:
     """
     Comprehensive data quality pipeline orchestration service.
     
     Coordinates all data quality validation activities including RAGAS evaluation,
     duplicate detection, citation validation, and quality monitoring.
+    
+    Used as a context manager, the pipeline keeps its worker process pool
+    across assessments until the block exits; otherwise the pool is shut
+    down after each assessment.
     """
     
     def __init__(self, config: Optional[QualityPipelineConfig] = None):
@@ -333,9 +405,45 @@ class DataQualityPipeline:
         self._duplicate_service = None
         self._quality_monitor = None
         
+        # Worker processes for CPU-heavy components
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._keep_process_pool = False
+        
         # Performance tracking
         self._performance_stats = {}
     
+    def close(self) -> None:
+        """Shut down the worker process pool."""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+            self._process_pool = None
+    
+    # Context Manager Support
+    def __enter__(self) -> 'DataQualityPipeline':
+        """Sync context manager entry; keeps the process pool across assessments."""
+        self._keep_process_pool = True
+        return self
+    
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Sync context manager exit."""
+        self._keep_process_pool = False
+        self.close()
+    
+    async def __aenter__(self) -> 'DataQualityPipeline':
+        """Async context manager entry; keeps the process pool across assessments."""
+        return self.__enter__()
+    
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit."""
+        self.__exit__(exc_type, exc_val, exc_tb)
+    
+    @property
+    def process_pool(self) -> ProcessPoolExecutor:
+        """Get or create the worker process pool."""
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.config.max_workers)
+        return self._process_pool
+    
     @property
     def ragas_service(self) -> RAGASQualityService:
         """Get or create RAGAS quality service."""
@@ -431,6 +539,10 @@ class DataQualityPipeline:
             ))
             raise
         
+        finally:
+            if not self._keep_process_pool:
+                self.close()
+        
         return report
     
     def _categorize_data(self, data: Union[List[Any], Dict[str, List[Any]]]) -> Dict[str, List[Any]]:
@@ -465,24 +577,131 @@ class DataQualityPipeline:
         contexts: Optional[List[str]],
         ground_truth: Optional[str]
     ):
-        """Run all enabled assessment components."""
+        """Run all enabled assessment components as a task graph."""
+        components = []
         
         # RAGAS Evaluation
         if self.config.enable_ragas_evaluation and query:
-            await self._run_ragas_evaluation(report, query, contexts, ground_truth)
+            components.append(self._component(
+                "ragas_evaluation",
+                lambda: self._run_ragas_evaluation(report, query, contexts, ground_truth)
+            ))
         
-        # Duplicate Detection
+        # Duplicate Detection, followed by deduplication of the detected groups
         if self.config.enable_duplicate_detection:
-            await self._run_duplicate_detection(report, data_by_type)
+            components.append(self._component(
+                "duplicate_detection",
+                lambda: self._run_duplicate_detection(report, data_by_type)
+            ))
+            components.append(self._component(
+                "deduplication",
+                lambda: self._run_deduplication(report, data_by_type),
+                depends_on=("duplicate_detection",)
+            ))
         
         # Citation Validation
         if self.config.enable_citation_validation and data_by_type.get("citations"):
-            await self._run_citation_validation(report, data_by_type["citations"])
+            components.append(self._component(
+                "citation_validation",
+                lambda: self._run_citation_validation(report, data_by_type["citations"])
+            ))
         
         # Quality Monitoring (if comprehensive level)
         if (self.config.enable_quality_monitoring and 
             self.config.assessment_level in [QualityAssessmentLevel.COMPREHENSIVE, QualityAssessmentLevel.RESEARCH]):
-            await self._run_quality_monitoring(report)
+            components.append(self._component(
+                "quality_monitoring",
+                lambda: self._run_quality_monitoring(report)
+            ))
+        
+        outcomes = await self._execute_component_graph(components)
+        report.validation_summary["components"] = outcomes
+        
+        for name, outcome in outcomes.items():
+            if outcome["status"] == "timed_out":
+                self._mark_component_skipped(report, name)
+                report.quality_alerts.append(QualityAlert(
+                    alert_id=f"timeout_{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                    severity=AlertSeverity.WARNING,
+                    metric_name=name,
+                    current_value=outcome["duration"],
+                    threshold_value=outcome["timeout"],
+                    message=f"{name} timed out after {outcome['timeout']:.0f}s; report is partial",
+                    timestamp=datetime.now(timezone.utc)
+                ))
+    
+    def _component(
+        self,
+        name: str,
+        run: Callable[[], Awaitable[None]],
+        depends_on: Tuple[str, ...] = ()
+    ) -> AssessmentComponent:
+        """Create an assessment component with its configured timeout."""
+        return AssessmentComponent(
+            name=name,
+            run=run,
+            depends_on=depends_on,
+            timeout=self.config.component_timeouts.get(name, self.config.timeout_seconds)
+        )
+    
+    async def _execute_component_graph(
+        self,
+        components: List[AssessmentComponent]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run components concurrently, starting each once its dependencies finish.
+        
+        A component whose dependency failed, timed out or was skipped is
+        skipped itself. Components must be listed after their dependencies.
+        
+        Args:
+            components: Components to run
+            
+        Returns:
+            Outcome per component: status, duration and timeout
+        """
+        tasks: Dict[str, asyncio.Task] = {}
+        
+        async def run_component(component: AssessmentComponent) -> Dict[str, Any]:
+            dependencies = [tasks[name] for name in component.depends_on if name in tasks]
+            if dependencies:
+                dependency_outcomes = await asyncio.gather(*dependencies)
+                if any(outcome["status"] != "completed" for outcome in dependency_outcomes):
+                    return {"status": "skipped", "duration": 0.0, "timeout": component.timeout}
+            
+            start = time.monotonic()
+            try:
+                await asyncio.wait_for(component.run(), timeout=component.timeout)
+                status = "completed"
+            except asyncio.TimeoutError:
+                self.logger.warning(f"Assessment component {component.name} timed out")
+                status = "timed_out"
+            except Exception as e:
+                self.logger.error(f"Assessment component {component.name} failed: {e}")
+                status = "failed"
+            
+            return {
+                "status": status,
+                "duration": time.monotonic() - start,
+                "timeout": component.timeout
+            }
+        
+        for component in components:
+            tasks[component.name] = asyncio.create_task(run_component(component))
+        
+        outcomes = await asyncio.gather(*tasks.values())
+        return dict(zip(tasks.keys(), outcomes))
+    
+    @staticmethod
+    def _mark_component_skipped(report: QualityAssessmentReport, name: str) -> None:
+        """Mark the report section of an unfinished component as skipped."""
+        status_fields = {
+            "ragas_evaluation": "ragas_status",
+            "duplicate_detection": "duplicate_status",
+            "citation_validation": "citation_status"
+        }
+        if name in status_fields:
+            setattr(report, status_fields[name], ValidationStatus.SKIPPED)
     
     async def _run_ragas_evaluation(
         self,
@@ -533,12 +752,17 @@ class DataQualityPipeline:
         report: QualityAssessmentReport,
         data_by_type: Dict[str, List[Any]]
     ):
-        """Run duplicate detection component."""
+        """
+        Run duplicate detection component.
+        
+        Exact and fuzzy matching run in the worker process pool while
+        semantic matching runs in a thread next to the loaded sentence model.
+        """
         try:
             self.logger.info("Running duplicate detection")
             
-            all_duplicates = []
             total_items = 0
+            item_groups = []
             
             # Process each data type
             for data_type, items in data_by_type.items():
@@ -549,37 +773,22 @@ class DataQualityPipeline:
                 
                 # Determine field to check for duplicates
                 text_field = self._get_text_field_for_type(data_type)
-                if not text_field:
-                    continue
-                
-                # Run duplicate detection with configured strategies
-                for strategy in self.config.duplication_strategies:
-                    if strategy == DuplicationStrategy.EXACT_MATCH:
-                        duplicates = self.duplicate_service.find_exact_duplicates(items, field=text_field)
-                    elif strategy == DuplicationStrategy.SEMANTIC_SIMILARITY:
-                        duplicates = await self.duplicate_service.find_semantic_duplicates(
-                            items, field=text_field
-                        )
-                    elif strategy == DuplicationStrategy.FUZZY_MATCHING:
-                        duplicates = self.duplicate_service.find_fuzzy_duplicates(
-                            items, field=text_field
-                        )
-                    else:
-                        continue
-                    
-                    all_duplicates.extend(duplicates)
+                if text_field:
+                    item_groups.append((items, text_field))
             
-            report.duplicate_results = all_duplicates
+            # Run duplicate detection with configured strategies
+            detections = [self._detect_lexical_duplicates(item_groups)]
+            if DuplicationStrategy.SEMANTIC_SIMILARITY in self.config.duplication_strategies:
+                detections.extend(
+                    self.duplicate_service.find_semantic_duplicates(items, field=text_field)
+                    for items, text_field in item_groups
+                )
             
-            # Run deduplication if duplicates found
-            if all_duplicates and total_items > 0:
-                # Combine all items for deduplication
-                all_items = []
-                for items in data_by_type.values():
-                    all_items.extend(items)
-                
-                dedup_result = await self.duplicate_service.deduplicate_items(all_items)
-                report.deduplication_summary = dedup_result
+            all_duplicates = []
+            for duplicates in await asyncio.gather(*detections):
+                all_duplicates.extend(duplicates)
+            
+            report.duplicate_results = all_duplicates
             
             # Validate against thresholds
             status, issues = self.config.validation_rules.validate_duplicate_results(
@@ -606,6 +815,85 @@ class DataQualityPipeline:
                 timestamp=datetime.now(timezone.utc)
             ))
     
+    async def _detect_lexical_duplicates(
+        self,
+        item_groups: List[Tuple[List[Any], str]]
+    ) -> List[DuplicateResult]:
+        """Run exact and fuzzy detection, in the process pool when enabled."""
+        if not item_groups:
+            return []
+        
+        args = (
+            item_groups,
+            list(self.config.duplication_strategies),
+            self.config.validation_rules.fuzzy_matching_threshold
+        )
+        if self.config.use_process_pool:
+            duplicates = await self._run_in_process_pool(_detect_lexical_duplicates, args)
+            if duplicates is not None:
+                return duplicates
+        
+        return await asyncio.to_thread(_detect_lexical_duplicates, *args)
+    
+    async def _run_in_process_pool(
+        self,
+        function: Callable[..., Any],
+        args: Tuple[Any, ...]
+    ) -> Optional[Any]:
+        """
+        Run a module-level function in the worker process pool.
+        
+        Args:
+            function: Function to run
+            args: Positional arguments of the function
+            
+        Returns:
+            Result of the function, or None if the arguments cannot be pickled
+            or the pool is unavailable; errors raised by the function propagate
+        """
+        try:
+            payload = pickle.dumps(args)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            self.logger.warning(f"Arguments cannot be sent to a worker process, using a thread: {e}")
+            return None
+        
+        try:
+            pool = self.process_pool
+        except (OSError, NotImplementedError) as e:
+            self.logger.warning(f"Process pool unavailable, using a thread: {e}")
+            return None
+        
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                pool, _call_with_pickled_args, function, payload
+            )
+        except BrokenProcessPool as e:
+            self.logger.warning(f"Process pool broke, using a thread: {e}")
+            self.close()
+            return None
+    
+    async def _run_deduplication(
+        self,
+        report: QualityAssessmentReport,
+        data_by_type: Dict[str, List[Any]]
+    ):
+        """Run deduplication once duplicate detection has found groups."""
+        if not report.duplicate_results:
+            return
+        
+        try:
+            # Combine all items for deduplication
+            all_items = []
+            for items in data_by_type.values():
+                all_items.extend(items)
+            
+            dedup_result = await self.duplicate_service.deduplicate_items(all_items)
+            report.deduplication_summary = dedup_result
+            
+        except Exception as e:
+            self.logger.error(f"Deduplication failed: {e}")
+            raise
+    
     async def _run_citation_validation(
         self,
         report: QualityAssessmentReport,
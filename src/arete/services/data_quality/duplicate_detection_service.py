@@ -51,6 +51,9 @@ from arete.models.document import Document
 from arete.models.chunk import Chunk
 from arete.models.citation import Citation
 
+from .minhash_lsh import LSHIndex, MinHasher
+from .signature_store import DuplicateSignatureStore, content_hash
+
 logger = logging.getLogger(__name__)
 
 
@@ -156,16 +159,65 @@ class DetectionPerformanceMetrics:
     detection_accuracy: Optional[float] = None
 
 
+class _UnionFind:
+    """Disjoint-set forest with path compression and union by size."""
+    
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+        self.size = [1] * size
+    
+    def find(self, index: int) -> int:
+        """Find the representative of an element's set."""
+        root = index
+        while self.parent[root] != root:
+            root = self.parent[root]
+        while self.parent[index] != root:
+            self.parent[index], index = root, self.parent[index]
+        return root
+    
+    def union(self, first: int, second: int) -> None:
+        """Merge the sets containing two elements."""
+        root1, root2 = self.find(first), self.find(second)
+        if root1 == root2:
+            return
+        if self.size[root1] < self.size[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        self.size[root1] += self.size[root2]
+    
+    def groups(self) -> List[List[int]]:
+        """Get all sets with more than one element, in index order."""
+        members: Dict[int, List[int]] = defaultdict(list)
+        for index in range(len(self.parent)):
+            members[self.find(index)].append(index)
+        return [group for group in members.values() if len(group) > 1]
+
+
 class DuplicateDetectionService:
     """Service for comprehensive duplicate detection and deduplication."""
     
     def __init__(
         self,
         similarity_threshold: float = 0.8,
-        settings: Optional[Settings] = None
+        settings: Optional[Settings] = None,
+        load_models: bool = True,
+        fuzzy_threshold: float = 0.8,
+        load_signatures: bool = True
     ):
-        """Initialize duplicate detection service."""
+        """
+        Initialize duplicate detection service.
+        
+        Args:
+            similarity_threshold: Default similarity threshold for duplicates
+            settings: Application settings
+            load_models: Load the sentence transformer; lexical-only workers
+                (exact and fuzzy matching) can skip it
+            fuzzy_threshold: Default minimum string similarity for fuzzy duplicates
+            load_signatures: Open the configured persistent signature store;
+                lexical-only workers, which never check incrementally, can skip it
+        """
         self.similarity_threshold = similarity_threshold
+        self.fuzzy_threshold = fuzzy_threshold
         self.settings = settings or get_settings()
         self.logger = logging.getLogger(__name__)
         
@@ -179,6 +231,17 @@ class DuplicateDetectionService:
             DuplicationStrategy.COSINE_SIMILARITY: self._cosine_similarity_detection
         }
         
+        # MinHash signer for LSH candidate generation
+        self.minhasher = MinHasher()
+        
+        # Persistent signatures for incremental duplicate checks
+        self.signature_store: Optional[DuplicateSignatureStore] = None
+        store_path = getattr(self.settings, 'duplicate_signature_store_path', '')
+        if load_signatures and isinstance(store_path, str) and store_path:
+            self.signature_store = DuplicateSignatureStore(
+                store_path, minhasher=self.minhasher, lsh_threshold=fuzzy_threshold / 2
+            )
+        
         # Custom similarity functions
         self.custom_similarity_functions: Dict[str, Callable] = {}
         
@@ -186,7 +249,10 @@ class DuplicateDetectionService:
         self.performance_metrics: List[DetectionPerformanceMetrics] = []
         
         # Initialize ML models if available
-        self._initialize_ml_models()
+        if load_models:
+            self._initialize_ml_models()
+        else:
+            self.sentence_model = None
     
     def _initialize_ml_models(self):
         """Initialize ML models for semantic similarity."""
@@ -245,13 +311,43 @@ class DuplicateDetectionService:
         self,
         items: List[Any], 
         similarity_threshold: Optional[float] = None,
-        field: str = 'text'
+        field: str = 'text',
+        block_size: int = 1024
     ) -> List[DuplicateResult]:
-        """Find semantic duplicates using sentence embeddings."""
+        """
+        Find semantic duplicates using sentence embeddings.
+        
+        Normalized embeddings are compared one block of rows at a time, so
+        peak memory is ``block_size x n`` similarities instead of a full
+        ``n x n`` matrix. Only above-threshold pairs are kept, and pairs are
+        merged into duplicate clusters with union-find. Encoding and
+        comparison run in a worker thread, so the event loop stays responsive.
+        
+        Args:
+            items: Items to check
+            similarity_threshold: Minimum cosine similarity for a duplicate
+            field: Attribute holding the text to embed
+            block_size: Number of rows compared per block
+            
+        Returns:
+            One duplicate group per connected cluster of similar items
+        """
         if not items or not self.sentence_model:
             return []
         
         threshold = similarity_threshold or self.similarity_threshold
+        return await asyncio.to_thread(
+            self._cluster_semantic_duplicates, items, threshold, field, block_size
+        )
+    
+    def _cluster_semantic_duplicates(
+        self,
+        items: List[Any],
+        threshold: float,
+        field: str,
+        block_size: int
+    ) -> List[DuplicateResult]:
+        """Embed items and cluster those above the similarity threshold."""
         start_time = datetime.now()
         
         # Extract text content
@@ -265,44 +361,32 @@ class DuplicateDetectionService:
         
         # Generate embeddings
         try:
-            embeddings = self.sentence_model.encode(texts)
+            embeddings = self._normalize_embeddings(self.sentence_model.encode(texts))
+            pairs = self._find_similar_pairs(embeddings, threshold, block_size)
             
-            # Calculate pairwise similarities
-            similarity_matrix = cosine_similarity(embeddings)
+            # Merge pairs into clusters
+            clusters = _UnionFind(len(items))
+            for i, j, _ in pairs:
+                clusters.union(i, j)
             
-            # Find duplicate groups
-            duplicate_results = []
-            processed_indices = set()
+            cluster_similarities: Dict[int, List[float]] = defaultdict(list)
+            for i, _, similarity in pairs:
+                cluster_similarities[clusters.find(i)].append(similarity)
             
-            for i in range(len(items)):
-                if i in processed_indices:
-                    continue
-                
-                # Find similar items
-                similar_indices = []
-                for j in range(i + 1, len(items)):
-                    if similarity_matrix[i][j] >= threshold:
-                        similar_indices.append(j)
+            duplicate_results = []
+            for indices in clusters.groups():
+                avg_similarity = float(np.mean(cluster_similarities[clusters.find(indices[0])]))
                 
-                # Create duplicate group if similar items found
-                if similar_indices:
-                    group_items = [items[i]] + [items[j] for j in similar_indices]
-                    avg_similarity = float(np.mean([similarity_matrix[i][j] for j in similar_indices]))
-                    
-                    result = DuplicateResult(
-                        group_id=f"semantic_{i}_{datetime.now().strftime('%H%M%S')}",
-                        items=group_items,
-                        similarity_score=avg_similarity,
-                        detection_method="semantic_similarity",
-                        confidence_level=avg_similarity,
-                        false_positive_risk=max(0, 1 - avg_similarity),
-                        processing_time_ms=(datetime.now() - start_time).total_seconds() * 1000
-                    )
-                    duplicate_results.append(result)
-                    
-                    # Mark as processed
-                    processed_indices.add(i)
-                    processed_indices.update(similar_indices)
+                result = DuplicateResult(
+                    group_id=f"semantic_{indices[0]}_{datetime.now().strftime('%H%M%S')}",
+                    items=[items[index] for index in indices],
+                    similarity_score=min(avg_similarity, 1.0),
+                    detection_method="semantic_similarity",
+                    confidence_level=min(avg_similarity, 1.0),
+                    false_positive_risk=max(0, 1 - avg_similarity),
+                    processing_time_ms=(datetime.now() - start_time).total_seconds() * 1000
+                )
+                duplicate_results.append(result)
             
             return duplicate_results
             
@@ -310,42 +394,137 @@ class DuplicateDetectionService:
             self.logger.error(f"Error in semantic duplicate detection: {str(e)}")
             return []
     
+    @staticmethod
+    def _normalize_embeddings(embeddings: Any) -> np.ndarray:
+        """L2-normalize embedding rows so dot products are cosine similarities."""
+        matrix = np.asarray(embeddings, dtype=np.float32)
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+    
+    @staticmethod
+    def _find_similar_pairs(
+        embeddings: np.ndarray,
+        threshold: float,
+        block_size: int = 1024
+    ) -> List[Tuple[int, int, float]]:
+        """
+        Find all pairs of normalized embeddings above a cosine threshold.
+        
+        Each block of rows is compared only against itself and later rows, so
+        every pair is evaluated once and at most ``block_size x n``
+        similarities are held in memory.
+        
+        Args:
+            embeddings: L2-normalized embeddings, one row per item
+            threshold: Minimum cosine similarity
+            block_size: Number of rows compared per block
+            
+        Returns:
+            List of (i, j, similarity) with i < j
+        """
+        pairs: List[Tuple[int, int, float]] = []
+        count = len(embeddings)
+        block_size = max(1, block_size)
+        
+        for block_start in range(0, count, block_size):
+            block_end = min(block_start + block_size, count)
+            similarities = embeddings[block_start:block_end] @ embeddings[block_start:].T
+            
+            rows, cols = np.nonzero(similarities >= threshold)
+            upper = cols > rows  # Skip self-pairs and pairs already seen
+            rows, cols = rows[upper], cols[upper]
+            
+            pairs.extend(zip(
+                (rows + block_start).tolist(),
+                (cols + block_start).tolist(),
+                similarities[rows, cols].tolist()
+            ))
+        
+        return pairs
+    
     def find_fuzzy_duplicates(
         self,
         items: List[Any],
         field: str,
-        fuzzy_threshold: float = 0.8
+        fuzzy_threshold: Optional[float] = None,
+        lsh_threshold: Optional[float] = None,
+        num_perm: int = 128
     ) -> List[DuplicateResult]:
-        """Find fuzzy duplicates using string similarity."""
+        """
+        Find fuzzy duplicates using MinHash/LSH candidates and string similarity.
+        
+        Items are shingled and MinHash-signed, and only items that collide in
+        at least one LSH band are compared with Levenshtein/difflib similarity,
+        so a sweep costs roughly O(n) instead of O(n^2) string alignments.
+        
+        Args:
+            items: Items to check
+            field: Attribute holding the text to compare
+            fuzzy_threshold: Minimum string similarity for a duplicate
+                (defaults to the service's fuzzy threshold)
+            lsh_threshold: Shingle Jaccard similarity around which candidates are
+                generated; lower values raise recall at the cost of more
+                verifications. Defaults to half of ``fuzzy_threshold`` because
+                small edits destroy several shingles at once.
+            num_perm: MinHash signature length
+            
+        Returns:
+            Duplicate groups, each anchored on its first item
+        """
         if not items:
             return []
         
         start_time = datetime.now()
+        if fuzzy_threshold is None:
+            fuzzy_threshold = self.fuzzy_threshold
+        texts = [str(getattr(item, field, '') or '') for item in items]
+        
+        minhasher = self.minhasher
+        if minhasher.num_perm != num_perm:
+            minhasher = MinHasher(num_perm=num_perm, shingle_size=minhasher.shingle_size)
+        lsh_index = LSHIndex(
+            num_perm=num_perm,
+            threshold=lsh_threshold if lsh_threshold is not None else fuzzy_threshold / 2
+        )
+        for index, text in enumerate(texts):
+            if text:
+                lsh_index.insert(index, minhasher.signature(text))
+        
+        neighbours: Dict[int, Set[int]] = defaultdict(set)
+        for first, second in lsh_index.candidate_pairs():
+            neighbours[first].add(second)
+            neighbours[second].add(first)
+        
         duplicate_results = []
         processed_indices = set()
+        verified_pairs = 0
         
-        for i in range(len(items)):
+        for i in sorted(neighbours):
             if i in processed_indices:
                 continue
             
-            text1 = str(getattr(items[i], field, ''))
             similar_items = [items[i]]
             similar_indices = [i]
+            similarities = []
             
-            for j in range(i + 1, len(items)):
-                if j in processed_indices:
+            for j in sorted(neighbours[i]):
+                if j <= i or j in processed_indices:
                     continue
                 
-                text2 = str(getattr(items[j], field, ''))
-                similarity = self._calculate_string_similarity(text1, text2)
+                verified_pairs += 1
+                similarity = self._calculate_string_similarity(texts[i], texts[j])
                 
                 if similarity >= fuzzy_threshold:
                     similar_items.append(items[j])
                     similar_indices.append(j)
+                    similarities.append(similarity)
             
             # Create duplicate group if similar items found
             if len(similar_items) > 1:
-                avg_similarity = fuzzy_threshold  # Simplified - could calculate actual average
+                avg_similarity = float(np.mean(similarities))
                 
                 result = DuplicateResult(
                     group_id=f"fuzzy_{i}_{datetime.now().strftime('%H%M%S')}",
@@ -361,6 +540,11 @@ class DuplicateDetectionService:
                 # Mark as processed
                 processed_indices.update(similar_indices)
         
+        self.logger.info(
+            f"Found {len(duplicate_results)} fuzzy duplicate groups from {len(items)} items "
+            f"({verified_pairs} candidate pairs verified, "
+            f"{lsh_index.bands} bands x {lsh_index.rows} rows)"
+        )
         return duplicate_results
     
     def _calculate_string_similarity(self, text1: str, text2: str) -> float:
@@ -723,28 +907,154 @@ class DuplicateDetectionService:
         self,
         existing_items: List[Any],
         new_items: List[Any],
-        field: str
+        field: str,
+        signature_store: Optional[DuplicateSignatureStore] = None
     ) -> List[DuplicateResult]:
-        """Detect duplicates in new items against existing items."""
-        all_items = existing_items + new_items
-        
-        # Find all duplicates
-        all_duplicates = await self.detect_all_duplicates(
-            all_items,
-            [DuplicationStrategy.EXACT_MATCH, DuplicationStrategy.SEMANTIC_SIMILARITY],
-            field
-        )
+        """
+        Detect duplicates in new items against existing items.
+        
+        Only the new items are checked: each one is probed against a signature
+        store (content hashes, MinHash signatures and normalized embeddings)
+        and appended to it afterwards, so later new items also match earlier
+        ones. Existing items missing from the store are signed first, which is
+        a no-op for a persistent store that is kept up to date at ingest.
+        MinHash candidates are verified with string similarity against the
+        fuzzy threshold, like ``find_fuzzy_duplicates``.
+        
+        Args:
+            existing_items: Items already in the corpus
+            new_items: Items to check
+            field: Attribute holding the text to compare
+            signature_store: Store to use; defaults to the configured persistent
+                store, or a transient in-memory store
+            
+        Returns:
+            Duplicate groups, each led by a new item. Stored items that are not
+            among ``existing_items`` are represented by their item ID.
+        """
+        if not new_items:
+            return []
+        
+        start_time = datetime.now()
+        store = signature_store or self.signature_store
+        if store is None:
+            store = DuplicateSignatureStore(
+                minhasher=self.minhasher, lsh_threshold=self.fuzzy_threshold / 2
+            )
+        
+        # New items are registered once checked, so none is matched against itself
+        items_by_key: Dict[str, Any] = {}
+        for item in existing_items:
+            items_by_key.setdefault(self._signature_key(item, field), item)
+        
+        unsigned_items = [
+            item for item in existing_items
+            if self._signature_key(item, field) not in store
+        ]
+        embeddings = self._encode_for_store(unsigned_items + new_items, field)
+        
+        for index, item in enumerate(unsigned_items):
+            store.add(
+                self._signature_key(item, field),
+                str(getattr(item, field, '') or ''),
+                embeddings[index] if embeddings is not None else None
+            )
         
-        # Filter to only duplicates involving new items
         incremental_duplicates = []
-        for duplicate in all_duplicates:
-            # Check if any new items are in this duplicate group
-            has_new_item = any(item in new_items for item in duplicate.items)
-            if has_new_item:
-                incremental_duplicates.append(duplicate)
+        for offset, item in enumerate(new_items):
+            key = self._signature_key(item, field)
+            text = str(getattr(item, field, '') or '')
+            embedding = embeddings[len(unsigned_items) + offset] if embeddings is not None else None
+            
+            # A content-hash key is shared by exact duplicates, so only an item ID identifies the probe
+            matches = store.query(
+                text,
+                embedding=embedding,
+                near_threshold=self.fuzzy_threshold / 2,
+                semantic_threshold=self.similarity_threshold,
+                exclude=key if getattr(item, 'id', None) else None
+            )
+            
+            groups = [
+                ("exact_match", [(match, 1.0) for match in matches.exact]),
+                ("fuzzy_matching", self._verify_near_matches(text, matches.near, items_by_key, field)),
+                ("semantic_similarity", matches.semantic),
+            ]
+            for method, matched in groups:
+                if not matched:
+                    continue
+                
+                avg_similarity = float(np.mean([similarity for _, similarity in matched]))
+                incremental_duplicates.append(DuplicateResult(
+                    group_id=f"incremental_{method}_{hashlib.md5(key.encode()).hexdigest()[:8]}",
+                    items=[item] + [items_by_key.get(match, match) for match, _ in matched],
+                    similarity_score=min(avg_similarity, 1.0),
+                    detection_method=method,
+                    confidence_level=min(avg_similarity, 1.0),
+                    false_positive_risk=max(0, 1 - avg_similarity),
+                    processing_time_ms=(datetime.now() - start_time).total_seconds() * 1000
+                ))
+            
+            store.add(key, text, embedding)
+            items_by_key.setdefault(key, item)
         
+        self.logger.info(
+            f"Checked {len(new_items)} new items against {len(store)} signatures: "
+            f"{len(incremental_duplicates)} duplicate groups"
+        )
         return incremental_duplicates
     
+    def _verify_near_matches(
+        self,
+        text: str,
+        candidates: List[Tuple[str, float]],
+        items_by_key: Dict[str, Any],
+        field: str
+    ) -> List[Tuple[str, float]]:
+        """
+        Keep MinHash candidates whose string similarity reaches the fuzzy threshold.
+        
+        Stored items whose text is not at hand are kept only if their
+        estimated shingle Jaccard similarity alone reaches the threshold.
+        """
+        verified = []
+        for match, estimate in candidates:
+            matched_item = items_by_key.get(match)
+            if matched_item is None:
+                similarity = estimate
+            else:
+                similarity = self._calculate_string_similarity(
+                    text, str(getattr(matched_item, field, '') or '')
+                )
+            if similarity >= self.fuzzy_threshold:
+                verified.append((match, similarity))
+        return verified
+    
+    @staticmethod
+    def _signature_key(item: Any, field: str) -> str:
+        """
+        Get the key identifying an item in the signature store.
+        
+        Items without an ID are keyed by their content hash, so exact
+        duplicates among them share one key.
+        """
+        item_id = getattr(item, 'id', None)
+        if item_id:
+            return str(item_id)
+        return content_hash(str(getattr(item, field, '') or ''))
+    
+    def _encode_for_store(self, items: List[Any], field: str) -> Optional[np.ndarray]:
+        """Embed items for the signature store, if a sentence model is available."""
+        if not items or not self.sentence_model:
+            return None
+        
+        try:
+            texts = [str(getattr(item, field, '') or '') for item in items]
+            return np.asarray(self.sentence_model.encode(texts), dtype=np.float32)
+        except Exception as e:
+            self.logger.warning(f"Embedding failed, skipping semantic matching: {str(e)}")
+            return None
+    
     def _monitor_performance(self, operation_name: str, start_time: datetime, items_count: int) -> Dict[str, Any]:
         """Monitor performance of detection operations."""
         end_time = datetime.now()
@@ -0,0 +1,189 @@
+"""
+Concurrent, memoized RAGAS evaluation for Arete Graph-RAG system.
+
+Scores many question/context/answer samples with a bounded number of
+in-flight RAGAS calls, grouping uncached samples into batches so one RAGAS
+call scores several rows. Results are memoized by a hash of the sample, the
+metric set and the evaluator model, so unchanged samples are never re-scored.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from arete.services.result_cache import LRUCache, SQLiteCacheStore, make_cache_key
+
+from .ragas_quality_service import EvaluationResult, RAGASQualityService
+
+logger = logging.getLogger(__name__)
+
+
+class EvaluationExecutor:
+    """Runs RAGAS evaluations concurrently with result memoization."""
+
+    def __init__(
+        self,
+        quality_service: RAGASQualityService,
+        max_concurrency: int = 4,
+        batch_size: int = 8,
+        cache_size: int = 1024,
+        cache_ttl_seconds: Optional[float] = None
+    ):
+        """
+        Initialize evaluation executor.
+
+        Args:
+            quality_service: Service performing the RAGAS evaluation
+            max_concurrency: Maximum number of RAGAS calls in flight
+            batch_size: Maximum samples scored per RAGAS call
+            cache_size: Maximum number of memoized results kept in memory
+            cache_ttl_seconds: Optional lifetime of memoized results
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.quality_service = quality_service
+        self.max_concurrency = max_concurrency
+        self.batch_size = max(1, batch_size)
+
+        shared_store = None
+        shared_cache_path = getattr(quality_service.settings, "shared_cache_path", "")
+        if isinstance(shared_cache_path, str) and shared_cache_path:
+            shared_store = SQLiteCacheStore(shared_cache_path, "ragas_evaluations")
+        self.cache = LRUCache(
+            max_size=cache_size,
+            ttl_seconds=cache_ttl_seconds,
+            shared_store=shared_store
+        )
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self.evaluations_run = 0
+
+    def cache_key(self, sample: Dict[str, Any]) -> str:
+        """
+        Build the memoization key of a sample.
+
+        Args:
+            sample: Dict with question, contexts, answer and optional ground_truth
+
+        Returns:
+            Key covering the sample, the metric set and the evaluator model
+        """
+        return make_cache_key(
+            sample["question"],
+            list(sample["contexts"]),
+            sample["answer"],
+            sample.get("ground_truth"),
+            self.quality_service.get_metric_set(),
+            self.quality_service.evaluator_model,
+        )
+
+    async def evaluate_many(
+        self,
+        samples: List[Dict[str, Any]],
+        raise_errors: bool = False
+    ) -> List[EvaluationResult]:
+        """
+        Evaluate samples, serving unchanged ones from the cache.
+
+        Args:
+            samples: Dicts with question, contexts, answer and optional
+                ground_truth and query_id
+            raise_errors: Re-raise the first evaluation error instead of
+                skipping failed samples
+
+        Returns:
+            Evaluation results in sample order, without failed samples
+        """
+        results: List[Optional[EvaluationResult]] = [None] * len(samples)
+        pending: Dict[str, List[int]] = {}
+
+        for index, sample in enumerate(samples):
+            key = self.cache_key(sample)
+            cached = self.cache.get(key)
+            if cached is not None:
+                results[index] = self._reuse(cached, sample)
+            else:
+                pending.setdefault(key, []).append(index)
+
+        if pending:
+            # Evaluate each distinct sample once; batches must agree on ground truth
+            with_truth = [key for key, indices in pending.items() if samples[indices[0]].get("ground_truth")]
+            without_truth = [key for key, indices in pending.items() if not samples[indices[0]].get("ground_truth")]
+            batches = [
+                group[start:start + self.batch_size]
+                for group in (with_truth, without_truth)
+                for start in range(0, len(group), self.batch_size)
+            ]
+
+            outcomes = await asyncio.gather(
+                *[self._evaluate_batch([samples[pending[key][0]] for key in batch]) for batch in batches],
+                return_exceptions=True
+            )
+
+            for batch, outcome in zip(batches, outcomes):
+                if isinstance(outcome, BaseException):
+                    if raise_errors:
+                        raise outcome
+                    logger.error(f"Failed to evaluate batch of {len(batch)} samples: {outcome}")
+                    continue
+
+                for key, result in zip(batch, outcome):
+                    if isinstance(result, BaseException):
+                        if raise_errors:
+                            raise result
+                        logger.error(f"Failed to evaluate query: {result}")
+                        continue
+
+                    self.cache.set(key, result)
+                    first, *duplicates = pending[key]
+                    results[first] = result
+                    for index in duplicates:
+                        results[index] = self._reuse(result, samples[index])
+
+        logger.info(
+            f"Evaluated {len(samples)} samples: {len(samples) - sum(map(len, pending.values()))} "
+            f"from cache, {len(pending)} scored"
+        )
+        return [result for result in results if result is not None]
+
+    async def _evaluate_batch(self, batch: List[Dict[str, Any]]) -> List[Any]:
+        """Score a batch with one RAGAS call, falling back to per-sample calls."""
+        async with self._semaphore:
+            try:
+                results = await self.quality_service.evaluate_samples_batched(batch)
+                self.evaluations_run += len(batch)
+                return results
+            except Exception as e:
+                if len(batch) == 1:
+                    raise
+                logger.warning(f"Batched evaluation failed, scoring samples individually: {e}")
+
+        outcomes = await asyncio.gather(
+            *[self._evaluate_batch([sample]) for sample in batch],
+            return_exceptions=True
+        )
+        return [
+            outcome if isinstance(outcome, BaseException) else outcome[0]
+            for outcome in outcomes
+        ]
+
+    @staticmethod
+    def _reuse(result: EvaluationResult, sample: Dict[str, Any]) -> EvaluationResult:
+        """Copy a memoized result for a new evaluation of the same sample."""
+        return result.model_copy(update={
+            "query_id": sample.get("query_id") or str(uuid4()),
+            "evaluation_timestamp": datetime.now(timezone.utc),
+            "evaluation_duration_ms": 0.0,
+        })
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get executor statistics."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "batch_size": self.batch_size,
+            "evaluations_run": self.evaluations_run,
+            "cache": self.cache.get_stats(),
+        }
@@ -0,0 +1,211 @@
+"""
+MinHash signatures and banded locality-sensitive hashing for Arete.
+
+Provides sub-quadratic near-duplicate candidate generation:
+- Character shingling of normalized text
+- Fixed-seed MinHash signatures, so signatures computed in different runs
+  are comparable and can be persisted
+- Banded LSH buckets whose collision probability follows an S-curve around
+  a tunable Jaccard threshold
+
+Only items that share at least one bucket are returned as candidates; callers
+verify candidates with an exact similarity measure.
+"""
+
+import re
+import zlib
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# Mersenne prime 2**31 - 1; keeps (a * x + b) within uint64 without overflow
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def shingle_text(text: str, shingle_size: int = 5) -> Set[str]:
+    """
+    Split text into overlapping character shingles.
+
+    Text is lowercased and whitespace is collapsed first, so formatting
+    differences do not change the shingle set.
+
+    Args:
+        text: Text to shingle
+        shingle_size: Number of characters per shingle
+
+    Returns:
+        Set of shingles (the whole text if it is shorter than one shingle)
+    """
+    normalized = _WHITESPACE.sub(" ", text.lower()).strip()
+    if not normalized:
+        return set()
+    if len(normalized) <= shingle_size:
+        return {normalized}
+    return {
+        normalized[i:i + shingle_size]
+        for i in range(len(normalized) - shingle_size + 1)
+    }
+
+
+def choose_lsh_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    Choose (bands, rows) so the LSH S-curve is centred near the threshold.
+
+    The Jaccard similarity at which two items collide with probability ~0.5
+    is approximately ``(1 / bands) ** (1 / rows)``.
+
+    Args:
+        num_perm: Signature length
+        threshold: Target Jaccard similarity
+
+    Returns:
+        Tuple of (bands, rows per band)
+    """
+    best: Optional[Tuple[float, int, int]] = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if bands < 1:
+            break
+        error = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class MinHasher:
+    """Computes fixed-seed MinHash signatures for shingle sets."""
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        """
+        Initialize MinHasher.
+
+        Args:
+            num_perm: Number of hash permutations (signature length)
+            shingle_size: Characters per shingle
+            seed: Seed for the permutation coefficients
+        """
+        if num_perm < 1:
+            raise ValueError("num_perm must be at least 1")
+
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+
+        rng = np.random.RandomState(seed)
+        prime = int(_MERSENNE_PRIME)
+        self._a = rng.randint(1, prime, size=num_perm).astype(np.uint64)
+        self._b = rng.randint(0, prime, size=num_perm).astype(np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text: Text to sign
+
+        Returns:
+            Array of ``num_perm`` unsigned integers; empty texts get a
+            signature of maximal values that collides with nothing real
+        """
+        shingles = shingle_text(text, self.shingle_size)
+        if not shingles:
+            return np.full(self.num_perm, _MERSENNE_PRIME, dtype=np.uint64)
+
+        hashes = np.fromiter(
+            (zlib.crc32(s.encode("utf-8")) for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles),
+        ) % _MERSENNE_PRIME
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+    @staticmethod
+    def estimate_jaccard(signature1: np.ndarray, signature2: np.ndarray) -> float:
+        """Estimate Jaccard similarity from two signatures."""
+        return float(np.mean(signature1 == signature2))
+
+
+class LSHIndex:
+    """
+    Banded LSH index over MinHash signatures.
+
+    Each signature is split into ``bands`` slices of ``rows`` values; items
+    whose slices are identical in any band land in the same bucket.
+    """
+
+    def __init__(self, num_perm: int = 128, threshold: float = 0.5):
+        """
+        Initialize LSH index.
+
+        Args:
+            num_perm: Signature length of indexed signatures
+            threshold: Jaccard similarity around which items start colliding
+        """
+        self.num_perm = num_perm
+        self.threshold = threshold
+        self.bands, self.rows = choose_lsh_bands(num_perm, threshold)
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [
+            defaultdict(list) for _ in range(self.bands)
+        ]
+        self._keys: Dict[Hashable, List[bytes]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._keys
+
+    def _band_hashes(self, signature: np.ndarray) -> List[bytes]:
+        """Split a signature into per-band bucket keys."""
+        return [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def insert(self, key: Hashable, signature: np.ndarray) -> None:
+        """Add a signature under the given key."""
+        if key in self._keys:
+            self.remove(key)
+
+        band_hashes = self._band_hashes(signature)
+        for band, band_hash in enumerate(band_hashes):
+            self._buckets[band][band_hash].append(key)
+        self._keys[key] = band_hashes
+
+    def remove(self, key: Hashable) -> None:
+        """Remove a key from the index."""
+        band_hashes = self._keys.pop(key, None)
+        if band_hashes is None:
+            return
+
+        for band, band_hash in enumerate(band_hashes):
+            bucket = self._buckets[band].get(band_hash)
+            if bucket is None:
+                continue
+            bucket.remove(key)
+            if not bucket:
+                del self._buckets[band][band_hash]
+
+    def query(self, signature: np.ndarray) -> Set[Hashable]:
+        """Get keys sharing at least one bucket with the signature."""
+        candidates: Set[Hashable] = set()
+        for band, band_hash in enumerate(self._band_hashes(signature)):
+            candidates.update(self._buckets[band].get(band_hash, ()))
+        return candidates
+
+    def candidate_pairs(self) -> Iterable[Tuple[Hashable, Hashable]]:
+        """Yield each unordered pair of keys that share a bucket once."""
+        seen: Set[Tuple[Hashable, Hashable]] = set()
+        for buckets in self._buckets:
+            for bucket in buckets.values():
+                if len(bucket) < 2:
+                    continue
+                for i, first in enumerate(bucket):
+                    for second in bucket[i + 1:]:
+                        pair = (first, second)
+                        if pair in seen or (second, first) in seen:
+                            continue
+                        seen.add(pair)
+                        yield pair
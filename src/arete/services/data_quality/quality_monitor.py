@@ -22,6 +22,7 @@ from arete.services.data_quality.ragas_quality_service import (
     EvaluationResult,
     QualityThresholds
 )
+from arete.services.data_quality.evaluation_executor import EvaluationExecutor
 from arete.config import Settings, get_settings
 
 logger = logging.getLogger(__name__)
@@ -98,6 +99,14 @@ class QualityMonitor:
         self.alert_thresholds = config.get('alert_thresholds', {})
         self.max_history_size = config.get('max_history_size', 1000)
         
+        # Concurrent, memoized evaluation
+        self.evaluation_executor = EvaluationExecutor(
+            quality_service,
+            max_concurrency=config.get('max_concurrent_evaluations', 4),
+            batch_size=config.get('evaluation_batch_size', 8),
+            cache_size=config.get('evaluation_cache_size', 1024)
+        )
+        
         # Alert callbacks
         self.alert_callbacks: List[Callable[[QualityAlert], None]] = []
         
@@ -185,21 +194,8 @@ class QualityMonitor:
                 self.logger.warning("No sample queries generated for evaluation")
                 return
             
-            # Run evaluations
-            evaluation_results = []
-            for query_data in sample_queries:
-                try:
-                    result = await self.quality_service.evaluate_single_query(
-                        question=query_data["question"],
-                        contexts=query_data["contexts"],
-                        answer=query_data["answer"],
-                        ground_truth=query_data.get("ground_truth")
-                    )
-                    evaluation_results.append(result)
-                    
-                except Exception as e:
-                    self.logger.error(f"Failed to evaluate query: {str(e)}")
-                    continue
+            # Run evaluations; unchanged samples are served from the cache
+            evaluation_results = await self.evaluation_executor.evaluate_many(sample_queries)
             
             # Store results
             self.evaluation_history.extend(evaluation_results)
@@ -382,6 +378,7 @@ class QualityMonitor:
         
         return {
             "status": self.status.value,
+            "evaluation_executor": self.evaluation_executor.get_stats(),
             "start_time": self.start_time.isoformat() if self.start_time else None,
             "uptime_hours": stats.monitoring_uptime_hours,
             "statistics": {
@@ -487,16 +484,9 @@ class QualityMonitor:
         try:
             # Generate and evaluate queries
             sample_queries = await self._generate_sample_queries()
-            evaluation_results = []
-            
-            for query_data in sample_queries:
-                result = await self.quality_service.evaluate_single_query(
-                    question=query_data["question"],
-                    contexts=query_data["contexts"],
-                    answer=query_data["answer"],
-                    ground_truth=query_data.get("ground_truth")
-                )
-                evaluation_results.append(result)
+            evaluation_results = await self.evaluation_executor.evaluate_many(
+                sample_queries, raise_errors=True
+            )
             
             # Store results in history
             self.evaluation_history.extend(evaluation_results)
@@ -28,6 +28,7 @@ import numpy as np
 from pydantic import BaseModel, Field, field_validator
 
 try:
+    import ragas
     from ragas import evaluate
     from ragas.metrics import (
         faithfulness, 
@@ -37,19 +38,22 @@ try:
         context_relevancy
     )
     RAGAS_AVAILABLE = True
+    RAGAS_VERSION = getattr(ragas, "__version__", "unknown")
 except ImportError:
     RAGAS_AVAILABLE = False
+    RAGAS_VERSION = "mock"
     # Mock classes for testing without RAGAS installed
     class MockMetric:
         pass
     faithfulness = answer_relevancy = context_precision = context_recall = context_relevancy = MockMetric()
     
-    def evaluate(*args, **kwargs):
+    def evaluate(dataset=None, *args, **kwargs):
+        rows = len(dataset) if dataset is not None else 1
         return pd.DataFrame({
-            'faithfulness': [0.8],
-            'answer_relevancy': [0.85], 
-            'context_precision': [0.75],
-            'context_recall': [0.82]
+            'faithfulness': [0.8] * rows,
+            'answer_relevancy': [0.85] * rows, 
+            'context_precision': [0.75] * rows,
+            'context_recall': [0.82] * rows
         })
 
 from arete.config import Settings, get_settings
@@ -242,12 +246,29 @@ class RAGASQualityService:
         self,
         settings: Optional[Settings] = None,
         thresholds: Optional[QualityThresholds] = None,
-        metrics_config: Optional[QualityMetrics] = None
+        metrics_config: Optional[QualityMetrics] = None,
+        evaluator_llm: Optional[Any] = None,
+        evaluator_embeddings: Optional[Any] = None,
+        evaluator_model: Optional[str] = None
     ):
-        """Initialize RAGAS quality service."""
+        """
+        Initialize RAGAS quality service.
+        
+        Args:
+            settings: Application settings
+            thresholds: Quality thresholds
+            metrics_config: Enabled metrics and weights
+            evaluator_llm: LLM judging the RAGAS metrics (RAGAS default if None)
+            evaluator_embeddings: Embeddings used by RAGAS metrics (RAGAS default if None)
+            evaluator_model: Identifier of the evaluator; derived from the RAGAS
+                version, LLM and embeddings if not given
+        """
         self.settings = settings or get_settings()
         self.thresholds = thresholds or QualityThresholds()
         self.metrics = metrics_config or QualityMetrics()
+        self.evaluator_llm = evaluator_llm
+        self.evaluator_embeddings = evaluator_embeddings
+        self._evaluator_model = evaluator_model
         self.logger = logging.getLogger(__name__)
         
         # Warn if RAGAS is not available
@@ -257,6 +278,28 @@ class RAGASQualityService:
         # Initialize custom metrics
         self._initialize_philosophical_metrics()
     
+    @property
+    def evaluator_model(self) -> str:
+        """Identifier of the evaluator; results from another evaluator are not comparable."""
+        return self._evaluator_model or self._describe_evaluator()
+    
+    def _describe_evaluator(self) -> str:
+        """Identify the evaluator by RAGAS version and the models it scores with."""
+        def model_name(component: Any, default: str) -> str:
+            if component is None:
+                return default
+            for attribute in ("model_name", "model"):
+                value = getattr(component, attribute, None)
+                if isinstance(value, str) and value:
+                    return value
+            return type(component).__name__
+        
+        return ":".join([
+            f"ragas-{RAGAS_VERSION}",
+            model_name(self.evaluator_llm, "default-llm"),
+            model_name(self.evaluator_embeddings, "default-embeddings"),
+        ])
+    
     def _initialize_philosophical_metrics(self):
         """Initialize philosophical domain-specific metrics."""
         
@@ -348,58 +391,129 @@ class RAGASQualityService:
             query_id = str(uuid4())
         
         try:
-            # Prepare data for RAGAS evaluation
-            eval_data = {
-                'question': [question],
-                'contexts': [contexts], 
-                'answer': [answer]
-            }
-            
-            if ground_truth:
-                eval_data['ground_truth'] = [ground_truth]
-            
-            eval_dataset = pd.DataFrame(eval_data)
-            
-            # Run RAGAS evaluation
-            ragas_metrics = [faithfulness, answer_relevancy, context_precision, context_recall]
-            result = evaluate(eval_dataset, metrics=ragas_metrics)
+            ragas_scores = self._run_ragas_evaluation([{
+                'question': question,
+                'contexts': contexts,
+                'answer': answer,
+                'ground_truth': ground_truth
+            }])[0]
             
-            # Extract scores
-            faithfulness_score = float(result['faithfulness'].iloc[0])
-            answer_relevancy_score = float(result['answer_relevancy'].iloc[0])
-            context_precision_score = float(result['context_precision'].iloc[0])
-            context_recall_score = float(result['context_recall'].iloc[0])
-            
-            # Calculate philosophical domain metrics
-            philosophical_scores = self.evaluate_philosophical_quality({
-                "response": answer,
-                "contexts": contexts
-            })
-            
-            # Create evaluation result
-            evaluation_result = EvaluationResult(
-                query_id=query_id,
-                question=question,
-                faithfulness_score=faithfulness_score,
-                answer_relevancy_score=answer_relevancy_score,
-                context_precision_score=context_precision_score,
-                context_recall_score=context_recall_score,
-                argument_coherence_score=philosophical_scores.get('argument_coherence_score'),
-                conceptual_clarity_score=philosophical_scores.get('conceptual_clarity_score'),
-                textual_fidelity_score=philosophical_scores.get('textual_fidelity_score'),
-                dialogical_quality_score=philosophical_scores.get('dialogical_quality_score'),
-                evaluation_duration_ms=(datetime.now() - start_time).total_seconds() * 1000
+            return self._build_evaluation_result(
+                query_id, question, contexts, answer, ragas_scores, start_time
             )
             
-            # Calculate overall score
-            evaluation_result.overall_quality_score = evaluation_result.calculate_overall_score()
-            
-            return evaluation_result
-            
         except Exception as e:
             self.logger.error(f"Error evaluating query {query_id}: {str(e)}")
             raise
     
+    async def evaluate_samples_batched(
+        self,
+        samples: List[Dict[str, Any]]
+    ) -> List[EvaluationResult]:
+        """
+        Evaluate several samples with a single RAGAS call.
+        
+        The blocking RAGAS evaluation runs in a worker thread so concurrent
+        batches can overlap.
+        
+        Args:
+            samples: Dicts with question, contexts, answer and optional
+                ground_truth and query_id; all samples must either have or
+                lack ground truth
+            
+        Returns:
+            Evaluation results in sample order
+        """
+        if not samples:
+            return []
+        
+        start_time = datetime.now()
+        ragas_scores = await asyncio.to_thread(self._run_ragas_evaluation, samples)
+        
+        return [
+            self._build_evaluation_result(
+                sample.get("query_id") or str(uuid4()),
+                sample["question"],
+                sample["contexts"],
+                sample["answer"],
+                scores,
+                start_time
+            )
+            for sample, scores in zip(samples, ragas_scores)
+        ]
+    
+    def _run_ragas_evaluation(self, samples: List[Dict[str, Any]]) -> List[Dict[str, float]]:
+        """Run RAGAS core metrics over samples and return per-sample scores."""
+        eval_data = {
+            'question': [sample['question'] for sample in samples],
+            'contexts': [sample['contexts'] for sample in samples],
+            'answer': [sample['answer'] for sample in samples]
+        }
+        
+        if all(sample.get('ground_truth') for sample in samples):
+            eval_data['ground_truth'] = [sample['ground_truth'] for sample in samples]
+        
+        eval_dataset = pd.DataFrame(eval_data)
+        
+        # Run RAGAS evaluation
+        ragas_metrics = [faithfulness, answer_relevancy, context_precision, context_recall]
+        evaluator_kwargs = {}
+        if self.evaluator_llm is not None:
+            evaluator_kwargs['llm'] = self.evaluator_llm
+        if self.evaluator_embeddings is not None:
+            evaluator_kwargs['embeddings'] = self.evaluator_embeddings
+        result = evaluate(eval_dataset, metrics=ragas_metrics, **evaluator_kwargs)
+        
+        metric_names = ['faithfulness', 'answer_relevancy', 'context_precision', 'context_recall']
+        return [
+            {name: float(result[name].iloc[index]) for name in metric_names}
+            for index in range(len(samples))
+        ]
+    
+    def _build_evaluation_result(
+        self,
+        query_id: str,
+        question: str,
+        contexts: List[str],
+        answer: str,
+        ragas_scores: Dict[str, float],
+        start_time: datetime
+    ) -> EvaluationResult:
+        """Combine RAGAS scores and philosophical metrics into a result."""
+        # Calculate philosophical domain metrics
+        philosophical_scores = self.evaluate_philosophical_quality({
+            "response": answer,
+            "contexts": contexts
+        })
+        
+        # Create evaluation result
+        evaluation_result = EvaluationResult(
+            query_id=query_id,
+            question=question,
+            faithfulness_score=ragas_scores['faithfulness'],
+            answer_relevancy_score=ragas_scores['answer_relevancy'],
+            context_precision_score=ragas_scores['context_precision'],
+            context_recall_score=ragas_scores['context_recall'],
+            overall_quality_score=0.0,
+            argument_coherence_score=philosophical_scores.get('argument_coherence_score'),
+            conceptual_clarity_score=philosophical_scores.get('conceptual_clarity_score'),
+            textual_fidelity_score=philosophical_scores.get('textual_fidelity_score'),
+            dialogical_quality_score=philosophical_scores.get('dialogical_quality_score'),
+            evaluation_duration_ms=(datetime.now() - start_time).total_seconds() * 1000
+        )
+        
+        # Calculate overall score
+        evaluation_result.overall_quality_score = evaluation_result.calculate_overall_score()
+        
+        return evaluation_result
+    
+    def get_metric_set(self) -> List[str]:
+        """Get the sorted names of all metrics contributing to a result."""
+        return sorted(
+            [metric.value for metric in self.metrics.enabled_metrics]
+            + list(self.metrics.custom_metrics.keys())
+        )
+    
     async def evaluate_batch(
         self, 
         evaluation_data: List[Dict[str, Any]]
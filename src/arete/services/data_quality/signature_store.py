@@ -0,0 +1,285 @@
+"""
+Persistent duplicate-signature store for Arete Graph-RAG system.
+
+Keeps, per indexed item, a content hash, a MinHash signature and an optional
+L2-normalized embedding in a local SQLite file. On open, signatures are
+loaded into memory once (hash map, LSH index and a growable embedding
+matrix); afterwards, checking a new item costs a hash lookup, a handful of
+LSH bucket probes and one matrix-vector product, and appending it is a
+single insert.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+from .minhash_lsh import LSHIndex, MinHasher
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(text: str) -> str:
+    """Compute the exact-match hash of an item's text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SignatureMatches:
+    """Stored items matching a probe, grouped by how they matched."""
+
+    exact: List[str] = field(default_factory=list)
+    near: List[Tuple[str, float]] = field(default_factory=list)
+    semantic: List[Tuple[str, float]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.exact or self.near or self.semantic)
+
+
+class DuplicateSignatureStore:
+    """
+    SQLite-backed store of duplicate-detection signatures.
+
+    Pass ``":memory:"`` as the path for a transient store that lives only as
+    long as the object.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        minhasher: Optional[MinHasher] = None,
+        lsh_threshold: float = 0.5
+    ) -> None:
+        """
+        Initialize signature store and load existing signatures.
+
+        Args:
+            path: Path to the SQLite database file, or ":memory:"
+            minhasher: MinHash signer; must match the one used to build the file
+            lsh_threshold: Jaccard similarity around which LSH candidates collide
+        """
+        self.path = path
+        self.minhasher = minhasher or MinHasher()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False)
+
+        self._hashes: Dict[str, List[str]] = {}
+        self._item_ids: Set[str] = set()
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._lsh = LSHIndex(num_perm=self.minhasher.num_perm, threshold=lsh_threshold)
+        self._embedding_ids: List[str] = []
+        self._embeddings: Optional[np.ndarray] = None
+
+        self._initialize()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._item_ids)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._item_ids
+
+    def _initialize(self) -> None:
+        """Create the signature table if it does not exist yet."""
+        with self._conn:
+            if self.path != ":memory:":
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS duplicate_signatures ("
+                "item_id TEXT PRIMARY KEY, content_hash TEXT NOT NULL, "
+                "num_perm INTEGER NOT NULL, minhash BLOB NOT NULL, "
+                "embedding BLOB, created_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_duplicate_signatures_hash "
+                "ON duplicate_signatures (content_hash)"
+            )
+
+    def _load(self) -> None:
+        """Load all stored signatures into the in-memory indexes."""
+        rows = self._conn.execute(
+            "SELECT item_id, content_hash, num_perm, minhash, embedding "
+            "FROM duplicate_signatures ORDER BY created_at"
+        ).fetchall()
+
+        skipped = 0
+        for item_id, digest, num_perm, minhash, embedding in rows:
+            if num_perm != self.minhasher.num_perm:
+                skipped += 1
+                continue
+            signature = np.frombuffer(minhash, dtype=np.uint64)
+            vector = np.frombuffer(embedding, dtype=np.float32) if embedding else None
+            self._index(item_id, digest, signature, vector)
+
+        if skipped:
+            logger.warning(
+                f"Ignored {skipped} stored signatures with a different num_perm "
+                f"than {self.minhasher.num_perm}"
+            )
+        logger.debug(f"Loaded {len(self._item_ids)} duplicate signatures from {self.path}")
+
+    def _index(
+        self,
+        item_id: str,
+        digest: str,
+        signature: np.ndarray,
+        embedding: Optional[np.ndarray]
+    ) -> None:
+        """Add a signature to the in-memory indexes."""
+        self._item_ids.add(item_id)
+        self._hashes.setdefault(digest, []).append(item_id)
+        self._signatures[item_id] = signature
+        self._lsh.insert(item_id, signature)
+        if embedding is not None:
+            self._append_embedding(item_id, embedding)
+
+    def _append_embedding(self, item_id: str, embedding: np.ndarray) -> None:
+        """Append a row to the embedding matrix, growing it geometrically."""
+        count = len(self._embedding_ids)
+        if self._embeddings is None:
+            self._embeddings = np.empty((16, embedding.shape[0]), dtype=np.float32)
+        elif embedding.shape[0] != self._embeddings.shape[1]:
+            logger.warning(f"Skipping embedding for {item_id}: dimension mismatch")
+            return
+        elif count == self._embeddings.shape[0]:
+            grown = np.empty((count * 2, self._embeddings.shape[1]), dtype=np.float32)
+            grown[:count] = self._embeddings
+            self._embeddings = grown
+
+        self._embeddings[count] = embedding
+        self._embedding_ids.append(item_id)
+
+    @staticmethod
+    def _normalize(embedding: Iterable[float]) -> Optional[np.ndarray]:
+        """L2-normalize an embedding, returning None for zero vectors."""
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def add(
+        self,
+        item_id: str,
+        text: str,
+        embedding: Optional[Iterable[float]] = None
+    ) -> None:
+        """
+        Sign and persist an item. Items already in the store are skipped.
+
+        Args:
+            item_id: Unique item identifier
+            text: Item text
+            embedding: Optional embedding of the text
+        """
+        with self._lock:
+            if item_id in self._item_ids:
+                return
+
+            digest = content_hash(text)
+            signature = self.minhasher.signature(text)
+            vector = self._normalize(embedding) if embedding is not None else None
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO duplicate_signatures "
+                "(item_id, content_hash, num_perm, minhash, embedding, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    item_id, digest, self.minhasher.num_perm, signature.tobytes(),
+                    vector.tobytes() if vector is not None else None, time.time()
+                ),
+            )
+            self._conn.commit()
+            self._index(item_id, digest, signature, vector)
+
+    def query(
+        self,
+        text: str,
+        embedding: Optional[Iterable[float]] = None,
+        near_threshold: float = 0.8,
+        semantic_threshold: float = 0.8,
+        exclude: Optional[str] = None
+    ) -> SignatureMatches:
+        """
+        Find stored items duplicating a text.
+
+        Args:
+            text: Text to check
+            embedding: Optional embedding of the text for semantic matches
+            near_threshold: Minimum estimated Jaccard similarity of shingles
+            semantic_threshold: Minimum cosine similarity of embeddings
+            exclude: Item ID to leave out of the matches (the probe itself)
+
+        Returns:
+            Matches by exact hash, MinHash estimate and embedding similarity
+        """
+        matches = SignatureMatches()
+        if not text:
+            return matches
+
+        with self._lock:
+            exact = [
+                item_id for item_id in self._hashes.get(content_hash(text), [])
+                if item_id != exclude
+            ]
+            matches.exact = exact
+            seen = set(exact)
+
+            signature = self.minhasher.signature(text)
+            for item_id in self._lsh.query(signature):
+                if item_id in seen or item_id == exclude:
+                    continue
+                similarity = MinHasher.estimate_jaccard(signature, self._signatures[item_id])
+                if similarity >= near_threshold:
+                    matches.near.append((item_id, similarity))
+                    seen.add(item_id)
+
+            vector = self._normalize(embedding) if embedding is not None else None
+            count = len(self._embedding_ids)
+            if vector is not None and count and vector.shape[0] == self._embeddings.shape[1]:
+                similarities = self._embeddings[:count] @ vector
+                for index in np.nonzero(similarities >= semantic_threshold)[0].tolist():
+                    item_id = self._embedding_ids[index]
+                    if item_id in seen or item_id == exclude:
+                        continue
+                    matches.semantic.append((item_id, float(similarities[index])))
+
+        matches.near.sort(key=lambda match: match[1], reverse=True)
+        matches.semantic.sort(key=lambda match: match[1], reverse=True)
+        return matches
+
+    def remove(self, item_id: str) -> None:
+        """Remove an item's signatures and rebuild the in-memory indexes."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM duplicate_signatures WHERE item_id = ?", (item_id,)
+            )
+            self._conn.commit()
+        self._reload()
+
+    def clear(self) -> None:
+        """Remove all stored signatures."""
+        with self._lock:
+            self._conn.execute("DELETE FROM duplicate_signatures")
+            self._conn.commit()
+        self._reload()
+
+    def _reload(self) -> None:
+        """Rebuild the in-memory indexes from the database."""
+        with self._lock:
+            self._hashes = {}
+            self._item_ids = set()
+            self._signatures = {}
+            self._lsh = LSHIndex(num_perm=self.minhasher.num_perm, threshold=self._lsh.threshold)
+            self._embedding_ids = []
+            self._embeddings = None
+            self._load()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -8,7 +8,7 @@ and advanced generation features.
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Union
+from typing import AsyncIterator, List, Dict, Any, Optional, Union
 import json
 
 import httpx
@@ -17,13 +17,16 @@ from arete.services.llm_provider import (
     LLMProvider,
     LLMMessage,
     LLMResponse,
+    LLMStreamChunk,
     MessageRole,
     LLMProviderError,
     ProviderUnavailableError,
     RateLimitError,
-    AuthenticationError
+    AuthenticationError,
+    collect_stream
 )
 from arete.config import Settings
+from arete.services.llm_async_core import pooled_http_client, run_sync
 
 # Setup logger
 logger = logging.getLogger(__name__)
@@ -112,7 +115,7 @@ class GeminiProvider(LLMProvider):
                 self._initialized = True
             else:
                 # We're not in an async context, run synchronously
-                asyncio.run(init_check())
+                run_sync(init_check())
                 self._initialized = True
         
         except Exception as e:
@@ -138,7 +141,7 @@ class GeminiProvider(LLMProvider):
         try:
             url = self._get_models_url()
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_client(self.timeout) as client:
                 response = await client.get(url)
                 
                 if response.status_code == 403:
@@ -221,7 +224,7 @@ class GeminiProvider(LLMProvider):
         # Use defaults if not provided
         model = model or self._get_default_model(self._available_models)
         max_tokens = max_tokens or self.max_tokens
-        temperature = temperature or self.temperature
+        temperature = temperature if temperature is not None else self.temperature
         
         try:
             if stream:
@@ -263,7 +266,7 @@ class GeminiProvider(LLMProvider):
         
         url = self._get_generation_url(model)
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with pooled_http_client(self.timeout) as client:
             response = await client.post(url, json=request_data)
             
             await self._handle_api_errors(response)
@@ -288,6 +291,52 @@ class GeminiProvider(LLMProvider):
                 }
             )
 
+    async def stream_response(
+        self,
+        messages: List[LLMMessage],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a response from the Gemini API as content deltas.
+        
+        Args:
+            messages: Conversation messages
+            model: Model to use (defaults to available model)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional parameters
+            
+        Yields:
+            Response chunks; the last one carries finish reason and usage
+            
+        Raises:
+            LLMProviderError: If generation fails
+            ProviderUnavailableError: If API is unavailable
+        """
+        if not self._initialized:
+            raise LLMProviderError("Provider not initialized. Call initialize() first.")
+        
+        model = model or self._get_default_model(self._available_models)
+        max_tokens = max_tokens or self.max_tokens
+        temperature = temperature if temperature is not None else self.temperature
+        kwargs.pop("stream", None)
+        
+        try:
+            async for chunk in self._stream_chunks(
+                messages, model, max_tokens, temperature, **kwargs
+            ):
+                yield chunk
+        except httpx.ConnectError as e:
+            raise ProviderUnavailableError(
+                f"Gemini API unavailable: {e}",
+                provider=self.name
+            )
+        except httpx.TimeoutException as e:
+            raise LLMProviderError(f"Request timeout: {e}")
+
     async def _generate_streaming(
         self,
         messages: List[LLMMessage],
@@ -297,6 +346,21 @@ class GeminiProvider(LLMProvider):
         **kwargs
     ) -> LLMResponse:
         """Generate response using streaming mode."""
+        return await collect_stream(
+            self._stream_chunks(messages, model, max_tokens, temperature, **kwargs),
+            self.name,
+            model
+        )
+
+    async def _stream_chunks(
+        self,
+        messages: List[LLMMessage],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        **kwargs
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Yield text deltas from the streamGenerateContent event stream."""
         request_data = self._build_request_params(
             messages=messages,
             model=model,
@@ -306,64 +370,63 @@ class GeminiProvider(LLMProvider):
             **kwargs
         )
         
-        url = self._get_generation_url(model, stream=True)
-        content_parts = []
+        # Server-sent events deliver one complete JSON chunk per data line
+        url = self._get_generation_url(model, stream=True) + "&alt=sse"
         final_usage = None
         final_finish_reason = None
         safety_ratings = []
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with pooled_http_client(self.timeout) as client:
             async with client.stream("POST", url, json=request_data) as response:
                 
                 await self._handle_api_errors(response)
                 
                 async for line in response.aiter_lines():
-                    if line.strip():
-                        try:
-                            chunk_data = json.loads(line)
-                            
-                            if "candidates" in chunk_data and chunk_data["candidates"]:
-                                candidate = chunk_data["candidates"][0]
-                                
-                                # Extract content
-                                if "content" in candidate and "parts" in candidate["content"]:
-                                    for part in candidate["content"]["parts"]:
-                                        if "text" in part:
-                                            content_parts.append(part["text"])
-                                
-                                # Check finish reason
-                                if "finishReason" in candidate:
-                                    final_finish_reason = candidate["finishReason"].lower()
-                                
-                                # Extract safety ratings
-                                if "safetyRatings" in candidate:
-                                    safety_ratings = candidate["safetyRatings"]
-                            
-                            # Extract usage info if available
-                            if "usageMetadata" in chunk_data:
-                                final_usage = chunk_data["usageMetadata"]
-                                
-                        except json.JSONDecodeError:
-                            continue
-        
-        full_content = "".join(content_parts)
-        total_tokens = None
-        
-        if final_usage:
-            total_tokens = final_usage.get("totalTokenCount")
+                    line = line.strip()
+                    if line.startswith("data: "):
+                        line = line[6:]
+                    if not line:
+                        continue
+                    
+                    try:
+                        chunk_data = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    
+                    if "candidates" in chunk_data and chunk_data["candidates"]:
+                        candidate = chunk_data["candidates"][0]
+                        
+                        # Extract content
+                        text = "".join(
+                            part.get("text", "")
+                            for part in candidate.get("content", {}).get("parts", [])
+                        )
+                        if text:
+                            yield LLMStreamChunk(delta=text, provider=self.name, model=model)
+                        
+                        # Check finish reason
+                        if "finishReason" in candidate:
+                            final_finish_reason = candidate["finishReason"].lower()
+                        
+                        # Extract safety ratings
+                        if "safetyRatings" in candidate:
+                            safety_ratings = candidate["safetyRatings"]
+                    
+                    # Extract usage info if available
+                    if "usageMetadata" in chunk_data:
+                        final_usage = chunk_data["usageMetadata"]
         
         # Check for safety blocking
         if final_finish_reason == "safety":
             raise LLMProviderError("Content blocked by safety filters")
         
-        return LLMResponse(
-            content=full_content,
-            usage_tokens=total_tokens,
+        yield LLMStreamChunk(
+            delta="",
             provider=self.name,
             model=model,
             finish_reason=final_finish_reason or "stop",
+            usage_tokens=final_usage.get("totalTokenCount") if final_usage else None,
             metadata={
-                "streaming": True,
                 "safety_ratings": safety_ratings,
                 "usage": final_usage or {},
                 "model_info": self._model_info.get(model, {})
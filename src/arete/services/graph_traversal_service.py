@@ -16,7 +16,7 @@ import re
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union, Tuple
+from typing import Any, Dict, List, Optional, Union
 from uuid import UUID, uuid4
 from contextlib import contextmanager
 
@@ -28,8 +28,11 @@ if TYPE_CHECKING:
     from ..services.dense_retrieval_service import SearchResult
 
 from ..config import Settings, get_settings
+from ..database.graph_version import GraphVersionTracker, get_graph_version_tracker
 from ..models.entity import Entity, EntityType
+from ..processing.entity_mentions import LOAD_MENTIONS_QUERY, EntityMentionIndex
 from .base import ServiceError
+from .result_cache import LRUCache, SQLiteCacheStore, make_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -110,6 +113,7 @@ class CypherQuery:
     estimated_complexity: int = 1
     timeout_seconds: int = 30
     query_type: str = "general"
+    max_depth: int = 1
     
     def __post_init__(self):
         """Calculate estimated complexity if not provided."""
@@ -143,10 +147,17 @@ class CypherQuery:
         return any(keyword in cypher_upper for keyword in required_keywords)
     
     def get_cache_key(self) -> str:
-        """Generate cache key for this query."""
-        import hashlib
-        query_str = f"{self.cypher}_{str(sorted(self.parameters.items()))}"
-        return hashlib.md5(query_str.encode()).hexdigest()
+        """Generate cache key from normalized query type, entities, depth and filters."""
+        parameters = {
+            name: " ".join(value.lower().split()) if isinstance(value, str) else value
+            for name, value in self.parameters.items()
+        }
+        return make_cache_key(
+            self.query_type,
+            self.max_depth,
+            parameters,
+            " ".join(self.cypher.split())
+        )
 
 
 @dataclass
@@ -309,7 +320,8 @@ class CypherQueryGenerator:
         return CypherQuery(
             cypher=cypher.strip(),
             parameters=parameters,
-            query_type="entity_lookup"
+            query_type="entity_lookup",
+            max_depth=0
         )
     
     def generate_relationship_traversal(self, entities: List[EntityMention]) -> CypherQuery:
@@ -339,7 +351,8 @@ class CypherQueryGenerator:
             cypher=cypher.strip(),
             parameters={"name": entity.normalized_text},
             query_type="single_entity_relations",
-            estimated_complexity=3
+            estimated_complexity=3,
+            max_depth=1
         )
     
     def _generate_multi_entity_paths(self, entities: List[EntityMention]) -> CypherQuery:
@@ -367,7 +380,8 @@ class CypherQueryGenerator:
                 "name2": entity2.normalized_text
             },
             query_type="multi_entity_paths",
-            estimated_complexity=5
+            estimated_complexity=5,
+            max_depth=self.max_path_length
         )
     
     def generate_deep_traversal(self, entities: List[EntityMention], max_depth: int = 2) -> CypherQuery:
@@ -391,7 +405,8 @@ class CypherQueryGenerator:
             cypher=cypher.strip(),
             parameters={"start_name": entity.normalized_text},
             query_type="deep_traversal",
-            estimated_complexity=max_depth * 2 + 1
+            estimated_complexity=max_depth * 2 + 1,
+            max_depth=max_depth
         )
 
 
@@ -401,11 +416,23 @@ class GraphTraversalService:
     def __init__(
         self,
         neo4j_client: Optional["Neo4jClient"] = None,
-        settings: Optional[Settings] = None
+        settings: Optional[Settings] = None,
+        graph_version_tracker: Optional[GraphVersionTracker] = None,
+        mention_index: Optional[EntityMentionIndex] = None
     ):
-        """Initialize graph traversal service."""
+        """Initialize graph traversal service.
+        
+        The entity mention index is loaded from the graph on first use and
+        reloaded whenever the graph version changes; an index passed in is
+        used until then.
+        """
         self.settings = settings or get_settings()
         self.neo4j_client = neo4j_client
+        self.mention_index = mention_index
+        self.graph_version_tracker = graph_version_tracker or get_graph_version_tracker()
+        self._mention_index_version: Optional[int] = (
+            self.graph_version_tracker.current if mention_index is not None else None
+        )
         
         # Initialize components
         self.entity_detector = EntityDetector(self.settings)
@@ -413,8 +440,20 @@ class GraphTraversalService:
         
         # Performance settings
         self.max_query_complexity = 8
-        self.cache_ttl_seconds = 300  # 5 minutes
-        self._query_cache: Dict[str, Tuple[List[GraphResult], float]] = {}
+        self.cache_ttl_seconds = self.settings.graph_cache_ttl_seconds
+        
+        # LRU result cache, optionally shared with other workers via a local store
+        shared_store = None
+        if self.settings.shared_cache_path:
+            shared_store = SQLiteCacheStore(
+                self.settings.shared_cache_path, namespace="graph_traversal"
+            )
+        self._query_cache = LRUCache(
+            max_size=self.settings.graph_cache_max_size,
+            ttl_seconds=self.cache_ttl_seconds,
+            shared_store=shared_store
+        )
+        self._cached_graph_version = self.graph_version_tracker.current
         
         logger.info("Initialized GraphTraversalService")
     
@@ -488,7 +527,7 @@ class GraphTraversalService:
         # Check cache first
         cache_key = query.get_cache_key()
         cached_result = self._get_cached_result(cache_key)
-        if cached_result:
+        if cached_result is not None:
             logger.debug("Returning cached query result")
             return cached_result
         
@@ -521,10 +560,8 @@ class GraphTraversalService:
     ) -> List["SearchResult"]:
         """Integrate graph results with existing search results."""
         try:
-            # Import SearchResult here to avoid circular import
-            from ..services.dense_retrieval_service import SearchResult
-            
             integrated_results = list(search_results)  # Copy existing results
+            self.refresh_mention_index()
             
             # Convert graph results to SearchResult format
             for graph_result in graph_results:
@@ -544,9 +581,15 @@ class GraphTraversalService:
                     "graph_confidence": graph_result.confidence
                 }
                 
-                # Update existing results that match this entity
+                # Update existing results that match this entity, using the
+                # ingest-time mention index when it covers the entity
+                mentioning_chunk_ids = self._get_mentioning_chunk_ids(graph_result.entity)
                 for result in integrated_results:
-                    if self._entity_matches_chunk(graph_result.entity, result.chunk):
+                    if mentioning_chunk_ids is not None:
+                        matches = str(result.chunk.id) in mentioning_chunk_ids
+                    else:
+                        matches = self._entity_matches_chunk(graph_result.entity, result.chunk)
+                    if matches:
                         result.enhanced_score = enhanced_score
                         result.metadata.update(metadata)
             
@@ -579,6 +622,42 @@ class GraphTraversalService:
         enhanced_score = min(base_score + relationship_boost + confidence_boost - path_penalty, 1.0)
         return enhanced_score
     
+    def set_mention_index(self, mention_index: Optional[EntityMentionIndex]) -> None:
+        """Set the entity mention index used for graph-to-chunk expansion."""
+        self.mention_index = mention_index
+        self._mention_index_version = self.graph_version_tracker.current
+    
+    def refresh_mention_index(self) -> None:
+        """Load the mention index from the graph if it is missing or stale.
+        
+        Failures are logged and retried only after the next graph change;
+        until then entities the index does not cover fall back to text
+        matching.
+        """
+        graph_version = self.graph_version_tracker.current
+        if graph_version == self._mention_index_version:
+            return
+        if not self.neo4j_client or not self.neo4j_client.is_connected:
+            return
+        
+        try:
+            with self.neo4j_client.session() as session:
+                rows = [dict(record) for record in session.run(LOAD_MENTIONS_QUERY)]
+            self.mention_index = EntityMentionIndex.from_mention_rows(rows)
+            logger.info(
+                f"Loaded entity mention index with {len(self.mention_index)} entries "
+                f"for graph version {graph_version}"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to load entity mention index: {e}")
+        self._mention_index_version = graph_version
+    
+    def _get_mentioning_chunk_ids(self, entity: Entity) -> Optional[set]:
+        """Look up chunks mentioning an entity, or None if the index does not cover it."""
+        if self.mention_index is None or not self.mention_index.knows_entity(entity):
+            return None
+        return self.mention_index.get_chunk_ids(entity)
+    
     def _entity_matches_chunk(self, entity: Entity, chunk) -> bool:
         """Check if an entity is mentioned in a chunk."""
         # Simple text matching - would use more sophisticated NLP in practice
@@ -598,30 +677,29 @@ class GraphTraversalService:
             if elapsed > timeout_seconds:
                 logger.warning(f"Query exceeded timeout: {elapsed:.2f}s > {timeout_seconds}s")
     
+    def _versioned_cache_key(self, cache_key: str) -> str:
+        """Scope a cache key to the current graph version.
+        
+        Local entries computed against an older graph are dropped as soon as
+        a new version is observed; shared entries simply stop matching.
+        """
+        graph_version = self.graph_version_tracker.current
+        if graph_version != self._cached_graph_version:
+            logger.debug(
+                f"Graph version changed {self._cached_graph_version} -> {graph_version}, "
+                "invalidating traversal cache"
+            )
+            self._query_cache.clear()
+            self._cached_graph_version = graph_version
+        return f"v{graph_version}:{cache_key}"
+    
     def _get_cached_result(self, cache_key: str) -> Optional[List[GraphResult]]:
         """Get cached query result if still valid."""
-        if cache_key in self._query_cache:
-            results, timestamp = self._query_cache[cache_key]
-            if time.time() - timestamp < self.cache_ttl_seconds:
-                return results
-            else:
-                # Remove expired cache entry
-                del self._query_cache[cache_key]
-        return None
+        return self._query_cache.get(self._versioned_cache_key(cache_key))
     
     def _cache_result(self, cache_key: str, results: List[GraphResult]) -> None:
         """Cache query results."""
-        self._query_cache[cache_key] = (results, time.time())
-        
-        # Simple cache size management
-        if len(self._query_cache) > 100:
-            # Remove oldest entries
-            oldest_keys = sorted(
-                self._query_cache.keys(),
-                key=lambda k: self._query_cache[k][1]
-            )[:20]
-            for key in oldest_keys:
-                del self._query_cache[key]
+        self._query_cache.set(self._versioned_cache_key(cache_key), results)
     
     def _convert_records_to_results(self, records: List[Any], query_type: str) -> List[GraphResult]:
         """Convert Neo4j records to GraphResult objects."""
@@ -705,13 +783,16 @@ class GraphTraversalService:
     
     def clear_cache(self) -> None:
         """Clear query result cache."""
-        self._query_cache.clear()
+        self._query_cache.clear(include_shared=True)
         logger.info("Query cache cleared")
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get service metrics."""
         return {
             "cache_size": len(self._query_cache),
+            "cache": self._query_cache.get_stats(),
+            "graph_version": self._cached_graph_version,
+            "mention_index_size": len(self.mention_index) if self.mention_index else 0,
             "max_complexity": self.max_query_complexity,
             "cache_ttl_seconds": self.cache_ttl_seconds,
             "is_initialized": self.is_initialized
@@ -721,7 +802,8 @@ class GraphTraversalService:
 # Factory function following established pattern
 def create_graph_traversal_service(
     neo4j_client: Optional["Neo4jClient"] = None,
-    settings: Optional[Settings] = None
+    settings: Optional[Settings] = None,
+    mention_index: Optional[EntityMentionIndex] = None
 ) -> GraphTraversalService:
     """
     Create graph traversal service with dependency injection.
@@ -729,6 +811,8 @@ def create_graph_traversal_service(
     Args:
         neo4j_client: Optional Neo4j client instance
         settings: Optional configuration settings
+        mention_index: Optional entity mention index built at ingest
+            (loaded from the graph if None)
         
     Returns:
         Configured GraphTraversalService instance
@@ -739,7 +823,11 @@ def create_graph_traversal_service(
         neo4j_client = Neo4jClient()
         neo4j_client.connect()
     
-    return GraphTraversalService(
+    service = GraphTraversalService(
         neo4j_client=neo4j_client,
-        settings=settings
-    )
\ No newline at end of file
+        settings=settings,
+        mention_index=mention_index
+    )
+    if mention_index is None:
+        service.refresh_mention_index()
+    return service
\ No newline at end of file
@@ -11,7 +11,9 @@ patterns in philosophical thought, including:
 
 The service integrates with Neo4j to analyze temporal patterns in the
 philosophical knowledge graph, providing insights for educational content
-and research analysis.
+and research analysis. Because historical data only changes at ingest time,
+timelines, period buckets and concept development chains can be materialized
+once per graph version and served without touching the database.
 """
 
 import logging
@@ -28,7 +30,9 @@ from pydantic import BaseModel, Field, ConfigDict
 
 from arete.config import get_settings
 from arete.database.client import Neo4jClient
+from arete.database.graph_version import GraphVersionTracker, get_graph_version_tracker
 from arete.models.entity import Entity, EntityType
+from arete.services.result_cache import SQLiteCacheStore
 
 logger = logging.getLogger(__name__)
 
@@ -94,19 +98,40 @@ class PeriodAnalysis:
     schools_of_thought: List[str] = field(default_factory=list)
     period_characteristics: List[str] = field(default_factory=list)
 
+@dataclass
+class TimelineMaterialization:
+    """Precomputed historical views for a single graph version."""
+    graph_version: int
+    events: List[HistoricalEvent] = field(default_factory=list)  # chronologically sorted
+    periods: Dict[TimePeriod, List[HistoricalEvent]] = field(default_factory=dict)
+    concept_evolutions: Dict[str, ConceptEvolution] = field(default_factory=dict)
+    concept_developments: Dict[str, ConceptEvolution] = field(default_factory=dict)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
 class HistoricalDevelopmentService:
     """Service for tracking historical development in philosophical thought."""
     
     def __init__(
         self,
         neo4j_client: Optional[Neo4jClient] = None,
-        settings: Optional[Any] = None
+        settings: Optional[Any] = None,
+        graph_version_tracker: Optional[GraphVersionTracker] = None
     ):
         """Initialize historical development service."""
         self.settings = settings or get_settings()
         self.neo4j_client = neo4j_client
         self.logger = logging.getLogger(__name__)
         
+        # Materialized timelines, keyed by graph version
+        self.graph_version_tracker = graph_version_tracker or get_graph_version_tracker()
+        self._materialization: Optional[TimelineMaterialization] = None
+        self._materialization_lock = asyncio.Lock()
+        self._failed_materialization_version: Optional[int] = None
+        self._artifact_store: Optional[SQLiteCacheStore] = None
+        shared_cache_path = getattr(self.settings, "shared_cache_path", "")
+        if shared_cache_path:
+            self._artifact_store = SQLiteCacheStore(shared_cache_path, namespace="historical_timelines")
+        
         # Date parsing patterns
         self.date_patterns = [
             r"(\d{1,4})\s*(BCE?|CE?|AD)",  # 384 BCE, 428 BC, 1225 CE, 1596 AD
@@ -203,8 +228,14 @@ class HistoricalDevelopmentService:
         """
         self.logger.info("Constructing historical timeline")
         
+        materialization = await self._get_materialization()
+        if materialization is not None:
+            return self._timeline_from_materialization(
+                materialization, entity_types, start_year, end_year
+            )
+        
         try:
-            async with self.client.session() as session:
+            async with self.client.async_session() as session:
                 events = await self._extract_historical_events(session, entity_types)
                 
                 # Filter by date range if specified
@@ -335,6 +366,13 @@ class HistoricalDevelopmentService:
         events: List[HistoricalEvent]
     ) -> Dict[str, ConceptEvolution]:
         """Analyze how concepts evolved over time."""
+        return self._build_concept_evolutions(events)
+    
+    def _build_concept_evolutions(
+        self,
+        events: List[HistoricalEvent]
+    ) -> Dict[str, ConceptEvolution]:
+        """Group concept events into evolutions with periods and influence chains."""
         concept_evolutions = {}
         
         # Group events by concept
@@ -389,8 +427,14 @@ class HistoricalDevelopmentService:
         """
         self.logger.info(f"Analyzing period: {period}")
         
+        materialization = await self._get_materialization()
+        if materialization is not None:
+            return self._period_analysis_from_events(
+                period, materialization.periods.get(period, [])
+            )
+        
         try:
-            async with self.client.session() as session:
+            async with self.client.async_session() as session:
                 # Get period boundaries
                 period_years = self._get_period_boundaries(period)
                 
@@ -516,8 +560,12 @@ class HistoricalDevelopmentService:
         """
         self.logger.info(f"Tracing development of concept: {concept_id}")
         
+        materialization = await self._get_materialization()
+        if materialization is not None and concept_id in materialization.concept_developments:
+            return materialization.concept_developments[concept_id]
+        
         try:
-            async with self.client.session() as session:
+            async with self.client.async_session() as session:
                 # Get concept and related historical information
                 query = """
                 MATCH (concept:Entity {id: $concept_id})
@@ -538,48 +586,253 @@ class HistoricalDevelopmentService:
                     raise HistoricalAnalysisError(f"Concept {concept_id} not found")
                 
                 concept_name = records[0]["concept_name"] or concept_id
+                return self._build_concept_development(concept_id, concept_name, records)
                 
-                # Build timeline events
-                timeline_events = []
-                for record in records:
-                    if record["related_id"] and record["date_string"]:
-                        date, confidence = self._parse_date(record["date_string"])
-                        if date:
-                            event = HistoricalEvent(
-                                entity_id=record["related_id"],
-                                entity_name=record["related_name"] or record["related_id"],
-                                entity_type=EntityType(record["related_type"]) if record["related_type"] else EntityType.OTHER,
-                                date=date,
-                                date_string=record["date_string"],
-                                period=self._determine_period(date),
-                                confidence_score=confidence
-                            )
-                            timeline_events.append(event)
-                
-                # Sort chronologically
-                timeline_events.sort(key=lambda e: e.date or datetime(1, 1, 1))
+        except Exception as e:
+            self.logger.error(f"Concept development tracing failed: {e}")
+            raise HistoricalAnalysisError(f"Failed to trace concept {concept_id}: {str(e)}")
+    
+    def _build_concept_development(
+        self,
+        concept_id: str,
+        concept_name: str,
+        records: List[Dict[str, Any]]
+    ) -> ConceptEvolution:
+        """Build a concept development chain from related-entity records."""
+        # Build timeline events
+        timeline_events = []
+        for record in records:
+            if record["related_id"] and record["date_string"]:
+                date, confidence = self._parse_date(record["date_string"])
+                if date:
+                    try:
+                        related_type = EntityType(record["related_type"]) if record["related_type"] else EntityType.OTHER
+                    except ValueError:
+                        related_type = EntityType.OTHER
+                    event = HistoricalEvent(
+                        entity_id=record["related_id"],
+                        entity_name=record["related_name"] or record["related_id"],
+                        entity_type=related_type,
+                        date=date,
+                        date_string=record["date_string"],
+                        period=self._determine_period(date),
+                        confidence_score=confidence
+                    )
+                    timeline_events.append(event)
+        
+        # Sort chronologically
+        timeline_events.sort(key=lambda e: e.date or datetime(1, 1, 1))
+        
+        # Analyze evolution periods
+        evolution_periods = defaultdict(list)
+        for event in timeline_events:
+            if event.period and event.entity_type == EntityType.PERSON:
+                evolution_periods[event.period].append(event.entity_id)
+        
+        # Chronological influence ordering between successive contributors
+        influence_chain = [
+            (current.entity_id, next_event.entity_id, current.date)
+            for current, next_event in zip(timeline_events, timeline_events[1:])
+        ]
+        
+        return ConceptEvolution(
+            concept_id=concept_id,
+            concept_name=concept_name,
+            timeline=timeline_events,
+            evolution_periods=dict(evolution_periods),
+            influence_chain=influence_chain
+        )
+    
+    # Timeline materialization
+    
+    async def materialize_timelines(self) -> TimelineMaterialization:
+        """
+        Precompute timelines, period buckets and concept development chains.
+        
+        Runs after ingest, and otherwise on the first query against a new graph
+        version. The result is keyed by the current graph version and, when a
+        shared cache path is configured, stored as a serialized artifact so
+        that other workers can reuse it.
+        
+        Returns:
+            TimelineMaterialization for the current graph version
+        """
+        graph_version = self.graph_version_tracker.current
+        self.logger.info(f"Materializing historical timelines for graph version {graph_version}")
+        
+        try:
+            async with self.client.async_session() as session:
+                events = await self._extract_historical_events(session, None)
+                events.sort(key=lambda e: e.date or datetime(1, 1, 1))
                 
-                # Analyze evolution periods
-                evolution_periods = defaultdict(list)
-                for event in timeline_events:
-                    if event.period and event.entity_type == EntityType.PERSON:
-                        evolution_periods[event.period].append(event.entity_id)
+                periods = defaultdict(list)
+                for event in events:
+                    if event.period:
+                        periods[event.period].append(event)
                 
-                return ConceptEvolution(
-                    concept_id=concept_id,
-                    concept_name=concept_name,
-                    timeline=timeline_events,
-                    evolution_periods=dict(evolution_periods)
+                # One query for every concept's related entities instead of one per trace
+                query = """
+                MATCH (concept:Entity {type: $concept_type})-[r]-(related:Entity)
+                WHERE related.id IS NOT NULL
+                OPTIONAL MATCH (related)-[:HAS_ATTRIBUTE]->(date_attr:Entity {type: 'DATE'})
+                RETURN concept.id as concept_id, concept.name as concept_name,
+                       related.id as related_id, related.name as related_name,
+                       related.type as related_type,
+                       date_attr.value as date_string,
+                       type(r) as relationship_type
+                """
+                result = await session.run(query, concept_type=EntityType.CONCEPT.value)
+                records = await result.data()
+            
+            records_by_concept = defaultdict(list)
+            concept_names = {}
+            for record in records:
+                records_by_concept[record["concept_id"]].append(record)
+                concept_names[record["concept_id"]] = record["concept_name"] or record["concept_id"]
+            
+            concept_developments = {
+                concept_id: self._build_concept_development(
+                    concept_id, concept_names[concept_id], concept_records
                 )
-                
+                for concept_id, concept_records in records_by_concept.items()
+            }
+            
+            materialization = TimelineMaterialization(
+                graph_version=graph_version,
+                events=events,
+                periods=dict(periods),
+                concept_evolutions=self._build_concept_evolutions(events),
+                concept_developments=concept_developments
+            )
+            
         except Exception as e:
-            self.logger.error(f"Concept development tracing failed: {e}")
-            raise HistoricalAnalysisError(f"Failed to trace concept {concept_id}: {str(e)}")
+            self.logger.error(f"Timeline materialization failed: {e}")
+            raise TimelineConstructionError(f"Failed to materialize timelines: {str(e)}")
+        
+        self._materialization = materialization
+        if self._artifact_store is not None:
+            self._artifact_store.set(
+                f"v{graph_version}", materialization, materialization.created_at.timestamp()
+            )
+        
+        self.logger.info(
+            f"Materialized {len(events)} events and "
+            f"{len(concept_developments)} concept development chains"
+        )
+        return materialization
+    
+    async def _get_materialization(self) -> Optional[TimelineMaterialization]:
+        """
+        Get materialized timelines for the current graph version.
+        
+        The first miss for a graph version materializes the timelines. If that
+        fails, None is returned and callers query Neo4j directly until the
+        graph changes.
+        """
+        graph_version = self.graph_version_tracker.current
+        materialization = self._load_materialization(graph_version)
+        if materialization is not None or self._failed_materialization_version == graph_version:
+            return materialization
+        
+        async with self._materialization_lock:
+            # Another caller may have materialized while this one waited
+            materialization = self._load_materialization(graph_version)
+            if materialization is None and self._failed_materialization_version != graph_version:
+                try:
+                    materialization = await self.materialize_timelines()
+                except TimelineConstructionError:
+                    self._failed_materialization_version = graph_version
+        return materialization
+    
+    def _load_materialization(self, graph_version: int) -> Optional[TimelineMaterialization]:
+        """Get already materialized timelines of a graph version from memory or the shared store."""
+        if self._materialization is not None and self._materialization.graph_version == graph_version:
+            return self._materialization
+        
+        self._materialization = None
+        if self._artifact_store is not None:
+            stored = self._artifact_store.get(f"v{graph_version}")
+            if stored is not None:
+                self._materialization = stored[0]
+        
+        return self._materialization
+    
+    def invalidate_materialization(self) -> None:
+        """Drop in-memory materialized timelines."""
+        self._materialization = None
+    
+    def _timeline_from_materialization(
+        self,
+        materialization: TimelineMaterialization,
+        entity_types: Optional[List[EntityType]],
+        start_year: Optional[int],
+        end_year: Optional[int]
+    ) -> HistoricalTimeline:
+        """Build a timeline view from materialized events."""
+        if not entity_types and not (start_year or end_year):
+            events = list(materialization.events)
+            periods = {period: list(bucket) for period, bucket in materialization.periods.items()}
+            concept_evolutions = dict(materialization.concept_evolutions)
+        else:
+            events = materialization.events
+            if entity_types:
+                allowed_types = set(entity_types)
+                events = [event for event in events if event.entity_type in allowed_types]
+            if start_year or end_year:
+                events = self._filter_events_by_date_range(events, start_year, end_year)
+            
+            # Events are already chronological, so filtering preserves order
+            periods = defaultdict(list)
+            for event in events:
+                if event.period:
+                    periods[event.period].append(event)
+            periods = dict(periods)
+            concept_evolutions = self._build_concept_evolutions(events)
+        
+        return HistoricalTimeline(
+            start_date=events[0].date if events else None,
+            end_date=events[-1].date if events else None,
+            events=events,
+            periods=periods,
+            concept_evolutions=concept_evolutions,
+            total_events=len(events)
+        )
+    
+    def _period_analysis_from_events(
+        self,
+        period: TimePeriod,
+        events: List[HistoricalEvent]
+    ) -> PeriodAnalysis:
+        """Build a period analysis from materialized period events."""
+        period_years = self._get_period_boundaries(period)
+        
+        key_figures = [
+            (event.entity_id, event.entity_name)
+            for event in events if event.entity_type == EntityType.PERSON
+        ]
+        dominant_concepts = [
+            (event.entity_id, event.entity_name)
+            for event in events if event.entity_type == EntityType.CONCEPT
+        ]
+        
+        return PeriodAnalysis(
+            period=period,
+            start_year=period_years[0],
+            end_year=period_years[1],
+            key_figures=key_figures[:20],  # Top 20
+            dominant_concepts=dominant_concepts[:15],  # Top 15
+            period_characteristics=self._get_period_characteristics(period)
+        )
 
 
 def create_historical_development_service(
     neo4j_client: Optional[Neo4jClient] = None,
-    settings: Optional[Any] = None
+    settings: Optional[Any] = None,
+    graph_version_tracker: Optional[GraphVersionTracker] = None
 ) -> HistoricalDevelopmentService:
     """Create a HistoricalDevelopmentService instance."""
-    return HistoricalDevelopmentService(neo4j_client=neo4j_client, settings=settings)
\ No newline at end of file
+    return HistoricalDevelopmentService(
+        neo4j_client=neo4j_client,
+        settings=settings,
+        graph_version_tracker=graph_version_tracker
+    )
\ No newline at end of file
@@ -0,0 +1,363 @@
+"""
+Shared async client core for Arete LLM provider calls.
+
+Provides:
+- Pooled HTTP transports: one keep-alive httpx client per event loop and
+  timeout, shared by all providers instead of a new client per request
+- Request-scoped cancellation tokens, cancellable from any thread, so an
+  abandoned question or a disconnected client stops its generation
+- Deadline-bounded calls and streams that cancel the in-flight provider
+  request, closing its connection, as soon as the token fires or the
+  deadline passes; streams can also be bounded by the wait for each chunk,
+  so long generations are not cut off while they make progress
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+import httpx
+
+from arete.services.llm_provider import DeadlineExceededError, RequestCancelledError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_END = object()  # Marks the end of a stream in the chunk queue
+
+
+class CancellationToken:
+    """
+    Cancellation signal scoped to one request.
+
+    Cancelling a token cancels every call running under it and under tokens
+    linked to it. cancel() is thread-safe, so UI and signal handlers can
+    abandon a request running on another thread's event loop.
+    """
+
+    def __init__(self):
+        """Initialize an uncancelled token."""
+        self._lock = threading.Lock()
+        self._callbacks: Dict[int, Callable[[], None]] = {}
+        self._next_id = 0
+        self._detach: List[Callable[[], None]] = []
+        self.cancelled = False
+        self.reason: Optional[str] = None
+
+    @classmethod
+    def linked(cls, *parents: Optional["CancellationToken"]) -> "CancellationToken":
+        """
+        Create a token cancelled whenever any of its parents is.
+
+        Args:
+            *parents: Parent tokens (None entries are ignored)
+
+        Returns:
+            Linked token; call detach() once the request finishes
+        """
+        token = cls()
+        for parent in parents:
+            if parent is not None:
+                token._detach.append(parent.add_callback(lambda parent=parent: token.cancel(parent.reason)))
+        return token
+
+    def add_callback(self, callback: Callable[[], None]) -> Callable[[], None]:
+        """
+        Run a callback when the token is cancelled.
+
+        Args:
+            callback: Called once on cancellation, immediately if already cancelled
+
+        Returns:
+            Function removing the callback
+        """
+        with self._lock:
+            if not self.cancelled:
+                callback_id = self._next_id
+                self._next_id += 1
+                self._callbacks[callback_id] = callback
+                return lambda: self._remove_callback(callback_id)
+        callback()
+        return lambda: None
+
+    def _remove_callback(self, callback_id: int) -> None:
+        with self._lock:
+            self._callbacks.pop(callback_id, None)
+
+    def cancel(self, reason: Optional[str] = None) -> None:
+        """
+        Cancel the token and every call running under it.
+
+        Args:
+            reason: Why the request was abandoned, reported in errors
+        """
+        with self._lock:
+            if self.cancelled:
+                return
+            self.cancelled = True
+            self.reason = reason or "cancelled"
+            callbacks = list(self._callbacks.values())
+            self._callbacks.clear()
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.warning(f"Cancellation callback failed: {e}")
+
+    def detach(self) -> None:
+        """Unlink the token from its parents."""
+        for detach in self._detach:
+            detach()
+        self._detach.clear()
+
+
+def _cancel_on(token: Optional[CancellationToken], task: asyncio.Future) -> Callable[[], None]:
+    """Cancel a task from the token's callback, whichever thread cancels it."""
+    if token is None:
+        return lambda: None
+    loop = asyncio.get_running_loop()
+
+    def cancel_task() -> None:
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(task.cancel)
+
+    return token.add_callback(cancel_task)
+
+
+async def run_with_deadline(
+    awaitable: Awaitable[T],
+    token: Optional[CancellationToken] = None,
+    timeout: Optional[float] = None,
+    description: str = "LLM request"
+) -> T:
+    """
+    Await a provider call, cancelling it on the token or its deadline.
+
+    The call runs as its own task, so cancelling it closes the provider's
+    HTTP request and releases its pooled connection. Cancelling the caller
+    cancels the call as well.
+
+    Args:
+        awaitable: Provider call
+        token: Cancellation token of the request
+        timeout: Seconds until the call is abandoned (None for no deadline)
+        description: Name of the call used in errors
+
+    Returns:
+        Result of the call
+
+    Raises:
+        RequestCancelledError: If the token is cancelled first
+        DeadlineExceededError: If the deadline passes first
+    """
+    if token is not None and token.cancelled:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise RequestCancelledError(f"{description} cancelled: {token.reason}")
+
+    task = asyncio.ensure_future(awaitable)
+    remove = _cancel_on(token, task)
+    try:
+        done, _ = await asyncio.wait({task}, timeout=timeout)
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    finally:
+        remove()
+
+    if not done:
+        task.cancel()
+        await asyncio.wait({task})
+        raise DeadlineExceededError(f"{description} exceeded its {timeout}s deadline")
+    if task.cancelled():
+        reason = token.reason if token is not None and token.cancelled else "cancelled"
+        raise RequestCancelledError(f"{description} cancelled: {reason}")
+    return task.result()
+
+
+async def stream_with_deadline(
+    stream: AsyncIterator[T],
+    token: Optional[CancellationToken] = None,
+    timeout: Optional[float] = None,
+    description: str = "LLM stream",
+    idle_timeout: Optional[float] = None
+) -> AsyncIterator[T]:
+    """
+    Iterate a provider stream, cancelling it on the token or its deadline.
+
+    The stream is consumed by one producer task, so the provider's HTTP
+    stream is opened and closed in the same task and is cancelled as a
+    whole. Closing this iterator early (e.g. on client disconnect) cancels
+    the producer too.
+
+    Args:
+        stream: Provider stream
+        token: Cancellation token of the request
+        timeout: Seconds until the whole stream is abandoned (None for no deadline)
+        description: Name of the stream used in errors
+        idle_timeout: Seconds to wait for the first or next item before the
+            stream is abandoned (None for no limit)
+
+    Yields:
+        Items of the stream
+
+    Raises:
+        RequestCancelledError: If the token is cancelled first
+        DeadlineExceededError: If the deadline passes before the stream ends,
+            or no item arrives within the idle timeout
+    """
+    if token is not None and token.cancelled:
+        raise RequestCancelledError(f"{description} cancelled: {token.reason}")
+
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def produce() -> None:
+        try:
+            async for item in stream:
+                queue.put_nowait((item, None))
+            queue.put_nowait((_END, None))
+        except asyncio.CancelledError:
+            reason = token.reason if token is not None and token.cancelled else "cancelled"
+            queue.put_nowait((_END, RequestCancelledError(f"{description} cancelled: {reason}")))
+            raise
+        except Exception as e:
+            queue.put_nowait((_END, e))
+
+    producer = asyncio.ensure_future(produce())
+    remove = _cancel_on(token, producer)
+    expires_at = loop.time() + timeout if timeout is not None else None
+    try:
+        while True:
+            remaining = None if expires_at is None else max(0.0, expires_at - loop.time())
+            idle = idle_timeout is not None and (remaining is None or idle_timeout < remaining)
+            try:
+                item, error = await asyncio.wait_for(queue.get(), idle_timeout if idle else remaining)
+            except asyncio.TimeoutError:
+                if idle:
+                    raise DeadlineExceededError(
+                        f"{description} produced nothing for {idle_timeout}s"
+                    ) from None
+                raise DeadlineExceededError(f"{description} exceeded its {timeout}s deadline") from None
+            if error is not None:
+                raise error
+            if item is _END:
+                return
+            yield item
+    finally:
+        remove()
+        producer.cancel()
+
+
+# Pooled HTTP clients, one per event loop and timeout
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[float, httpx.AsyncClient]]" = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+_pool_limits = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+
+
+def configure_http_pool(settings: Any) -> None:
+    """
+    Set the connection limits of pooled HTTP clients created from now on.
+
+    Args:
+        settings: Application configuration with the llm_http_* pool settings
+    """
+    global _pool_limits
+    _pool_limits = httpx.Limits(
+        max_connections=settings.llm_http_max_connections,
+        max_keepalive_connections=settings.llm_http_max_keepalive_connections,
+        keepalive_expiry=settings.llm_http_keepalive_expiry_seconds
+    )
+
+
+def get_http_client(timeout: float) -> httpx.AsyncClient:
+    """
+    Get the pooled HTTP client of the running event loop.
+
+    httpx connections belong to the loop that opened them, so each loop has
+    its own clients; clients of closed loops are dropped.
+
+    Args:
+        timeout: Request timeout of the client in seconds
+
+    Returns:
+        Shared keep-alive client
+    """
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        # Clients reference their loop, so drop those of finished loops explicitly
+        for closed_loop in [other for other in _clients if other.is_closed()]:
+            del _clients[closed_loop]
+        clients = _clients.setdefault(loop, {})
+        client = clients.get(float(timeout))
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(timeout=timeout, limits=_pool_limits)
+            clients[float(timeout)] = client
+        return client
+
+
+@asynccontextmanager
+async def pooled_http_client(timeout: float) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Borrow the pooled HTTP client of the running event loop.
+
+    Drop-in replacement for ``async with httpx.AsyncClient(timeout=...)``
+    whose client and keep-alive connections outlive the block.
+
+    Args:
+        timeout: Request timeout of the client in seconds
+
+    Yields:
+        Shared keep-alive client
+    """
+    yield get_http_client(timeout)
+
+
+async def close_http_clients() -> None:
+    """Close the pooled HTTP clients of the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        clients = _clients.pop(loop, {})
+    for client in clients.values():
+        await client.aclose()
+
+
+def run_sync(awaitable: Awaitable[T]) -> T:
+    """
+    Run a coroutine on a new event loop, closing its pooled clients afterwards.
+
+    Use instead of asyncio.run() for short-lived loops, whose keep-alive
+    connections could not be reused anyway.
+
+    Args:
+        awaitable: Coroutine to run
+
+    Returns:
+        Result of the coroutine
+    """
+    async def run_and_close() -> T:
+        try:
+            return await awaitable
+        finally:
+            await close_http_clients()
+
+    return asyncio.run(run_and_close())
+
+
+def get_http_pool_stats() -> Dict[str, Any]:
+    """Get the number of pooled HTTP clients and their connection limits."""
+    with _clients_lock:
+        client_count = sum(len(clients) for clients in _clients.values())
+    return {
+        "clients": client_count,
+        "max_connections": _pool_limits.max_connections,
+        "max_keepalive_connections": _pool_limits.max_keepalive_connections,
+        "keepalive_expiry": _pool_limits.keepalive_expiry
+    }
@@ -0,0 +1,173 @@
+"""
+Incremental response agreement for Arete Graph-RAG consensus generation.
+
+Responses are compared as they arrive:
+- Each response is split into claims (sentences reduced to content words)
+- Two responses agree to the extent their claims match each other, or by a
+  caller-supplied similarity such as embedding cosine similarity
+- A quorum is reached once one response agrees with enough others
+
+Consensus generation can therefore return as soon as a quorum agrees instead
+of waiting for the slowest provider.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?;])\s+|\n+")
+_WORD = re.compile(r"\w+")
+
+SimilarityFunction = Callable[[str, str], float]
+
+
+def extract_claims(text: str, min_words: int = 3) -> List[FrozenSet[str]]:
+    """
+    Split a response into claims.
+
+    Args:
+        text: Response text
+        min_words: Content words a sentence needs to count as a claim
+
+    Returns:
+        Content-word sets of the claims; words of three letters or fewer
+        are dropped as function words
+    """
+    claims = []
+    for sentence in _SENTENCE_SPLIT.split(text):
+        words = frozenset(word for word in _WORD.findall(sentence.lower()) if len(word) > 3)
+        if len(words) >= min_words:
+            claims.append(words)
+    return claims
+
+
+def claim_agreement(
+    first: List[FrozenSet[str]],
+    second: List[FrozenSet[str]],
+    match_threshold: float = 0.5
+) -> float:
+    """
+    Score the agreement of two claim lists.
+
+    A claim is supported if some claim of the other response overlaps it
+    with a Jaccard similarity of at least match_threshold.
+
+    Args:
+        first: Claims of one response
+        second: Claims of the other response
+        match_threshold: Jaccard similarity at which claims match
+
+    Returns:
+        Mean fraction of each response's claims supported by the other (0-1)
+    """
+    if not first or not second:
+        return 0.0
+
+    def supported(claims: List[FrozenSet[str]], others: List[FrozenSet[str]]) -> float:
+        matched = sum(
+            1 for claim in claims
+            if any(len(claim & other) / len(claim | other) >= match_threshold for other in others)
+        )
+        return matched / len(claims)
+
+    return (supported(first, second) + supported(second, first)) / 2
+
+
+@dataclass
+class ConsensusResult:
+    """Outcome of a consensus generation."""
+
+    responses: List[Any]  # LLMResponse objects in arrival order
+    answer: Optional[Any] = None  # Response agreeing best with the others
+    quorum: int = 0
+    quorum_reached: bool = False
+    agreeing_providers: List[str] = field(default_factory=list)
+    agreement_scores: Dict[str, float] = field(default_factory=dict)  # Mean agreement per provider
+    pairwise_agreement: Dict[str, float] = field(default_factory=dict)  # "a|b" -> score
+    latencies: Dict[str, float] = field(default_factory=dict)
+    failed_providers: List[str] = field(default_factory=list)
+    cancelled_providers: List[str] = field(default_factory=list)
+
+
+class ConsensusTracker:
+    """Pairwise agreement of responses, updated as each response arrives."""
+
+    def __init__(
+        self,
+        agreement_threshold: float = 0.6,
+        similarity: Optional[SimilarityFunction] = None,
+        match_threshold: float = 0.5
+    ):
+        """
+        Initialize consensus tracker.
+
+        Args:
+            agreement_threshold: Agreement at which two responses count as agreeing
+            similarity: Optional text similarity (0-1) used instead of claim overlap
+            match_threshold: Jaccard similarity at which two claims match
+        """
+        self.agreement_threshold = agreement_threshold
+        self.similarity = similarity
+        self.match_threshold = match_threshold
+        self._texts: Dict[str, str] = {}
+        self._claims: Dict[str, List[FrozenSet[str]]] = {}
+        self._pairwise: Dict[Tuple[str, str], float] = {}
+
+    def _score(self, first: str, second: str) -> float:
+        if self.similarity is not None:
+            return self.similarity(self._texts[first], self._texts[second])
+        return claim_agreement(self._claims[first], self._claims[second], self.match_threshold)
+
+    def add(self, name: str, text: str) -> None:
+        """
+        Add a response and score it against every earlier one.
+
+        Args:
+            name: Provider (or other unique) name of the response
+            text: Response text
+        """
+        self._texts[name] = text
+        if self.similarity is None:
+            self._claims[name] = extract_claims(text)
+        for other in self._texts:
+            if other != name:
+                self._pairwise[(other, name)] = self._score(other, name)
+
+    def agreement(self, first: str, second: str) -> float:
+        """Get the agreement of two added responses."""
+        return self._pairwise.get((first, second), self._pairwise.get((second, first), 0.0))
+
+    def agreeing_with(self, name: str) -> List[str]:
+        """Get the responses agreeing with one response, including itself."""
+        return [name] + [
+            other for other in self._texts
+            if other != name and self.agreement(name, other) >= self.agreement_threshold
+        ]
+
+    def quorum_group(self, quorum: int) -> Optional[List[str]]:
+        """
+        Find a response agreed with by at least quorum - 1 others.
+
+        Args:
+            quorum: Number of agreeing responses required
+
+        Returns:
+            The agreeing responses, best-supported first, or None
+        """
+        best = None
+        for name in self._texts:
+            group = self.agreeing_with(name)
+            if len(group) >= quorum and (best is None or len(group) > len(best)):
+                best = group
+        return best
+
+    def mean_agreement(self, name: str) -> float:
+        """Get the mean agreement of one response with all others."""
+        others = [other for other in self._texts if other != name]
+        if not others:
+            return 0.0
+        return sum(self.agreement(name, other) for other in others) / len(others)
+
+    def pairwise(self) -> Dict[str, float]:
+        """Get all pairwise agreements keyed by "first|second"."""
+        return {f"{first}|{second}": score for (first, second), score in self._pairwise.items()}
@@ -11,11 +11,15 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Any, Optional, Union
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple, Union
 import json
 import time
 
 from arete.services.base import BaseService, ServiceError, ConfigurationError
+from arete.services.circuit_breaker import CircuitBreaker, CircuitState
+from arete.services.llm_consensus import ConsensusResult, ConsensusTracker, SimilarityFunction
+from arete.services.llm_response_cache import create_llm_response_cache
+from arete.services.llm_telemetry import LLMTelemetry, response_cost
 from arete.config import Settings
 
 # Setup logger
@@ -48,6 +52,76 @@ class LLMResponse:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class LLMStreamChunk:
+    """Incremental piece of a streamed LLM response."""
+    delta: str
+    provider: str
+    model: Optional[str] = None
+    finish_reason: Optional[str] = None  # Set on the final chunk
+    usage_tokens: Optional[int] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+def merge_stream_chunks(
+    chunks: List[LLMStreamChunk],
+    provider: str,
+    model: Optional[str] = None
+) -> LLMResponse:
+    """
+    Assemble a complete response from streamed chunks.
+    
+    Args:
+        chunks: Response chunks in stream order
+        provider: Provider name, used if there are no chunks
+        model: Requested model, used if chunks do not report one
+        
+    Returns:
+        LLMResponse with the concatenated content
+    """
+    parts = []
+    finish_reason = None
+    usage_tokens = None
+    metadata: Dict[str, Any] = {"streaming": True}
+    
+    for chunk in chunks:
+        parts.append(chunk.delta)
+        provider = chunk.provider or provider
+        model = chunk.model or model
+        finish_reason = chunk.finish_reason or finish_reason
+        if chunk.usage_tokens is not None:
+            usage_tokens = chunk.usage_tokens
+        metadata.update(chunk.metadata)
+    
+    return LLMResponse(
+        content="".join(parts),
+        provider=provider,
+        usage_tokens=usage_tokens,
+        model=model,
+        finish_reason=finish_reason,
+        metadata=metadata
+    )
+
+
+async def collect_stream(
+    chunks: AsyncIterator[LLMStreamChunk],
+    provider: str,
+    model: Optional[str] = None
+) -> LLMResponse:
+    """
+    Consume a stream and assemble the complete response.
+    
+    Args:
+        chunks: Stream of response chunks
+        provider: Provider name, used if the stream yields nothing
+        model: Requested model, used if chunks do not report one
+        
+    Returns:
+        LLMResponse with the concatenated content
+    """
+    return merge_stream_chunks([chunk async for chunk in chunks], provider, model)
+
+
 # LLM Provider Exceptions
 class LLMProviderError(ServiceError):
     """Base exception for LLM provider errors."""
@@ -70,6 +144,21 @@ class RateLimitError(LLMProviderError):
         self.retry_after = retry_after
 
 
+class CircuitOpenError(ProviderUnavailableError):
+    """Raised when a provider's circuit breaker rejects a call."""
+    pass
+
+
+class DeadlineExceededError(LLMProviderError):
+    """Raised when no provider answers within the request deadline."""
+    pass
+
+
+class RequestCancelledError(LLMProviderError):
+    """Raised when a request is cancelled through its cancellation token."""
+    pass
+
+
 class AuthenticationError(LLMProviderError):
     """Raised when authentication fails."""
     
@@ -78,6 +167,44 @@ class AuthenticationError(LLMProviderError):
         self.provider = provider
 
 
+@dataclass
+class HedgingPolicy:
+    """When to issue a backup request to the next provider."""
+    enabled: bool = True
+    delay_percentile: float = 0.95  # Hedge once the primary is slower than this
+    min_delay_seconds: float = 0.25
+    initial_delay_seconds: float = 2.0  # Delay used until enough latencies are known
+    min_samples: int = 10
+    budget_ratio: float = 0.1  # Hedged requests as a fraction of all requests
+
+
+class HedgeBudget:
+    """Caps hedged requests at a fraction of all requests."""
+    
+    def __init__(self, ratio: float, max_credit: float = 10.0):
+        """
+        Initialize hedge budget.
+        
+        Args:
+            ratio: Hedge credit earned per request
+            max_credit: Maximum credit saved up for bursts
+        """
+        self.ratio = ratio
+        self.max_credit = max_credit
+        self._credit = 0.0
+    
+    def record_request(self) -> None:
+        """Earn credit for one request."""
+        self._credit = min(self.max_credit, self._credit + self.ratio)
+    
+    def try_acquire(self) -> bool:
+        """Spend credit for one hedge if available."""
+        if self._credit >= 1.0:
+            self._credit -= 1.0
+            return True
+        return False
+
+
 class LLMProvider(ABC):
     """
     Abstract base class for LLM providers.
@@ -143,6 +270,42 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def stream_response(
+        self,
+        messages: List[LLMMessage],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a response from the LLM as content deltas.
+        
+        Providers without incremental output yield the complete response as a
+        single chunk; streaming providers override this.
+        
+        Args:
+            messages: Conversation messages
+            model: Model to use (if None, uses provider default)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional provider-specific parameters
+            
+        Yields:
+            Response chunks; the last one carries finish reason and usage
+        """
+        response = await self.generate_response(
+            messages, model=model, max_tokens=max_tokens, temperature=temperature, **kwargs
+        )
+        yield LLMStreamChunk(
+            delta=response.content,
+            provider=response.provider,
+            model=response.model,
+            finish_reason=response.finish_reason or "stop",
+            usage_tokens=response.usage_tokens,
+            metadata=response.metadata
+        )
+
     @abstractmethod
     def get_health_status(self) -> Dict[str, Any]:
         """Get provider health status and diagnostics."""
@@ -241,7 +404,9 @@ class MultiProviderLLMService(BaseService):
     Multi-provider LLM service with intelligent routing and failover.
     
     Coordinates multiple LLM providers, handles failover, load balancing,
-    and provides a unified interface for LLM generation.
+    and provides a unified interface for LLM generation. Each provider sits
+    behind a circuit breaker, so providers that keep failing or timing out
+    are skipped without a network call until a probe finds them healthy.
     """
     
     def __init__(self, settings: Settings):
@@ -255,6 +420,18 @@ class MultiProviderLLMService(BaseService):
         self.settings = settings
         self.factory = LLMProviderFactory(settings)
         self._providers: List[LLMProvider] = []
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._probe_task: Optional[asyncio.Task] = None
+        self.telemetry = LLMTelemetry()
+        self.response_cache = create_llm_response_cache(settings)
+        
+        self.hedging_policy = HedgingPolicy(
+            enabled=settings.llm_hedging_enabled,
+            delay_percentile=settings.llm_hedge_delay_percentile,
+            budget_ratio=settings.llm_hedge_budget_ratio
+        )
+        self._hedge_budget = HedgeBudget(self.hedging_policy.budget_ratio)
+        self.hedge_stats = {"requests": 0, "hedged": 0, "hedge_wins": 0}
 
     def initialize(self) -> None:
         """Initialize the service and all providers."""
@@ -279,8 +456,157 @@ class MultiProviderLLMService(BaseService):
             provider: Provider instance to add
         """
         self._providers.append(provider)
+        self._breakers[provider.name] = CircuitBreaker(
+            name=provider.name,
+            failure_rate_threshold=self.settings.llm_circuit_failure_rate,
+            minimum_calls=self.settings.llm_circuit_minimum_calls,
+            consecutive_failure_threshold=self.settings.llm_circuit_consecutive_failures,
+            window_seconds=self.settings.llm_circuit_window_seconds,
+            open_seconds=self.settings.llm_circuit_open_seconds
+        )
         logger.info(f"Added provider: {provider.name}")
 
+    def get_circuit_breaker(self, provider_name: str) -> CircuitBreaker:
+        """
+        Get the circuit breaker guarding a provider.
+
+        Args:
+            provider_name: Provider name
+
+        Returns:
+            The provider's circuit breaker
+
+        Raises:
+            LLMProviderError: If provider not found
+        """
+        if provider_name not in self._breakers:
+            raise LLMProviderError(f"Provider '{provider_name}' not found")
+        return self._breakers[provider_name]
+
+    def is_provider_healthy(self, provider: LLMProvider) -> bool:
+        """Check that a provider is configured and its circuit is not open."""
+        breaker = self._breakers.get(provider.name)
+        return provider.is_available and (breaker is None or breaker.state != CircuitState.OPEN)
+
+    def get_circuit_states(self) -> Dict[str, Dict[str, Any]]:
+        """Get breaker state and rolling statistics for every provider."""
+        return {name: breaker.snapshot() for name, breaker in self._breakers.items()}
+
+    async def _call_provider(
+        self,
+        provider: LLMProvider,
+        messages: List[LLMMessage],
+        **kwargs
+    ) -> LLMResponse:
+        """
+        Call a provider through its circuit breaker with a per-attempt timeout.
+
+        Raises:
+            CircuitOpenError: If the breaker rejects the call
+            ProviderUnavailableError: If the call times out
+        """
+        breaker = self._breakers[provider.name]
+        if not breaker.allow_request():
+            raise CircuitOpenError(
+                f"Circuit open for provider {provider.name}", provider.name
+            )
+
+        started = time.monotonic()
+        try:
+            response = await asyncio.wait_for(
+                provider.generate_response(messages, **kwargs),
+                timeout=self.settings.llm_timeout
+            )
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+        except asyncio.TimeoutError as e:
+            breaker.record_failure(e)
+            self.telemetry.record_failure(provider.name, kwargs.get("model"), time.monotonic() - started)
+            raise ProviderUnavailableError(
+                f"Provider {provider.name} timed out after {self.settings.llm_timeout}s",
+                provider.name
+            ) from e
+        except Exception as e:
+            breaker.record_failure(e)
+            self.telemetry.record_failure(provider.name, kwargs.get("model"), time.monotonic() - started)
+            raise
+
+        breaker.record_success()
+        self.telemetry.record_success(
+            provider.name,
+            response.model or kwargs.get("model"),
+            time.monotonic() - started,
+            tokens=response.usage_tokens,
+            cost=response_cost(response)
+        )
+        return response
+
+    def _hedge_delay(self, provider_name: str) -> float:
+        """Seconds to wait on a provider before hedging, from its latency percentile."""
+        policy = self.hedging_policy
+        latencies = self.telemetry.get(provider_name).latencies
+        if len(latencies) < policy.min_samples:
+            return policy.initial_delay_seconds
+        return max(policy.min_delay_seconds, latencies.percentile(policy.delay_percentile))
+
+    async def probe_providers(self) -> Dict[str, bool]:
+        """
+        Send a minimal request to each provider whose breaker is half-open.
+
+        Returns:
+            Mapping of probed provider names to whether the probe succeeded
+        """
+        probe_messages = [LLMMessage(role=MessageRole.USER, content="ping")]
+        results = {}
+
+        for provider in self._providers:
+            if not provider.is_available:
+                continue
+            if self._breakers[provider.name].state != CircuitState.HALF_OPEN:
+                continue
+            try:
+                await self._call_provider(provider, probe_messages, max_tokens=1, temperature=0.0)
+                results[provider.name] = True
+            except CircuitOpenError:
+                continue
+            except Exception as e:
+                logger.debug(f"Health probe failed for provider {provider.name}: {e}")
+                results[provider.name] = False
+
+        return results
+
+    def start_health_probes(self, interval: Optional[float] = None) -> None:
+        """
+        Start probing half-open providers in the background.
+
+        Must be called from a running event loop.
+
+        Args:
+            interval: Seconds between probe rounds (defaults to settings)
+        """
+        if self._probe_task is not None and not self._probe_task.done():
+            return
+
+        interval = interval or self.settings.llm_health_probe_interval_seconds
+
+        async def probe_loop() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await self.probe_providers()
+                except Exception as e:
+                    logger.error(f"Provider health probe round failed: {e}")
+
+        self._probe_task = asyncio.get_running_loop().create_task(probe_loop())
+        logger.info(f"Started provider health probes every {interval}s")
+
+    def stop_health_probes(self) -> None:
+        """Stop background health probes."""
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            self._probe_task = None
+
     async def generate_response(
         self,
         messages: List[LLMMessage],
@@ -288,10 +614,19 @@ class MultiProviderLLMService(BaseService):
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         preferred_provider: Optional[str] = None,
+        provider_order: Optional[List[str]] = None,
+        deadline: Optional[float] = None,
+        cache: Optional[bool] = None,
         **kwargs
     ) -> LLMResponse:
         """
-        Generate response using available providers with failover.
+        Generate response using available providers with failover and hedging.
+        
+        Providers are tried in order. If the current provider has not answered
+        within its observed latency percentile, a backup request is sent to the
+        next provider (within the hedge budget); the first success wins and the
+        other request is cancelled. Deterministic requests are answered from
+        the response cache when an identical request was seen recently.
         
         Args:
             messages: Conversation messages
@@ -299,12 +634,17 @@ class MultiProviderLLMService(BaseService):
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
             preferred_provider: Preferred provider name (if available)
+            provider_order: Restrict to these providers, tried in this order
+            deadline: Seconds until the request is abandoned (defaults to settings)
+            cache: Force (True) or bypass (False) the response cache; by default
+                only temperature 0 requests are cached
             **kwargs: Additional parameters
             
         Returns:
-            LLMResponse from first successful provider
+            LLMResponse from the first successful provider
             
         Raises:
+            DeadlineExceededError: If no provider answers within the deadline
             LLMProviderError: If all providers fail or none configured
         """
         if not self._providers:
@@ -312,98 +652,309 @@ class MultiProviderLLMService(BaseService):
         
         # Use default settings if not provided
         max_tokens = max_tokens or self.settings.llm_max_tokens
-        temperature = temperature or self.settings.llm_temperature
+        temperature = temperature if temperature is not None else self.settings.llm_temperature
         
-        # Try preferred provider first if specified and available
         providers_to_try = self._providers.copy()
+        if provider_order is not None:
+            by_name = {p.name: p for p in self._providers}
+            providers_to_try = [by_name[name] for name in provider_order if name in by_name]
+        
+        # Try preferred provider first if specified and available
         if preferred_provider:
-            preferred = next((p for p in self._providers if p.name == preferred_provider), None)
+            preferred = next((p for p in providers_to_try if p.name == preferred_provider), None)
             if preferred and preferred.is_available:
                 providers_to_try.remove(preferred)
                 providers_to_try.insert(0, preferred)
         
-        last_error = None
+        cache_key = None
+        if (
+            self.response_cache is not None
+            and providers_to_try
+            and self.response_cache.is_cacheable(temperature, cache)
+        ):
+            cache_key = self.response_cache.make_key(
+                providers_to_try[0].name, model, messages,
+                max_tokens=max_tokens, temperature=temperature, **kwargs
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
         
-        for provider in providers_to_try:
-            if not provider.is_available:
-                logger.debug(f"Skipping unavailable provider: {provider.name}")
-                continue
-            
-            try:
+        response = await self._generate_with_failover(
+            providers_to_try,
+            messages,
+            deadline if deadline is not None else self.settings.llm_request_deadline_seconds,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs
+        )
+        
+        if cache_key is not None:
+            self.response_cache.set(cache_key, response)
+        return response
+
+    async def _generate_with_failover(
+        self,
+        providers: List[LLMProvider],
+        messages: List[LLMMessage],
+        deadline: float,
+        **kwargs
+    ) -> LLMResponse:
+        """Run hedged, deadline-bounded failover across providers in order."""
+        loop = asyncio.get_running_loop()
+        expires_at = loop.time() + deadline
+        candidates = iter(providers)
+        pending: Dict[asyncio.Task, Tuple[LLMProvider, float]] = {}
+        failed_providers: List[str] = []
+        open_circuits: List[str] = []
+        last_error: Optional[Exception] = None
+        hedge_decided = False
+        hedge_task: Optional[asyncio.Task] = None
+        
+        self.hedge_stats["requests"] += 1
+        self._hedge_budget.record_request()
+        
+        def launch_next() -> Optional[asyncio.Task]:
+            for provider in candidates:
+                if not provider.is_available:
+                    logger.debug(f"Skipping unavailable provider: {provider.name}")
+                    continue
+                if self._breakers[provider.name].state == CircuitState.OPEN:
+                    logger.debug(f"Skipping provider with open circuit: {provider.name}")
+                    open_circuits.append(provider.name)
+                    continue
                 logger.debug(f"Attempting generation with provider: {provider.name}")
+                task = loop.create_task(self._call_provider(provider, messages, **kwargs))
+                pending[task] = (provider, loop.time())
+                return task
+            return None
+        
+        try:
+            launch_next()
+            while pending:
+                now = loop.time()
+                if now >= expires_at:
+                    outstanding = [p.name for p, _ in pending.values()]
+                    raise DeadlineExceededError(
+                        f"No provider answered within the {deadline}s deadline",
+                        details={"providers": outstanding, "failed_providers": failed_providers + outstanding}
+                    )
                 
-                response = await provider.generate_response(
-                    messages=messages,
-                    model=model,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                    **kwargs
+                # Hedge at most once, and only while a single request is in flight
+                hedge_at = None
+                if self.hedging_policy.enabled and not hedge_decided and len(pending) == 1:
+                    provider, started = next(iter(pending.values()))
+                    hedge_at = started + self._hedge_delay(provider.name)
+                
+                timeout = expires_at - now
+                if hedge_at is not None:
+                    timeout = min(timeout, max(0.0, hedge_at - now))
+                
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
                 )
                 
-                logger.info(f"Successfully generated response with provider: {provider.name}")
-                return response
+                if not done:
+                    if hedge_at is not None and loop.time() >= hedge_at:
+                        hedge_decided = True
+                        hedge_task = launch_next() if self._hedge_budget.try_acquire() else None
+                        if hedge_task is not None:
+                            self.hedge_stats["hedged"] += 1
+                            logger.info("Primary provider slow, issued hedged request")
+                    continue
                 
-            except (ProviderUnavailableError, RateLimitError, AuthenticationError) as e:
-                logger.warning(f"Provider {provider.name} failed: {e}")
-                last_error = e
-                continue
-            except Exception as e:
-                logger.error(f"Unexpected error from provider {provider.name}: {e}")
-                last_error = e
-                continue
+                for task in done:
+                    provider, _ = pending.pop(task)
+                    error = task.exception()
+                    if error is None:
+                        response = task.result()
+                        if task is hedge_task:
+                            self.hedge_stats["hedge_wins"] += 1
+                        response.metadata.update({
+                            "provider_name": provider.name,
+                            "hedged": hedge_task is not None,
+                            "failed_providers": failed_providers,
+                        })
+                        logger.info(f"Successfully generated response with provider: {provider.name}")
+                        return response
+                    
+                    if isinstance(error, CircuitOpenError):
+                        open_circuits.append(provider.name)
+                        continue
+                    if isinstance(error, (ProviderUnavailableError, RateLimitError, AuthenticationError)):
+                        logger.warning(f"Provider {provider.name} failed: {error}")
+                    else:
+                        logger.error(f"Unexpected error from provider {provider.name}: {error}")
+                    failed_providers.append(provider.name)
+                    last_error = error
+                
+                if not pending:
+                    launch_next()
+        finally:
+            # Cancel the losing or abandoned requests
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
         
         # If we get here, all providers failed
         error_msg = "All providers failed to generate response"
         if last_error:
             error_msg += f". Last error: {last_error}"
+        if open_circuits:
+            error_msg += f". Open circuits: {', '.join(open_circuits)}"
         
-        raise LLMProviderError(error_msg)
+        raise LLMProviderError(
+            error_msg,
+            details={"failed_providers": failed_providers, "open_circuits": open_circuits}
+        )
 
     async def generate_with_consensus(
         self,
         messages: List[LLMMessage],
         consensus_count: int = 2,
+        quorum: Optional[int] = None,
+        agreement_threshold: Optional[float] = None,
+        similarity: Optional[SimilarityFunction] = None,
         **kwargs
     ) -> List[LLMResponse]:
         """
         Generate multiple responses for consensus or comparison.
         
+        Returns once a quorum of responses agrees; see generate_consensus.
+        Each response's metadata carries its latency and agreement score
+        under "consensus".
+        
         Args:
             messages: Conversation messages
-            consensus_count: Number of responses to generate
+            consensus_count: Number of providers to query
+            quorum: Agreeing responses that end generation early
+            agreement_threshold: Agreement at which two responses agree
+            similarity: Optional text similarity replacing claim overlap
             **kwargs: Generation parameters
             
         Returns:
-            List of responses from different providers
+            Responses received before the quorum was reached, in arrival order
+        """
+        result = await self.generate_consensus(
+            messages, consensus_count, quorum, agreement_threshold, similarity, **kwargs
+        )
+        return result.responses
+
+    async def generate_consensus(
+        self,
+        messages: List[LLMMessage],
+        consensus_count: int = 2,
+        quorum: Optional[int] = None,
+        agreement_threshold: Optional[float] = None,
+        similarity: Optional[SimilarityFunction] = None,
+        **kwargs
+    ) -> ConsensusResult:
+        """
+        Query several providers and stop as soon as a quorum agrees.
+        
+        Responses are scored against each other as they arrive; once one
+        response agrees with quorum - 1 others, the outstanding calls are
+        cancelled.
+        
+        Args:
+            messages: Conversation messages
+            consensus_count: Number of providers to query
+            quorum: Agreeing responses that end generation early (defaults
+                to settings, capped at consensus_count)
+            agreement_threshold: Agreement at which two responses agree
+                (defaults to settings)
+            similarity: Optional text similarity (0-1), e.g. embedding
+                cosine similarity, replacing claim overlap
+            **kwargs: Generation parameters
+            
+        Returns:
+            Consensus result with the responses, chosen answer, per-provider
+            latencies and agreement scores
+            
+        Raises:
+            LLMProviderError: If too few providers are available
         """
         if consensus_count > len(self._providers):
             raise LLMProviderError(
                 f"Requested {consensus_count} responses but only {len(self._providers)} providers available"
             )
         
-        available_providers = [p for p in self._providers if p.is_available]
+        available_providers = [p for p in self._providers if self.is_provider_healthy(p)]
         
         if consensus_count > len(available_providers):
             raise LLMProviderError(
                 f"Requested {consensus_count} responses but only {len(available_providers)} providers available"
             )
         
-        tasks = []
-        for provider in available_providers[:consensus_count]:
-            task = self._generate_with_single_provider(provider, messages, **kwargs)
-            tasks.append(task)
+        quorum = min(quorum or self.settings.llm_consensus_quorum, consensus_count)
+        tracker = ConsensusTracker(
+            agreement_threshold=(
+                agreement_threshold if agreement_threshold is not None
+                else self.settings.llm_consensus_agreement_threshold
+            ),
+            similarity=similarity
+        )
+        result = ConsensusResult(responses=[], quorum=quorum)
+        
+        started = time.monotonic()
+        tasks = {
+            asyncio.create_task(self._generate_with_single_provider(provider, messages, **kwargs)): provider
+            for provider in available_providers[:consensus_count]
+        }
+        pending = set(tasks)
+        responders: List[Tuple[str, LLMResponse]] = []
+        group = None
+        
+        try:
+            while pending and group is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    provider = tasks[task]
+                    result.latencies[provider.name] = time.monotonic() - started
+                    error = task.exception()
+                    if error is not None:
+                        logger.warning(f"Provider {provider.name} failed during consensus: {error}")
+                        result.failed_providers.append(provider.name)
+                        continue
+                    responders.append((provider.name, task.result()))
+                    tracker.add(provider.name, task.result().content)
+                group = tracker.quorum_group(quorum)
+        finally:
+            for task in pending:
+                task.cancel()
+                result.cancelled_providers.append(tasks[task].name)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
         
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
+        for name, response in responders:
+            score = tracker.mean_agreement(name)
+            result.agreement_scores[name] = score
+            response.metadata["consensus"] = {
+                "agreement": score,
+                "latency": result.latencies[name],
+                "quorum_reached": group is not None
+            }
+            result.responses.append(response)
+        result.pairwise_agreement = tracker.pairwise()
         
-        # Filter out exceptions and return successful responses
-        successful_responses = []
-        for response in responses:
-            if isinstance(response, LLMResponse):
-                successful_responses.append(response)
-            else:
-                logger.warning(f"Provider failed during consensus: {response}")
+        if group is not None:
+            result.quorum_reached = True
+            result.agreeing_providers = group
+            anchor = group[0]
+        elif responders:
+            anchor = max(result.agreement_scores, key=result.agreement_scores.get)
+        else:
+            anchor = None
+        result.answer = next((response for name, response in responders if name == anchor), None)
         
-        return successful_responses
+        if result.cancelled_providers:
+            logger.info(
+                f"Consensus of {quorum} reached by {', '.join(result.agreeing_providers)}; "
+                f"cancelled {', '.join(result.cancelled_providers)}"
+            )
+        return result
 
     async def _generate_with_single_provider(
         self,
@@ -412,7 +963,7 @@ class MultiProviderLLMService(BaseService):
         **kwargs
     ) -> LLMResponse:
         """Helper method for generating with a single provider."""
-        return await provider.generate_response(messages, **kwargs)
+        return await self._call_provider(provider, messages, **kwargs)
 
     def get_health_status(self) -> Dict[str, Any]:
         """
@@ -426,27 +977,35 @@ class MultiProviderLLMService(BaseService):
         for provider in self._providers:
             try:
                 status = provider.get_health_status()
-                provider_statuses.append(status)
             except Exception as e:
-                provider_statuses.append({
+                status = {
                     "provider": provider.name,
                     "status": "error",
                     "error": str(e)
-                })
+                }
+            status["circuit"] = self._breakers[provider.name].snapshot()
+            provider_statuses.append(status)
         
-        healthy_count = sum(1 for status in provider_statuses if status.get("status") == "healthy")
+        healthy_count = sum(
+            1 for status in provider_statuses
+            if status.get("status") == "healthy" and status["circuit"]["state"] != CircuitState.OPEN.value
+        )
         
         return {
             "service": "MultiProviderLLMService",
             "status": "healthy" if healthy_count > 0 else "unhealthy",
             "providers_total": len(self._providers),
             "providers_healthy": healthy_count,
-            "providers": provider_statuses
+            "providers": provider_statuses,
+            "hedging": dict(self.hedge_stats),
+            "telemetry": self.telemetry.snapshot(),
+            "response_cache": self.response_cache.get_stats() if self.response_cache else None
         }
 
     def cleanup(self) -> None:
         """Cleanup service resources."""
         logger.info("Cleaning up MultiProviderLLMService")
+        self.stop_health_probes()
         
         for provider in self._providers:
             try:
@@ -456,6 +1015,7 @@ class MultiProviderLLMService(BaseService):
                 logger.error(f"Error cleaning up provider {provider.name}: {e}")
         
         self._providers.clear()
+        self._breakers.clear()
         logger.info("MultiProviderLLMService cleanup complete")
 
 
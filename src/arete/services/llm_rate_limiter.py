@@ -0,0 +1,363 @@
+"""
+Provider-aware LLM request scheduling for Arete Graph-RAG system.
+
+Each provider gets:
+- Token buckets sized from its requests/min and tokens/min limits
+- A priority wait queue in which interactive requests are admitted before
+  queued batch requests, and batch requests leave a reserve of each bucket
+  untouched so live users are not starved
+- A retry-after block: a 429 pauses the provider for the time it asks for,
+  and the rejected request is requeued at its original position
+
+Batch jobs therefore run at the highest rate the provider sustains instead
+of bursting into rate limit errors.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from arete.services.llm_provider import RateLimitError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TrafficClass(IntEnum):
+    """Scheduling classes of LLM requests; lower values are admitted first."""
+
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+class TokenBucket:
+    """Token bucket refilled continuously up to its capacity."""
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize token bucket, starting full.
+
+        Args:
+            capacity: Maximum number of tokens held
+            refill_per_second: Tokens added per second
+            clock: Monotonic time source
+        """
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._clock = clock
+        self._level = capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.refill_per_second)
+        self._updated = now
+
+    @property
+    def level(self) -> float:
+        """Tokens currently available."""
+        self._refill()
+        return self._level
+
+    def wait_time(self, amount: float, keep: float = 0.0) -> float:
+        """
+        Get the time until an amount can be taken.
+
+        Amounts larger than the capacity are admitted once the bucket is full,
+        so oversized requests are throttled rather than blocked forever.
+
+        Args:
+            amount: Tokens to take
+            keep: Tokens that must remain in the bucket afterwards
+
+        Returns:
+            Seconds to wait, 0 if the amount is available now
+        """
+        self._refill()
+        needed = min(amount + keep, self.capacity)
+        if self._level >= needed:
+            return 0.0
+        return (needed - self._level) / self.refill_per_second
+
+    def consume(self, amount: float) -> None:
+        """Take tokens; the level may go negative to record overuse."""
+        self._refill()
+        self._level -= amount
+
+    def adjust(self, amount: float) -> None:
+        """Return (positive) or charge (negative) tokens after the fact."""
+        self._refill()
+        self._level = min(self.capacity, self._level + amount)
+
+
+class ProviderRateLimiter:
+    """Rate limits and priority wait queue of a single provider."""
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        interactive_reserve_ratio: float = 0.2,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize provider rate limiter.
+
+        Args:
+            name: Provider name
+            requests_per_minute: Request limit, 0 for unlimited
+            tokens_per_minute: Token limit, 0 for unlimited
+            interactive_reserve_ratio: Fraction of each bucket batch requests
+                may not consume
+            clock: Monotonic time source
+        """
+        self.name = name
+        self.interactive_reserve_ratio = interactive_reserve_ratio
+        self._clock = clock
+        self.requests = (
+            TokenBucket(requests_per_minute, requests_per_minute / 60, clock)
+            if requests_per_minute > 0 else None
+        )
+        self.tokens = (
+            TokenBucket(tokens_per_minute, tokens_per_minute / 60, clock)
+            if tokens_per_minute > 0 else None
+        )
+        self.blocked_until = 0.0
+        self._waiting: List[List[Any]] = []
+        self._sequence = itertools.count()
+
+        self.granted = {traffic: 0 for traffic in TrafficClass}
+        self.throttled = 0
+        self.wait_seconds = 0.0
+
+    def _wait_time(self, tokens: int, traffic: TrafficClass) -> float:
+        wait = max(0.0, self.blocked_until - self._clock())
+        reserve = self.interactive_reserve_ratio if traffic == TrafficClass.BATCH else 0.0
+        for bucket, amount in ((self.requests, 1), (self.tokens, tokens)):
+            if bucket is not None:
+                wait = max(wait, bucket.wait_time(amount, keep=reserve * bucket.capacity))
+        return wait
+
+    def _wake_head(self) -> None:
+        if self._waiting:
+            self._waiting[0][2].set()
+
+    async def acquire(
+        self,
+        tokens: int,
+        traffic: TrafficClass = TrafficClass.INTERACTIVE,
+        sequence: Optional[int] = None
+    ) -> int:
+        """
+        Wait until a request may be sent, then consume its capacity.
+
+        Requests are admitted in (traffic class, arrival) order; only the
+        head of the queue consumes capacity, so a newly arrived interactive
+        request overtakes every queued batch request.
+
+        Args:
+            tokens: Estimated tokens of the request
+            traffic: Scheduling class of the request
+            sequence: Arrival position to keep when requeueing a request
+
+        Returns:
+            Arrival position of the request
+        """
+        if sequence is None:
+            sequence = next(self._sequence)
+        entry = [int(traffic), sequence, asyncio.Event()]
+        heapq.heappush(self._waiting, entry)
+        started = self._clock()
+
+        try:
+            while True:
+                wait = None
+                if self._waiting[0] is entry:
+                    wait = self._wait_time(tokens, traffic)
+                    if wait <= 0:
+                        break
+                entry[2].clear()
+                try:
+                    await asyncio.wait_for(entry[2].wait(), timeout=wait)
+                except asyncio.TimeoutError:
+                    pass
+        except BaseException:
+            self._waiting.remove(entry)
+            heapq.heapify(self._waiting)
+            self._wake_head()
+            raise
+
+        heapq.heappop(self._waiting)
+        for bucket, amount in ((self.requests, 1), (self.tokens, tokens)):
+            if bucket is not None:
+                bucket.consume(amount)
+        self.granted[traffic] += 1
+        self.wait_seconds += self._clock() - started
+        self._wake_head()
+        return sequence
+
+    def reconcile(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token bucket once a request's actual usage is known."""
+        if self.tokens is not None:
+            self.tokens.adjust(estimated_tokens - actual_tokens)
+
+    def block(self, seconds: float) -> None:
+        """Pause admissions for this provider, e.g. after a 429 response."""
+        self.blocked_until = max(self.blocked_until, self._clock() + seconds)
+        self.throttled += 1
+        self._wake_head()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get limiter state and statistics."""
+        return {
+            "provider": self.name,
+            "queued": len(self._waiting),
+            "available_requests": self.requests.level if self.requests else None,
+            "available_tokens": self.tokens.level if self.tokens else None,
+            "blocked_for_seconds": max(0.0, self.blocked_until - self._clock()),
+            "granted_interactive": self.granted[TrafficClass.INTERACTIVE],
+            "granted_batch": self.granted[TrafficClass.BATCH],
+            "throttled": self.throttled,
+            "wait_seconds": self.wait_seconds,
+        }
+
+
+class LLMRequestScheduler:
+    """Admits LLM requests per provider within rate limits and by priority."""
+
+    def __init__(
+        self,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        provider_limits: Optional[Dict[str, Dict[str, int]]] = None,
+        interactive_reserve_ratio: float = 0.2,
+        max_retries: int = 3,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize request scheduler.
+
+        Args:
+            requests_per_minute: Default request limit per provider, 0 for unlimited
+            tokens_per_minute: Default token limit per provider, 0 for unlimited
+            provider_limits: Per-provider overrides with "requests_per_minute"
+                and/or "tokens_per_minute" keys
+            interactive_reserve_ratio: Fraction of each bucket batch requests
+                may not consume
+            max_retries: Requeues of a request after rate limit errors
+            clock: Monotonic time source
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.provider_limits = provider_limits or {}
+        self.interactive_reserve_ratio = interactive_reserve_ratio
+        self.max_retries = max_retries
+        self._clock = clock
+        self._limiters: Dict[str, ProviderRateLimiter] = {}
+
+    def limiter(self, provider: str) -> ProviderRateLimiter:
+        """Get the rate limiter of a provider."""
+        if provider not in self._limiters:
+            limits = self.provider_limits.get(provider, {})
+            self._limiters[provider] = ProviderRateLimiter(
+                provider,
+                requests_per_minute=limits.get("requests_per_minute", self.requests_per_minute),
+                tokens_per_minute=limits.get("tokens_per_minute", self.tokens_per_minute),
+                interactive_reserve_ratio=self.interactive_reserve_ratio,
+                clock=self._clock
+            )
+        return self._limiters[provider]
+
+    async def acquire(
+        self,
+        provider: str,
+        estimated_tokens: int,
+        traffic: TrafficClass = TrafficClass.INTERACTIVE
+    ) -> None:
+        """Wait until a request to the provider may be sent."""
+        await self.limiter(provider).acquire(estimated_tokens, traffic)
+
+    def reconcile(self, provider: str, estimated_tokens: int, actual_tokens: Optional[int]) -> None:
+        """Correct a provider's token bucket with a request's actual usage."""
+        if actual_tokens is not None:
+            self.limiter(provider).reconcile(estimated_tokens, actual_tokens)
+
+    async def run(
+        self,
+        provider: str,
+        call: Callable[[], Awaitable[T]],
+        estimated_tokens: int,
+        traffic: TrafficClass = TrafficClass.INTERACTIVE
+    ) -> T:
+        """
+        Send a request once admitted, requeueing it after rate limit errors.
+
+        A rate limit error blocks the provider for its retry-after time (or
+        an exponential backoff if none is given) and puts the request back
+        at its original queue position.
+
+        Args:
+            provider: Provider the request is sent to
+            call: Coroutine function performing the request
+            estimated_tokens: Estimated prompt plus completion tokens
+            traffic: Scheduling class of the request
+
+        Returns:
+            Result of the call
+
+        Raises:
+            RateLimitError: If the request is still rate limited after all retries
+        """
+        limiter = self.limiter(provider)
+        sequence = None
+
+        for attempt in range(self.max_retries + 1):
+            sequence = await limiter.acquire(estimated_tokens, traffic, sequence)
+            try:
+                result = await call()
+            except RateLimitError as e:
+                # Rejected requests use no tokens
+                limiter.reconcile(estimated_tokens, 0)
+                if attempt >= self.max_retries:
+                    raise
+                delay = e.retry_after if e.retry_after is not None else min(60, 2 ** attempt)
+                logger.warning(f"Rate limited by {provider}, requeueing request in {delay}s")
+                limiter.block(delay)
+                continue
+
+            self.reconcile(provider, estimated_tokens, getattr(result, "usage_tokens", None))
+            return result
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get limiter statistics per provider."""
+        return {name: limiter.snapshot() for name, limiter in self._limiters.items()}
+
+
+def create_llm_request_scheduler(settings: Any) -> LLMRequestScheduler:
+    """
+    Create the request scheduler configured in settings.
+
+    Args:
+        settings: Application configuration
+
+    Returns:
+        Request scheduler
+    """
+    return LLMRequestScheduler(
+        requests_per_minute=settings.llm_rate_limit_requests_per_minute,
+        tokens_per_minute=settings.llm_rate_limit_tokens_per_minute,
+        provider_limits=settings.llm_provider_rate_limits,
+        interactive_reserve_ratio=settings.llm_interactive_reserve_ratio,
+        max_retries=settings.llm_rate_limit_max_retries
+    )
@@ -0,0 +1,166 @@
+"""
+LLM response caching for Arete Graph-RAG system.
+
+Caches complete provider responses keyed on a canonical hash of the provider,
+model, normalized messages and generation parameters. Only deterministic
+requests (temperature 0) are cached unless a caller opts in explicitly, so
+sampling behaviour is never silently replaced by a replay.
+
+Entries are bounded by LRU size and TTL, and can be persisted to the shared
+SQLite cache file so worker processes and restarts reuse them.
+"""
+
+import dataclasses
+import logging
+from typing import Any, Dict, List, Optional
+
+from arete.services.result_cache import LRUCache, SQLiteCacheStore, make_cache_key
+
+logger = logging.getLogger(__name__)
+
+# Metadata describing how one call was served, not the response itself
+_PER_CALL_METADATA = ("failed_providers", "hedged")
+
+
+def canonical_messages(messages: List[Any]) -> List[List[str]]:
+    """
+    Normalize messages so formatting-only differences share a cache key.
+
+    Line endings are unified and trailing whitespace is stripped from every
+    line and from the ends of each message; inner text is kept verbatim.
+
+    Args:
+        messages: LLMMessage objects
+
+    Returns:
+        List of [role, content] pairs
+    """
+    canonical = []
+    for message in messages:
+        role = getattr(message.role, "value", message.role)
+        lines = (message.content or "").replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        canonical.append([str(role), "\n".join(line.rstrip() for line in lines).strip()])
+    return canonical
+
+
+class LLMResponseCache:
+    """Bounded cache of complete LLM responses for deterministic requests."""
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_seconds: Optional[float] = 3600,
+        shared_store: Optional[SQLiteCacheStore] = None
+    ):
+        """
+        Initialize response cache.
+
+        Args:
+            max_size: Maximum number of responses kept in memory
+            ttl_seconds: Response lifetime in seconds, or None for no expiry
+            shared_store: Optional store persisting responses locally
+        """
+        self.cache = LRUCache(max_size=max_size, ttl_seconds=ttl_seconds, shared_store=shared_store)
+
+    @staticmethod
+    def is_cacheable(temperature: Optional[float], cache: Optional[bool] = None) -> bool:
+        """
+        Decide whether a request may be served from or stored in the cache.
+
+        Args:
+            temperature: Sampling temperature of the request
+            cache: Explicit opt-in (True) or opt-out (False); None caches
+                deterministic requests only
+
+        Returns:
+            True if the request is cacheable
+        """
+        if cache is not None:
+            return cache
+        return temperature == 0
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: Optional[str],
+        messages: List[Any],
+        **params: Any
+    ) -> str:
+        """
+        Build the cache key of a request.
+
+        Args:
+            provider: Provider name
+            model: Model name, or None for the provider default
+            messages: LLMMessage objects
+            **params: Generation parameters (max_tokens, temperature, ...)
+
+        Returns:
+            Canonical hash of the request
+        """
+        return make_cache_key(provider, model or "", canonical_messages(messages), params)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached response.
+
+        Args:
+            key: Request key from make_key
+
+        Returns:
+            A copy of the cached LLMResponse marked as a cache hit, or None
+        """
+        response = self.cache.get(key)
+        if response is None:
+            return None
+        return dataclasses.replace(response, metadata={**response.metadata, "cache_hit": True})
+
+    def set(self, key: str, response: Any) -> None:
+        """
+        Cache a response.
+
+        Failover and hedging metadata of the originating call are dropped,
+        so replays do not report failures that did not happen again.
+
+        Args:
+            key: Request key from make_key
+            response: LLMResponse to cache
+        """
+        metadata = {
+            name: value for name, value in response.metadata.items()
+            if name not in _PER_CALL_METADATA
+        }
+        self.cache.set(key, dataclasses.replace(response, metadata=metadata))
+
+    def clear(self, include_shared: bool = False) -> None:
+        """Remove cached responses."""
+        self.cache.clear(include_shared=include_shared)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return self.cache.get_stats()
+
+
+def create_llm_response_cache(settings: Any) -> Optional[LLMResponseCache]:
+    """
+    Create the response cache configured in settings.
+
+    Args:
+        settings: Application configuration
+
+    Returns:
+        Response cache, or None if disabled
+    """
+    if not settings.llm_response_cache_enabled:
+        return None
+
+    shared_store = None
+    if settings.llm_response_cache_persist and settings.shared_cache_path:
+        shared_store = SQLiteCacheStore(settings.shared_cache_path, "llm_responses")
+
+    ttl = settings.llm_response_cache_ttl_seconds
+    return LLMResponseCache(
+        max_size=settings.llm_response_cache_size,
+        ttl_seconds=ttl if ttl > 0 else None,
+        shared_store=shared_store
+    )
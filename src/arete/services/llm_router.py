@@ -7,9 +7,15 @@ This module provides smart routing of LLM requests based on:
 - Quality requirements  
 - Performance characteristics
 - Philosophical accuracy for educational content
+
+Static provider capabilities are priors: as live telemetry accumulates
+(latency, error rate, throughput and observed cost per 1k tokens), it
+progressively replaces them, and a small share of requests explores
+less-observed providers so their telemetry stays current.
 """
 
 import logging
+import random
 from dataclasses import dataclass
 from enum import Enum
 from typing import List, Dict, Any, Optional, Union
@@ -17,8 +23,9 @@ import asyncio
 
 from arete.services.llm_provider import (
     MultiProviderLLMService, LLMProvider, LLMMessage, LLMResponse,
-    LLMProviderError, ProviderUnavailableError, RateLimitError
+    LLMProviderError
 )
+from arete.services.token_counter import get_token_counter
 from arete.config import Settings
 
 # Setup logger
@@ -55,6 +62,17 @@ class ProviderCapabilities:
     reliability_score: float = 0.8  # 0.0-1.0, based on historical uptime
 
 
+@dataclass
+class LiveProviderSignals:
+    """Telemetry-derived scores of a provider, relative to the other candidates."""
+    confidence: float                   # 0.0-1.0, weight of live over static scores
+    speed_score: Optional[float] = None  # 0.0-1.0, higher is faster
+    reliability_score: float = 1.0      # 0.0-1.0, one minus the recent error rate
+    cost_score: Optional[float] = None   # 0.0-1.0, higher is more expensive
+    p95_latency: Optional[float] = None
+    cost_per_1k_tokens: Optional[float] = None
+
+
 @dataclass
 class RoutingRequest:
     """Request parameters for intelligent routing."""
@@ -66,6 +84,7 @@ class RoutingRequest:
     preferred_providers: Optional[List[str]] = None
     exclude_providers: Optional[List[str]] = None
     require_streaming: bool = False
+    deadline_seconds: Optional[float] = None  # Overall deadline, defaults to settings
 
 
 class IntelligentLLMRouter:
@@ -96,13 +115,20 @@ class IntelligentLLMRouter:
         # Historical performance tracking
         self.performance_history: Dict[str, Dict[str, float]] = {}
         
+        # Share of requests routed to a less-observed provider
+        self.exploration_rate = settings.llm_routing_exploration_rate
+        self.min_samples = settings.llm_routing_min_samples
+        self._rng = random.Random()
+        
         # Routing statistics
         self.routing_stats = {
             "total_requests": 0,
             "successful_routes": 0,
             "cost_optimized": 0,
             "quality_upgrades": 0,
-            "provider_failovers": 0
+            "provider_failovers": 0,
+            "explorations": 0,
+            "cache_hits": 0
         }
     
     def _initialize_provider_capabilities(self) -> Dict[str, ProviderCapabilities]:
@@ -195,53 +221,55 @@ class IntelligentLLMRouter:
                 reverse=True
             )
             
-            # Try providers in order until success
-            last_error = None
-            
-            for provider_name, score in ranked_providers:
-                try:
-                    logger.info(f"Routing request to {provider_name} (score: {score:.3f})")
-                    
-                    response = await self.llm_service.generate_response(
-                        messages=request.messages,
-                        preferred_provider=provider_name,
-                        **self._get_provider_kwargs(request)
-                    )
-                    
-                    # Track successful routing
-                    self.routing_stats["successful_routes"] += 1
-                    self._update_performance_history(provider_name, True, score)
-                    
-                    # Add routing metadata
-                    response.metadata.update({
-                        "router_selected_provider": provider_name,
-                        "router_score": score,
-                        "router_alternatives": len(ranked_providers) - 1,
-                        "request_priority": request.priority.value,
-                        "request_type": request.request_type.value
-                    })
-                    
-                    return response
-                    
-                except (ProviderUnavailableError, RateLimitError) as e:
-                    logger.warning(f"Provider {provider_name} failed: {e}")
-                    self._update_performance_history(provider_name, False, score)
+            # Hand the ranking to the service, which fails over and hedges
+            # to the next-best provider within the request deadline
+            provider_order = self._explore([name for name, _ in ranked_providers], request)
+            logger.info(
+                f"Routing request to {provider_order[0]} (score: {ranked_providers[0][1]:.3f})"
+            )
+            
+            try:
+                response = await self.llm_service.generate_response(
+                    messages=request.messages,
+                    provider_order=provider_order,
+                    deadline=request.deadline_seconds,
+                    **self._get_provider_kwargs(request)
+                )
+            except Exception as e:
+                logger.warning(f"All suitable providers failed for request: {e}")
+                # Only providers that were actually called count as failed
+                scores = dict(ranked_providers)
+                for provider_name in getattr(e, "details", {}).get("failed_providers", []):
+                    if provider_name in scores:
+                        self._update_performance_history(provider_name, False, scores[provider_name])
+                raise
+            
+            scores = dict(ranked_providers)
+            provider_name = response.metadata.get("provider_name", provider_order[0])
+            score = scores.get(provider_name, 0.0)
+            
+            if response.metadata.get("cache_hit"):
+                # Replayed from the response cache: no provider was called
+                self.routing_stats["cache_hits"] += 1
+            else:
+                for failed_name in response.metadata.get("failed_providers", []):
+                    self._update_performance_history(failed_name, False, scores[failed_name])
                     self.routing_stats["provider_failovers"] += 1
-                    last_error = e
-                    continue
-                    
-                except Exception as e:
-                    logger.error(f"Unexpected error from provider {provider_name}: {e}")
-                    self._update_performance_history(provider_name, False, score)
-                    last_error = e
-                    continue
-            
-            # All providers failed
-            error_msg = "All suitable providers failed for request"
-            if last_error:
-                error_msg += f". Last error: {last_error}"
-            
-            raise LLMProviderError(error_msg)
+                
+                # Track successful routing
+                self.routing_stats["successful_routes"] += 1
+                self._update_performance_history(provider_name, True, score)
+            
+            # Add routing metadata
+            response.metadata.update({
+                "router_selected_provider": provider_name,
+                "router_score": score,
+                "router_alternatives": len(ranked_providers) - 1,
+                "request_priority": request.priority.value,
+                "request_type": request.request_type.value
+            })
+            
+            return response
             
         except Exception as e:
             logger.error(f"Routing failed: {e}")
@@ -252,7 +280,7 @@ class IntelligentLLMRouter:
         available = []
         
         for provider in self.llm_service._providers:
-            if provider.is_available:
+            if self.llm_service.is_provider_healthy(provider):
                 available.append(provider.name)
         
         return available
@@ -273,6 +301,8 @@ class IntelligentLLMRouter:
             Dictionary mapping provider names to scores (0.0-1.0)
         """
         scores = {}
+        live_signals = self._get_live_signals(available_providers)
+        estimated_tokens = self._estimate_prompt_tokens(request)
         
         for provider_name in available_providers:
             if provider_name not in self.provider_capabilities:
@@ -292,8 +322,24 @@ class IntelligentLLMRouter:
             if request.require_streaming and not capabilities.supports_streaming:
                 continue
             
+            live = live_signals.get(provider_name)
+            
+            # Skip providers whose observed price exceeds the budget on the prompt alone
+            if (
+                request.max_cost is not None
+                and live is not None
+                and live.cost_per_1k_tokens is not None
+                and live.cost_per_1k_tokens * estimated_tokens / 1000 > request.max_cost
+            ):
+                continue
+            
             # Calculate base score
-            score = self._calculate_provider_score(request, capabilities)
+            score = self._calculate_provider_score(request, capabilities, live)
+            
+            # Penalize providers whose tail latency would miss the deadline
+            deadline = request.deadline_seconds
+            if deadline and live is not None and live.p95_latency and live.p95_latency > deadline:
+                score *= 0.5
             
             # Apply historical performance adjustment
             performance_modifier = self._get_performance_modifier(provider_name)
@@ -307,13 +353,118 @@ class IntelligentLLMRouter:
         
         return scores
     
+    def _get_live_signals(self, provider_names: List[str]) -> Dict[str, LiveProviderSignals]:
+        """
+        Derive live scores from service telemetry for the candidate providers.
+        
+        Speed and cost are relative to the best and most expensive observed
+        candidate, so they are comparable with the static 0.0-1.0 scores.
+        
+        Args:
+            provider_names: Candidate provider names
+            
+        Returns:
+            Signals for providers with at least one observed call
+        """
+        telemetry = getattr(self.llm_service, "telemetry", None)
+        if telemetry is None:
+            return {}
+        
+        observed = {
+            name: telemetry.get(name) for name in provider_names
+        }
+        observed = {name: entry for name, entry in observed.items() if entry.requests > 0}
+        if not observed:
+            return {}
+        
+        latencies = [e.ewma_latency for e in observed.values() if e.ewma_latency]
+        throughputs = [e.ewma_tokens_per_second for e in observed.values() if e.ewma_tokens_per_second]
+        costs = [e.ewma_cost_per_1k_tokens for e in observed.values() if e.ewma_cost_per_1k_tokens is not None]
+        fastest = min(latencies) if latencies else None
+        best_throughput = max(throughputs) if throughputs else None
+        highest_cost = max(costs) if costs else None
+        
+        signals = {}
+        for name, entry in observed.items():
+            speed_parts = []
+            if fastest and entry.ewma_latency:
+                speed_parts.append(fastest / entry.ewma_latency)
+            if best_throughput and entry.ewma_tokens_per_second:
+                speed_parts.append(entry.ewma_tokens_per_second / best_throughput)
+            
+            cost_score = None
+            if entry.ewma_cost_per_1k_tokens is not None:
+                cost_score = entry.ewma_cost_per_1k_tokens / highest_cost if highest_cost else 0.0
+            
+            signals[name] = LiveProviderSignals(
+                confidence=entry.requests / (entry.requests + self.min_samples),
+                speed_score=sum(speed_parts) / len(speed_parts) if speed_parts else None,
+                reliability_score=1.0 - entry.ewma_error_rate,
+                cost_score=cost_score,
+                p95_latency=entry.latencies.percentile(0.95),
+                cost_per_1k_tokens=entry.ewma_cost_per_1k_tokens
+            )
+        
+        return signals
+    
+    @staticmethod
+    def _estimate_prompt_tokens(request: RoutingRequest) -> int:
+        """Prompt size in tokens, counted with the generic tokenizer."""
+        return get_token_counter().count_messages(request.messages)
+    
+    def _explore(self, provider_order: List[str], request: RoutingRequest) -> List[str]:
+        """
+        Occasionally promote the least-observed runner-up to the front.
+        
+        Epsilon-greedy exploration keeps telemetry of non-preferred providers
+        fresh, so a recovered or newly fast provider can win again. Critical
+        requests always go to the best-ranked provider.
+        
+        Args:
+            provider_order: Providers ranked best first
+            request: Routing request
+            
+        Returns:
+            Provider order to attempt
+        """
+        if (
+            len(provider_order) < 2
+            or request.priority == RequestPriority.CRITICAL
+            or self._rng.random() >= self.exploration_rate
+        ):
+            return provider_order
+        
+        telemetry = getattr(self.llm_service, "telemetry", None)
+        runners_up = provider_order[1:]
+        if telemetry is not None:
+            fewest = min(telemetry.get(name).requests for name in runners_up)
+            runners_up = [name for name in runners_up if telemetry.get(name).requests == fewest]
+        explored = self._rng.choice(runners_up)
+        
+        self.routing_stats["explorations"] += 1
+        logger.debug(f"Exploring provider {explored} instead of {provider_order[0]}")
+        return [explored] + [name for name in provider_order if name != explored]
+    
     def _calculate_provider_score(
         self, 
         request: RoutingRequest, 
-        capabilities: ProviderCapabilities
+        capabilities: ProviderCapabilities,
+        live: Optional[LiveProviderSignals] = None
     ) -> float:
         """Calculate base score for a provider given request requirements."""
         
+        # Blend static capabilities with live telemetry by its confidence
+        speed_score = capabilities.speed_score
+        reliability_score = capabilities.reliability_score
+        provider_cost = capabilities.cost_score
+        if live is not None:
+            weight = live.confidence
+            if live.speed_score is not None:
+                speed_score = (1 - weight) * speed_score + weight * live.speed_score
+            reliability_score = (1 - weight) * reliability_score + weight * live.reliability_score
+            if live.cost_score is not None:
+                provider_cost = (1 - weight) * provider_cost + weight * live.cost_score
+        
         # Priority-based weighting
         if request.priority == RequestPriority.LOW:
             # Cost-optimized: prioritize low cost
@@ -343,6 +494,12 @@ class IntelligentLLMRouter:
             speed_weight = 0.25
             reliability_weight = 0.2
         
+        # A deadline shifts weight from cost to speed
+        if request.deadline_seconds and cost_weight > 0:
+            shift = min(cost_weight, 0.1)
+            cost_weight -= shift
+            speed_weight += shift
+        
         # Request type adjustments
         if request.request_type == RequestType.PHILOSOPHICAL:
             # Boost philosophical accuracy for educational content
@@ -353,13 +510,13 @@ class IntelligentLLMRouter:
         
         # Calculate weighted score
         # Note: Cost score is inverted (lower cost = higher score)
-        cost_score = 1.0 - capabilities.cost_score
+        cost_score = 1.0 - provider_cost
         
         base_score = (
             cost_score * cost_weight +
             capabilities.quality_score * quality_weight +
-            capabilities.speed_score * speed_weight +
-            capabilities.reliability_score * reliability_weight +
+            speed_score * speed_weight +
+            reliability_score * reliability_weight +
             capabilities.philosophical_accuracy * philosophical_weight
         )
         
@@ -423,9 +580,10 @@ class IntelligentLLMRouter:
     def get_routing_statistics(self) -> Dict[str, Any]:
         """Get routing statistics and performance metrics."""
         total_requests = self.routing_stats["total_requests"]
+        routed_requests = total_requests - self.routing_stats["cache_hits"]
         success_rate = (
-            self.routing_stats["successful_routes"] / total_requests 
-            if total_requests > 0 else 0.0
+            self.routing_stats["successful_routes"] / routed_requests 
+            if routed_requests > 0 else 0.0
         )
         
         return {
@@ -434,7 +592,10 @@ class IntelligentLLMRouter:
             "cost_optimized_requests": self.routing_stats["cost_optimized"],
             "quality_upgrades": self.routing_stats["quality_upgrades"], 
             "provider_failovers": self.routing_stats["provider_failovers"],
+            "explorations": self.routing_stats["explorations"],
+            "cache_hits": self.routing_stats["cache_hits"],
             "provider_performance": dict(self.performance_history),
+            "provider_telemetry": self.llm_service.telemetry.snapshot(),
             "active_providers": len(self._get_available_providers())
         }
     
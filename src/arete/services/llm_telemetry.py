@@ -0,0 +1,233 @@
+"""
+Live LLM provider telemetry for Arete Graph-RAG system.
+
+Tracks, per provider and per (provider, model):
+- A bounded window of recent latencies for percentiles
+- Exponentially weighted latency, error rate, throughput and cost per 1k tokens
+
+Routing and hedging use these observations instead of static estimates, so
+they react within a few requests when a provider degrades.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+class LatencyWindow:
+    """Bounded window of the most recent call latencies."""
+
+    def __init__(self, max_samples: int = 200):
+        """
+        Initialize latency window.
+
+        Args:
+            max_samples: Number of most recent latencies kept
+        """
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """Record the latency of one call in seconds."""
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Get a latency percentile using the nearest-rank method.
+
+        Args:
+            q: Percentile as a fraction (0.95 for p95)
+
+        Returns:
+            Latency in seconds, or None without samples
+        """
+        with self._lock:
+            if not self._samples:
+                return None
+            ordered = sorted(self._samples)
+        rank = max(1, math.ceil(q * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+
+def response_cost(response: Any) -> Optional[float]:
+    """
+    Get the actual cost of a response in USD, if it can be determined.
+
+    Uses an explicit cost in the response metadata when a provider reports
+    one, otherwise the per-1k pricing in ``model_info`` applied to the
+    reported usage. Local Ollama responses cost nothing.
+
+    Args:
+        response: LLMResponse returned by a provider
+
+    Returns:
+        Cost in USD, or None if unknown
+    """
+    metadata = response.metadata or {}
+    for key in ("cost", "total_cost"):
+        if isinstance(metadata.get(key), (int, float)):
+            return float(metadata[key])
+
+    if response.provider == "ollama":
+        return 0.0
+
+    model_info = metadata.get("model_info") or {}
+    usage = metadata.get("usage") or {}
+    if "cost_per_1k_input" in model_info and usage:
+        input_tokens = usage.get("input_tokens", usage.get("prompt_tokens", 0)) or 0
+        output_tokens = usage.get("output_tokens", usage.get("completion_tokens", 0)) or 0
+        return (
+            input_tokens / 1000 * model_info["cost_per_1k_input"]
+            + output_tokens / 1000 * model_info.get("cost_per_1k_output", 0.0)
+        )
+    return None
+
+
+class ProviderTelemetry:
+    """Exponentially weighted live performance of one provider or model."""
+
+    def __init__(self, alpha: float = 0.2, max_samples: int = 200):
+        """
+        Initialize provider telemetry.
+
+        Args:
+            alpha: Weight of the newest observation in the moving averages
+            max_samples: Latencies kept for percentiles
+        """
+        self.alpha = alpha
+        self.latencies = LatencyWindow(max_samples)
+        self.requests = 0
+        self.failures = 0
+        self.ewma_latency: Optional[float] = None
+        self.ewma_error_rate = 0.0
+        self.ewma_tokens_per_second: Optional[float] = None
+        self.ewma_cost_per_1k_tokens: Optional[float] = None
+        self.last_updated: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _ewma(self, current: Optional[float], value: float) -> float:
+        return value if current is None else self.alpha * value + (1 - self.alpha) * current
+
+    def record_success(
+        self,
+        latency: float,
+        tokens: Optional[int] = None,
+        cost: Optional[float] = None
+    ) -> None:
+        """
+        Record a successful call.
+
+        Args:
+            latency: Call latency in seconds
+            tokens: Total tokens used, if reported
+            cost: Actual cost in USD, if known
+        """
+        self.latencies.record(latency)
+        with self._lock:
+            self.requests += 1
+            self.ewma_latency = self._ewma(self.ewma_latency, latency)
+            self.ewma_error_rate = self._ewma(self.ewma_error_rate, 0.0)
+            if tokens:
+                if latency > 0:
+                    self.ewma_tokens_per_second = self._ewma(self.ewma_tokens_per_second, tokens / latency)
+                if cost is not None:
+                    self.ewma_cost_per_1k_tokens = self._ewma(
+                        self.ewma_cost_per_1k_tokens, cost / tokens * 1000
+                    )
+            self.last_updated = time.time()
+
+    def record_failure(self, latency: Optional[float] = None) -> None:
+        """
+        Record a failed or timed-out call.
+
+        Args:
+            latency: Time spent before the failure, in seconds
+        """
+        with self._lock:
+            self.requests += 1
+            self.failures += 1
+            self.ewma_error_rate = self._ewma(self.ewma_error_rate, 1.0)
+            if latency is not None:
+                # Slow failures (timeouts) should also raise the latency estimate
+                self.ewma_latency = self._ewma(self.ewma_latency, latency)
+            self.last_updated = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get current statistics."""
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "ewma_latency": self.ewma_latency,
+            "p50_latency": self.latencies.percentile(0.5),
+            "p95_latency": self.latencies.percentile(0.95),
+            "error_rate": self.ewma_error_rate,
+            "tokens_per_second": self.ewma_tokens_per_second,
+            "cost_per_1k_tokens": self.ewma_cost_per_1k_tokens,
+            "last_updated": self.last_updated,
+        }
+
+
+class LLMTelemetry:
+    """Live telemetry per provider and per (provider, model)."""
+
+    def __init__(self, alpha: float = 0.2):
+        """
+        Initialize telemetry registry.
+
+        Args:
+            alpha: Weight of the newest observation in the moving averages
+        """
+        self.alpha = alpha
+        self._entries: Dict[Tuple[str, Optional[str]], ProviderTelemetry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, provider: str, model: Optional[str] = None) -> ProviderTelemetry:
+        """Get telemetry for a provider, or for one of its models."""
+        key = (provider, model)
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = ProviderTelemetry(alpha=self.alpha)
+            return self._entries[key]
+
+    def _targets(self, provider: str, model: Optional[str]) -> List[ProviderTelemetry]:
+        targets = [self.get(provider)]
+        if model:
+            targets.append(self.get(provider, model))
+        return targets
+
+    def record_success(
+        self,
+        provider: str,
+        model: Optional[str],
+        latency: float,
+        tokens: Optional[int] = None,
+        cost: Optional[float] = None
+    ) -> None:
+        """Record a successful call for the provider and its model."""
+        for telemetry in self._targets(provider, model):
+            telemetry.record_success(latency, tokens, cost)
+
+    def record_failure(
+        self,
+        provider: str,
+        model: Optional[str],
+        latency: Optional[float] = None
+    ) -> None:
+        """Record a failed call for the provider and its model."""
+        for telemetry in self._targets(provider, model):
+            telemetry.record_failure(latency)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get statistics keyed by "provider" or "provider/model"."""
+        with self._lock:
+            entries = list(self._entries.items())
+        return {
+            provider if model is None else f"{provider}/{model}": telemetry.snapshot()
+            for (provider, model), telemetry in entries
+        }
@@ -7,7 +7,7 @@ including model management, streaming support, and error handling.
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Union
+from typing import AsyncIterator, List, Dict, Any, Optional, Union
 import json
 
 import httpx
@@ -16,12 +16,15 @@ from arete.services.llm_provider import (
     LLMProvider,
     LLMMessage,
     LLMResponse,
+    LLMStreamChunk,
     MessageRole,
     LLMProviderError,
     ProviderUnavailableError,
-    RateLimitError
+    RateLimitError,
+    collect_stream
 )
 from arete.config import Settings
+from arete.services.llm_async_core import pooled_http_client, run_sync
 
 # Setup logger
 logger = logging.getLogger(__name__)
@@ -105,7 +108,7 @@ class OllamaProvider(LLMProvider):
                 self._initialized = True
             else:
                 # We're not in an async context, run synchronously
-                asyncio.run(init_check())
+                run_sync(init_check())
                 self._initialized = True
         
         except Exception as e:
@@ -130,7 +133,7 @@ class OllamaProvider(LLMProvider):
     async def _check_availability(self) -> bool:
         """Check if Ollama server is available."""
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
+            async with pooled_http_client(5.0) as client:
                 response = await client.get(f"{self.base_url}/api/version")
                 return response.status_code == 200
         except (httpx.ConnectError, httpx.TimeoutException, Exception):
@@ -139,7 +142,7 @@ class OllamaProvider(LLMProvider):
     async def _get_available_models(self) -> List[str]:
         """Get list of available models from Ollama server."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_client(self.timeout) as client:
                 response = await client.get(f"{self.base_url}/api/tags")
                 
                 if response.status_code == 200:
@@ -186,7 +189,7 @@ class OllamaProvider(LLMProvider):
         # Use defaults if not provided
         model = model or self._get_default_model(self._available_models)
         max_tokens = max_tokens or self.max_tokens
-        temperature = temperature or self.temperature
+        temperature = temperature if temperature is not None else self.temperature
         
         try:
             if stream:
@@ -226,7 +229,7 @@ class OllamaProvider(LLMProvider):
             **kwargs
         )
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with pooled_http_client(self.timeout) as client:
             response = await client.post(
                 f"{self.base_url}/api/chat",
                 json=request_data
@@ -254,6 +257,52 @@ class OllamaProvider(LLMProvider):
                 }
             )
 
+    async def stream_response(
+        self,
+        messages: List[LLMMessage],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a response from Ollama as content deltas.
+        
+        Args:
+            messages: Conversation messages
+            model: Model to use (defaults to available model)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional parameters
+            
+        Yields:
+            Response chunks; the last one carries finish reason and usage
+            
+        Raises:
+            LLMProviderError: If generation fails
+            ProviderUnavailableError: If Ollama server is unavailable
+        """
+        if not self._initialized:
+            raise LLMProviderError("Provider not initialized. Call initialize() first.")
+        
+        model = model or self._get_default_model(self._available_models)
+        max_tokens = max_tokens or self.max_tokens
+        temperature = temperature if temperature is not None else self.temperature
+        kwargs.pop("stream", None)
+        
+        try:
+            async for chunk in self._stream_chunks(
+                messages, model, max_tokens, temperature, **kwargs
+            ):
+                yield chunk
+        except httpx.ConnectError as e:
+            raise ProviderUnavailableError(
+                f"Ollama server unavailable: {e}",
+                provider=self.name
+            )
+        except httpx.TimeoutException as e:
+            raise LLMProviderError(f"Request timeout: {e}")
+
     async def _generate_streaming(
         self,
         messages: List[LLMMessage],
@@ -263,6 +312,21 @@ class OllamaProvider(LLMProvider):
         **kwargs
     ) -> LLMResponse:
         """Generate response using streaming mode."""
+        return await collect_stream(
+            self._stream_chunks(messages, model, max_tokens, temperature, **kwargs),
+            self.name,
+            model
+        )
+
+    async def _stream_chunks(
+        self,
+        messages: List[LLMMessage],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        **kwargs
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Yield text deltas from the newline-delimited JSON chat stream."""
         request_data = self._build_request_params(
             messages=messages,
             model=model,
@@ -272,62 +336,46 @@ class OllamaProvider(LLMProvider):
             **kwargs
         )
         
-        content_parts = []
         final_data = {}
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            # For testing, we need to handle both streaming and mock responses
-            if hasattr(client, 'stream') and callable(client.stream):
-                async with client.stream(
-                    "POST",
-                    f"{self.base_url}/api/chat",
-                    json=request_data
-                ) as response:
+        async with pooled_http_client(self.timeout) as client:
+            async with client.stream(
+                "POST",
+                f"{self.base_url}/api/chat",
+                json=request_data
+            ) as response:
+                
+                if response.status_code != 200:
+                    raise LLMProviderError(
+                        f"Ollama API error: HTTP {response.status_code}"
+                    )
+                
+                async for line in response.aiter_lines():
+                    if not line.strip():
+                        continue
                     
-                    if response.status_code != 200:
-                        raise LLMProviderError(
-                            f"Ollama API error: HTTP {response.status_code}"
-                        )
+                    try:
+                        chunk_data = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
                     
-                    async for line in response.aiter_lines():
-                        if line.strip():
-                            try:
-                                chunk_data = json.loads(line)
-                                
-                                if "message" in chunk_data and "content" in chunk_data["message"]:
-                                    content_parts.append(chunk_data["message"]["content"])
-                                
-                                if chunk_data.get("done", False):
-                                    final_data = chunk_data
-                                    break
-                                    
-                            except json.JSONDecodeError:
-                                continue
-            else:
-                # Fallback for testing with mocked stream
-                stream_mock = client.stream("POST", f"{self.base_url}/api/chat", json=request_data)
-                async for chunk in stream_mock:
-                    chunk_data = chunk.json()
-                    if "message" in chunk_data and "content" in chunk_data["message"]:
-                        content_parts.append(chunk_data["message"]["content"])
+                    content = chunk_data.get("message", {}).get("content")
+                    if content:
+                        yield LLMStreamChunk(delta=content, provider=self.name, model=model)
                     
                     if chunk_data.get("done", False):
                         final_data = chunk_data
                         break
         
-        full_content = "".join(content_parts)
-        tokens = final_data.get("eval_count")
-        
-        return LLMResponse(
-            content=full_content,
-            usage_tokens=tokens,
+        yield LLMStreamChunk(
+            delta="",
             provider=self.name,
             model=model,
             finish_reason="stop" if final_data.get("done") else "incomplete",
+            usage_tokens=final_data.get("eval_count"),
             metadata={
                 "total_duration": final_data.get("total_duration"),
-                "eval_duration": final_data.get("eval_duration"),
-                "streaming": True
+                "eval_duration": final_data.get("eval_duration")
             }
         )
 
@@ -405,7 +453,7 @@ class OllamaProvider(LLMProvider):
             True if successful, False otherwise
         """
         try:
-            async with httpx.AsyncClient(timeout=300) as client:  # Longer timeout for model pulls
+            async with pooled_http_client(300) as client:  # Longer timeout for model pulls
                 response = await client.post(
                     f"{self.base_url}/api/pull",
                     json={"name": model_name}
@@ -435,7 +483,7 @@ class OllamaProvider(LLMProvider):
             True if successful, False otherwise
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_client(self.timeout) as client:
                 response = await client.delete(
                     f"{self.base_url}/api/delete",
                     json={"name": model_name}
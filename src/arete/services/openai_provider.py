@@ -8,15 +8,17 @@ with comprehensive error handling.
 
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional, AsyncGenerator
+from typing import List, Dict, Any, Optional, AsyncGenerator, AsyncIterator
 import httpx
 import json
 import time
 
 from arete.services.llm_provider import (
-    LLMProvider, LLMMessage, LLMResponse, MessageRole,
-    LLMProviderError, ProviderUnavailableError, RateLimitError, AuthenticationError
+    LLMProvider, LLMMessage, LLMResponse, LLMStreamChunk, MessageRole,
+    LLMProviderError, ProviderUnavailableError, RateLimitError, AuthenticationError,
+    collect_stream
 )
+from arete.services.token_counter import get_token_counter
 from arete.config import Settings
 
 # Setup logger
@@ -344,65 +346,123 @@ class OpenAIProvider(LLMProvider):
             }
         )
     
+    async def stream_response(
+        self,
+        messages: List[LLMMessage],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        frequency_penalty: Optional[float] = None,
+        presence_penalty: Optional[float] = None,
+        **kwargs
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a response from the OpenAI API as content deltas.
+        
+        Args:
+            messages: Conversation messages
+            model: Model to use (defaults to gpt-3.5-turbo)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature (0-2)
+            top_p: Top-p sampling parameter
+            frequency_penalty: Frequency penalty (-2 to 2)
+            presence_penalty: Presence penalty (-2 to 2)
+            **kwargs: Additional parameters
+            
+        Yields:
+            Response chunks; the last one carries finish reason and usage
+            
+        Raises:
+            LLMProviderError: If generation fails
+            ProviderUnavailableError: If OpenAI API is unavailable
+            RateLimitError: If rate limit is exceeded
+            AuthenticationError: If authentication fails
+        """
+        await self._ensure_initialized()
+        
+        if not self.is_available:
+            raise ProviderUnavailableError("OpenAI provider not available", "openai")
+        
+        kwargs.pop("stream", None)
+        payload = self.build_request_params(
+            messages=messages,
+            model=model or self.get_default_model(),
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True,
+            top_p=top_p,
+            frequency_penalty=frequency_penalty,
+            presence_penalty=presence_penalty,
+            **kwargs
+        )
+        
+        try:
+            async for chunk in self._stream_payload(payload):
+                yield chunk
+        except httpx.HTTPStatusError as e:
+            await self._handle_http_error(e)
+    
     async def _generate_streaming_response(self, payload: Dict[str, Any]) -> LLMResponse:
         """Generate streaming response."""
-        content_chunks = []
+        return await collect_stream(self._stream_payload(payload), "openai", payload.get("model"))
+    
+    async def _stream_payload(self, payload: Dict[str, Any]) -> AsyncIterator[LLMStreamChunk]:
+        """Yield content deltas from a streamed chat completion."""
+        # Ask for a final usage chunk so streamed calls report tokens
+        payload = {**payload, "stream_options": {"include_usage": True}}
         finish_reason = None
         model = None
-        usage_tokens = None
+        usage = {}
         metadata = {}
         
         async with self.client.stream("POST", "/chat/completions", json=payload) as response:
             response.raise_for_status()
             
             async for line in response.aiter_lines():
-                if not line.strip():
+                if not line.startswith("data: "):
                     continue
                 
-                if line.startswith("data: "):
-                    data_str = line[6:]  # Remove "data: " prefix
+                data_str = line[6:]  # Remove "data: " prefix
+                if data_str.strip() == "[DONE]":
+                    break
+                
+                try:
+                    chunk_data = json.loads(data_str)
+                except json.JSONDecodeError:
+                    continue
+                
+                # Get model and metadata from first chunk
+                if model is None:
+                    model = chunk_data.get("model")
+                if not metadata and chunk_data.get("id"):
+                    metadata.update({
+                        "id": chunk_data.get("id"),
+                        "created": chunk_data.get("created")
+                    })
+                
+                if chunk_data.get("usage"):
+                    usage = chunk_data["usage"]
+                
+                if chunk_data.get("choices"):
+                    choice = chunk_data["choices"][0]
                     
-                    if data_str.strip() == "[DONE]":
-                        break
+                    # Extract content delta
+                    content = choice.get("delta", {}).get("content")
+                    if content:
+                        yield LLMStreamChunk(delta=content, provider="openai", model=model)
                     
-                    try:
-                        chunk_data = json.loads(data_str)
-                        
-                        if "choices" in chunk_data and chunk_data["choices"]:
-                            choice = chunk_data["choices"][0]
-                            
-                            # Get model from first chunk
-                            if model is None:
-                                model = chunk_data.get("model")
-                            
-                            # Extract content delta
-                            delta = choice.get("delta", {})
-                            if "content" in delta and delta["content"]:
-                                content_chunks.append(delta["content"])
-                            
-                            # Check for finish reason
-                            if choice.get("finish_reason"):
-                                finish_reason = choice["finish_reason"]
-                        
-                        # Extract metadata from first chunk
-                        if not metadata and chunk_data.get("id"):
-                            metadata.update({
-                                "id": chunk_data.get("id"),
-                                "created": chunk_data.get("created")
-                            })
-                            
-                    except json.JSONDecodeError:
-                        continue
-        
-        content = "".join(content_chunks)
+                    # Check for finish reason
+                    if choice.get("finish_reason"):
+                        finish_reason = choice["finish_reason"]
         
-        return LLMResponse(
-            content=content,
+        yield LLMStreamChunk(
+            delta="",
             provider="openai",
             model=model,
-            usage_tokens=usage_tokens,
             finish_reason=finish_reason,
-            metadata=metadata
+            usage_tokens=usage.get("total_tokens"),
+            metadata={**metadata, "usage": usage}
         )
     
     def _format_messages(self, messages: List[LLMMessage]) -> List[Dict[str, str]]:
@@ -478,9 +538,7 @@ class OpenAIProvider(LLMProvider):
         """
         model = model or "gpt-3.5-turbo"
         
-        # Rough token estimation (4 chars = 1 token)
-        total_chars = sum(len(msg.content) for msg in messages)
-        estimated_tokens = total_chars // 4
+        estimated_tokens = get_token_counter(self.name, model).count_messages(messages)
         
         # Pricing per 1K tokens (as of 2024, approximate)
         pricing = {
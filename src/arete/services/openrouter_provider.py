@@ -8,7 +8,7 @@ model selection, and rate limit handling.
 
 import asyncio
 import logging
-from typing import List, Dict, Any, Optional, Union
+from typing import AsyncIterator, List, Dict, Any, Optional, Union
 import json
 
 import httpx
@@ -17,13 +17,16 @@ from arete.services.llm_provider import (
     LLMProvider,
     LLMMessage,
     LLMResponse,
+    LLMStreamChunk,
     MessageRole,
     LLMProviderError,
     ProviderUnavailableError,
     RateLimitError,
-    AuthenticationError
+    AuthenticationError,
+    collect_stream
 )
 from arete.config import Settings
+from arete.services.llm_async_core import pooled_http_client, run_sync
 
 # Setup logger
 logger = logging.getLogger(__name__)
@@ -112,7 +115,7 @@ class OpenRouterProvider(LLMProvider):
                 self._initialized = True
             else:
                 # We're not in an async context, run synchronously
-                asyncio.run(init_check())
+                run_sync(init_check())
                 self._initialized = True
         
         except Exception as e:
@@ -138,7 +141,7 @@ class OpenRouterProvider(LLMProvider):
         try:
             headers = self._get_headers()
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with pooled_http_client(self.timeout) as client:
                 response = await client.get(
                     f"{self.base_url}/models",
                     headers=headers
@@ -223,7 +226,7 @@ class OpenRouterProvider(LLMProvider):
         # Use defaults if not provided
         model = model or self._get_default_model(self._available_models)
         max_tokens = max_tokens or self.max_tokens
-        temperature = temperature or self.temperature
+        temperature = temperature if temperature is not None else self.temperature
         
         try:
             if stream:
@@ -265,7 +268,7 @@ class OpenRouterProvider(LLMProvider):
         
         headers = self._get_headers()
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with pooled_http_client(self.timeout) as client:
             response = await client.post(
                 f"{self.base_url}/chat/completions",
                 json=request_data,
@@ -291,6 +294,52 @@ class OpenRouterProvider(LLMProvider):
                 }
             )
 
+    async def stream_response(
+        self,
+        messages: List[LLMMessage],
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a response from the OpenRouter API as content deltas.
+        
+        Args:
+            messages: Conversation messages
+            model: Model to use (defaults to available model)
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            **kwargs: Additional parameters
+            
+        Yields:
+            Response chunks; the last one carries finish reason and usage
+            
+        Raises:
+            LLMProviderError: If generation fails
+            ProviderUnavailableError: If API is unavailable
+        """
+        if not self._initialized:
+            raise LLMProviderError("Provider not initialized. Call initialize() first.")
+        
+        model = model or self._get_default_model(self._available_models)
+        max_tokens = max_tokens or self.max_tokens
+        temperature = temperature if temperature is not None else self.temperature
+        kwargs.pop("stream", None)
+        
+        try:
+            async for chunk in self._stream_chunks(
+                messages, model, max_tokens, temperature, **kwargs
+            ):
+                yield chunk
+        except httpx.ConnectError as e:
+            raise ProviderUnavailableError(
+                f"OpenRouter API unavailable: {e}",
+                provider=self.name
+            )
+        except httpx.TimeoutException as e:
+            raise LLMProviderError(f"Request timeout: {e}")
+
     async def _generate_streaming(
         self,
         messages: List[LLMMessage],
@@ -300,6 +349,21 @@ class OpenRouterProvider(LLMProvider):
         **kwargs
     ) -> LLMResponse:
         """Generate response using streaming mode."""
+        return await collect_stream(
+            self._stream_chunks(messages, model, max_tokens, temperature, **kwargs),
+            self.name,
+            model
+        )
+
+    async def _stream_chunks(
+        self,
+        messages: List[LLMMessage],
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        **kwargs
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """Yield text deltas from the chat completions event stream."""
         request_data = self._build_request_params(
             messages=messages,
             model=model,
@@ -310,11 +374,10 @@ class OpenRouterProvider(LLMProvider):
         )
         
         headers = self._get_headers()
-        content_parts = []
         final_usage = None
         final_finish_reason = None
         
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with pooled_http_client(self.timeout) as client:
             async with client.stream(
                 "POST",
                 f"{self.base_url}/chat/completions",
@@ -325,49 +388,42 @@ class OpenRouterProvider(LLMProvider):
                 await self._handle_api_errors(response)
                 
                 async for line in response.aiter_lines():
-                    if line.strip():
-                        # Parse server-sent events format
-                        if line.startswith("data: "):
-                            data_str = line[6:]  # Remove "data: " prefix
-                            
-                            if data_str == "[DONE]":
-                                break
-                            
-                            try:
-                                chunk_data = json.loads(data_str)
-                                
-                                if "choices" in chunk_data and chunk_data["choices"]:
-                                    choice = chunk_data["choices"][0]
-                                    
-                                    # Extract content delta
-                                    if "delta" in choice and "content" in choice["delta"]:
-                                        content_parts.append(choice["delta"]["content"])
-                                    
-                                    # Check for finish reason
-                                    if "finish_reason" in choice and choice["finish_reason"]:
-                                        final_finish_reason = choice["finish_reason"]
-                                
-                                # Extract usage info if available
-                                if "usage" in chunk_data:
-                                    final_usage = chunk_data["usage"]
-                                    
-                            except json.JSONDecodeError:
-                                continue
-        
-        full_content = "".join(content_parts)
-        total_tokens = None
-        
-        if final_usage:
-            total_tokens = final_usage.get("total_tokens")
-        
-        return LLMResponse(
-            content=full_content,
-            usage_tokens=total_tokens,
+                    # Parse server-sent events format; comments keep the connection alive
+                    if not line.startswith("data: "):
+                        continue
+                    
+                    data_str = line[6:]
+                    if data_str.strip() == "[DONE]":
+                        break
+                    
+                    try:
+                        chunk_data = json.loads(data_str)
+                    except json.JSONDecodeError:
+                        continue
+                    
+                    if "choices" in chunk_data and chunk_data["choices"]:
+                        choice = chunk_data["choices"][0]
+                        
+                        # Extract content delta
+                        content = choice.get("delta", {}).get("content")
+                        if content:
+                            yield LLMStreamChunk(delta=content, provider=self.name, model=model)
+                        
+                        # Check for finish reason
+                        if choice.get("finish_reason"):
+                            final_finish_reason = choice["finish_reason"]
+                    
+                    # Extract usage info if available
+                    if chunk_data.get("usage"):
+                        final_usage = chunk_data["usage"]
+        
+        yield LLMStreamChunk(
+            delta="",
             provider=self.name,
             model=model,
             finish_reason=final_finish_reason or "stop",
+            usage_tokens=final_usage.get("total_tokens") if final_usage else None,
             metadata={
-                "streaming": True,
                 "usage": final_usage or {},
                 "model_info": self._model_info.get(model, {})
             }
@@ -0,0 +1,300 @@
+"""
+Pipeline Scheduler for Arete Graph-RAG system.
+
+Provides admission control and bounded concurrency for pipeline work:
+- Global limit on concurrently running jobs
+- Per-stage semaphores so expensive stages (e.g. LLM generation) can be
+  narrower than cheap ones (e.g. retrieval)
+- Fair round-robin queueing across callers, so one large batch cannot
+  starve interactive requests
+- Load shedding with an explicit overload error when the queue is full or
+  a job waits too long to start
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional
+
+from .base import ServiceError
+
+logger = logging.getLogger(__name__)
+
+
+class SchedulerOverloadedError(ServiceError):
+    """Raised when a job is shed because the scheduler is overloaded."""
+    pass
+
+
+@dataclass
+class SchedulerMetrics:
+    """Counters for scheduler activity."""
+
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    shed: int = 0
+    total_queue_wait: float = 0.0
+    max_queue_wait: float = 0.0
+
+    @property
+    def average_queue_wait(self) -> float:
+        """Average time jobs spent queued before starting."""
+        started = self.completed + self.failed
+        return self.total_queue_wait / started if started else 0.0
+
+
+@dataclass
+class _QueuedJob:
+    """A job waiting for an execution slot."""
+
+    caller_id: str
+    job_factory: Callable[[], Awaitable[Any]]
+    future: "asyncio.Future[Any]"
+    enqueued_at: float = field(default_factory=time.monotonic)
+    started: bool = False
+    task: Optional["asyncio.Task[None]"] = None
+
+
+class PipelineScheduler:
+    """
+    Fair, bounded scheduler for asynchronous pipeline jobs.
+
+    Jobs are queued per caller and dispatched round-robin whenever one of the
+    ``max_concurrency`` execution slots frees up. Inside a job, ``stage()``
+    bounds the number of concurrent calls to a particular backend.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        stage_limits: Optional[Dict[str, int]] = None,
+        max_queue_size: int = 500,
+        max_queue_wait: Optional[float] = None
+    ):
+        """
+        Initialize pipeline scheduler.
+
+        Args:
+            max_concurrency: Maximum number of jobs running at once
+            stage_limits: Maximum concurrent executions per named stage
+            max_queue_size: Maximum number of queued jobs before shedding
+            max_queue_wait: Optional seconds a job may wait before being shed
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.max_concurrency = max_concurrency
+        self.max_queue_size = max_queue_size
+        self.max_queue_wait = max_queue_wait
+        self.stage_limits = dict(stage_limits or {})
+        self.metrics = SchedulerMetrics()
+
+        self._stage_semaphores: Dict[str, asyncio.Semaphore] = {
+            stage: asyncio.Semaphore(limit) for stage, limit in self.stage_limits.items()
+        }
+        self._queues: "OrderedDict[str, Deque[_QueuedJob]]" = OrderedDict()
+        self._queued_count = 0
+        self._active_count = 0
+
+    @property
+    def queued(self) -> int:
+        """Number of jobs waiting for a slot."""
+        return self._queued_count
+
+    @property
+    def active(self) -> int:
+        """Number of jobs currently running."""
+        return self._active_count
+
+    async def submit(
+        self,
+        job_factory: Callable[[], Awaitable[Any]],
+        caller_id: str = "default"
+    ) -> Any:
+        """
+        Run a job once an execution slot is available.
+
+        Args:
+            job_factory: Zero-argument callable returning the awaitable to run
+            caller_id: Identifier used for fair queueing between callers
+
+        Returns:
+            Result of the job
+
+        Raises:
+            SchedulerOverloadedError: If the job was shed
+        """
+        self.metrics.submitted += 1
+
+        if self._queued_count >= self.max_queue_size:
+            self.metrics.shed += 1
+            raise SchedulerOverloadedError(
+                "Pipeline scheduler overloaded: queue is full",
+                {"queued": self._queued_count, "max_queue_size": self.max_queue_size}
+            )
+
+        job = _QueuedJob(
+            caller_id=caller_id,
+            job_factory=job_factory,
+            future=asyncio.get_running_loop().create_future()
+        )
+        self._queues.setdefault(caller_id, deque()).append(job)
+        self._queued_count += 1
+        self._dispatch()
+
+        try:
+            if self.max_queue_wait is None:
+                return await job.future
+
+            try:
+                return await asyncio.wait_for(asyncio.shield(job.future), timeout=self.max_queue_wait)
+            except asyncio.TimeoutError:
+                if job.started:
+                    # Already running; only admission is time-bounded
+                    return await job.future
+                self._remove_queued(job)
+                self.metrics.shed += 1
+                raise SchedulerOverloadedError(
+                    "Pipeline scheduler overloaded: job waited too long to start",
+                    {"max_queue_wait": self.max_queue_wait}
+                )
+        except asyncio.CancelledError:
+            # Caller went away: drop the job or stop it if already running
+            if job.started and job.task is not None:
+                job.task.cancel()
+            else:
+                self._remove_queued(job)
+            raise
+
+    @asynccontextmanager
+    async def admit(self, caller_id: str = "default") -> AsyncIterator[None]:
+        """
+        Hold an execution slot for the duration of a block.
+
+        For work that cannot be wrapped in a single awaitable, such as a
+        streamed response. Queueing and shedding work as in ``submit()``.
+
+        Args:
+            caller_id: Identifier used for fair queueing between callers
+
+        Raises:
+            SchedulerOverloadedError: If the block was shed before it started
+        """
+        loop = asyncio.get_running_loop()
+        admitted = loop.create_future()
+        released = asyncio.Event()
+
+        async def hold_slot() -> None:
+            if not admitted.done():
+                admitted.set_result(None)
+            await released.wait()
+
+        holder = asyncio.ensure_future(self.submit(hold_slot, caller_id=caller_id))
+        try:
+            await asyncio.wait({admitted, holder}, return_when=asyncio.FIRST_COMPLETED)
+        except asyncio.CancelledError:
+            holder.cancel()
+            raise
+        if not admitted.done():
+            # Shed before a slot was free
+            holder.result()
+
+        try:
+            yield
+        finally:
+            released.set()
+            await asyncio.wait({holder})
+
+    @asynccontextmanager
+    async def stage(self, name: str) -> AsyncIterator[None]:
+        """
+        Bound concurrent executions of a named stage.
+
+        Stages without a configured limit are not restricted.
+
+        Args:
+            name: Stage name
+        """
+        semaphore = self._stage_semaphores.get(name)
+        if semaphore is None:
+            yield
+            return
+
+        async with semaphore:
+            yield
+
+    def _next_job(self) -> Optional[_QueuedJob]:
+        """Pop the next job, rotating between callers."""
+        while self._queues:
+            caller_id, queue = next(iter(self._queues.items()))
+            job = queue.popleft()
+            if queue:
+                self._queues.move_to_end(caller_id)
+            else:
+                del self._queues[caller_id]
+            self._queued_count -= 1
+            if not job.future.done():
+                return job
+        return None
+
+    def _remove_queued(self, job: _QueuedJob) -> None:
+        """Remove a job that is still waiting in its caller's queue."""
+        queue = self._queues.get(job.caller_id)
+        if queue is None or job not in queue:
+            return
+        queue.remove(job)
+        self._queued_count -= 1
+        if not queue:
+            del self._queues[job.caller_id]
+
+    def _dispatch(self) -> None:
+        """Start queued jobs while execution slots are free."""
+        while self._active_count < self.max_concurrency:
+            job = self._next_job()
+            if job is None:
+                return
+            job.started = True
+            self._active_count += 1
+            job.task = asyncio.create_task(self._run(job))
+
+    async def _run(self, job: _QueuedJob) -> None:
+        """Execute a job and release its slot."""
+        wait_time = time.monotonic() - job.enqueued_at
+        self.metrics.total_queue_wait += wait_time
+        self.metrics.max_queue_wait = max(self.metrics.max_queue_wait, wait_time)
+
+        try:
+            result = await job.job_factory()
+            self.metrics.completed += 1
+            if not job.future.done():
+                job.future.set_result(result)
+        except asyncio.CancelledError:
+            self.metrics.failed += 1
+            job.future.cancel()
+        except Exception as e:
+            self.metrics.failed += 1
+            if not job.future.done():
+                job.future.set_exception(e)
+        finally:
+            self._active_count -= 1
+            self._dispatch()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "stage_limits": dict(self.stage_limits),
+            "active": self._active_count,
+            "queued": self._queued_count,
+            "callers_waiting": len(self._queues),
+            "submitted": self.metrics.submitted,
+            "completed": self.metrics.completed,
+            "failed": self.metrics.failed,
+            "shed": self.metrics.shed,
+            "average_queue_wait": self.metrics.average_queue_wait,
+            "max_queue_wait": self.metrics.max_queue_wait,
+        }
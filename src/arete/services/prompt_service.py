@@ -19,6 +19,8 @@ from arete.services.prompt_template import (
     PhilosophicalContext,
     Citation
 )
+from arete.services.prompt_versioning import PromptVersioningService
+from arete.services.llm_async_core import CancellationToken
 from arete.services.simple_llm_service import SimpleLLMService
 from arete.services.llm_provider import LLMMessage, MessageRole, LLMResponse
 from arete.config import Settings, get_settings
@@ -32,11 +34,21 @@ class PromptTemplateFactory:
     Factory for creating provider-specific prompt templates.
     
     Manages the creation and caching of prompt templates optimized for
-    different LLM providers and philosophical tutoring scenarios.
+    different LLM providers and philosophical tutoring scenarios. Templates
+    are versioned under the name "<provider>:<prompt type>"; when a newer
+    version is published, the template switches to it and its compiled
+    prompts are discarded.
     """
     
-    def __init__(self):
-        """Initialize template factory."""
+    def __init__(self, versioning_service: Optional[PromptVersioningService] = None):
+        """
+        Initialize template factory.
+        
+        Args:
+            versioning_service: Optional prompt versioning service whose latest
+                versions override the built-in system prompts
+        """
+        self.versioning_service = versioning_service
         self._template_cache: Dict[str, BasePromptTemplate] = {}
         self._template_registry: Dict[PromptType, Type[BasePromptTemplate]] = {
             PromptType.TUTORING: PhilosophicalTutoringTemplate,
@@ -61,21 +73,31 @@ class PromptTemplateFactory:
         cache_key = f"{provider}:{prompt_type.value}"
         
         # Check cache first
-        if cache_key in self._template_cache:
-            return self._template_cache[cache_key]
-        
-        # Get template class
-        template_class = self._template_registry.get(prompt_type)
-        if not template_class:
-            raise ValueError(f"Unsupported prompt type: {prompt_type}")
+        template = self._template_cache.get(cache_key)
+        if template is None:
+            # Get template class
+            template_class = self._template_registry.get(prompt_type)
+            if not template_class:
+                raise ValueError(f"Unsupported prompt type: {prompt_type}")
+            
+            # Create and cache template
+            template = template_class(provider)
+            self._template_cache[cache_key] = template
+            logger.info(f"Created prompt template: {cache_key}")
         
-        # Create and cache template
-        template = template_class(provider)
-        self._template_cache[cache_key] = template
+        if self.versioning_service is not None:
+            self._sync_version(template, cache_key)
         
-        logger.info(f"Created prompt template: {provider}:{prompt_type.value}")
         return template
     
+    def _sync_version(self, template: BasePromptTemplate, template_name: str) -> None:
+        """Switch a template to the latest published version of its prompt."""
+        latest = self.versioning_service.get_latest_version(template_name)
+        version_id = latest.version_id if latest else None
+        if version_id != template.version_id:
+            template.apply_version(version_id, latest.system_prompt if latest else None)
+            logger.info(f"Prompt template {template_name} switched to version {version_id}")
+    
     def register_template(self, prompt_type: PromptType, template_class: Type[BasePromptTemplate]) -> None:
         """
         Register a new template type.
@@ -110,6 +132,8 @@ class TutoringRequest:
     provider: Optional[str] = None
     prompt_type: PromptType = PromptType.TUTORING
     metadata: Dict[str, Any] = None
+    cancel_token: Optional[CancellationToken] = None  # Cancelled when the student abandons the question
+    deadline: Optional[float] = None  # Seconds until generation is abandoned
     
     def __post_init__(self):
         """Initialize default values."""
@@ -144,17 +168,24 @@ class PromptService:
     optimized philosophical tutoring experiences.
     """
     
-    def __init__(self, settings: Optional[Settings] = None, llm_service: Optional[SimpleLLMService] = None):
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        llm_service: Optional[SimpleLLMService] = None,
+        versioning_service: Optional[PromptVersioningService] = None
+    ):
         """
         Initialize prompt service.
         
         Args:
             settings: Application configuration
             llm_service: LLM service instance (creates new if None)
+            versioning_service: Optional prompt versioning service for
+                versioned system prompts
         """
         self.settings = settings or get_settings()
         self.llm_service = llm_service or SimpleLLMService(self.settings)
-        self.template_factory = PromptTemplateFactory()
+        self.template_factory = PromptTemplateFactory(versioning_service)
         
         logger.info("PromptService initialized")
     
@@ -203,7 +234,9 @@ class PromptService:
         # Generate response
         llm_response = await self.llm_service.generate_response(
             messages=messages,
-            provider=provider
+            provider=provider,
+            cancel_token=request.cancel_token,
+            deadline=request.deadline
         )
         
         # Create tutoring response
@@ -10,12 +10,18 @@ import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Any, Optional, Union
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, Optional, Tuple, Union
 import re
 
+from arete.services.token_counter import get_token_counter, pack_passages
+
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# Provider configurations, loaded once per template class
+_provider_configs_by_class: Dict[type, Dict[str, Dict[str, Any]]] = {}
+
 
 class PromptType(Enum):
     """Types of philosophical prompts supported."""
@@ -58,6 +64,7 @@ class PromptContext:
     student_level: str = "undergraduate"  # undergraduate, graduate, advanced
     learning_objective: Optional[str] = None
     previous_context: Optional[str] = None
+    max_context_tokens: Optional[int] = None  # Token budget of the retrieved passages
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
@@ -73,6 +80,14 @@ class PromptResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@lru_cache(maxsize=1024)
+def _render_citations(entries: Tuple[Tuple[str, str], ...]) -> str:
+    """Render (text, reference) citation entries as a numbered list."""
+    return "\n\n".join(
+        f"[{i}] {text}\n    — {reference}" for i, (text, reference) in enumerate(entries, 1)
+    )
+
+
 class BasePromptTemplate(ABC):
     """
     Abstract base class for prompt templates.
@@ -91,6 +106,8 @@ class BasePromptTemplate(ABC):
         """
         self.provider = provider
         self.prompt_type = prompt_type
+        self.version_id: Optional[str] = None
+        self._system_prompt_override: Optional[str] = None
         self._template_cache: Dict[str, str] = {}
     
     @abstractmethod
@@ -106,18 +123,46 @@ class BasePromptTemplate(ABC):
         """
         pass
     
+    def apply_version(self, version_id: Optional[str], system_prompt: Optional[str] = None) -> None:
+        """
+        Switch the template to a prompt version, discarding compiled prompts.
+        
+        Args:
+            version_id: Version identifier (None for the built-in prompt)
+            system_prompt: Versioned system prompt replacing the built-in static part
+        """
+        self.version_id = version_id
+        self._system_prompt_override = system_prompt or None
+        self._template_cache.clear()
+    
+    def _compile(self, key: str, render: Callable[[], str]) -> str:
+        """
+        Get a compiled prompt part, rendering it on first use.
+        
+        Args:
+            key: Static slots the part depends on
+            render: Renders the part
+            
+        Returns:
+            Compiled prompt part
+        """
+        compiled = self._template_cache.get(key)
+        if compiled is None:
+            compiled = render()
+            self._template_cache[key] = compiled
+        return compiled
+    
     def _estimate_tokens(self, text: str) -> int:
         """
-        Estimate token count for text.
+        Count tokens of text with the provider's tokenizer.
         
         Args:
-            text: Text to estimate
+            text: Text to count
             
         Returns:
-            Estimated token count
+            Token count
         """
-        # Simple estimation: ~4 characters per token
-        return len(text) // 4
+        return get_token_counter(self.provider).count(text)
     
     def _format_citations(self, citations: List[Citation]) -> str:
         """
@@ -132,12 +177,10 @@ class BasePromptTemplate(ABC):
         if not citations:
             return ""
         
-        formatted = []
-        for i, citation in enumerate(citations, 1):
-            ref = citation.reference or f"{citation.author}, {citation.work}"
-            formatted.append(f"[{i}] {citation.text}\n    — {ref}")
-        
-        return "\n\n".join(formatted)
+        return _render_citations(tuple(
+            (citation.text, citation.reference or f"{citation.author}, {citation.work}")
+            for citation in citations
+        ))
     
     def _build_context_section(self, context: PromptContext) -> str:
         """
@@ -156,6 +199,12 @@ class BasePromptTemplate(ABC):
         for i, passage in enumerate(context.retrieved_passages, 1):
             context_parts.append(f"Context {i}:\n{passage}")
         
+        if context.max_context_tokens is not None:
+            counter = get_token_counter(self.provider)
+            context_parts, _ = pack_passages(
+                counter, context_parts, counter.usable(context.max_context_tokens)
+            )
+        
         return "\n\n".join(context_parts)
 
 
@@ -165,19 +214,29 @@ class PhilosophicalTutoringTemplate(BasePromptTemplate):
     
     Optimized for educational scenarios where the AI acts as a philosophy tutor
     guiding students through classical philosophical texts and concepts.
+    
+    System prompts are compiled once per philosophical context and student
+    level; only the user prompt is rendered per request.
     """
     
     def __init__(self, provider: str):
         """Initialize tutoring template."""
         super().__init__(provider, PromptType.TUTORING)
-        self._provider_configs = self._load_provider_configs()
+        template_class = type(self)
+        if template_class not in _provider_configs_by_class:
+            _provider_configs_by_class[template_class] = self._load_provider_configs()
+        self._provider_configs = _provider_configs_by_class[template_class]
+        self._config = self._provider_configs.get(provider, self._provider_configs["default"])
     
     def generate(self, context: PromptContext) -> PromptResult:
         """Generate tutoring prompt for specified provider."""
-        config = self._provider_configs.get(self.provider, self._provider_configs["default"])
+        philosophical_context = context.philosophical_context.value if context.philosophical_context else ""
         
-        # Build system prompt
-        system_prompt = self._build_system_prompt(context, config)
+        # Compiled system prompt for these static slots
+        system_prompt = self._compile(
+            f"system:{philosophical_context}:{context.student_level}",
+            lambda: self._build_system_prompt(context, self._config)
+        )
         
         # Build user prompt with context and citations
         user_prompt = self._build_user_prompt(context)
@@ -199,13 +258,25 @@ class PhilosophicalTutoringTemplate(BasePromptTemplate):
             metadata={
                 "student_level": context.student_level,
                 "philosophical_context": context.philosophical_context,
-                "learning_objective": context.learning_objective
+                "learning_objective": context.learning_objective,
+                "prompt_version": self.version_id
             }
         )
     
     def _build_system_prompt(self, context: PromptContext, config: Dict[str, Any]) -> str:
-        """Build provider-specific system prompt."""
-        base_role = config["base_role"]
+        """
+        Build provider-specific system prompt.
+        
+        The parts shared by every request (role, citation requirements and
+        response guidelines, or a versioned prompt replacing them) come
+        first, so provider-side prompt caching can reuse the prefix across
+        contexts and student levels.
+        """
+        static_prefix = self._system_prompt_override or "\n\n".join([
+            config["base_role"],
+            config["citation_requirements"],
+            config["response_guidelines"]
+        ])
         
         # Add philosophical context specialization
         context_specialization = ""
@@ -221,11 +292,9 @@ class PhilosophicalTutoringTemplate(BasePromptTemplate):
         
         # Combine components
         system_parts = [
-            base_role,
+            static_prefix,
             context_specialization,
-            level_adaptation,
-            config["citation_requirements"],
-            config["response_guidelines"]
+            level_adaptation
         ]
         
         return "\n\n".join(filter(None, system_parts))
@@ -387,17 +456,19 @@ class PhilosophicalTutoringTemplate(BasePromptTemplate):
 class ExplanationTemplate(BasePromptTemplate):
     """Template for philosophical explanation prompts."""
     
+    SYSTEM_PROMPT = (
+        "You are a philosophy expert providing clear explanations of philosophical "
+        "concepts. Use the provided sources to give accurate, well-cited explanations. "
+        "Structure your response logically and include relevant examples."
+    )
+    
     def __init__(self, provider: str):
         """Initialize explanation template."""
         super().__init__(provider, PromptType.EXPLANATION)
     
     def generate(self, context: PromptContext) -> PromptResult:
         """Generate explanation prompt."""
-        system_prompt = (
-            "You are a philosophy expert providing clear explanations of philosophical "
-            "concepts. Use the provided sources to give accurate, well-cited explanations. "
-            "Structure your response logically and include relevant examples."
-        )
+        system_prompt = self._system_prompt_override or self.SYSTEM_PROMPT
         
         user_prompt_parts = []
         
@@ -423,5 +494,5 @@ class ExplanationTemplate(BasePromptTemplate):
             provider=self.provider,
             citations_included=context.citations.copy(),
             token_estimate=self._estimate_tokens(system_prompt + user_prompt),
-            metadata={"explanation_focus": True}
+            metadata={"explanation_focus": True, "prompt_version": self.version_id}
         )
\ No newline at end of file
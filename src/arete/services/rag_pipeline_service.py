@@ -12,10 +12,12 @@ This service orchestrates the complete RAG pipeline:
 Provides end-to-end philosophical tutoring capabilities.
 """
 
+import asyncio
 import logging
+import re
 import time
-from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass, field
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
 from arete.config import Settings, get_settings
@@ -25,12 +27,21 @@ from arete.services.graph_traversal_service import GraphTraversalService
 from arete.services.reranking_service import RerankingService
 from arete.services.diversity_service import DiversityService
 from arete.services.context_composition_service import ContextCompositionService, ContextResult
-from arete.services.response_generation_service import ResponseGenerationService, ResponseResult
+from arete.services.llm_async_core import CancellationToken
+from arete.services.llm_provider import LLMMessage, MessageRole, RequestCancelledError
+from arete.services.response_generation_service import (
+    ResponseGenerationConfig, ResponseGenerationService, ResponseResult
+)
 from arete.repositories.retrieval import RetrievalRepository
 from .base import ServiceError
+from .pipeline_scheduler import PipelineScheduler, SchedulerOverloadedError
+from .result_cache import LRUCache, SemanticCacheIndex, make_cache_key
 
 logger = logging.getLogger(__name__)
 
+# Scheduler queue shared by single interactive queries
+INTERACTIVE_CALLER_ID = "interactive"
+
 
 class RAGPipelineError(ServiceError):
     """Base exception for RAG pipeline errors."""
@@ -54,6 +65,7 @@ class RAGPipelineConfig:
     
     # Retrieval settings
     max_retrieval_results: int = 50
+    min_relevance_score: float = 0.0
     sparse_weight: float = 0.3
     dense_weight: float = 0.5
     graph_weight: float = 0.2
@@ -76,6 +88,16 @@ class RAGPipelineConfig:
     # Performance optimization
     enable_caching: bool = True
     cache_ttl: int = 3600
+    cache_max_size: int = 256
+    enable_semantic_cache: bool = False
+    semantic_cache_threshold: float = 0.95
+    
+    # Admission control and concurrency limits
+    max_concurrent_pipelines: int = 8
+    max_concurrent_retrievals: int = 8
+    max_concurrent_generations: int = 4
+    max_queued_pipelines: int = 500
+    max_queue_wait: Optional[float] = None
     
     # Educational focus
     philosophical_domain_boost: float = 1.2
@@ -128,6 +150,15 @@ class RAGPipelineResult:
     # Error information
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
+    overloaded: bool = False
+
+
+@dataclass
+class PipelineStreamEvent:
+    """Incremental output of a streamed pipeline execution."""
+    
+    delta: str = ""
+    result: Optional[RAGPipelineResult] = None  # Set on the final event
 
 
 class RAGPipelineService:
@@ -149,7 +180,8 @@ class RAGPipelineService:
         response_generation_service: Optional[ResponseGenerationService] = None,
         retrieval_repository: Optional[RetrievalRepository] = None,
         config: Optional[RAGPipelineConfig] = None,
-        settings: Optional[Settings] = None
+        settings: Optional[Settings] = None,
+        embedding_service: Optional[Any] = None
     ):
         """
         Initialize RAG pipeline service.
@@ -165,6 +197,8 @@ class RAGPipelineService:
             retrieval_repository: Repository for hybrid retrieval coordination
             config: Pipeline configuration
             settings: Application settings
+            embedding_service: Optional service with ``generate_embedding`` used
+                by the semantic cache tier
         """
         self.config = config or RAGPipelineConfig()
         self.settings = settings or get_settings()
@@ -178,10 +212,29 @@ class RAGPipelineService:
         self.context_composition = context_composition_service
         self.response_generation = response_generation_service
         self.retrieval_repository = retrieval_repository
+        self.embedding_service = embedding_service
         
-        # Pipeline caching
-        self._pipeline_cache: Dict[str, RAGPipelineResult] = {}
-        self._cache_timestamps: Dict[str, float] = {}
+        # Pipeline caching: exact tier on normalized queries, optional semantic tier
+        self._pipeline_cache = LRUCache(
+            max_size=self.config.cache_max_size,
+            ttl_seconds=self.config.cache_ttl
+        )
+        self._semantic_index = SemanticCacheIndex(
+            max_size=self.config.cache_max_size,
+            similarity_threshold=self.config.semantic_cache_threshold
+        )
+        self._semantic_hits = 0
+        
+        # Admission control shared by all callers of this pipeline
+        self.scheduler = PipelineScheduler(
+            max_concurrency=self.config.max_concurrent_pipelines,
+            stage_limits={
+                PipelineStage.RETRIEVAL.value: self.config.max_concurrent_retrievals,
+                PipelineStage.RESPONSE_GENERATION.value: self.config.max_concurrent_generations
+            },
+            max_queue_size=self.config.max_queued_pipelines,
+            max_queue_wait=self.config.max_queue_wait
+        )
         
         logger.info(
             f"Initialized RAGPipelineService with config: "
@@ -193,15 +246,22 @@ class RAGPipelineService:
         self,
         query: str,
         config: Optional[RAGPipelineConfig] = None,
-        user_context: Optional[Dict[str, Any]] = None
+        user_context: Optional[Dict[str, Any]] = None,
+        caller_id: Optional[str] = None
     ) -> RAGPipelineResult:
         """
         Execute the complete RAG pipeline for a query.
         
+        The query is admitted through the pipeline scheduler like batch
+        queries; interactive callers share their own queue, so a large batch
+        cannot starve them. A query shed under load comes back as a result
+        with ``overloaded=True``.
+        
         Args:
             query: User query to process
             config: Optional pipeline configuration override
             user_context: Optional user context (student level, preferences, etc.)
+            caller_id: Optional identifier for fair queueing between callers
             
         Returns:
             Complete pipeline result with response and metadata
@@ -209,126 +269,341 @@ class RAGPipelineService:
         Raises:
             RAGPipelineError: If pipeline execution fails
         """
+        try:
+            return await self.scheduler.submit(
+                lambda: self._run_pipeline(query, config, user_context),
+                caller_id=caller_id or INTERACTIVE_CALLER_ID
+            )
+        except SchedulerOverloadedError as e:
+            logger.warning(f"Pipeline shed query '{query[:50]}': {e}")
+            return self._create_overloaded_result(query, config or self.config, e)
+    
+    async def _run_pipeline(
+        self,
+        query: str,
+        config: Optional[RAGPipelineConfig],
+        user_context: Optional[Dict[str, Any]]
+    ) -> RAGPipelineResult:
+        """Run the pipeline stages for a query that holds a scheduler slot."""
         start_time = time.time()
         pipeline_config = config or self.config
         metrics = PipelineMetrics()
         
         try:
-            # Check cache if enabled
-            if pipeline_config.enable_caching:
-                cache_key = self._generate_cache_key(query, pipeline_config, user_context)
-                cached_result = self._get_cached_result(cache_key)
-                if cached_result:
-                    logger.debug(f"Returning cached pipeline result for query: {query[:50]}...")
-                    return cached_result
+            cached_result, cache_key, query_embedding = await self._lookup_cached_result(
+                query, pipeline_config, user_context
+            )
+            if cached_result:
+                return cached_result
             
             logger.info(f"Executing RAG pipeline for query: {query[:100]}...")
             
-            # Stage 1: Query Processing and Retrieval
-            stage_start = time.time()
-            retrieval_results = await self._execute_retrieval_stage(
-                query, pipeline_config, user_context
+            stage_results = await self._execute_context_stages(
+                query, pipeline_config, user_context, metrics
             )
-            metrics.retrieval_time = time.time() - stage_start
-            metrics.retrieved_results = len(retrieval_results)
-            
-            if not retrieval_results:
-                logger.warning(f"No retrieval results found for query: {query}")
+            if stage_results is None:
                 return self._create_empty_result(
                     query, pipeline_config, metrics, PipelineStage.RETRIEVAL,
                     errors=["No relevant documents found"]
                 )
+            context_result = stage_results[-1]
             
-            # Stage 2: Re-ranking
-            reranked_results = retrieval_results
-            if pipeline_config.enable_reranking and self.reranking_service:
-                stage_start = time.time()
-                reranked_results = await self._execute_reranking_stage(
-                    query, retrieval_results, pipeline_config
-                )
-                metrics.reranking_time = time.time() - stage_start
-                metrics.reranked_results = len(reranked_results)
-            
-            # Stage 3: Diversification
-            diversified_results = reranked_results
-            if pipeline_config.enable_diversification and self.diversity_service:
-                stage_start = time.time()
-                diversified_results = await self._execute_diversification_stage(
-                    query, reranked_results, pipeline_config
+            # Stage 5: Response Generation
+            stage_start = time.time()
+            async with self.scheduler.stage(PipelineStage.RESPONSE_GENERATION.value):
+                response_result = await self._execute_response_generation_stage(
+                    query, context_result, pipeline_config, user_context
                 )
-                metrics.diversification_time = time.time() - stage_start
-                metrics.diversified_results = len(diversified_results)
+            metrics.response_generation_time = time.time() - stage_start
             
-            # Stage 4: Context Composition
-            stage_start = time.time()
-            context_result = await self._execute_context_composition_stage(
-                query, diversified_results, pipeline_config
+            return self._complete_pipeline_result(
+                query, pipeline_config, user_context, metrics, start_time,
+                stage_results, response_result, cache_key, query_embedding
             )
-            metrics.context_composition_time = time.time() - stage_start
             
-            # Stage 5: Response Generation
-            stage_start = time.time()
-            response_result = await self._execute_response_generation_stage(
-                query, context_result, pipeline_config
-            )
-            metrics.response_generation_time = time.time() - stage_start
-            metrics.final_citations = len(response_result.citations)
+        except Exception as e:
+            logger.error(f"RAG pipeline execution failed: {e}")
+            raise RAGPipelineError(f"Pipeline execution failed: {e}") from e
+    
+    async def execute_pipeline_stream(
+        self,
+        query: str,
+        config: Optional[RAGPipelineConfig] = None,
+        user_context: Optional[Dict[str, Any]] = None,
+        caller_id: Optional[str] = None,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> AsyncIterator[PipelineStreamEvent]:
+        """
+        Execute the RAG pipeline, streaming the response text as it is generated.
+        
+        Retrieval and context composition run as in execute_pipeline; the
+        answer is then streamed from the LLM, and citations are post-processed
+        once generation completes. The final event carries the complete result.
+        The stream holds a scheduler slot from admission until it ends.
+        
+        Args:
+            query: User query to process
+            config: Optional pipeline configuration override
+            user_context: Optional user context (student level, preferences, etc.)
+            caller_id: Optional identifier for fair queueing between callers
+            cancel_token: Token stopping response generation when cancelled
             
-            # Calculate final metrics
-            metrics.total_time = time.time() - start_time
-            metrics.average_relevance_score = self._calculate_average_relevance(diversified_results)
-            metrics.citation_coverage = len(response_result.citations) / max(len(context_result.citations), 1)
-            metrics.validation_score = response_result.validation.accuracy_score
+        Yields:
+            Text delta events, then one event with the pipeline result
             
-            # Create final result
-            pipeline_result = RAGPipelineResult(
-                query=query,
-                response=response_result,
-                config_used=pipeline_config,
-                metrics=metrics,
-                stage_completed=PipelineStage.VALIDATION,
-                retrieval_results=retrieval_results,
-                reranked_results=reranked_results,
-                diversified_results=diversified_results,
-                context_result=context_result
+        Raises:
+            RAGPipelineError: If pipeline execution fails
+            RequestCancelledError: If the token is cancelled during generation
+        """
+        try:
+            async with self.scheduler.admit(caller_id or INTERACTIVE_CALLER_ID):
+                async for event in self._stream_pipeline(query, config, user_context, cancel_token):
+                    yield event
+        except SchedulerOverloadedError as e:
+            # Only admission raises this; stage errors surface as RAGPipelineError
+            logger.warning(f"Pipeline stream shed query '{query[:50]}': {e}")
+            overloaded_result = self._create_overloaded_result(query, config or self.config, e)
+            yield PipelineStreamEvent(delta=overloaded_result.response.response_text)
+            yield PipelineStreamEvent(result=overloaded_result)
+    
+    async def _stream_pipeline(
+        self,
+        query: str,
+        config: Optional[RAGPipelineConfig],
+        user_context: Optional[Dict[str, Any]],
+        cancel_token: Optional[CancellationToken] = None
+    ) -> AsyncIterator[PipelineStreamEvent]:
+        """Stream the pipeline stages for a query that holds a scheduler slot."""
+        start_time = time.time()
+        pipeline_config = config or self.config
+        metrics = PipelineMetrics()
+        
+        try:
+            cached_result, cache_key, query_embedding = await self._lookup_cached_result(
+                query, pipeline_config, user_context
             )
+            if cached_result:
+                yield PipelineStreamEvent(delta=cached_result.response.response_text)
+                yield PipelineStreamEvent(result=cached_result)
+                return
             
-            # Cache result if enabled
-            if pipeline_config.enable_caching and cache_key:
-                self._cache_result(cache_key, pipeline_result)
+            logger.info(f"Streaming RAG pipeline for query: {query[:100]}...")
             
-            logger.info(
-                f"RAG pipeline completed successfully: {metrics.total_time:.3f}s total, "
-                f"{len(diversified_results)} results, {len(response_result.citations)} citations"
+            stage_results = await self._execute_context_stages(
+                query, pipeline_config, user_context, metrics
             )
+            if stage_results is None:
+                empty_result = self._create_empty_result(
+                    query, pipeline_config, metrics, PipelineStage.RETRIEVAL,
+                    errors=["No relevant documents found"]
+                )
+                yield PipelineStreamEvent(delta=empty_result.response.response_text)
+                yield PipelineStreamEvent(result=empty_result)
+                return
+            context_result = stage_results[-1]
+            
+            if not self.response_generation:
+                raise RAGPipelineError("Response generation service not available")
             
-            return pipeline_result
+            # Stage 5: Response Generation, streamed
+            stage_start = time.time()
+            response_result = None
+            async with self.scheduler.stage(PipelineStage.RESPONSE_GENERATION.value):
+                async for event in self.response_generation.stream_response(
+                    context_result=context_result,
+                    query=query,
+                    config=self._build_generation_config(pipeline_config),
+                    history=self._conversation_history(user_context),
+                    cancel_token=cancel_token
+                ):
+                    if event.result is not None:
+                        response_result = event.result
+                    elif event.delta:
+                        yield PipelineStreamEvent(delta=event.delta)
+            metrics.response_generation_time = time.time() - stage_start
+            
+            if response_result is None:
+                raise RAGPipelineError("Response stream ended without a result")
             
+            yield PipelineStreamEvent(result=self._complete_pipeline_result(
+                query, pipeline_config, user_context, metrics, start_time,
+                stage_results, response_result, cache_key, query_embedding
+            ))
+            
+        except (RAGPipelineError, RequestCancelledError):
+            raise
         except Exception as e:
-            logger.error(f"RAG pipeline execution failed: {e}")
+            logger.error(f"RAG pipeline stream failed: {e}")
             raise RAGPipelineError(f"Pipeline execution failed: {e}") from e
     
+    async def _lookup_cached_result(
+        self,
+        query: str,
+        pipeline_config: RAGPipelineConfig,
+        user_context: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[RAGPipelineResult], Optional[str], Optional[List[float]]]:
+        """
+        Look a query up in the exact and semantic cache tiers.
+        
+        Returns:
+            Tuple of (cached result or None, cache key, query embedding), where
+            the key and embedding are reused to cache a fresh result
+        """
+        if not pipeline_config.enable_caching:
+            return None, None, None
+        
+        cache_key = self._generate_cache_key(query, pipeline_config, user_context)
+        cached_result = self._get_cached_result(cache_key)
+        if cached_result:
+            logger.debug(f"Returning cached pipeline result for query: {query[:50]}...")
+            return cached_result, cache_key, None
+        
+        query_embedding = None
+        if pipeline_config.enable_semantic_cache:
+            query_embedding = await self._embed_query(query)
+            cached_result = self._get_semantic_cached_result(
+                query, query_embedding, pipeline_config, user_context
+            )
+        return cached_result, cache_key, query_embedding
+    
+    async def _execute_context_stages(
+        self,
+        query: str,
+        pipeline_config: RAGPipelineConfig,
+        user_context: Optional[Dict[str, Any]],
+        metrics: PipelineMetrics
+    ) -> Optional[Tuple[List[SearchResult], List[SearchResult], List[SearchResult], ContextResult]]:
+        """
+        Run retrieval, re-ranking, diversification and context composition.
+        
+        Returns:
+            Tuple of (retrieval, reranked, diversified results, composed context),
+            or None if nothing was retrieved
+        """
+        # Stage 1: Query Processing and Retrieval
+        stage_start = time.time()
+        async with self.scheduler.stage(PipelineStage.RETRIEVAL.value):
+            retrieval_results = await self._execute_retrieval_stage(
+                query, pipeline_config, user_context
+            )
+        metrics.retrieval_time = time.time() - stage_start
+        metrics.retrieved_results = len(retrieval_results)
+        
+        if not retrieval_results:
+            logger.warning(f"No retrieval results found for query: {query}")
+            return None
+        
+        # Stage 2: Re-ranking
+        reranked_results = retrieval_results
+        if pipeline_config.enable_reranking and self.reranking_service:
+            stage_start = time.time()
+            reranked_results = await self._execute_reranking_stage(
+                query, retrieval_results, pipeline_config
+            )
+            metrics.reranking_time = time.time() - stage_start
+            metrics.reranked_results = len(reranked_results)
+        
+        # Stage 3: Diversification
+        diversified_results = reranked_results
+        if pipeline_config.enable_diversification and self.diversity_service:
+            stage_start = time.time()
+            diversified_results = await self._execute_diversification_stage(
+                query, reranked_results, pipeline_config
+            )
+            metrics.diversification_time = time.time() - stage_start
+            metrics.diversified_results = len(diversified_results)
+        
+        # Stage 4: Context Composition
+        stage_start = time.time()
+        context_result = await self._execute_context_composition_stage(
+            query, diversified_results, pipeline_config
+        )
+        metrics.context_composition_time = time.time() - stage_start
+        
+        return retrieval_results, reranked_results, diversified_results, context_result
+    
+    def _complete_pipeline_result(
+        self,
+        query: str,
+        pipeline_config: RAGPipelineConfig,
+        user_context: Optional[Dict[str, Any]],
+        metrics: PipelineMetrics,
+        start_time: float,
+        stage_results: Tuple[List[SearchResult], List[SearchResult], List[SearchResult], ContextResult],
+        response_result: ResponseResult,
+        cache_key: Optional[str],
+        query_embedding: Optional[List[float]]
+    ) -> RAGPipelineResult:
+        """Compute final metrics, then build and cache the pipeline result."""
+        retrieval_results, reranked_results, diversified_results, context_result = stage_results
+        
+        # Calculate final metrics
+        metrics.total_time = time.time() - start_time
+        metrics.final_citations = len(response_result.citations)
+        metrics.average_relevance_score = self._calculate_average_relevance(diversified_results)
+        metrics.citation_coverage = len(response_result.citations) / max(len(context_result.citations), 1)
+        metrics.validation_score = response_result.validation.accuracy_score
+        
+        # Create final result
+        pipeline_result = RAGPipelineResult(
+            query=query,
+            response=response_result,
+            config_used=pipeline_config,
+            metrics=metrics,
+            stage_completed=PipelineStage.VALIDATION,
+            retrieval_results=retrieval_results,
+            reranked_results=reranked_results,
+            diversified_results=diversified_results,
+            context_result=context_result
+        )
+        
+        # Cache result if enabled
+        if pipeline_config.enable_caching and cache_key:
+            self._cache_result(cache_key, pipeline_result)
+            if query_embedding is not None:
+                self._semantic_index.add(
+                    cache_key, query_embedding,
+                    scope=self._generate_cache_scope(pipeline_config, user_context)
+                )
+        
+        logger.info(
+            f"RAG pipeline completed successfully: {metrics.total_time:.3f}s total, "
+            f"{len(diversified_results)} results, {len(response_result.citations)} citations"
+        )
+        
+        return pipeline_result
+    
     async def execute_pipeline_batch(
         self,
         queries: List[str],
         config: Optional[RAGPipelineConfig] = None,
-        user_context: Optional[Dict[str, Any]] = None
+        user_context: Optional[Dict[str, Any]] = None,
+        caller_id: Optional[str] = None
     ) -> List[RAGPipelineResult]:
         """
         Execute pipeline for multiple queries in batch.
         
+        Queries are admitted through the pipeline scheduler, so at most
+        ``max_concurrent_pipelines`` run at once and batches from different
+        callers are interleaved fairly. Queries shed under load come back as
+        results with ``overloaded=True``.
+        
         Args:
             queries: List of queries to process
             config: Optional pipeline configuration
             user_context: Optional user context
+            caller_id: Optional identifier for fair queueing between callers
             
         Returns:
-            List of pipeline results
+            List of pipeline results, in query order
         """
-        import asyncio
+        caller = caller_id or f"batch-{id(queries)}"
         
         tasks = [
-            self.execute_pipeline(query, config, user_context)
+            self.scheduler.submit(
+                lambda query=query: self._run_pipeline(query, config, user_context),
+                caller_id=caller
+            )
             for query in queries
         ]
         
@@ -338,7 +613,12 @@ class RAGPipelineService:
             # Handle exceptions in results
             processed_results = []
             for i, result in enumerate(results):
-                if isinstance(result, Exception):
+                if isinstance(result, SchedulerOverloadedError):
+                    logger.warning(f"Batch pipeline shed query '{queries[i]}': {result}")
+                    processed_results.append(
+                        self._create_overloaded_result(queries[i], config or self.config, result)
+                    )
+                elif isinstance(result, Exception):
                     logger.error(f"Batch pipeline failed for query '{queries[i]}': {result}")
                     # Create error result
                     error_result = self._create_empty_result(
@@ -366,13 +646,14 @@ class RAGPipelineService:
         
         # Use retrieval repository for coordinated hybrid retrieval if available
         if self.retrieval_repository:
-            return await self.retrieval_repository.hybrid_search(
+            results = await self.retrieval_repository.hybrid_search(
                 query=query,
                 limit=config.max_retrieval_results,
                 sparse_weight=config.sparse_weight,
                 dense_weight=config.dense_weight,
                 graph_weight=config.graph_weight
             )
+            return self._filter_by_relevance(results, config)
         
         # Fallback to individual services
         all_results = []
@@ -411,7 +692,7 @@ class RAGPipelineService:
         
         # Remove duplicates and limit results
         unique_results = self._deduplicate_results(all_results)
-        return unique_results[:config.max_retrieval_results]
+        return self._filter_by_relevance(unique_results, config)[:config.max_retrieval_results]
     
     async def _execute_reranking_stage(
         self,
@@ -507,7 +788,8 @@ class RAGPipelineService:
         self,
         query: str,
         context_result: ContextResult,
-        config: RAGPipelineConfig
+        config: RAGPipelineConfig,
+        user_context: Optional[Dict[str, Any]] = None
     ) -> ResponseResult:
         """Execute response generation stage."""
         logger.debug(f"Executing response generation for query: {query[:50]}...")
@@ -516,19 +798,11 @@ class RAGPipelineService:
             raise RAGPipelineError("Response generation service not available")
         
         try:
-            from arete.services.response_generation_service import ResponseGenerationConfig
-            
-            generation_config = ResponseGenerationConfig(
-                max_response_tokens=config.max_response_tokens,
-                temperature=config.temperature,
-                enable_validation=config.enable_validation,
-                enable_caching=config.enable_caching
-            )
-            
             response_result = await self.response_generation.generate_response(
                 context_result=context_result,
                 query=query,
-                config=generation_config
+                config=self._build_generation_config(config),
+                history=self._conversation_history(user_context)
             )
             
             logger.debug(
@@ -543,6 +817,25 @@ class RAGPipelineService:
             logger.error(f"Response generation failed: {e}")
             raise RAGPipelineError(f"Response generation failed: {e}") from e
     
+    @staticmethod
+    def _conversation_history(user_context: Optional[Dict[str, Any]]) -> List[LLMMessage]:
+        """Convert the user context's conversation history into LLM messages."""
+        history = (user_context or {}).get("conversation_history") or []
+        return [
+            LLMMessage(role=MessageRole(turn["role"]), content=turn["content"])
+            for turn in history
+        ]
+    
+    @staticmethod
+    def _build_generation_config(config: RAGPipelineConfig) -> ResponseGenerationConfig:
+        """Derive the response generation configuration from the pipeline's."""
+        return ResponseGenerationConfig(
+            max_response_tokens=config.max_response_tokens,
+            temperature=config.temperature,
+            enable_validation=config.enable_validation,
+            enable_caching=config.enable_caching
+        )
+    
     def _deduplicate_results(self, results: List[SearchResult]) -> List[SearchResult]:
         """Remove duplicate results based on chunk ID."""
         seen_ids = set()
@@ -556,6 +849,11 @@ class RAGPipelineService:
         
         return unique_results
     
+    @staticmethod
+    def _filter_by_relevance(results: List[SearchResult], config: RAGPipelineConfig) -> List[SearchResult]:
+        """Drop results scoring below the configured minimum relevance."""
+        return [result for result in results if result.relevance_score >= config.min_relevance_score]
+    
     def _calculate_average_relevance(self, results: List[SearchResult]) -> float:
         """Calculate average relevance score."""
         if not results:
@@ -600,6 +898,43 @@ class RAGPipelineService:
             warnings=warnings or []
         )
     
+    def _create_overloaded_result(
+        self,
+        query: str,
+        config: RAGPipelineConfig,
+        error: SchedulerOverloadedError
+    ) -> RAGPipelineResult:
+        """Create result for a query shed by the scheduler."""
+        overloaded_result = self._create_empty_result(
+            query, config, PipelineMetrics(),
+            PipelineStage.QUERY_PROCESSING, errors=[f"overloaded: {error}"]
+        )
+        overloaded_result.overloaded = True
+        return overloaded_result
+    
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        """Normalize query text for cache matching (case, whitespace, punctuation)."""
+        without_punctuation = re.sub(r"[^\w\s]", " ", query.lower())
+        return " ".join(without_punctuation.split())
+    
+    def _generate_cache_scope(
+        self,
+        config: RAGPipelineConfig,
+        user_context: Optional[Dict[str, Any]]
+    ) -> str:
+        """Generate key for the configuration and user context a result depends on."""
+        return make_cache_key(
+            config.max_retrieval_results,
+            config.min_relevance_score,
+            config.max_response_tokens,
+            config.temperature,
+            config.composition_strategy,
+            config.enable_reranking,
+            config.enable_diversification,
+            user_context or {}
+        )
+    
     def _generate_cache_key(
         self,
         query: str,
@@ -607,54 +942,73 @@ class RAGPipelineService:
         user_context: Optional[Dict[str, Any]]
     ) -> str:
         """Generate cache key for pipeline request."""
-        import hashlib
-        
-        key_components = [
-            query,
-            str(config.max_retrieval_results),
-            str(config.max_response_tokens),
-            str(config.temperature),
-            config.composition_strategy,
-            str(config.enable_reranking),
-            str(config.enable_diversification)
-        ]
-        
-        if user_context:
-            key_components.append(str(sorted(user_context.items())))
-        
-        key_string = "|".join(key_components)
-        return hashlib.md5(key_string.encode()).hexdigest()
+        return make_cache_key(
+            self._normalize_query(query),
+            self._generate_cache_scope(config, user_context)
+        )
     
     def _get_cached_result(self, cache_key: str) -> Optional[RAGPipelineResult]:
         """Get cached pipeline result if valid."""
-        if cache_key not in self._pipeline_cache:
+        return self._pipeline_cache.get(cache_key)
+    
+    async def _embed_query(self, query: str) -> Optional[List[float]]:
+        """Embed a query for the semantic cache tier, if an embedding service is available."""
+        if self.embedding_service is None:
+            return None
+        
+        try:
+            return await asyncio.to_thread(self.embedding_service.generate_embedding, query)
+        except Exception as e:
+            logger.warning(f"Query embedding for semantic cache failed: {e}")
+            return None
+    
+    def _get_semantic_cached_result(
+        self,
+        query: str,
+        query_embedding: Optional[List[float]],
+        config: RAGPipelineConfig,
+        user_context: Optional[Dict[str, Any]]
+    ) -> Optional[RAGPipelineResult]:
+        """Reuse a cached result whose query embedding is close to this one."""
+        if query_embedding is None:
             return None
         
-        # Check cache TTL
-        timestamp = self._cache_timestamps.get(cache_key, 0)
-        if time.time() - timestamp > self.config.cache_ttl:
-            # Remove expired cache entry
-            del self._pipeline_cache[cache_key]
-            del self._cache_timestamps[cache_key]
+        match = self._semantic_index.find(
+            query_embedding,
+            scope=self._generate_cache_scope(config, user_context),
+            threshold=config.semantic_cache_threshold
+        )
+        if match is None:
+            return None
+        
+        matched_key, similarity = match
+        cached_result = self._pipeline_cache.get(matched_key, record_stats=False)
+        if cached_result is None:
+            self._semantic_index.discard(matched_key)
             return None
         
-        return self._pipeline_cache[cache_key]
+        self._semantic_hits += 1
+        logger.debug(
+            f"Semantic cache hit ({similarity:.3f}) for query: {query[:50]}... "
+            f"-> {cached_result.query[:50]}..."
+        )
+        return replace(
+            cached_result,
+            warnings=cached_result.warnings + [
+                f"Answer reused from similar question: {cached_result.query} "
+                f"(similarity {similarity:.3f})"
+            ]
+        )
     
     def _cache_result(self, cache_key: str, result: RAGPipelineResult) -> None:
         """Cache pipeline result."""
-        self._pipeline_cache[cache_key] = result
-        self._cache_timestamps[cache_key] = time.time()
-        
-        # Limit cache size (simple LRU)
-        if len(self._pipeline_cache) > 20:  # Max 20 cached results
-            oldest_key = min(self._cache_timestamps.keys(), key=lambda k: self._cache_timestamps[k])
-            del self._pipeline_cache[oldest_key]
-            del self._cache_timestamps[oldest_key]
+        self._pipeline_cache.set(cache_key, result)
     
     def clear_cache(self) -> None:
         """Clear pipeline cache."""
         self._pipeline_cache.clear()
-        self._cache_timestamps.clear()
+        self._semantic_index.clear()
+        self._semantic_hits = 0
         logger.info("RAG pipeline cache cleared")
     
     def get_pipeline_stats(self) -> Dict[str, Any]:
@@ -667,14 +1021,8 @@ class RAGPipelineService:
                 'enable_diversification': self.config.enable_diversification,
                 'composition_strategy': self.config.composition_strategy
             },
-            'cache_stats': {
-                'cached_results': len(self._pipeline_cache),
-                'cache_hit_potential': len(self._pipeline_cache) > 0,
-                'oldest_entry_age': (
-                    time.time() - min(self._cache_timestamps.values())
-                    if self._cache_timestamps else 0
-                )
-            },
+            'cache_stats': self._get_cache_stats(),
+            'scheduler_stats': self.scheduler.get_stats(),
             'services_available': {
                 'dense_retrieval': self.dense_retrieval is not None,
                 'sparse_retrieval': self.sparse_retrieval is not None,
@@ -688,6 +1036,22 @@ class RAGPipelineService:
         }
 
 
+    def _get_cache_stats(self) -> Dict[str, Any]:
+        """Get pipeline cache statistics including semantic tier hits."""
+        stats = self._pipeline_cache.get_stats()
+        lookups = stats['hits'] + stats['misses']
+        total_hits = stats['hits'] + self._semantic_hits
+        
+        stats.update({
+            'cached_results': len(self._pipeline_cache),
+            'semantic_hits': self._semantic_hits,
+            'semantic_entries': len(self._semantic_index),
+            # A semantic hit follows an exact-tier miss, so lookups already count it
+            'overall_hit_rate': total_hits / lookups if lookups else 0.0
+        })
+        return stats
+
+
 # Factory function following established pattern
 def create_rag_pipeline_service(
     config: Optional[RAGPipelineConfig] = None,
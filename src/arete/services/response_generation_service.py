@@ -12,7 +12,7 @@ This service provides complete response generation functionality including:
 import logging
 import time
 import hashlib
-from typing import List, Dict, Any, Optional, Union, Tuple
+from typing import AsyncIterator, List, Dict, Any, Optional, Union, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import asyncio
@@ -24,7 +24,12 @@ from ..services.expert_validation_service import ExpertValidationService
 from ..services.citation_extraction_service import CitationExtractionService, CitationExtractionConfig
 from ..services.citation_validation_service import CitationValidationService, CitationValidationConfig
 from ..services.citation_tracking_service import CitationTrackingService, CitationTrackingConfig, TrackingEventType, CitationSource
-from ..services.llm_provider import LLMMessage, LLMResponse, MessageRole
+from ..services.llm_provider import (
+    LLMMessage, LLMResponse, LLMStreamChunk, MessageRole, RequestCancelledError, merge_stream_chunks
+)
+from ..services.llm_async_core import CancellationToken
+from ..services.llm_rate_limiter import LLMRequestScheduler, TrafficClass, create_llm_request_scheduler
+from ..services.token_counter import context_window_for, get_token_counter
 from ..models.citation import Citation
 from .base import ServiceError
 
@@ -148,6 +153,14 @@ class ResponseResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class ResponseStreamEvent:
+    """Incremental output of a streamed response generation."""
+    
+    delta: str = ""
+    result: Optional[ResponseResult] = None  # Set on the final event
+
+
 class ResponseGenerationService:
     """
     Response Generation Service for philosophical tutoring responses.
@@ -164,7 +177,8 @@ class ResponseGenerationService:
         citation_validation_service: Optional[CitationValidationService] = None,
         citation_tracking_service: Optional[CitationTrackingService] = None,
         config: Optional[ResponseGenerationConfig] = None,
-        settings: Optional[Settings] = None
+        settings: Optional[Settings] = None,
+        request_scheduler: Optional[LLMRequestScheduler] = None
     ):
         """
         Initialize response generation service.
@@ -177,6 +191,7 @@ class ResponseGenerationService:
             citation_tracking_service: Service for tracking citation provenance
             config: Response generation configuration
             settings: Application settings
+            request_scheduler: Rate-aware scheduler admitting LLM requests
         """
         self.config = config or ResponseGenerationConfig()
         self.settings = settings or get_settings()
@@ -187,6 +202,7 @@ class ResponseGenerationService:
         self.citation_extraction_service = citation_extraction_service or CitationExtractionService()
         self.citation_validation_service = citation_validation_service or CitationValidationService()
         self.citation_tracking_service = citation_tracking_service or CitationTrackingService()
+        self.request_scheduler = request_scheduler or create_llm_request_scheduler(self.settings)
         
         # Initialize caching
         self._response_cache: Dict[str, ResponseResult] = {}
@@ -201,7 +217,9 @@ class ResponseGenerationService:
         self,
         context_result: ContextResult,
         query: str,
-        config: Optional[ResponseGenerationConfig] = None
+        config: Optional[ResponseGenerationConfig] = None,
+        traffic: TrafficClass = TrafficClass.INTERACTIVE,
+        history: Optional[List[LLMMessage]] = None
     ) -> ResponseResult:
         """
         Generate educational response from composed context.
@@ -210,6 +228,8 @@ class ResponseGenerationService:
             context_result: Composed context from retrieval pipeline
             query: Original user query
             config: Optional configuration override
+            traffic: Scheduling class of the LLM request
+            history: Earlier conversation turns, oldest first
             
         Returns:
             Complete response result with validation
@@ -220,140 +240,256 @@ class ResponseGenerationService:
         """
         start_time = time.time()
         generation_config = config or self.config
+        cache_key = None
         
         try:
             # Check cache if enabled
             if generation_config.enable_caching:
-                cache_key = self._generate_cache_key(context_result, query, generation_config)
+                cache_key = self._generate_cache_key(context_result, query, generation_config, history)
                 cached_result = self._get_cached_result(cache_key)
                 if cached_result:
                     logger.debug(f"Returning cached response for query: {query[:50]}...")
                     return cached_result
             
             # Build messages for LLM
-            messages = self._build_messages(context_result, query)
+            messages = self._build_messages(context_result, query, generation_config, history)
             
             # Generate response using LLM service
             llm_response = await self._generate_llm_response(
-                messages, generation_config
-            )
-            
-            # Extract citations from LLM response
-            extraction_result = self.citation_extraction_service.extract_citations_from_response(
-                llm_response.content, context_result, query
-            )
-            
-            # Validate extracted citations
-            validated_citations = []
-            if extraction_result.citations:
-                validation_results = await self.citation_validation_service.validate_citations_batch(
-                    extraction_result.citations, context_result
-                )
-                validated_citations = [
-                    citation for citation, result in zip(
-                        extraction_result.citations, validation_results.citation_results
-                    )
-                    if result.is_valid or not generation_config.fail_on_validation_error
-                ]
-            
-            # Track citation events
-            for citation in validated_citations:
-                self.citation_tracking_service.record_citation_event(
-                    citation,
-                    TrackingEventType.EXTRACTED,
-                    CitationSource.LLM_RESPONSE,
-                    processor="response_generation_service",
-                    context={
-                        "query": query,
-                        "response_length": len(llm_response.content),
-                        "extraction_confidence": extraction_result.accuracy_score
-                    }
-                )
-            
-            # Process additional citations from context (for completeness)
-            context_citations = self._process_citations(context_result, generation_config)
-            
-            # Combine and deduplicate citations
-            all_citations = validated_citations + context_citations
-            if generation_config.deduplicate_citations:
-                all_citations = self._deduplicate_citations(all_citations)
-            
-            # Format source attribution
-            source_attribution = self._format_source_attribution(
-                context_result, all_citations, generation_config
+                messages, generation_config, traffic
             )
             
-            # Create initial response result
-            response_result = ResponseResult(
-                response_text=llm_response.content,
-                query=query,
-                citations=all_citations,
-                source_attribution=source_attribution,
-                llm_response_metadata={
-                    "model": llm_response.model,
-                    "provider": llm_response.provider,
-                    "usage_tokens": llm_response.usage_tokens
-                },
-                generation_time=time.time() - start_time,
-                token_usage={
-                    "context_tokens": context_result.total_tokens,
-                    "response_tokens": llm_response.usage_tokens
-                },
-                context_tokens_used=context_result.total_tokens,
-                citations_formatted=len(all_citations),
-                provider_used=llm_response.provider
+            return await self._finalize_response(
+                llm_response, context_result, query, generation_config, start_time, cache_key
             )
             
-            # Validate response if enabled
-            if generation_config.enable_validation and self.validation_service:
-                try:
-                    validation = await self._validate_response(
-                        response_result, context_result, generation_config
-                    )
-                    response_result.validation = validation
-                    
-                    # Handle validation failures
-                    if not validation.is_valid and generation_config.fail_on_validation_error:
-                        raise ValidationError(
-                            f"Response validation failed: {', '.join(validation.issues)}"
-                        )
-                        
-                except Exception as e:
-                    logger.warning(f"Response validation failed: {e}")
-                    if generation_config.fail_on_validation_error:
-                        raise ValidationError(f"Validation service error: {e}") from e
+        except (ValidationError, CitationError):
+            # Re-raise these specific errors
+            raise
+        except Exception as e:
+            logger.error(f"Response generation failed: {e}")
+            raise ResponseGenerationError(f"Response generation failed: {e}") from e
+    
+    async def stream_response(
+        self,
+        context_result: ContextResult,
+        query: str,
+        config: Optional[ResponseGenerationConfig] = None,
+        history: Optional[List[LLMMessage]] = None,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> AsyncIterator[ResponseStreamEvent]:
+        """
+        Generate an educational response, yielding text as the LLM produces it.
+        
+        Citations are extracted and validated once the stream completes; the
+        final event carries the complete ResponseResult. If the stream fails
+        before producing any text, generation falls back to the non-streaming
+        path with its fallback providers, unless the stream was cancelled.
+        
+        Args:
+            context_result: Composed context from retrieval pipeline
+            query: Original user query
+            config: Optional configuration override
+            history: Earlier conversation turns, oldest first
+            cancel_token: Token stopping generation when cancelled
             
-            # Cache result if enabled
-            if generation_config.enable_caching and cache_key:
-                self._cache_result(cache_key, response_result)
+        Yields:
+            Text delta events, then one event with the final result
             
-            logger.info(
-                f"Response generated successfully: {len(response_result.response_text)} chars, "
-                f"{len(citations)} citations, {response_result.generation_time:.3f}s"
+        Raises:
+            RequestCancelledError: If the token is cancelled before generation ends
+            ResponseGenerationError: If generation fails
+            ValidationError: If validation fails and fail_on_validation_error is True
+        """
+        start_time = time.time()
+        generation_config = config or self.config
+        cache_key = None
+        
+        if generation_config.enable_caching:
+            cache_key = self._generate_cache_key(context_result, query, generation_config, history)
+            cached_result = self._get_cached_result(cache_key)
+            if cached_result:
+                yield ResponseStreamEvent(delta=cached_result.response_text)
+                yield ResponseStreamEvent(result=cached_result)
+                return
+        
+        messages = self._build_messages(context_result, query, generation_config, history)
+        chunks: List[LLMStreamChunk] = []
+        provider_name = generation_config.preferred_provider or self.llm_service.get_active_provider_name()
+        estimated_tokens = self._estimate_request_tokens(messages, generation_config)
+        
+        try:
+            await self.request_scheduler.acquire(provider_name, estimated_tokens)
+            async for chunk in self.llm_service.stream_response(
+                messages=messages,
+                provider=generation_config.preferred_provider,
+                max_tokens=generation_config.max_response_tokens,
+                temperature=generation_config.temperature,
+                top_p=generation_config.top_p,
+                cancel_token=cancel_token
+            ):
+                chunks.append(chunk)
+                if chunk.delta:
+                    yield ResponseStreamEvent(delta=chunk.delta)
+            llm_response = merge_stream_chunks(chunks, generation_config.preferred_provider or "")
+            self.request_scheduler.reconcile(provider_name, estimated_tokens, llm_response.usage_tokens)
+        except RequestCancelledError:
+            raise
+        except Exception as e:
+            if any(chunk.delta for chunk in chunks):
+                logger.error(f"Response stream failed mid-generation: {e}")
+                raise ResponseGenerationError(f"Response streaming failed: {e}") from e
+            
+            logger.warning(f"Response stream failed before first token, generating without streaming: {e}")
+            try:
+                llm_response = await self._generate_llm_response(
+                    messages, generation_config, cancel_token=cancel_token
+                )
+            except RequestCancelledError:
+                raise
+            except Exception as fallback_error:
+                raise ResponseGenerationError(
+                    f"Response generation failed: {fallback_error}"
+                ) from fallback_error
+            yield ResponseStreamEvent(delta=llm_response.content)
+        
+        try:
+            result = await self._finalize_response(
+                llm_response, context_result, query, generation_config, start_time, cache_key
             )
-            
-            return response_result
-            
         except (ValidationError, CitationError):
-            # Re-raise these specific errors
             raise
         except Exception as e:
-            logger.error(f"Response generation failed: {e}")
+            logger.error(f"Response post-processing failed: {e}")
             raise ResponseGenerationError(f"Response generation failed: {e}") from e
+        
+        yield ResponseStreamEvent(result=result)
+    
+    async def _finalize_response(
+        self,
+        llm_response: LLMResponse,
+        context_result: ContextResult,
+        query: str,
+        generation_config: ResponseGenerationConfig,
+        start_time: float,
+        cache_key: Optional[str] = None
+    ) -> ResponseResult:
+        """Extract, validate and attribute citations of a complete LLM response."""
+        # Extract citations from LLM response
+        extraction_result = self.citation_extraction_service.extract_citations_from_response(
+            llm_response.content, context_result, query
+        )
+        
+        # Validate extracted citations
+        validated_citations = []
+        if extraction_result.citations:
+            validation_results = await self.citation_validation_service.validate_citations_batch(
+                extraction_result.citations, context_result
+            )
+            validated_citations = [
+                citation for citation, result in zip(
+                    extraction_result.citations, validation_results.citation_results
+                )
+                if result.is_valid or not generation_config.fail_on_validation_error
+            ]
+        
+        # Track citation events
+        for citation in validated_citations:
+            self.citation_tracking_service.record_citation_event(
+                citation,
+                TrackingEventType.EXTRACTED,
+                CitationSource.LLM_RESPONSE,
+                processor="response_generation_service",
+                context={
+                    "query": query,
+                    "response_length": len(llm_response.content),
+                    "extraction_confidence": extraction_result.accuracy_score
+                }
+            )
+        
+        # Process additional citations from context (for completeness)
+        context_citations = self._process_citations(context_result, generation_config)
+        
+        # Combine and deduplicate citations
+        all_citations = validated_citations + context_citations
+        if generation_config.deduplicate_citations:
+            all_citations = self._deduplicate_citations(all_citations)
+        
+        # Format source attribution
+        source_attribution = self._format_source_attribution(
+            context_result, all_citations, generation_config
+        )
+        
+        # Create initial response result
+        response_result = ResponseResult(
+            response_text=llm_response.content,
+            query=query,
+            citations=all_citations,
+            source_attribution=source_attribution,
+            llm_response_metadata={
+                "model": llm_response.model,
+                "provider": llm_response.provider,
+                "usage_tokens": llm_response.usage_tokens
+            },
+            generation_time=time.time() - start_time,
+            token_usage={
+                "context_tokens": context_result.total_tokens,
+                "response_tokens": llm_response.usage_tokens
+            },
+            context_tokens_used=context_result.total_tokens,
+            citations_formatted=len(all_citations),
+            provider_used=llm_response.provider
+        )
+        
+        # Validate response if enabled
+        if generation_config.enable_validation and self.validation_service:
+            try:
+                validation = await self._validate_response(
+                    response_result, context_result, generation_config
+                )
+                response_result.validation = validation
+                
+                # Handle validation failures
+                if not validation.is_valid and generation_config.fail_on_validation_error:
+                    raise ValidationError(
+                        f"Response validation failed: {', '.join(validation.issues)}"
+                    )
+                    
+            except Exception as e:
+                logger.warning(f"Response validation failed: {e}")
+                if generation_config.fail_on_validation_error:
+                    raise ValidationError(f"Validation service error: {e}") from e
+        
+        # Cache result if enabled
+        if generation_config.enable_caching and cache_key:
+            self._cache_result(cache_key, response_result)
+        
+        logger.info(
+            f"Response generated successfully: {len(response_result.response_text)} chars, "
+            f"{len(all_citations)} citations, {response_result.generation_time:.3f}s"
+        )
+        
+        return response_result
     
     async def generate_response_batch(
         self,
         context_results: List[ContextResult],
         queries: List[str],
-        config: Optional[ResponseGenerationConfig] = None
+        config: Optional[ResponseGenerationConfig] = None,
+        traffic: TrafficClass = TrafficClass.BATCH
     ) -> List[ResponseResult]:
         """
         Generate responses for multiple queries in batch.
         
+        Requests run with bounded concurrency and are admitted by the request
+        scheduler within provider rate limits; as batch traffic they yield to
+        interactive requests.
+        
         Args:
             context_results: List of composed contexts
             queries: List of queries
             config: Optional configuration override
+            traffic: Scheduling class of the batch's LLM requests
             
         Returns:
             List of response results
@@ -363,9 +499,14 @@ class ResponseGenerationService:
                 "context_results and queries must have the same length"
             )
         
-        # Process all requests concurrently
+        semaphore = asyncio.Semaphore(self.settings.llm_batch_max_concurrency)
+        
+        async def generate(context_result: ContextResult, query: str) -> ResponseResult:
+            async with semaphore:
+                return await self.generate_response(context_result, query, config, traffic)
+        
         tasks = [
-            self.generate_response(context_result, query, config)
+            generate(context_result, query)
             for context_result, query in zip(context_results, queries)
         ]
         
@@ -402,18 +543,30 @@ class ResponseGenerationService:
     def _build_messages(
         self, 
         context_result: ContextResult, 
-        query: str
+        query: str,
+        config: Optional[ResponseGenerationConfig] = None,
+        history: Optional[List[LLMMessage]] = None
     ) -> List[LLMMessage]:
         """
         Build LLM messages from context and query.
         
+        The source material is fitted, at token boundaries, into what is left
+        of the provider's context window (and max_context_tokens) after the
+        system prompt, conversation history, citations, question and reserved
+        response tokens.
+        
         Args:
             context_result: Composed context
             query: User query
+            config: Optional configuration override
+            history: Earlier conversation turns, oldest first
             
         Returns:
             List of LLM messages
         """
+        generation_config = config or self.config
+        provider = generation_config.preferred_provider or self.llm_service.get_active_provider_name()
+        counter = get_token_counter(provider)
         messages = []
         
         # System message for philosophical tutoring
@@ -422,9 +575,25 @@ class ResponseGenerationService:
             role=MessageRole.SYSTEM,
             content=system_prompt
         ))
+        messages.extend(history or [])
+        
+        # Budget the source material with everything else in place
+        context_text = ""
+        if context_result.composed_text:
+            fixed_prompt = self._build_user_prompt(context_result, query, "")
+            fixed_tokens = counter.count_messages(
+                messages + [LLMMessage(role=MessageRole.USER, content=fixed_prompt)]
+            ) + counter.count("**Source Material:**\n\n\n")
+            window_room = (
+                context_window_for(provider, self.settings)
+                - generation_config.max_response_tokens
+                - fixed_tokens
+            )
+            budget = counter.usable(min(generation_config.max_context_tokens, window_room))
+            context_text = counter.truncate(context_result.composed_text, budget, "...")
         
         # User message with context and query
-        user_prompt = self._build_user_prompt(context_result, query)
+        user_prompt = self._build_user_prompt(context_result, query, context_text)
         messages.append(LLMMessage(
             role=MessageRole.USER,
             content=user_prompt
@@ -451,19 +620,12 @@ class ResponseGenerationService:
             "Always indicate which parts of your response come from the provided sources."
         )
     
-    def _build_user_prompt(self, context_result: ContextResult, query: str) -> str:
-        """Build user prompt with context and query."""
+    def _build_user_prompt(self, context_result: ContextResult, query: str, context_text: str) -> str:
+        """Build user prompt with the fitted context text and query."""
         prompt_parts = []
         
         # Add composed context
-        if context_result.composed_text:
-            # Truncate if necessary to fit token limits
-            context_text = context_result.composed_text
-            if context_result.total_tokens > self.config.max_context_tokens:
-                # Simple truncation - could be enhanced
-                max_chars = self.config.max_context_tokens * 4  # rough estimate
-                context_text = context_text[:max_chars] + "..."
-            
+        if context_text:
             prompt_parts.append(f"**Source Material:**\n{context_text}")
         
         # Add citations if available
@@ -479,43 +641,60 @@ class ResponseGenerationService:
     async def _generate_llm_response(
         self,
         messages: List[LLMMessage],
-        config: ResponseGenerationConfig
+        config: ResponseGenerationConfig,
+        traffic: TrafficClass = TrafficClass.INTERACTIVE,
+        cancel_token: Optional[CancellationToken] = None
     ) -> LLMResponse:
         """Generate response using LLM service."""
         try:
             # Use preferred provider if specified
-            provider = config.preferred_provider
-            
-            response = await self.llm_service.generate_response(
-                messages=messages,
-                provider=provider,
-                max_tokens=config.max_response_tokens,
-                temperature=config.temperature,
-                top_p=config.top_p
-            )
-            
-            return response
+            return await self._call_llm(messages, config.preferred_provider, config, traffic, cancel_token)
             
+        except RequestCancelledError:
+            raise
         except Exception as e:
             # Try fallback providers if configured
             if config.fallback_providers:
                 for fallback_provider in config.fallback_providers:
                     try:
                         logger.info(f"Trying fallback provider: {fallback_provider}")
-                        response = await self.llm_service.generate_response(
-                            messages=messages,
-                            provider=fallback_provider,
-                            max_tokens=config.max_response_tokens,
-                            temperature=config.temperature,
-                            top_p=config.top_p
-                        )
-                        return response
+                        return await self._call_llm(messages, fallback_provider, config, traffic, cancel_token)
+                    except RequestCancelledError:
+                        raise
                     except Exception as fallback_error:
                         logger.warning(f"Fallback provider {fallback_provider} failed: {fallback_error}")
                         continue
             
             raise ResponseGenerationError(f"All LLM providers failed. Last error: {e}") from e
     
+    async def _call_llm(
+        self,
+        messages: List[LLMMessage],
+        provider: Optional[str],
+        config: ResponseGenerationConfig,
+        traffic: TrafficClass,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> LLMResponse:
+        """Send one LLM request through the rate-aware request scheduler."""
+        return await self.request_scheduler.run(
+            provider or self.llm_service.get_active_provider_name(),
+            lambda: self.llm_service.generate_response(
+                messages=messages,
+                provider=provider,
+                max_tokens=config.max_response_tokens,
+                temperature=config.temperature,
+                top_p=config.top_p,
+                cancel_token=cancel_token
+            ),
+            self._estimate_request_tokens(messages, config),
+            traffic
+        )
+    
+    def _estimate_request_tokens(self, messages: List[LLMMessage], config: ResponseGenerationConfig) -> int:
+        """Estimate prompt plus completion tokens of a request for rate limiting."""
+        provider = config.preferred_provider or self.llm_service.get_active_provider_name()
+        return get_token_counter(provider).count_messages(messages) + config.max_response_tokens
+    
     def _process_citations(
         self,
         context_result: ContextResult,
@@ -670,7 +849,8 @@ class ResponseGenerationService:
         self,
         context_result: ContextResult,
         query: str,
-        config: ResponseGenerationConfig
+        config: ResponseGenerationConfig,
+        history: Optional[List[LLMMessage]] = None
     ) -> str:
         """Generate cache key for response request."""
         key_components = [
@@ -681,6 +861,10 @@ class ResponseGenerationService:
             config.citation_format,
             str(len(context_result.citations))
         ]
+        key_components.extend(
+            f"{getattr(message.role, 'value', message.role)}:{message.content}"
+            for message in history or []
+        )
         
         key_string = "|".join(key_components)
         return hashlib.md5(key_string.encode()).hexdigest()
@@ -734,6 +918,7 @@ class ResponseGenerationService:
             'llm_service_info': self.llm_service.get_provider_info() if self.llm_service else {},
             'validation_enabled': self.config.enable_validation,
             'cache_stats': self.get_cache_stats(),
+            'rate_limits': self.request_scheduler.get_stats(),
             'config': {
                 'max_response_tokens': self.config.max_response_tokens,
                 'temperature': self.config.temperature,
@@ -751,7 +936,8 @@ def create_response_generation_service(
     citation_validation_service: Optional[CitationValidationService] = None,
     citation_tracking_service: Optional[CitationTrackingService] = None,
     config: Optional[ResponseGenerationConfig] = None,
-    settings: Optional[Settings] = None
+    settings: Optional[Settings] = None,
+    request_scheduler: Optional[LLMRequestScheduler] = None
 ) -> ResponseGenerationService:
     """
     Create response generation service with optional dependencies.
@@ -764,6 +950,7 @@ def create_response_generation_service(
         citation_tracking_service: Optional citation tracking service
         config: Optional configuration
         settings: Optional settings
+        request_scheduler: Optional rate-aware LLM request scheduler
         
     Returns:
         Configured ResponseGenerationService instance
@@ -775,5 +962,6 @@ def create_response_generation_service(
         citation_validation_service=citation_validation_service,
         citation_tracking_service=citation_tracking_service,
         config=config,
-        settings=settings
+        settings=settings,
+        request_scheduler=request_scheduler
     )
\ No newline at end of file
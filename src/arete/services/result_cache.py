@@ -0,0 +1,420 @@
+"""
+Result caching utilities for Arete Graph-RAG system.
+
+Provides a bounded in-memory LRU cache with time-to-live expiry and an
+optional SQLite-backed store that lets several worker processes share cached
+results through a local file. Lookups, inserts and evictions are O(1).
+
+A small semantic index can sit beside an LRU cache to find entries whose
+query embedding is within a cosine similarity threshold of a new query.
+"""
+
+import hashlib
+import json
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    Build a stable cache key from arbitrary JSON-compatible parts.
+
+    Dictionaries are serialized with sorted keys so that logically equal
+    inputs always produce the same key.
+
+    Args:
+        *parts: Values identifying the cached result
+
+    Returns:
+        Hex digest suitable for use as a cache key
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    shared_hits: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert stats to dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "shared_hits": self.shared_hits,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class SQLiteCacheStore:
+    """Namespaced key/value store in a local SQLite file shared across processes."""
+
+    def __init__(self, path: str, namespace: str) -> None:
+        """
+        Initialize SQLite cache store.
+
+        Args:
+            path: Path to the SQLite database file
+            namespace: Namespace separating this cache from others in the file
+        """
+        self.path = path
+        self.namespace = namespace
+        self._initialize()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the store."""
+        return sqlite3.connect(self.path, timeout=5.0)
+
+    def _initialize(self) -> None:
+        """Create the cache table if it does not exist yet."""
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS result_cache ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, "
+                "value BLOB NOT NULL, created_at REAL NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Get a stored value and its creation timestamp."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value, created_at FROM result_cache "
+                    "WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache read failed: {e}")
+            return None
+
+        if row is None:
+            return None
+
+        try:
+            return pickle.loads(row[0]), row[1]
+        except Exception as e:
+            logger.warning(f"Discarding unreadable shared cache entry: {e}")
+            self.delete(key)
+            return None
+
+    def set(self, key: str, value: Any, created_at: float) -> None:
+        """Store a value."""
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO result_cache "
+                    "(namespace, key, value, created_at) VALUES (?, ?, ?, ?)",
+                    (self.namespace, key, blob, created_at),
+                )
+        except Exception as e:
+            logger.warning(f"Shared cache write failed: {e}")
+
+    def delete(self, key: str) -> None:
+        """Delete a stored value."""
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "DELETE FROM result_cache WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache delete failed: {e}")
+
+    def prune(self, older_than: float) -> None:
+        """Delete entries created before the given timestamp."""
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "DELETE FROM result_cache WHERE namespace = ? AND created_at < ?",
+                    (self.namespace, older_than),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache prune failed: {e}")
+
+    def clear(self) -> None:
+        """Delete all entries in this namespace."""
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "DELETE FROM result_cache WHERE namespace = ?", (self.namespace,)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Shared cache clear failed: {e}")
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache with time-to-live expiry.
+
+    Entries live in an ordered dictionary so lookups, inserts and evictions
+    are O(1). When a shared store is configured, local misses fall through to
+    it and every insert is written through.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        ttl_seconds: Optional[float] = None,
+        shared_store: Optional[SQLiteCacheStore] = None,
+    ) -> None:
+        """
+        Initialize LRU cache.
+
+        Args:
+            max_size: Maximum number of entries kept in memory
+            ttl_seconds: Entry lifetime in seconds, or None for no expiry
+            shared_store: Optional store shared with other processes
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.shared_store = shared_store
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._inserts_since_prune = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, record_stats=False) is not None
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        """Check whether an entry created at the given time has expired."""
+        return self.ttl_seconds is not None and now - created_at >= self.ttl_seconds
+
+    def get(self, key: str, record_stats: bool = True) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            record_stats: Whether the lookup counts towards hit/miss stats
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, created_at = entry
+                if not self._is_expired(created_at, now):
+                    self._entries.move_to_end(key)
+                    if record_stats:
+                        self.stats.hits += 1
+                    return value
+
+                del self._entries[key]
+                self.stats.expirations += 1
+
+        if self.shared_store is not None:
+            stored = self.shared_store.get(key)
+            if stored is not None:
+                value, created_at = stored
+                if not self._is_expired(created_at, now):
+                    with self._lock:
+                        self._insert(key, value, created_at)
+                        if record_stats:
+                            self.stats.hits += 1
+                            self.stats.shared_hits += 1
+                    return value
+                self.shared_store.delete(key)
+
+        if record_stats:
+            with self._lock:
+                self.stats.misses += 1
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Cache a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+        """
+        created_at = time.time()
+
+        with self._lock:
+            self._insert(key, value, created_at)
+
+        if self.shared_store is not None:
+            self.shared_store.set(key, value, created_at)
+            self._maybe_prune_shared(created_at)
+
+    def _insert(self, key: str, value: Any, created_at: float) -> None:
+        """Insert an entry; caller must hold the lock."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        self._entries[key] = (value, created_at)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def _maybe_prune_shared(self, now: float) -> None:
+        """Periodically drop expired entries from the shared store."""
+        if self.ttl_seconds is None:
+            return
+
+        self._inserts_since_prune += 1
+        if self._inserts_since_prune >= self.max_size:
+            self._inserts_since_prune = 0
+            self.shared_store.prune(now - self.ttl_seconds)
+
+    def invalidate(self, key: str) -> None:
+        """Remove a single entry."""
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.shared_store is not None:
+            self.shared_store.delete(key)
+
+    def clear(self, include_shared: bool = False) -> None:
+        """
+        Remove all in-memory entries.
+
+        Args:
+            include_shared: Also clear the shared store
+        """
+        with self._lock:
+            self._entries.clear()
+        if include_shared and self.shared_store is not None:
+            self.shared_store.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        stats = self.stats.to_dict()
+        stats.update({
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "shared": self.shared_store is not None,
+        })
+        return stats
+
+
+class SemanticCacheIndex:
+    """
+    Bounded index of query embeddings for near-duplicate cache lookups.
+
+    Each entry maps a cache key to an L2-normalized embedding within a scope
+    (for example, a hash of the pipeline configuration), so only queries
+    issued under the same settings can match each other.
+    """
+
+    def __init__(self, max_size: int = 256, similarity_threshold: float = 0.95) -> None:
+        """
+        Initialize semantic cache index.
+
+        Args:
+            max_size: Maximum number of embeddings kept
+            similarity_threshold: Minimum cosine similarity for a match
+        """
+        self.max_size = max_size
+        self.similarity_threshold = similarity_threshold
+        self._entries: "OrderedDict[str, Tuple[str, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _normalize(embedding: Sequence[float]) -> Optional[np.ndarray]:
+        """L2-normalize an embedding, returning None for zero vectors."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm == 0.0:
+            return None
+        return vector / norm
+
+    def add(self, key: str, embedding: Sequence[float], scope: str = "") -> None:
+        """Register the embedding of a cached entry."""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (scope, vector)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def find(
+        self,
+        embedding: Sequence[float],
+        scope: str = "",
+        threshold: Optional[float] = None
+    ) -> Optional[Tuple[str, float]]:
+        """
+        Find the most similar cached entry above the threshold.
+
+        Args:
+            embedding: Embedding of the new query
+            scope: Scope the match must belong to
+            threshold: Optional override of the similarity threshold
+
+        Returns:
+            Tuple of (cache key, similarity), or None if nothing is close enough
+        """
+        vector = self._normalize(embedding)
+        if vector is None:
+            return None
+
+        with self._lock:
+            candidates: List[Tuple[str, np.ndarray]] = [
+                (key, cached) for key, (entry_scope, cached) in self._entries.items()
+                if entry_scope == scope and cached.shape == vector.shape
+            ]
+        if not candidates:
+            return None
+
+        matrix = np.vstack([cached for _, cached in candidates])
+        similarities = matrix @ vector
+        best = int(np.argmax(similarities))
+        similarity = float(similarities[best])
+
+        if similarity < (self.similarity_threshold if threshold is None else threshold):
+            return None
+        return candidates[best][0], similarity
+
+    def discard(self, key: str) -> None:
+        """Remove an entry, e.g. after its cached value expired."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
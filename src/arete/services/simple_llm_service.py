@@ -6,7 +6,7 @@ via environment variables or direct input, without the complexity of intelligent
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from datetime import datetime
 import os
 
@@ -15,11 +15,25 @@ from arete.services.llm_provider import (
     LLMProvider,
     LLMMessage,
     LLMResponse,
+    LLMStreamChunk,
     LLMProviderError,
     ProviderUnavailableError,
-    AuthenticationError
+    AuthenticationError,
+    RateLimitError,
+    DeadlineExceededError,
+    RequestCancelledError
 )
 from arete.config import Settings, get_settings
+from arete.services.llm_async_core import (
+    CancellationToken,
+    close_http_clients,
+    configure_http_pool,
+    get_http_pool_stats,
+    run_sync,
+    run_with_deadline,
+    stream_with_deadline
+)
+from arete.services.llm_response_cache import create_llm_response_cache
 from arete.services.provider_config_service import ProviderConfigurationService
 
 # Setup logger
@@ -34,6 +48,10 @@ class SimpleLLMService:
     - Environment variable: SELECTED_LLM_PROVIDER
     - Direct method calls with provider parameter
     - Fallback to configured default provider
+    
+    Provider calls share pooled HTTP connections and run under a request
+    cancellation token and deadline, so an abandoned request stops consuming
+    tokens and frees its connection immediately.
     """
     
     def __init__(self, settings: Optional[Settings] = None):
@@ -48,6 +66,10 @@ class SimpleLLMService:
         self.config_service = ProviderConfigurationService(self.settings)
         self._providers: Dict[str, LLMProvider] = {}
         self._initialized_providers: Dict[str, bool] = {}
+        self.response_cache = create_llm_response_cache(self.settings)
+        self.active_requests = 0
+        self._lifetime_token = CancellationToken()
+        configure_http_pool(self.settings)
         
         # Available provider types
         self.available_provider_types = [
@@ -191,17 +213,27 @@ class SimpleLLMService:
         model: Optional[str] = None,
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
+        cache: Optional[bool] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        deadline: Optional[float] = None,
         **kwargs
     ) -> LLMResponse:
         """
         Generate response using specified or active provider.
         
+        Identical deterministic requests are answered from the response cache
+        without calling the provider.
+        
         Args:
             messages: Conversation messages
             provider: Specific provider to use (uses active if None)
             model: Model to use
             max_tokens: Maximum tokens to generate
             temperature: Sampling temperature
+            cache: Force (True) or bypass (False) the response cache; by default
+                only temperature 0 requests are cached
+            cancel_token: Token abandoning the request when cancelled
+            deadline: Seconds until the request is abandoned (defaults to settings)
             **kwargs: Additional provider-specific parameters
             
         Returns:
@@ -210,10 +242,27 @@ class SimpleLLMService:
         Raises:
             LLMProviderError: If generation fails
             ProviderUnavailableError: If provider unavailable
+            RequestCancelledError: If the request is cancelled
+            DeadlineExceededError: If the deadline passes
         """
         provider_name = provider or self.get_active_provider_name()
         model_name = model or self.get_active_model_name()
         
+        # Use settings defaults if not specified
+        max_tokens = max_tokens or self.settings.llm_max_tokens
+        temperature = temperature if temperature is not None else self.settings.llm_temperature
+        
+        cache_key = None
+        if self.response_cache is not None and self.response_cache.is_cacheable(temperature, cache):
+            cache_key = self.response_cache.make_key(
+                provider_name, model_name, messages,
+                max_tokens=max_tokens, temperature=temperature, **kwargs
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Served response from cache for {provider_name}")
+                return cached
+        
         try:
             provider_instance = self.get_provider(provider_name)
             
@@ -224,20 +273,27 @@ class SimpleLLMService:
                     provider_name
                 )
             
-            # Use settings defaults if not specified
-            max_tokens = max_tokens or self.settings.llm_max_tokens
-            temperature = temperature or self.settings.llm_temperature
-            
             logger.info(f"Generating response with {provider_name}" + 
                        (f" using model {model_name}" if model_name else ""))
             
-            response = await provider_instance.generate_response(
-                messages=messages,
-                model=model_name if model_name else None,
-                max_tokens=max_tokens,
-                temperature=temperature,
-                **kwargs
-            )
+            token = CancellationToken.linked(cancel_token, self._lifetime_token)
+            self.active_requests += 1
+            try:
+                response = await run_with_deadline(
+                    provider_instance.generate_response(
+                        messages=messages,
+                        model=model_name if model_name else None,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        **kwargs
+                    ),
+                    token,
+                    self._deadline(deadline),
+                    f"Generation with {provider_name}"
+                )
+            finally:
+                token.detach()
+                self.active_requests -= 1
             
             # Add service metadata
             response.metadata.update({
@@ -249,15 +305,169 @@ class SimpleLLMService:
             })
             
             logger.info(f"Generated response: {len(response.content)} chars, {response.usage_tokens} tokens")
+            
+            if cache_key is not None:
+                self.response_cache.set(cache_key, response)
             return response
             
-        except (ProviderUnavailableError, AuthenticationError):
+        except (
+            ProviderUnavailableError, AuthenticationError, RateLimitError,
+            RequestCancelledError, DeadlineExceededError
+        ):
             # Re-raise these with provider context
             raise
         except Exception as e:
             logger.error(f"Error generating response with {provider_name}: {e}")
             raise LLMProviderError(f"Failed to generate response with {provider_name}: {e}")
     
+    async def stream_response(
+        self,
+        messages: List[LLMMessage],
+        provider: Optional[str] = None,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: Optional[float] = None,
+        cache: Optional[bool] = None,
+        cancel_token: Optional[CancellationToken] = None,
+        deadline: Optional[float] = None,
+        **kwargs
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a response from the specified or active provider.
+        
+        A cached response is replayed as a single chunk; a completed stream
+        is cached under the same rules as generate_response. Closing the
+        iterator early cancels the provider stream.
+        
+        Args:
+            messages: Conversation messages
+            provider: Specific provider to use (uses active if None)
+            model: Model to use
+            max_tokens: Maximum tokens to generate
+            temperature: Sampling temperature
+            cache: Force (True) or bypass (False) the response cache
+            cancel_token: Token abandoning the stream when cancelled
+            deadline: Seconds until the whole stream is abandoned; by default
+                only llm_stream_idle_timeout_seconds bounds the wait for the
+                first and each following chunk, so long generations finish
+            **kwargs: Additional provider-specific parameters
+            
+        Yields:
+            Response chunks; the last one carries finish reason, usage and
+            service metadata
+            
+        Raises:
+            LLMProviderError: If generation fails
+            ProviderUnavailableError: If provider unavailable
+            RequestCancelledError: If the stream is cancelled
+            DeadlineExceededError: If the deadline passes
+        """
+        provider_name = provider or self.get_active_provider_name()
+        model_name = model or self.get_active_model_name()
+        max_tokens = max_tokens or self.settings.llm_max_tokens
+        temperature = temperature if temperature is not None else self.settings.llm_temperature
+        service_metadata = {
+            "service": "SimpleLLMService",
+            "provider_selected_by": "user" if provider else "default",
+            "model_selected_by": "user" if model else ("default" if model_name else "provider_default"),
+            "active_provider": provider_name,
+            "active_model": model_name or "provider_default"
+        }
+        
+        cache_key = None
+        if self.response_cache is not None and self.response_cache.is_cacheable(temperature, cache):
+            cache_key = self.response_cache.make_key(
+                provider_name, model_name, messages,
+                max_tokens=max_tokens, temperature=temperature, **kwargs
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                yield LLMStreamChunk(
+                    delta=cached.content,
+                    provider=cached.provider,
+                    model=cached.model,
+                    finish_reason=cached.finish_reason or "stop",
+                    usage_tokens=cached.usage_tokens,
+                    metadata=cached.metadata
+                )
+                return
+        
+        provider_instance = self.get_provider(provider_name)
+        if not provider_instance.is_available:
+            raise ProviderUnavailableError(
+                f"Provider '{provider_name}' is not available. "
+                f"Please check configuration and API keys.",
+                provider_name
+            )
+        
+        logger.info(f"Streaming response with {provider_name}" +
+                   (f" using model {model_name}" if model_name else ""))
+        
+        parts = []
+        last_chunk = None
+        token = CancellationToken.linked(cancel_token, self._lifetime_token)
+        self.active_requests += 1
+        chunks = stream_with_deadline(
+            provider_instance.stream_response(
+                messages=messages,
+                model=model_name if model_name else None,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **kwargs
+            ),
+            token,
+            deadline,
+            f"Stream from {provider_name}",
+            idle_timeout=self.settings.llm_stream_idle_timeout_seconds
+        )
+        try:
+            async for chunk in chunks:
+                # Stay one chunk behind so service metadata lands on the last one
+                if last_chunk is not None:
+                    yield last_chunk
+                last_chunk = chunk
+                parts.append(chunk.delta)
+        except (ProviderUnavailableError, AuthenticationError, LLMProviderError):
+            raise
+        except Exception as e:
+            logger.error(f"Error streaming response with {provider_name}: {e}")
+            raise LLMProviderError(f"Failed to stream response with {provider_name}: {e}")
+        finally:
+            # Stops the provider stream if the consumer went away early
+            await chunks.aclose()
+            token.detach()
+            self.active_requests -= 1
+        
+        last_chunk = last_chunk or LLMStreamChunk(delta="", provider=provider_name)
+        last_chunk.finish_reason = last_chunk.finish_reason or "stop"
+        last_chunk.metadata = {**last_chunk.metadata, **service_metadata, "streaming": True}
+        yield last_chunk
+        
+        if cache_key is not None:
+            self.response_cache.set(cache_key, LLMResponse(
+                content="".join(parts),
+                provider=last_chunk.provider,
+                usage_tokens=last_chunk.usage_tokens,
+                model=last_chunk.model,
+                finish_reason=last_chunk.finish_reason,
+                metadata=last_chunk.metadata
+            ))
+    
+    def _deadline(self, deadline: Optional[float]) -> float:
+        """Get the deadline of a request in seconds, defaulting to settings."""
+        return deadline if deadline is not None else self.settings.llm_request_deadline_seconds
+    
+    def cancel_all(self, reason: str = "cancelled") -> None:
+        """
+        Cancel every in-flight generation and stream of this service.
+        
+        Args:
+            reason: Why the requests were abandoned, reported in errors
+        """
+        token, self._lifetime_token = self._lifetime_token, CancellationToken()
+        token.cancel(reason)
+        logger.info(f"Cancelled in-flight LLM requests: {reason}")
+    
     def list_available_providers(self) -> List[str]:
         """Get list of available provider types."""
         return self.available_provider_types.copy()
@@ -298,7 +508,9 @@ class SimpleLLMService:
                 "env_variable": os.getenv("SELECTED_LLM_MODEL", ""),
                 "settings_selected": self.settings.selected_llm_model
             },
-            "initialization_status": dict(self._initialized_providers)
+            "initialization_status": dict(self._initialized_providers),
+            "active_requests": self.active_requests,
+            "http_pool": get_http_pool_stats()
         }
     
     def get_provider_health(self, provider_name: Optional[str] = None) -> Dict[str, Any]:
@@ -445,6 +657,7 @@ class SimpleLLMService:
     def cleanup(self) -> None:
         """Cleanup service resources."""
         logger.info("Cleaning up SimpleLLMService")
+        self.cancel_all("service shutdown")
         
         for provider_name, provider in self._providers.items():
             try:
@@ -460,6 +673,11 @@ class SimpleLLMService:
         self._providers.clear()
         self._initialized_providers.clear()
         logger.info("SimpleLLMService cleanup complete")
+    
+    async def aclose(self) -> None:
+        """Cleanup service resources and close the pooled connections of the running loop."""
+        self.cleanup()
+        await close_http_clients()
 
 
 # Convenience functions
@@ -476,6 +694,9 @@ async def quick_generate(
     """
     Quick utility function for simple text generation.
     
+    The throwaway service is cleaned up afterwards; pass ``cancel_token`` to
+    abandon the request early.
+    
     Args:
         prompt: Text prompt
         provider: Provider to use (uses active if None)
@@ -490,11 +711,14 @@ async def quick_generate(
     
     messages = [LLMMessage(role=MessageRole.USER, content=prompt)]
     
-    response = await service.generate_response(
-        messages=messages,
-        provider=provider,
-        **kwargs
-    )
+    try:
+        response = await service.generate_response(
+            messages=messages,
+            provider=provider,
+            **kwargs
+        )
+    finally:
+        service.cleanup()
     
     return response.content
 
@@ -562,6 +786,7 @@ def set_provider_interactive() -> None:
 if __name__ == "__main__":
     # Quick test/demo
     import asyncio
+    import signal
     
     async def demo():
         print("🤖 SimpleLLMService Demo")
@@ -569,11 +794,22 @@ if __name__ == "__main__":
         
         show_provider_status()
         
+        # Ctrl+C abandons the request and closes its connection
+        cancel_token = CancellationToken()
+        try:
+            asyncio.get_running_loop().add_signal_handler(
+                signal.SIGINT, cancel_token.cancel, "interrupted"
+            )
+        except NotImplementedError:
+            pass  # No loop signal handlers on Windows; Ctrl+C cancels the run instead
+        
         # Quick generation example
         try:
-            response = await quick_generate("Hello, how are you?")
+            response = await quick_generate("Hello, how are you?", cancel_token=cancel_token)
             print(f"\nResponse: {response}")
+        except RequestCancelledError:
+            print("\n⏹ Generation stopped")
         except Exception as e:
             print(f"\n❌ Error: {e}")
     
-    asyncio.run(demo())
\ No newline at end of file
+    run_sync(demo())
\ No newline at end of file
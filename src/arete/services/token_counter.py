@@ -0,0 +1,349 @@
+"""
+Token counting and budget packing for Arete Graph-RAG prompts.
+
+Provides:
+- Per-provider tokenizers: tiktoken BPE encodings for OpenAI-compatible
+  models when tiktoken and its cached vocabulary are available, otherwise
+  a conservative offline estimator built on the same pre-tokenization
+- An LRU cache of token counts, so passages reused across queries are
+  tokenized once
+- Exact packing of passages into a token budget and truncation at token
+  boundaries
+
+Estimated counts err on the high side and budgets computed from them keep
+a safety margin, so prompts never exceed the provider's context window.
+"""
+
+import logging
+import math
+import re
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from arete.services.result_cache import LRUCache, make_cache_key
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Chat formats add a few tokens per message and to prime the reply
+MESSAGE_OVERHEAD_TOKENS = 4
+REPLY_PRIMING_TOKENS = 3
+
+# Context windows used when neither settings nor model metadata give one
+DEFAULT_CONTEXT_WINDOWS = {
+    "openai": 128000,
+    "openrouter": 128000,
+    "anthropic": 200000,
+    "gemini": 1000000,
+    "ollama": 8192,
+}
+
+# Average characters per token of each provider's tokenizer, used by the estimator
+_CHARS_PER_TOKEN = {
+    "openai": 4.0,
+    "openrouter": 3.6,
+    "anthropic": 3.3,
+    "gemini": 3.8,
+    "ollama": 3.5,
+}
+
+# Pre-tokenization of BPE tokenizers: contractions, letter runs, short digit
+# runs and punctuation runs each with their leading space, and whitespace
+_PRETOKENIZE = re.compile(r"'(?:[sdmt]|ll|ve|re)| ?[^\W\d_]+| ?\d{1,3}| ?[^\s\w]+|\s+(?!\S)|\s+")
+
+
+class Tokenizer(ABC):
+    """Tokenizer counting and truncating text in a model's tokens."""
+
+    name: str = "tokenizer"
+    exact: bool = False  # True if counts match the provider's own tokenizer
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """Count the tokens of a text."""
+        pass
+
+    @abstractmethod
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Cut a text to at most max_tokens tokens at a token boundary."""
+        pass
+
+
+class TiktokenTokenizer(Tokenizer):
+    """BPE tokenizer backed by a tiktoken encoding."""
+
+    def __init__(self, encoding: Any, exact: bool = True):
+        """
+        Initialize tiktoken tokenizer.
+
+        Args:
+            encoding: Loaded tiktoken Encoding
+            exact: Whether the encoding is the model's own, rather than a
+                stand-in for an unknown model
+        """
+        self.encoding = encoding
+        self.exact = exact
+        self.name = f"tiktoken:{encoding.name}"
+
+    def count(self, text: str) -> int:
+        return len(self.encoding.encode(text, disallowed_special=()))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        tokens = self.encoding.encode(text, disallowed_special=())
+        if len(tokens) <= max_tokens:
+            return text
+        return self.encoding.decode(tokens[:max(0, max_tokens)])
+
+
+class EstimatingTokenizer(Tokenizer):
+    """
+    Offline token estimator for providers without a local tokenizer.
+
+    Splits text like a BPE pre-tokenizer and charges each piece one token
+    for its first 2 * chars_per_token characters and one per chars_per_token
+    after that. Common words are one token in every provider vocabulary, so
+    for prose the estimate is close but high. Vocabularies hold few merges
+    for non-Latin scripts, so non-ASCII characters are charged by their
+    UTF-8 bytes instead, one token per two bytes.
+    """
+
+    def __init__(self, name: str, chars_per_token: float = 3.5):
+        """
+        Initialize estimating tokenizer.
+
+        Args:
+            name: Name of the provider vocabulary being estimated
+            chars_per_token: Characters per token for long pieces
+        """
+        self.name = f"estimate:{name}"
+        self.chars_per_token = chars_per_token
+
+    def _piece_tokens(self, piece: str) -> int:
+        piece = piece.strip() or piece
+        ascii_length = sum(1 for char in piece if char.isascii())
+        non_ascii_bytes = len(piece.encode("utf-8")) - ascii_length
+        if non_ascii_bytes == 0:
+            return 1 + max(0, math.ceil((ascii_length - 2 * self.chars_per_token) / self.chars_per_token))
+        ascii_tokens = math.ceil(ascii_length / self.chars_per_token)
+        return ascii_tokens + math.ceil(non_ascii_bytes / 2)
+
+    def count(self, text: str) -> int:
+        return sum(self._piece_tokens(piece) for piece in _PRETOKENIZE.findall(text))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        used = 0
+        end = 0
+        for match in _PRETOKENIZE.finditer(text):
+            used += self._piece_tokens(match.group())
+            if used > max_tokens:
+                break
+            end = match.end()
+        return text[:end]
+
+
+class TokenCounter:
+    """Tokenizer with a bounded cache of per-text token counts."""
+
+    def __init__(self, tokenizer: Tokenizer, cache_size: int = 8192, safety_margin: float = 0.05):
+        """
+        Initialize token counter.
+
+        Args:
+            tokenizer: Tokenizer to count with
+            cache_size: Maximum number of cached counts
+            safety_margin: Fraction of a budget left unused when the
+                tokenizer only estimates counts
+        """
+        self.tokenizer = tokenizer
+        self.safety_margin = safety_margin
+        self.cache = LRUCache(max_size=cache_size)
+
+    @property
+    def exact(self) -> bool:
+        """Whether counts match the provider's tokenizer exactly."""
+        return self.tokenizer.exact
+
+    def count(self, text: str) -> int:
+        """
+        Count the tokens of a text, using cached counts where possible.
+
+        Args:
+            text: Text to count
+
+        Returns:
+            Number of tokens
+        """
+        if not text:
+            return 0
+        key = make_cache_key(self.tokenizer.name, text)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        tokens = self.tokenizer.count(text)
+        self.cache.set(key, tokens)
+        return tokens
+
+    def count_messages(self, messages: Iterable[Any]) -> int:
+        """Count the prompt tokens of chat messages, including format overhead."""
+        return sum(
+            self.count(message.content) + MESSAGE_OVERHEAD_TOKENS for message in messages
+        ) + REPLY_PRIMING_TOKENS
+
+    def usable(self, budget: int) -> int:
+        """Get the part of a budget that may be filled, net of the safety margin."""
+        if self.exact:
+            return max(0, budget)
+        return max(0, int(budget * (1 - self.safety_margin)))
+
+    def truncate(self, text: str, max_tokens: int, suffix: str = "") -> str:
+        """
+        Cut a text to at most max_tokens tokens, suffix included.
+
+        Args:
+            text: Text to truncate
+            max_tokens: Token limit
+            suffix: Marker appended when the text is cut (e.g. "...")
+
+        Returns:
+            The text itself if it fits, otherwise its longest fitting prefix
+            followed by the suffix
+        """
+        if self.count(text) <= max_tokens:
+            return text
+        room = max_tokens - self.count(suffix)
+        if room <= 0:
+            return ""
+        cut = self.tokenizer.truncate(text, room).rstrip()
+        # Token merges across the cut can differ; trim until the result fits
+        while cut and self.count(cut + suffix) > max_tokens:
+            cut = self.tokenizer.truncate(cut, self.count(cut) - 1).rstrip()
+        return cut + suffix if cut else ""
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tokenizer and cache statistics."""
+        return {"tokenizer": self.tokenizer.name, "exact": self.exact, **self.cache.get_stats()}
+
+
+def pack_passages(
+    counter: TokenCounter,
+    passages: List[str],
+    max_tokens: int,
+    separator: str = "\n\n",
+    min_partial_tokens: int = 50,
+    truncation_suffix: str = "..."
+) -> Tuple[List[str], int]:
+    """
+    Pack passages, in order, into a token budget.
+
+    Passages are added while they fit; the first one that does not is
+    truncated into the remaining room if at least min_partial_tokens remain.
+    The joined result is verified against the budget.
+
+    Args:
+        counter: Token counter of the target model
+        passages: Passages in priority order
+        max_tokens: Token budget of the joined passages
+        separator: Text placed between passages
+        min_partial_tokens: Smallest remainder worth filling with a partial passage
+        truncation_suffix: Marker appended to a truncated passage
+
+    Returns:
+        Tuple of (packed passages, token count of the joined passages)
+    """
+    packed: List[str] = []
+    used = 0
+    separator_tokens = counter.count(separator)
+
+    for passage in passages:
+        cost = counter.count(passage) + (separator_tokens if packed else 0)
+        if used + cost <= max_tokens:
+            packed.append(passage)
+            used += cost
+            continue
+
+        room = max_tokens - used - (separator_tokens if packed else 0)
+        if room >= min_partial_tokens:
+            partial = counter.truncate(passage, room, truncation_suffix)
+            if partial:
+                packed.append(partial)
+        break
+
+    # Counts of separately tokenized pieces can differ from the joined text;
+    # shorten the last passage by any overflow, dropping it if too little is left
+    total = counter.count(separator.join(packed))
+    while packed and total > max_tokens:
+        last = packed.pop()
+        room = counter.count(last) - (total - max_tokens)
+        if room >= min_partial_tokens:
+            shortened = counter.truncate(last, room, truncation_suffix)
+            if shortened:
+                packed.append(shortened)
+        total = counter.count(separator.join(packed))
+    return packed, total
+
+
+_counters: Dict[Tuple[str, str], TokenCounter] = {}
+_counters_lock = threading.Lock()
+
+
+def _load_tokenizer(provider: str, model: Optional[str]) -> Tokenizer:
+    if TIKTOKEN_AVAILABLE and provider in ("openai", "openrouter"):
+        try:
+            # OpenRouter also serves other vendors' models, whose tokenizers differ
+            vendor, _, model_name = (model or "").rpartition("/")
+            if model_name and vendor in ("", "openai"):
+                try:
+                    return TiktokenTokenizer(tiktoken.encoding_for_model(model_name))
+                except KeyError:
+                    pass
+            # A close vocabulary, but not the model's own: keep the safety margin
+            return TiktokenTokenizer(tiktoken.get_encoding("cl100k_base"), exact=False)
+        except Exception as e:
+            # Vocabulary files are not cached locally and cannot be fetched
+            logger.warning(f"tiktoken vocabulary unavailable, estimating tokens for {provider}: {e}")
+    return EstimatingTokenizer(provider, _CHARS_PER_TOKEN.get(provider, 3.5))
+
+
+def get_token_counter(provider: Optional[str] = None, model: Optional[str] = None) -> TokenCounter:
+    """
+    Get the shared token counter of a provider and model.
+
+    Args:
+        provider: LLM provider name (defaults to a conservative generic estimator)
+        model: Model name, selecting the exact encoding where known
+
+    Returns:
+        Token counter, created once per provider and model
+    """
+    key = ((provider or "default").lower(), model or "")
+    with _counters_lock:
+        counter = _counters.get(key)
+    if counter is None:
+        # Loading may download a tiktoken vocabulary; don't block other lookups meanwhile
+        counter = TokenCounter(_load_tokenizer(key[0], model))
+        with _counters_lock:
+            counter = _counters.setdefault(key, counter)
+    return counter
+
+
+def context_window_for(provider: Optional[str], settings: Any) -> int:
+    """
+    Get the context window of a provider in tokens.
+
+    Args:
+        provider: LLM provider name
+        settings: Application configuration; llm_context_window_tokens
+            overrides the provider default when positive
+
+    Returns:
+        Context window in tokens
+    """
+    if settings.llm_context_window_tokens > 0:
+        return settings.llm_context_window_tokens
+    return DEFAULT_CONTEXT_WINDOWS.get((provider or "").lower(), min(DEFAULT_CONTEXT_WINDOWS.values()))
@@ -78,6 +78,18 @@ def enhanced_message_input() -> rx.Component:
                         height="50px",
                         min_width="50px"
                     ),
+                    # Stop button (only show while a response is generated)
+                    rx.cond(
+                        RAGChatState.is_processing,
+                        rx.button(
+                            rx.icon("square", size="sm"),
+                            on_click=RAGChatState.stop_generation,
+                            variant="outline",
+                            color_scheme="red",
+                            size="sm",
+                            width="50px"
+                        )
+                    ),
                     # Regenerate button (only show if can regenerate)
                     rx.cond(
                         RAGChatState.can_regenerate & ~RAGChatState.is_processing,
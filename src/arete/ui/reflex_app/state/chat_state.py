@@ -1,9 +1,11 @@
 import reflex as rx
 import asyncio
 from typing import List, Dict, Optional, Any, AsyncGenerator
+from dataclasses import replace
 from datetime import datetime
 import json
 import logging
+import time
 from uuid import uuid4
 
 # Import existing RAG services
@@ -16,6 +18,9 @@ from arete.services.retrieval_service import RetrievalService
 from arete.services.embedding_service import get_embedding_service
 from arete.database.weaviate_client import WeaviateClient
 from arete.database.neo4j_client import Neo4jClient
+from arete.services.rag_pipeline_service import RAGPipelineService, create_rag_pipeline_service
+from arete.services.llm_async_core import CancellationToken
+from arete.services.llm_provider import RequestCancelledError
 from arete.core.config import get_settings
 from arete.models.chat_models import Message, ConversationHistory, Citation
 
@@ -23,6 +28,10 @@ from arete.models.chat_models import Message, ConversationHistory, Citation
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cancellation tokens of running generations by generation id; tokens cannot
+# be serialized with the state, so stop_generation looks them up here
+_active_generations: Dict[str, CancellationToken] = {}
+
 
 class MessageType:
     USER = "user"
@@ -63,6 +72,7 @@ class RAGChatState(rx.State):
     messages: List[ChatMessage] = []
     current_input: str = ""
     is_processing: bool = False
+    active_generation_id: str = ""
     conversation_metadata: ConversationMetadata = None
     
     # RAG service instances - lazy loaded
@@ -71,12 +81,14 @@ class RAGChatState(rx.State):
     _llm_service: Optional[LLMService] = None
     _weaviate_client: Optional[WeaviateClient] = None
     _neo4j_client: Optional[Neo4jClient] = None
+    _rag_pipeline: Optional[RAGPipelineService] = None
     
     # UI state management
     show_citations: bool = True
     show_retrieval_stats: bool = False
     auto_scroll: bool = True
     typing_indicator: bool = False
+    stream_flush_interval: float = 0.05  # Seconds between streamed UI updates
     selected_citation_id: Optional[str] = None
     citation_modal_open: bool = False
     
@@ -315,145 +327,138 @@ class RAGChatState(rx.State):
             self.conversation_metadata.last_updated = datetime.now()
     
     # Core RAG processing
-    async def process_query_with_rag(self, query: str) -> Dict[str, Any]:
-        """Process query through RAG pipeline"""
-        start_time = datetime.now()
-        
-        try:
-            await self._initialize_services()
-            
-            # Get conversation context
-            context_messages = []
-            recent_messages = self.messages[-self.max_context_messages:] if self.messages else []
-            
-            for msg in recent_messages:
-                if not msg.is_loading and msg.message_type in [MessageType.USER, MessageType.ASSISTANT]:
-                    context_messages.append({
-                        "role": "user" if msg.message_type == MessageType.USER else "assistant",
-                        "content": msg.content
-                    })
-            
-            # Retrieve relevant content
-            retrieval_result = await self._retrieval_service.retrieve(
-                query=query,
-                limit=self.retrieval_limit,
-                similarity_threshold=self.similarity_threshold
-            )
-            
-            # Process citations
-            citations = []
-            context_chunks = []
-            
-            for i, chunk_result in enumerate(retrieval_result.chunks):
-                citation = {
-                    "id": str(uuid4()),
-                    "text": chunk_result.content[:self.citation_preview_length],
-                    "full_text": chunk_result.content,
-                    "source": chunk_result.metadata.get('source', 'Unknown'),
-                    "position": chunk_result.metadata.get('position', 0),
-                    "relevance_score": chunk_result.score,
-                    "chunk_id": chunk_result.id,
-                    "page": chunk_result.metadata.get('page'),
-                    "section": chunk_result.metadata.get('section'),
-                    "entities": chunk_result.metadata.get('entities', [])
-                }
-                citations.append(citation)
-                context_chunks.append(chunk_result.content)
-            
-            # Generate response
-            rag_context = "\n\n".join(context_chunks) if context_chunks else ""
-            
-            response = await self._llm_service.generate_response(
-                query=query,
-                context=rag_context,
-                conversation_history=context_messages
-            )
-            
-            processing_time = (datetime.now() - start_time).total_seconds()
-            
-            # Prepare retrieval statistics
-            retrieval_stats = {
-                "chunks_retrieved": len(retrieval_result.chunks),
-                "entities_found": len(retrieval_result.entities) if hasattr(retrieval_result, 'entities') else 0,
-                "avg_relevance": sum(chunk.score for chunk in retrieval_result.chunks) / len(retrieval_result.chunks) if retrieval_result.chunks else 0,
-                "processing_time": processing_time,
-                "context_length": len(rag_context),
-                "query_complexity": len(query.split())
-            }
-            
-            return {
-                "response": response,
-                "citations": citations,
-                "retrieval_stats": retrieval_stats,
-                "processing_time": processing_time,
-                "token_count": len(response.split()) * 1.3  # Rough token estimate
-            }
-            
-        except Exception as e:
-            logger.error(f"Error in RAG processing: {e}")
-            processing_time = (datetime.now() - start_time).total_seconds()
-            
-            return {
-                "response": f"I apologize, but I encountered an error processing your question: {str(e)}",
-                "citations": [],
-                "retrieval_stats": {"error": str(e), "processing_time": processing_time},
-                "processing_time": processing_time,
-                "error": str(e)
+    def _conversation_context(self) -> Dict[str, Any]:
+        """Build the pipeline user context from the most recent conversation turns"""
+        recent_messages = self.messages[-self.max_context_messages:] if self.max_context_messages > 0 else []
+        history = [
+            {
+                "role": "user" if msg.message_type == MessageType.USER else "assistant",
+                "content": msg.content
             }
+            for msg in recent_messages
+            if not msg.is_loading and msg.message_type in [MessageType.USER, MessageType.ASSISTANT]
+        ]
+        return {"conversation_history": history}
+    
+    def _ensure_rag_pipeline(self) -> RAGPipelineService:
+        """Create the RAG pipeline on first use"""
+        if self._rag_pipeline is None:
+            self._rag_pipeline = create_rag_pipeline_service()
+        return self._rag_pipeline
+    
+    async def stream_query_with_rag(
+        self,
+        query: str,
+        user_context: Optional[Dict[str, Any]] = None,
+        cancel_token: Optional[CancellationToken] = None
+    ) -> AsyncGenerator[Any, None]:
+        """Stream a query through the RAG pipeline, yielding text deltas then the result"""
+        pipeline = self._ensure_rag_pipeline()
+        config = replace(
+            pipeline.config,
+            max_retrieval_results=self.retrieval_limit,
+            min_relevance_score=self.similarity_threshold
+        )
+        async for event in pipeline.execute_pipeline_stream(
+            query, config=config, user_context=user_context, cancel_token=cancel_token
+        ):
+            yield event
+    
+    def _citations_from_result(self, result: Any) -> List[Dict[str, Any]]:
+        """Convert pipeline citations to the chat citation format"""
+        citations = []
+        for citation in result.response.citations:
+            citations.append({
+                "id": str(uuid4()),
+                "text": citation.text[:self.citation_preview_length],
+                "full_text": citation.text,
+                "source": citation.source,
+                "position": 0,
+                "relevance_score": citation.confidence,
+                "chunk_id": citation.reference,
+                "page": None,
+                "section": citation.work,
+                "entities": []
+            })
+        return citations
     
     # Main chat actions
+    @rx.event(background=True)
     async def send_message(self):
-        """Send user message and get RAG response"""
-        if not self.current_input.strip() or self.is_processing:
-            return
+        """Send user message and stream the RAG response into the chat
         
-        user_query = self.current_input.strip()
-        self.current_input = ""
-        self.is_processing = True
-        self.typing_indicator = True
+        Runs as a background event so stop_generation is handled while the
+        answer streams; state is only changed inside ``async with self``.
+        """
+        async with self:
+            if not self.current_input.strip() or self.is_processing:
+                return
+            
+            user_query = self.current_input.strip()
+            self.current_input = ""
+            self.is_processing = True
+            self.typing_indicator = True
+            generation_id = str(uuid4())
+            cancel_token = CancellationToken()
+            _active_generations[generation_id] = cancel_token
+            self.active_generation_id = generation_id
+            
+            # Earlier turns only; the new question is sent as the query
+            user_context = self._conversation_context()
+            self.add_message(user_query, MessageType.USER)
+            assistant_message = self.add_message("", MessageType.ASSISTANT, is_loading=True)
+            self._ensure_rag_pipeline()
         
+        content = ""
         try:
-            # Add user message
-            user_message = self.add_message(user_query, MessageType.USER)
-            
-            # Add loading assistant message
-            assistant_message = self.add_message("", MessageType.ASSISTANT, is_loading=True)
-            
-            # Process through RAG
-            result = await self.process_query_with_rag(user_query)
-            
-            # Update assistant message
-            self.update_message(
-                assistant_message.id,
-                content=result["response"],
-                citations=result["citations"],
-                is_loading=False,
-                processing_time=result["processing_time"],
-                token_count=result.get("token_count"),
-                retrieval_stats=result["retrieval_stats"],
-                error_message=result.get("error")
-            )
-            
-            # Update performance stats
-            self.total_queries += 1
-            self.last_query_time = result["processing_time"]
-            self.average_response_time = (
-                (self.average_response_time * (self.total_queries - 1) + result["processing_time"]) 
-                / self.total_queries
-            )
-            
-            # Auto-generate conversation title if first exchange
-            if len(self.messages) == 2 and self.conversation_metadata.title == "New Conversation":
-                # Use first few words of user query as title
-                title_words = user_query.split()[:5]
-                self.conversation_metadata.title = " ".join(title_words) + ("..." if len(title_words) == 5 else "")
-            
+            # Stream through RAG, pushing partial text at most once per flush interval
+            start_time = time.time()
+            last_flush = 0.0
+            result = None
+            async for event in self.stream_query_with_rag(user_query, user_context, cancel_token):
+                if event.result is not None:
+                    result = event.result
+                    continue
+                content += event.delta
+                if time.time() - last_flush >= self.stream_flush_interval:
+                    async with self:
+                        self.update_message(assistant_message.id, content=content)
+                    last_flush = time.time()
+            
+            processing_time = time.time() - start_time
+            async with self:
+                if result is None:
+                    # Keep whatever was streamed and report the incomplete answer
+                    logger.error("RAG stream ended without a result")
+                    self.update_message(
+                        assistant_message.id,
+                        content=content or "I'm sorry, the response was interrupted. Please try again.",
+                        message_type=MessageType.ASSISTANT if content else MessageType.ERROR,
+                        error_message="Response stream ended without a result",
+                        is_loading=False,
+                        processing_time=processing_time
+                    )
+                    return
+                self._finish_response(assistant_message.id, user_query, result, processing_time)
+            
+        except RequestCancelledError:
+            # Keep the partial answer the user chose to stop
+            logger.info("Generation stopped by user")
+            async with self:
+                self.update_message(
+                    assistant_message.id,
+                    content=content or "Generation stopped.",
+                    message_type=MessageType.ASSISTANT if content else MessageType.SYSTEM,
+                    error_message="Generation stopped",
+                    is_loading=False
+                )
+        
         except Exception as e:
             logger.error(f"Error in send_message: {e}")
             # Update the loading message with error
-            if len(self.messages) > 0 and self.messages[-1].is_loading:
+            async with self:
                 self.update_message(
-                    self.messages[-1].id,
+                    assistant_message.id,
                     content="I'm sorry, I encountered an error processing your request. Please try again.",
                     message_type=MessageType.ERROR,
                     error_message=str(e),
@@ -461,10 +466,57 @@ class RAGChatState(rx.State):
                 )
         
         finally:
-            self.is_processing = False
-            self.typing_indicator = False
-    
-    async def regenerate_last_response(self):
+            _active_generations.pop(generation_id, None)
+            async with self:
+                self.active_generation_id = ""
+                self.is_processing = False
+                self.typing_indicator = False
+    
+    def _finish_response(self, message_id: str, user_query: str, result: Any, processing_time: float):
+        """Finalize the assistant message and performance stats from a pipeline result"""
+        metrics = result.metrics
+        
+        self.update_message(
+            message_id,
+            content=result.response.response_text,
+            citations=self._citations_from_result(result),
+            is_loading=False,
+            processing_time=processing_time,
+            token_count=result.response.token_usage.get("response_tokens"),
+            retrieval_stats={
+                "chunks_retrieved": metrics.retrieved_results,
+                "avg_relevance": metrics.average_relevance_score,
+                "processing_time": processing_time,
+                "context_tokens": result.response.context_tokens_used,
+                "query_complexity": len(user_query.split())
+            },
+            error_message="; ".join(result.errors) or None
+        )
+        
+        # Update performance stats
+        self.total_queries += 1
+        self.last_query_time = processing_time
+        self.average_response_time = (
+            (self.average_response_time * (self.total_queries - 1) + processing_time) 
+            / self.total_queries
+        )
+        
+        # Auto-generate conversation title if first exchange
+        if len(self.messages) == 2 and self.conversation_metadata.title == "New Conversation":
+            # Use first few words of user query as title
+            title_words = user_query.split()[:5]
+            self.conversation_metadata.title = " ".join(title_words) + ("..." if len(title_words) == 5 else "")
+    
+    @rx.event(background=True)
+    async def stop_generation(self):
+        """Stop the response being generated, keeping the text streamed so far"""
+        async with self:
+            generation_id = self.active_generation_id
+        cancel_token = _active_generations.get(generation_id)
+        if cancel_token is not None:
+            cancel_token.cancel("Stopped by user")
+    
+    def regenerate_last_response(self):
         """Regenerate the last assistant response"""
         if not self.can_regenerate:
             return
@@ -484,7 +536,7 @@ class RAGChatState(rx.State):
         
         # Set input and regenerate
         self.current_input = user_message.content
-        await self.send_message()
+        return RAGChatState.send_message
     
     # Message actions
     async def copy_message_content(self, message_id: str):
@@ -0,0 +1,82 @@
+"""
+Tests for the entity mention index used in graph-enhanced retrieval.
+"""
+from types import SimpleNamespace
+
+from arete.processing.entity_mentions import EntityMentionIndex, MultiPatternMatcher
+
+
+def make_entity(entity_id, name, aliases=None):
+    return SimpleNamespace(id=entity_id, name=name, aliases=aliases or [])
+
+
+def make_chunk(chunk_id, text):
+    return SimpleNamespace(id=chunk_id, text=text)
+
+
+class TestMultiPatternMatcher:
+    """Test Aho-Corasick matching."""
+
+    def test_finds_overlapping_patterns(self):
+        """Test that nested patterns are all reported."""
+        matcher = MultiPatternMatcher({"theory of forms": ["tof"], "forms": ["forms"]})
+        matches = {key for key, _, _ in matcher.find_all("Plato's Theory of Forms")}
+        assert matches == {"tof", "forms"}
+
+    def test_respects_word_boundaries(self):
+        """Test that patterns inside longer words are ignored."""
+        matcher = MultiPatternMatcher({"plato": ["plato"]})
+        assert list(matcher.find_all("Platonic dialogues")) == []
+
+    def test_offsets_span_collapsed_whitespace(self):
+        """Test that offsets point into the original text."""
+        text = "the theory  of\nforms"
+        matcher = MultiPatternMatcher({"theory of forms": ["tof"]})
+        [(key, start, end)] = list(matcher.find_all(text))
+        assert text[start:end] == "theory  of\nforms"
+
+
+class TestEntityMentionIndex:
+    """Test entity mention indexing."""
+
+    def test_build_and_lookup(self):
+        """Test building the index and looking up chunks by entity."""
+        plato = make_entity("e1", "Plato", aliases=["Platon"])
+        virtue = make_entity("e2", "Virtue")
+        chunks = [
+            make_chunk("c1", "Plato discusses virtue in the Meno."),
+            make_chunk("c2", "Platon wrote dialogues."),
+            make_chunk("c3", "Aristotle on the good life."),
+        ]
+
+        index = EntityMentionIndex.build([plato, virtue], chunks)
+
+        assert index.get_chunk_ids(plato) == {"c1", "c2"}
+        assert index.get_chunk_ids(virtue) == {"c1"}
+        assert index.get_offsets("e1", "c1") == [(0, 5)]
+
+    def test_lookup_by_name_for_unknown_id(self):
+        """Test that entities reconstructed with a new ID resolve by name."""
+        index = EntityMentionIndex.build(
+            [make_entity("e1", "Justice")],
+            [make_chunk("c1", "What is justice?")]
+        )
+
+        assert index.knows_entity(make_entity("other", "justice"))
+        assert index.get_chunk_ids(make_entity("other", "justice")) == {"c1"}
+        assert not index.knows_entity(make_entity("e9", "Courage"))
+
+    def test_mention_records_round_trip(self):
+        """Test exporting records and loading them back."""
+        entity = make_entity("e1", "Socrates")
+        index = EntityMentionIndex.build([entity], [make_chunk("c1", "Socrates asks.")])
+
+        loaded = EntityMentionIndex()
+        for record in index.to_mention_records():
+            loaded.add_mention(
+                record["entity_id"], entity.name, record["chunk_id"],
+                list(zip(record["starts"], record["ends"]))
+            )
+
+        assert loaded.get_chunk_ids(entity) == {"c1"}
+        assert loaded.get_offsets("e1", "c1") == [(0, 8)]
@@ -0,0 +1,64 @@
+"""Tests for stopping a streamed answer in the RAG chat state."""
+import asyncio
+
+import pytest
+
+from arete.services.llm_provider import RequestCancelledError
+from arete.services.rag_pipeline_service import PipelineStreamEvent, RAGPipelineConfig
+from arete.ui.reflex_app.state.chat_state import RAGChatState
+
+
+class UnproxiedChatState(RAGChatState):
+    """Chat state whose background handlers run without an app state manager."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
+class StoppablePipeline:
+    """Pipeline streaming one delta, then waiting until its token is cancelled."""
+
+    config = RAGPipelineConfig()
+
+    async def execute_pipeline_stream(self, query, config=None, user_context=None, cancel_token=None):
+        yield PipelineStreamEvent(delta="Virtue is")
+        while not cancel_token.cancelled:
+            await asyncio.sleep(0.01)
+        raise RequestCancelledError(f"Stream cancelled: {cancel_token.reason}")
+
+
+async def wait_until(condition, timeout=2.0):
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+class TestStopGeneration:
+    """Test that stop_generation reaches a stream while send_message runs."""
+
+    @pytest.mark.asyncio
+    async def test_stop_cancels_stream_in_progress(self):
+        """Test that the streamed text is kept and the state is released."""
+        state = UnproxiedChatState()
+        state._rag_pipeline = StoppablePipeline()
+        state.stream_flush_interval = 0.0
+        state.current_input = "What is virtue?"
+
+        sending = asyncio.create_task(UnproxiedChatState.send_message.fn(state))
+        await wait_until(lambda: state.messages and state.messages[-1].content == "Virtue is")
+        assert state.is_processing
+
+        await UnproxiedChatState.stop_generation.fn(state)
+        await asyncio.wait_for(sending, 2.0)
+
+        answer = state.messages[-1]
+        assert answer.content == "Virtue is"
+        assert answer.error_message == "Generation stopped"
+        assert not answer.is_loading
+        assert not state.is_processing
+        assert state.active_generation_id == ""
@@ -19,7 +19,11 @@ from arete.repositories.base import (
     EntityNotFoundError,
     DuplicateEntityError,
     ValidationError,
-    ModelType
+    ModelType,
+    Page,
+    encode_page_token,
+    decode_page_token,
+    build_keyset_query
 )
 from arete.models.base import BaseModel
 
@@ -62,6 +66,14 @@ class TestRepositoryInterfaceContracts:
         
         assert required_methods.issubset(actual_methods)
 
+    def test_keyset_listing_is_required(self):
+        """Test that a repository without _list_after cannot be instantiated."""
+        class WithoutKeyset(BaseRepository[MockModel]):
+            create = get_by_id = update = delete = list_all = count = exists = AsyncMock()
+
+        with pytest.raises(TypeError):
+            WithoutKeyset()
+
     def test_searchable_repository_extends_base(self):
         """Test that SearchableRepository extends BaseRepository."""
         assert issubclass(SearchableRepository, BaseRepository)
@@ -133,6 +145,7 @@ class MockBaseRepository(BaseRepository[MockModel]):
         self.list_all_mock = AsyncMock()
         self.count_mock = AsyncMock()
         self.exists_mock = AsyncMock()
+        self.list_after_mock = AsyncMock()
 
     async def create(self, entity: MockModel) -> MockModel:
         return await self.create_mock(entity)
@@ -160,6 +173,9 @@ class MockBaseRepository(BaseRepository[MockModel]):
     async def exists(self, entity_id: Union[UUID, str]) -> bool:
         return await self.exists_mock(entity_id)
 
+    async def _list_after(self, limit, cursor, filters) -> List[MockModel]:
+        return await self.list_after_mock(limit, cursor, filters)
+
 
 class TestBaseRepositoryImplementation:
     """Test BaseRepository interface through concrete implementation."""
@@ -365,4 +381,69 @@ class TestRepositoryTypeSystem:
         """Test that repository implementations preserve model type."""
         mock_repo = MockBaseRepository()
         # Type checking would catch issues here in a real IDE
-        assert isinstance(mock_repo, BaseRepository)
\ No newline at end of file
+        assert isinstance(mock_repo, BaseRepository)
+
+
+class KeysetMockRepository(MockBaseRepository):
+    """Repository serving keyset pages from an in-memory list."""
+
+    def __init__(self, items):
+        super().__init__()
+        self.items = sorted(items, key=lambda item: (item.created_at.timestamp(), str(item.id)), reverse=True)
+
+    async def _list_after(self, limit, cursor, filters):
+        rows = self.items
+        if cursor is not None:
+            rows = [
+                item for item in rows
+                if (item.created_at.timestamp(), str(item.id)) < cursor
+            ]
+        return rows[:limit]
+
+
+class TestKeysetPagination:
+    """Test generic keyset pagination in BaseRepository."""
+
+    def test_page_token_round_trip(self):
+        """Test that tokens decode to the encoded position."""
+        entity_id = uuid4()
+        token = encode_page_token(1700000000.5, entity_id)
+
+        assert decode_page_token(token) == (1700000000.5, str(entity_id))
+
+    def test_invalid_page_token_raises_validation_error(self):
+        """Test that malformed tokens are rejected."""
+        with pytest.raises(ValidationError):
+            decode_page_token("not-a-token")
+
+    @pytest.mark.asyncio
+    async def test_list_page_walks_all_items(self):
+        """Test that following tokens visits every item exactly once."""
+        repository = KeysetMockRepository([MockModel(name=f"item {i}") for i in range(7)])
+
+        seen = []
+        token = None
+        while True:
+            page = await repository.list_page(limit=3, page_token=token)
+            assert isinstance(page, Page)
+            seen.extend(item.id for item in page.items)
+            if not page.has_more:
+                break
+            token = page.next_page_token
+
+        assert seen == [item.id for item in repository.items]
+
+    def test_build_keyset_query_seeks_past_cursor(self):
+        """Test that the query seeks on (created_at, id) rather than skipping."""
+        query, params = build_keyset_query(
+            "Document", "d", 11, cursor=(1.5, "abc"), filters={"author": "Plato"}
+        )
+
+        assert "SKIP" not in query
+        assert "ORDER BY d.created_at DESC, d.id DESC" in query
+        assert params == {
+            "limit": 11,
+            "filter_author": "Plato",
+            "cursor_created_at": 1.5,
+            "cursor_id": "abc",
+        }
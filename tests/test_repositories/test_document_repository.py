@@ -18,7 +18,7 @@ from arete.repositories.base import (
     ValidationError,
     RepositoryError
 )
-from arete.repositories.document import DocumentRepository
+from arete.repositories.document import DocumentRepository, _escape_lucene
 from arete.models.document import Document
 from arete.database.client import Neo4jClient
 from arete.database.weaviate_client import WeaviateClient
@@ -450,6 +450,38 @@ class TestDocumentRepositorySearchOperations:
         # Results should be merged (exact logic will be implementation-specific)
         assert len(results) >= 1
 
+    @pytest.mark.asyncio
+    async def test_search_content_fuses_scores(
+        self,
+        document_repository,
+        mock_neo4j_client,
+        mock_weaviate_client,
+        sample_documents
+    ):
+        """Test search_content ranks by weighted keyword and semantic scores."""
+        mock_neo4j_client.query = AsyncMock(
+            return_value=[
+                {"d": sample_documents[0].model_dump(), "score": 4.0},
+                {"d": sample_documents[1].model_dump(), "score": 2.0},
+            ]
+        )
+        mock_weaviate_client.search_near_text = AsyncMock(
+            return_value=[{**sample_documents[1].model_dump(), "certainty": 0.9}]
+        )
+        
+        results = await document_repository.search_content(
+            "virtue", hybrid_weight=0.5
+        )
+        
+        query_call = mock_neo4j_client.query.call_args[0][0]
+        assert "db.index.fulltext.queryNodes" in query_call
+        assert [doc.title for doc in results] == ["Nicomachean Ethics", "The Republic"]
+
+    def test_escape_lucene_neutralizes_operators(self):
+        """Test that special characters and boolean keywords are matched as plain terms."""
+        assert _escape_lucene('justice (dikaiosyne)?') == 'justice \\(dikaiosyne\\)\\?'
+        assert _escape_lucene("virtue AND NOT vice OR ANDROS") == "virtue and not vice or ANDROS"
+
 
 class TestDocumentRepositoryErrorHandling:
     """Test error handling in DocumentRepository."""
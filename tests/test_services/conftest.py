@@ -0,0 +1,72 @@
+"""Shared test fixtures for LLM service tests."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from arete.services.llm_provider import LLMProvider, LLMResponse, ProviderUnavailableError
+
+LLM_SETTINGS = dict(
+    llm_max_tokens=100, llm_temperature=0.7, llm_timeout=5,
+    llm_circuit_failure_rate=0.5, llm_circuit_minimum_calls=5,
+    llm_circuit_consecutive_failures=3, llm_circuit_window_seconds=60.0,
+    llm_circuit_open_seconds=30.0, llm_health_probe_interval_seconds=10.0,
+    llm_request_deadline_seconds=5.0, llm_hedging_enabled=False,
+    llm_hedge_delay_percentile=0.95, llm_hedge_budget_ratio=0.1,
+    llm_response_cache_enabled=False, llm_response_cache_size=16,
+    llm_response_cache_ttl_seconds=60, llm_response_cache_persist=False,
+    llm_consensus_quorum=2, llm_consensus_agreement_threshold=0.6,
+    shared_cache_path="",
+)
+
+
+class StubProvider(LLMProvider):
+    """Healthy provider answering with fixed text, optionally slowly or not at all."""
+
+    def __init__(self, name, content=None, delay=0.0, fail=False):
+        super().__init__(name)
+        self.content = content if content is not None else name
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = False
+
+    @property
+    def is_available(self):
+        return True
+
+    @property
+    def supported_models(self):
+        return []
+
+    def initialize(self):
+        pass
+
+    async def generate_response(self, messages, **kwargs):
+        self.calls += 1
+        if self.fail:
+            raise ProviderUnavailableError("down", self.name)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return LLMResponse(content=self.content, provider=self.name, usage_tokens=42)
+
+    def get_health_status(self):
+        return {"provider": self.name, "status": "healthy"}
+
+
+@pytest.fixture
+def make_llm_settings():
+    """Factory for MultiProviderLLMService settings with keyword overrides."""
+    def make(**overrides):
+        return SimpleNamespace(**{**LLM_SETTINGS, **overrides})
+    return make
+
+
+@pytest.fixture
+def make_provider():
+    """Factory for stub providers."""
+    return StubProvider
@@ -0,0 +1,110 @@
+"""
+Tests for provider circuit breakers.
+"""
+
+import asyncio
+
+import pytest
+
+from arete.services.circuit_breaker import CircuitBreaker, CircuitState
+from arete.services.llm_provider import (
+    LLMMessage,
+    MessageRole,
+    MultiProviderLLMService,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Test breaker state transitions."""
+
+    def test_opens_on_consecutive_failures(self):
+        """Test that a run of failures opens the breaker and rejects calls."""
+        breaker = CircuitBreaker("p", consecutive_failure_threshold=3, clock=FakeClock())
+
+        for _ in range(3):
+            assert breaker.allow_request()
+            breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow_request()
+        assert breaker.snapshot()["rejected_calls"] == 1
+
+    def test_opens_on_error_rate(self):
+        """Test that the rolling error rate opens the breaker."""
+        breaker = CircuitBreaker(
+            "p", failure_rate_threshold=0.5, minimum_calls=4,
+            consecutive_failure_threshold=10, clock=FakeClock()
+        )
+
+        for success in (True, False, True, False):
+            breaker.record_success() if success else breaker.record_failure()
+
+        assert breaker.state == CircuitState.OPEN
+
+    def test_half_open_probe_closes_or_reopens(self):
+        """Test that one probe is admitted after the cooldown."""
+        clock = FakeClock()
+        breaker = CircuitBreaker("p", consecutive_failure_threshold=1, open_seconds=30, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 31
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+
+        clock.now = 62
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+
+
+class TestMultiProviderCircuitBreakers:
+    """Test health-gated failover in MultiProviderLLMService."""
+
+    def test_open_circuit_skips_provider(self, make_llm_settings, make_provider):
+        """Test that a failing primary is skipped once its circuit opens."""
+        service = MultiProviderLLMService(make_llm_settings(llm_circuit_consecutive_failures=2))
+        primary = make_provider("primary", fail=True)
+        backup = make_provider("backup")
+        service.add_provider(primary)
+        service.add_provider(backup)
+        messages = [LLMMessage(role=MessageRole.USER, content="What is virtue?")]
+
+        for _ in range(4):
+            response = asyncio.run(service.generate_response(messages))
+            assert response.provider == "backup"
+
+        assert primary.calls == 2
+        assert service.get_circuit_states()["primary"]["state"] == "open"
+        assert not service.is_provider_healthy(primary)
+
+    def test_probe_closes_recovered_provider(self, make_llm_settings, make_provider):
+        """Test that a successful probe closes a half-open circuit."""
+        service = MultiProviderLLMService(
+            make_llm_settings(llm_circuit_consecutive_failures=2, llm_circuit_open_seconds=1.0)
+        )
+        provider = make_provider("primary", fail=True)
+        service.add_provider(provider)
+        breaker = service.get_circuit_breaker("primary")
+        clock = FakeClock()
+        breaker._clock = clock
+
+        for _ in range(2):
+            with pytest.raises(Exception):
+                asyncio.run(service.generate_response([]))
+        assert breaker.state == CircuitState.OPEN
+
+        provider.fail = False
+        clock.now = 2.0
+        assert asyncio.run(service.probe_providers()) == {"primary": True}
+        assert breaker.state == CircuitState.CLOSED
@@ -0,0 +1,71 @@
+"""
+Tests for the incremental citation network builder.
+"""
+
+from types import SimpleNamespace
+from uuid import uuid4
+
+from arete.services.citation_tracking_service import (
+    CitationNetwork,
+    CitationNetworkBuilder,
+    CitationRelationship,
+)
+
+
+def make_citation(text, title="Republic", author="Plato"):
+    return SimpleNamespace(id=uuid4(), text=text, source_title=title, source_author=author)
+
+
+JUSTICE = "Justice is doing one's own work and not meddling with what is not one's own."
+
+
+class TestCitationNetworkBuilder:
+    """Test candidate pruning and incremental metrics."""
+
+    def test_only_same_work_pairs_are_scored(self):
+        """Test that pairs from different works are skipped above a 0.5 threshold."""
+        builder = CitationNetworkBuilder(similarity_threshold=0.7)
+        first = make_citation(JUSTICE)
+        second = make_citation(JUSTICE.replace("meddling", "interfering"))
+        other = make_citation(JUSTICE, title="Nicomachean Ethics", author="Aristotle")
+
+        for citation in (first, second, other):
+            builder.add_citation(citation)
+
+        assert builder.pairs_scored == 1
+        assert [(r.source_citation_id, r.target_citation_id) for r in builder.relationships] == [
+            (first.id, second.id)
+        ]
+
+    def test_cross_source_pairs_come_from_lsh(self):
+        """Test that low thresholds relate near-identical texts across works."""
+        builder = CitationNetworkBuilder(similarity_threshold=0.4)
+        first = make_citation(JUSTICE)
+        other = make_citation(JUSTICE, title="Nicomachean Ethics", author="Aristotle")
+        unrelated = make_citation("Pleasure is the absence of pain in the body.", "Letter", "Epicurus")
+
+        for citation in (first, other, unrelated):
+            builder.add_citation(citation)
+
+        assert builder.neighbors(first.id) == {other.id}
+        assert builder.degree(unrelated.id) == 0
+
+    def test_metrics_track_edges_incrementally(self):
+        """Test that density and centrality follow added edges."""
+        builder = CitationNetworkBuilder()
+        citations = [make_citation(f"Passage {i}", title=f"Work {i}") for i in range(4)]
+        for citation in citations:
+            builder.add_citation(citation)
+
+        builder.add_relationship(CitationRelationship(
+            source_citation_id=citations[0].id, target_citation_id=citations[1].id
+        ))
+        builder.add_relationship(CitationRelationship(
+            source_citation_id=citations[0].id, target_citation_id=citations[2].id
+        ))
+        network = builder.apply_to(CitationNetwork())
+
+        assert network.total_relationships == 2
+        assert network.density == 4 / 12
+        assert network.centrality_scores[citations[0].id] == 2 / 3
+        assert network.centrality_scores[citations[3].id] == 0.0
@@ -0,0 +1,66 @@
+"""
+Tests for the per-request citation source index.
+"""
+
+from types import SimpleNamespace
+
+from arete.services.citation_source_index import CitationSourceIndex, get_source_index
+
+
+def make_citation(text, title="Republic", author="Plato"):
+    return SimpleNamespace(text=text, source_title=title, source_author=author)
+
+
+SOURCES = [
+    make_citation("The unexamined life is not worth living for a human being.", "Apology"),
+    make_citation("Justice is doing one's own work and not meddling with what is not one's own."),
+    make_citation("Virtue is a state of character concerned with choice, lying in a mean.",
+                  "Nicomachean Ethics", "Aristotle"),
+]
+
+
+class TestCitationSourceIndex:
+    """Test candidate generation and matching."""
+
+    def test_best_text_match(self):
+        """Test that a lightly altered quote finds its passage."""
+        index = CitationSourceIndex(SOURCES)
+
+        match, similarity = index.best_text_match(
+            "the unexamined life is not worth living for a human", threshold=0.8
+        )
+
+        assert match is SOURCES[0]
+        assert similarity >= 0.8
+
+    def test_unrelated_text_has_no_candidates(self):
+        """Test that passages sharing no n-grams are never aligned."""
+        index = CitationSourceIndex(SOURCES)
+
+        assert index.text_candidates("xyzzy qwerty") == []
+        assert index.best_text_match("xyzzy qwerty") == (None, 0.0)
+
+    def test_title_candidates_require_substring_trigrams(self):
+        """Test that work lookups narrow to titles that can contain the work."""
+        index = CitationSourceIndex(SOURCES)
+
+        assert index.title_candidates("Ethics") == [2]
+        assert index.title_candidates("Symposium") == []
+        assert index.title_candidates("Ap") == [0, 1, 2]
+
+    def test_attribution_candidates(self):
+        """Test that author and title constraints are combined."""
+        index = CitationSourceIndex(SOURCES)
+
+        assert index.attribution_candidates("Plato", "Republic") == [1]
+        assert index.attribution_candidates("Aristotle", "Republic") == []
+
+    def test_index_is_memoized_per_context(self):
+        """Test that a context reuses its index until its citations change."""
+        context = SimpleNamespace(citations=[SimpleNamespace(citation=c) for c in SOURCES])
+
+        first = get_source_index(context)
+        assert get_source_index(context) is first
+
+        context.citations = context.citations[:1]
+        assert len(get_source_index(context)) == 1
@@ -0,0 +1,97 @@
+"""
+Tests for streamed, time-bounded citation validation.
+"""
+
+import asyncio
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from arete.services.citation_validation_service import (
+    CitationValidationConfig,
+    CitationValidationService,
+    ValidationResult,
+)
+
+
+def make_citation(delay):
+    return SimpleNamespace(id=uuid4(), document_id=None, citation_type="paraphrase", delay=delay)
+
+
+def make_service(**config):
+    service = CitationValidationService(CitationValidationConfig(**config))
+
+    async def validate_citation(citation, source_context=None, original_document=None):
+        await asyncio.sleep(citation.delay)
+        return ValidationResult(citation_id=citation.id, confidence_score=0.9, source_accuracy=0.9)
+
+    service.validate_citation = validate_citation
+    return service
+
+
+class TestIterCitationValidations:
+    """Test that results stream out and budgets produce timed-out markers."""
+
+    @pytest.mark.asyncio
+    async def test_yields_in_completion_order(self):
+        """Test that fast validations are not held back by slow ones."""
+        service = make_service()
+        citations = [make_citation(0.03), make_citation(0.0), make_citation(0.01)]
+
+        results = [result async for result in service.iter_citation_validations(citations)]
+
+        assert [result.citation_id for result in results] == [citations[i].id for i in (1, 2, 0)]
+        assert not any(result.timed_out for result in results)
+
+    @pytest.mark.asyncio
+    async def test_per_citation_timeout(self):
+        """Test that only the slow citation is marked as timed out."""
+        service = make_service(per_citation_timeout=0.02)
+        slow, fast = make_citation(1.0), make_citation(0.0)
+
+        results = {result.citation_id: result async for result in service.iter_citation_validations([slow, fast])}
+
+        assert results[slow.id].timed_out
+        assert not results[slow.id].is_valid
+        assert results[slow.id].issues == ["Validation timed out"]
+        assert not results[fast.id].timed_out
+
+    @pytest.mark.asyncio
+    async def test_batch_deadline_returns_partial_results(self):
+        """Test that finished results are kept when the batch deadline passes."""
+        service = make_service(validation_timeout=0.05, per_citation_timeout=None)
+        citations = [make_citation(0.0), make_citation(1.0), make_citation(1.0)]
+
+        results = [result async for result in service.iter_citation_validations(citations)]
+
+        assert [result.timed_out for result in results] == [False, True, True]
+        assert [result.citation_id for result in results] == [citation.id for citation in citations]
+        assert results[1].issues == ["Validation timed out (batch deadline)"]
+
+
+class TestBatchProgress:
+    """Test the progress callback and timed-out accounting of batch validation."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("asynchronous", [False, True])
+    async def test_progress_callback_sees_every_result(self, asynchronous):
+        """Test that sync and async callbacks are invoked once per citation."""
+        service = make_service(per_citation_timeout=0.02)
+        citations = [make_citation(0.0), make_citation(1.0), make_citation(0.0)]
+        seen = []
+
+        if asynchronous:
+            async def on_result(result):
+                seen.append(result.citation_id)
+        else:
+            def on_result(result):
+                seen.append(result.citation_id)
+
+        batch = await service.validate_citations_batch(citations, on_result=on_result)
+
+        assert sorted(seen) == sorted(citation.id for citation in citations)
+        assert [result.citation_id for result in batch.citation_results] == [c.id for c in citations]
+        assert batch.timed_out_citations == 1
+        assert batch.valid_citations == 2
+        assert any("timed out; results are partial" in issue for issue in batch.quality_issues)
@@ -0,0 +1,164 @@
+"""
+Tests for the data quality pipeline task graph and worker pool handling.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from types import SimpleNamespace
+
+import pytest
+
+from arete.services.data_quality import data_quality_pipeline, duplicate_detection_service
+from arete.services.data_quality.data_quality_pipeline import (
+    AssessmentComponent,
+    DataQualityPipeline,
+    QualityPipelineConfig,
+)
+from arete.services.data_quality.duplicate_detection_service import DuplicationStrategy
+
+
+def make_pipeline(**config):
+    return DataQualityPipeline(QualityPipelineConfig(save_results=False, **config))
+
+
+def failing_function(*args):
+    raise TypeError("bad item")
+
+
+class BrokenExecutor(ThreadPoolExecutor):
+    """Executor behaving like a process pool whose workers died."""
+
+    def submit(self, *args, **kwargs):
+        raise BrokenProcessPool("worker died")
+
+
+class TestComponentGraph:
+    """Test dependency ordering, skipping and timeouts of assessment components."""
+
+    @pytest.mark.asyncio
+    async def test_dependents_wait_and_independents_overlap(self):
+        """Test that a dependent starts after its dependency while others run alongside."""
+        pipeline = make_pipeline()
+        events = []
+
+        def component(name, delay, depends_on=()):
+            async def run():
+                events.append(f"{name}:start")
+                await asyncio.sleep(delay)
+                events.append(f"{name}:end")
+            return AssessmentComponent(name=name, run=run, depends_on=depends_on, timeout=1.0)
+
+        outcomes = await pipeline._execute_component_graph([
+            component("detect", 0.02),
+            component("dedupe", 0.0, depends_on=("detect",)),
+            component("citations", 0.01),
+        ])
+
+        assert all(outcome["status"] == "completed" for outcome in outcomes.values())
+        assert events.index("citations:start") < events.index("detect:end")
+        assert events.index("detect:end") < events.index("dedupe:start")
+
+    @pytest.mark.asyncio
+    async def test_failed_or_timed_out_dependency_skips_dependents(self):
+        """Test that dependents of unfinished components are skipped."""
+        pipeline = make_pipeline()
+
+        async def fail():
+            raise RuntimeError("detector crashed")
+
+        async def hang():
+            await asyncio.sleep(1.0)
+
+        async def never():
+            raise AssertionError("must not run")
+
+        outcomes = await pipeline._execute_component_graph([
+            AssessmentComponent("failing", fail, timeout=1.0),
+            AssessmentComponent("slow", hang, timeout=0.01),
+            AssessmentComponent("after_failing", never, depends_on=("failing",)),
+            AssessmentComponent("after_slow", never, depends_on=("slow",)),
+        ])
+
+        assert outcomes["failing"]["status"] == "failed"
+        assert outcomes["slow"]["status"] == "timed_out"
+        assert outcomes["after_failing"]["status"] == "skipped"
+        assert outcomes["after_slow"]["status"] == "skipped"
+
+
+class TestProcessPoolFallback:
+    """Test when lexical duplicate detection falls back from the process pool."""
+
+    @pytest.mark.asyncio
+    async def test_unpicklable_items_use_a_thread(self):
+        """Test that items that cannot be pickled are checked in a thread."""
+        pipeline = make_pipeline(duplication_strategies=[DuplicationStrategy.EXACT_MATCH])
+        items = [
+            SimpleNamespace(text="Know thyself.", callback=lambda: None),
+            SimpleNamespace(text="Know thyself.", callback=lambda: None),
+        ]
+
+        duplicates = await pipeline._detect_lexical_duplicates([(items, "text")])
+
+        assert len(duplicates) == 1
+        assert pipeline._process_pool is None
+
+    def test_lexical_service_is_reused_without_signature_store(self, monkeypatch, tmp_path):
+        """Test that worker tasks share one service that never opens the signature store."""
+        monkeypatch.setattr(
+            duplicate_detection_service, "get_settings",
+            lambda: SimpleNamespace(duplicate_signature_store_path=str(tmp_path / "signatures.db")),
+        )
+        data_quality_pipeline._get_lexical_duplicate_service.cache_clear()
+        items = [SimpleNamespace(text="Know thyself."), SimpleNamespace(text="Know thyself.")]
+
+        for _ in range(2):
+            duplicates = data_quality_pipeline._detect_lexical_duplicates(
+                [(items, "text")], [DuplicationStrategy.EXACT_MATCH], 0.8
+            )
+            assert len(duplicates) == 1
+
+        service = data_quality_pipeline._get_lexical_duplicate_service()
+        assert data_quality_pipeline._get_lexical_duplicate_service.cache_info().misses == 1
+        assert service.signature_store is None
+        assert not (tmp_path / "signatures.db").exists()
+        data_quality_pipeline._get_lexical_duplicate_service.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_is_dropped(self):
+        """Test that a broken pool is shut down and the caller told to fall back."""
+        pipeline = make_pipeline()
+        pipeline._process_pool = BrokenExecutor(max_workers=1)
+
+        assert await pipeline._run_in_process_pool(failing_function, ("item",)) is None
+        assert pipeline._process_pool is None
+
+    @pytest.mark.asyncio
+    async def test_function_errors_propagate(self):
+        """Test that errors raised by the function are not mistaken for pool errors."""
+        pipeline = make_pipeline()
+        pipeline._process_pool = ThreadPoolExecutor(max_workers=1)
+
+        with pytest.raises(TypeError, match="bad item"):
+            await pipeline._run_in_process_pool(failing_function, ("item",))
+        pipeline.close()
+
+    @pytest.mark.asyncio
+    async def test_pool_is_shut_down_after_assessment(self):
+        """Test that the pool outlives assessments only inside a with block."""
+        pipeline = make_pipeline()
+
+        async def use_pool(report, *args):
+            pipeline._process_pool = pipeline._process_pool or ThreadPoolExecutor(max_workers=1)
+            report.citation_accuracy = 1.0
+
+        pipeline._run_assessment_components = use_pool
+        data = {"documents": [SimpleNamespace(content="Know thyself.")]}
+
+        with pipeline:
+            await pipeline.assess_data_quality(data)
+            assert pipeline._process_pool is not None
+        assert pipeline._process_pool is None
+
+        await pipeline.assess_data_quality(data)
+        assert pipeline._process_pool is None
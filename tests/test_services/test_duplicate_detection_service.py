@@ -0,0 +1,169 @@
+"""
+Tests for blocked semantic duplicate detection.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from arete.services.data_quality.duplicate_detection_service import (
+    DuplicateDetectionService,
+    _UnionFind,
+)
+from arete.services.data_quality.signature_store import DuplicateSignatureStore, content_hash
+
+
+class FakeSentenceModel:
+    """Sentence model returning fixed embeddings per text."""
+
+    def __init__(self, embeddings):
+        self.embeddings = embeddings
+
+    def encode(self, texts):
+        return np.array([self.embeddings[text] for text in texts], dtype=np.float32)
+
+
+def make_service(embeddings=None):
+    service = DuplicateDetectionService(
+        similarity_threshold=0.9,
+        settings=SimpleNamespace(duplicate_signature_store_path=""),
+        load_models=False,
+    )
+    if embeddings is not None:
+        service.sentence_model = FakeSentenceModel(embeddings)
+    return service
+
+
+def brute_force_pairs(embeddings, threshold):
+    similarities = embeddings @ embeddings.T
+    return {
+        (i, j)
+        for i in range(len(embeddings))
+        for j in range(i + 1, len(embeddings))
+        if similarities[i, j] >= threshold
+    }
+
+
+class TestBlockedSimilarPairs:
+    """Test that blocked comparison finds exactly the above-threshold pairs."""
+
+    @pytest.mark.parametrize("block_size", [1, 2, 3, 7, 100])
+    def test_matches_full_matrix(self, block_size):
+        """Test that every block size yields the brute-force pairs, each once."""
+        rng = np.random.default_rng(7)
+        centers = rng.normal(size=(3, 8))
+        raw = np.repeat(centers, 4, axis=0) + rng.normal(scale=0.05, size=(12, 8))
+        embeddings = DuplicateDetectionService._normalize_embeddings(raw[rng.permutation(12)])
+
+        pairs = DuplicateDetectionService._find_similar_pairs(embeddings, 0.9, block_size)
+
+        found = [(i, j) for i, j, _ in pairs]
+        assert len(found) == len(set(found))
+        assert set(found) == brute_force_pairs(embeddings, 0.9)
+        assert all(i < j for i, j in found)
+
+    def test_zero_vectors_do_not_match(self):
+        """Test that empty embeddings are not reported as similar."""
+        embeddings = DuplicateDetectionService._normalize_embeddings(
+            [[0.0, 0.0], [0.0, 0.0], [1.0, 0.0]]
+        )
+
+        assert DuplicateDetectionService._find_similar_pairs(embeddings, 0.9, 1) == []
+
+
+class TestUnionFind:
+    """Test merging similar pairs into clusters."""
+
+    def test_groups_transitive_pairs(self):
+        """Test that chained pairs end up in one group and singletons are dropped."""
+        clusters = _UnionFind(6)
+        for i, j in [(0, 4), (4, 5), (1, 2)]:
+            clusters.union(i, j)
+
+        assert sorted(clusters.groups()) == [[0, 4, 5], [1, 2]]
+
+    @pytest.mark.asyncio
+    async def test_clusters_span_blocks(self):
+        """Test that a cluster whose pairs fall in different blocks is one group."""
+        embeddings = {
+            "virtue is knowledge": [1.0, 0.0, 0.0],
+            "the cave": [0.0, 1.0, 0.0],
+            "the divided line": [0.0, 0.0, 1.0],
+            "knowledge is virtue": [0.99, 0.05, 0.0],
+            "virtue, that is knowledge": [0.97, 0.1, 0.0],
+        }
+        items = [SimpleNamespace(id=str(index), text=text) for index, text in enumerate(embeddings)]
+        service = make_service(embeddings)
+
+        results = await service.find_semantic_duplicates(items, 0.9, block_size=2)
+
+        assert len(results) == 1
+        assert [item.id for item in results[0].items] == ["0", "3", "4"]
+        assert results[0].similarity_score > 0.9
+
+
+class TestIncrementalDuplicates:
+    """Test checking new items against existing ones through the signature store."""
+
+    VIRTUE = "Virtue is knowledge, and no one does wrong willingly."
+    CAVE = "Prisoners in the cave mistake shadows on the wall for reality."
+
+    @pytest.mark.asyncio
+    async def test_items_with_ids(self):
+        """Test that exact duplicates are found and a stored item never matches itself."""
+        service = make_service()
+        store = DuplicateSignatureStore(minhasher=service.minhasher)
+        existing = [SimpleNamespace(id="a", text=self.VIRTUE), SimpleNamespace(id="b", text=self.CAVE)]
+        new = [SimpleNamespace(id="c", text=self.VIRTUE)]
+
+        first = await service.detect_incremental_duplicates(existing, new, "text", store)
+        # Checking an item that is already stored must not report it against itself
+        second = await service.detect_incremental_duplicates(existing, new, "text", store)
+
+        for results in (first, second):
+            assert [result.detection_method for result in results] == ["exact_match"]
+            assert [item.id for item in results[0].items] == ["c", "a"]
+
+    @pytest.mark.asyncio
+    async def test_items_without_ids(self):
+        """Test that exact duplicates without IDs are reported despite sharing a key."""
+        service = make_service()
+        store = DuplicateSignatureStore(minhasher=service.minhasher)
+        existing = [SimpleNamespace(text=self.VIRTUE)]
+        new = [SimpleNamespace(text=self.VIRTUE), SimpleNamespace(text=self.CAVE), SimpleNamespace(text=self.CAVE)]
+
+        results = await service.detect_incremental_duplicates(existing, new, "text", store)
+
+        assert len(results) == 2
+        assert results[0].items == [new[0], existing[0]]
+        assert results[1].items == [new[2], new[1]]
+
+    @pytest.mark.asyncio
+    async def test_stored_items_without_ids_are_reported_by_key(self):
+        """Test that a duplicate stored by an earlier run is not matched to the probe itself."""
+        service = make_service()
+        store = DuplicateSignatureStore(minhasher=service.minhasher)
+        store.add(content_hash(self.CAVE), self.CAVE)
+        probe = SimpleNamespace(text=self.CAVE)
+
+        results = await service.detect_incremental_duplicates([], [probe], "text", store)
+
+        assert len(results) == 1
+        assert results[0].items == [probe, content_hash(self.CAVE)]
+
+    @pytest.mark.asyncio
+    async def test_fuzzy_duplicates_match_full_sweep(self):
+        """Test that an edit the full fuzzy sweep reports is also found incrementally."""
+        service = make_service()
+        store = DuplicateSignatureStore(minhasher=service.minhasher)
+        existing = [SimpleNamespace(id="a", text=self.VIRTUE), SimpleNamespace(id="b", text=self.CAVE)]
+        new = [SimpleNamespace(id="c", text="Virtue is knowledge and nobody does wrong willingly.")]
+
+        sweep = service.find_fuzzy_duplicates(existing + new, "text")
+        results = await service.detect_incremental_duplicates(existing, new, "text", store)
+
+        assert [item.id for item in sweep[0].items] == ["a", "c"]
+        assert [result.detection_method for result in results] == ["fuzzy_matching"]
+        assert [item.id for item in results[0].items] == ["c", "a"]
+        assert results[0].similarity_score >= service.fuzzy_threshold
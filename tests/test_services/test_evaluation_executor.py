@@ -0,0 +1,114 @@
+"""
+Tests for concurrent, memoized RAGAS evaluation.
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from arete.services.data_quality.evaluation_executor import EvaluationExecutor
+from arete.services.data_quality.ragas_quality_service import RAGASQualityService
+
+
+class RecordingQualityService(RAGASQualityService):
+    """Quality service returning fixed scores and recording each RAGAS call."""
+
+    def __init__(self, **kwargs):
+        super().__init__(settings=SimpleNamespace(shared_cache_path=""), **kwargs)
+        self.batches = []
+
+    async def evaluate_samples_batched(self, samples):
+        self.batches.append([sample["question"] for sample in samples])
+        scores = {
+            "faithfulness": 0.9, "answer_relevancy": 0.8,
+            "context_precision": 0.7, "context_recall": 0.6,
+        }
+        return [
+            self._build_evaluation_result(
+                sample.get("query_id") or "generated", sample["question"],
+                sample["contexts"], sample["answer"], scores, datetime.now()
+            )
+            for sample in samples
+        ]
+
+
+def sample(question, ground_truth=None, query_id=None):
+    return {
+        "question": question,
+        "contexts": [f"Context for {question}"],
+        "answer": f"Answer to {question}",
+        "ground_truth": ground_truth,
+        "query_id": query_id,
+    }
+
+
+class TestEvaluatorIdentity:
+    """Test that the evaluator identity reflects the evaluator configuration."""
+
+    def test_derived_from_models(self):
+        """Test that the LLM and embedding models are part of the identity."""
+        service = RAGASQualityService(
+            settings=SimpleNamespace(),
+            evaluator_llm=SimpleNamespace(model_name="gpt-4o-mini"),
+            evaluator_embeddings=SimpleNamespace(model="text-embedding-3-small"),
+        )
+
+        assert service.evaluator_model.startswith("ragas-")
+        assert "gpt-4o-mini" in service.evaluator_model
+        assert "text-embedding-3-small" in service.evaluator_model
+        assert RAGASQualityService(settings=SimpleNamespace()).evaluator_model != service.evaluator_model
+
+    def test_explicit_identity_wins(self):
+        """Test that an explicit evaluator model is used as given."""
+        service = RAGASQualityService(settings=SimpleNamespace(), evaluator_model="judge-v2")
+
+        assert service.evaluator_model == "judge-v2"
+
+
+class TestEvaluationExecutor:
+    """Test memoization, batching and cache invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_memoized_samples_are_not_rescored(self):
+        """Test that repeated and duplicate samples are scored once."""
+        service = RecordingQualityService()
+        executor = EvaluationExecutor(service, batch_size=8)
+
+        first = await executor.evaluate_many([sample("q1"), sample("q2"), sample("q1", query_id="again")])
+        second = await executor.evaluate_many([sample("q1", query_id="later"), sample("q2")])
+
+        assert service.batches == [["q1", "q2"]]
+        assert executor.evaluations_run == 2
+        assert [result.question for result in first] == ["q1", "q2", "q1"]
+        assert first[2].query_id == "again"
+        assert second[0].query_id == "later"
+        assert second[0].faithfulness_score == first[0].faithfulness_score
+
+    @pytest.mark.asyncio
+    async def test_batches_are_bounded_and_split_by_ground_truth(self):
+        """Test that batches respect the batch size and never mix ground-truth modes."""
+        service = RecordingQualityService()
+        executor = EvaluationExecutor(service, batch_size=2)
+
+        samples = [sample(f"q{i}") for i in range(3)] + [sample(f"t{i}", ground_truth="truth") for i in range(2)]
+        results = await executor.evaluate_many(samples)
+
+        assert len(results) == 5
+        assert all(len(batch) <= 2 for batch in service.batches)
+        assert sorted(service.batches) == [["q0", "q1"], ["q2"], ["t0", "t1"]]
+
+    @pytest.mark.asyncio
+    async def test_evaluator_or_metric_change_invalidates(self):
+        """Test that results are re-scored when the evaluator or metric set changes."""
+        service = RecordingQualityService()
+        executor = EvaluationExecutor(service)
+
+        await executor.evaluate_many([sample("q1")])
+        service.evaluator_llm = SimpleNamespace(model_name="another-judge")
+        await executor.evaluate_many([sample("q1")])
+        service.register_custom_metric("socratic_method", lambda response, contexts: 1.0)
+        await executor.evaluate_many([sample("q1")])
+        await executor.evaluate_many([sample("q1")])
+
+        assert len(service.batches) == 3
@@ -0,0 +1,77 @@
+"""
+Tests for graph-to-chunk expansion with the entity mention index.
+"""
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+from arete.database.graph_version import GraphVersionTracker
+from arete.services.graph_traversal_service import GraphResult, GraphTraversalService
+
+
+class FakeNeo4jClient:
+    """Neo4j client returning stored mention rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.is_connected = True
+        self.queries = 0
+
+    @contextmanager
+    def session(self):
+        self.queries += 1
+        yield SimpleNamespace(run=lambda query, parameters=None: list(self.rows))
+
+
+def make_service(rows):
+    settings = SimpleNamespace(graph_cache_ttl_seconds=300, graph_cache_max_size=16, shared_cache_path="")
+    client = FakeNeo4jClient(rows)
+    tracker = GraphVersionTracker()
+    service = GraphTraversalService(neo4j_client=client, settings=settings, graph_version_tracker=tracker)
+    return service, client, tracker
+
+
+def make_result(chunk_id, text):
+    return SimpleNamespace(
+        chunk=SimpleNamespace(id=chunk_id, text=text), final_score=0.5, metadata={}
+    )
+
+
+def mention_row(chunk_id):
+    return {"entity_id": "e1", "entity_name": "Plato", "chunk_id": chunk_id, "starts": [0], "ends": [5]}
+
+
+class TestMentionIndexIntegration:
+    """Test that graph results are matched to chunks through the mention index."""
+
+    def test_integration_uses_loaded_index(self):
+        """Test that indexed chunks match and unindexed text mentions do not."""
+        service, client, _ = make_service([mention_row("c1")])
+        plato = SimpleNamespace(id="e1", name="Plato", entity_type="person")
+        results = [
+            make_result("c1", "The Academy's founder on the forms."),
+            make_result("c2", "Plato is named here but was not indexed."),
+        ]
+
+        integrated = service.integrate_with_search_results(
+            results, [GraphResult(entity=plato, relevance_score=0.8, confidence=0.9)]
+        )
+
+        enhanced = [r.chunk.id for r in integrated if r.metadata.get("graph_enhanced")]
+        assert enhanced == ["c1"]
+        assert client.queries == 1
+
+    def test_index_reloads_when_graph_changes(self):
+        """Test that the index is loaded once per graph version."""
+        service, client, tracker = make_service([mention_row("c1")])
+
+        service.refresh_mention_index()
+        service.refresh_mention_index()
+        assert client.queries == 1
+
+        client.rows = [mention_row("c1"), mention_row("c2")]
+        tracker.bump()
+        service.refresh_mention_index()
+
+        assert client.queries == 2
+        assert service.mention_index.get_chunk_ids(SimpleNamespace(id="e1", name="Plato")) == {"c1", "c2"}
@@ -0,0 +1,128 @@
+"""
+Tests for materialized historical timelines.
+"""
+
+from contextlib import asynccontextmanager, contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from arete.database.graph_version import GraphVersionTracker
+from arete.services.historical_development_service import HistoricalDevelopmentService, TimePeriod
+
+
+class FakeResult:
+    """Query result holding fixed records."""
+
+    def __init__(self, records):
+        self.records = records
+
+    async def data(self):
+        return self.records
+
+
+class FakeNeo4jClient:
+    """Neo4j client with the real session API returning stored event and concept rows."""
+
+    def __init__(self, event_rows, concept_rows=()):
+        self.event_rows = event_rows
+        self.concept_rows = list(concept_rows)
+        self.queries = 0
+
+    @contextmanager
+    def session(self):
+        raise AssertionError("synchronous session used from async code")
+
+    @asynccontextmanager
+    async def async_session(self):
+        yield self
+
+    async def run(self, query, **parameters):
+        self.queries += 1
+        if "concept_type" in parameters:
+            return FakeResult(self.concept_rows)
+        return FakeResult(self.event_rows)
+
+
+def event_row(entity_id, name, entity_type, date_string):
+    return {
+        "entity_id": entity_id,
+        "entity_name": name,
+        "entity_type": entity_type,
+        "date_string": date_string,
+        "period_string": None,
+        "description": None,
+        "related_entities": [],
+    }
+
+
+MEDIEVAL_ROWS = [
+    event_row("aquinas", "Thomas Aquinas", "person", "1225 CE"),
+    event_row("ockham", "William of Ockham", "person", "1287 CE"),
+    event_row("anselm", "Anselm", "person", "1033 CE"),
+    event_row("nominalism", "Nominalism", "concept", "1300 CE"),
+]
+
+
+def make_service(event_rows, concept_rows=()):
+    client = FakeNeo4jClient(event_rows, concept_rows)
+    tracker = GraphVersionTracker()
+    service = HistoricalDevelopmentService(
+        neo4j_client=client,
+        settings=SimpleNamespace(shared_cache_path=""),
+        graph_version_tracker=tracker,
+    )
+    return service, client, tracker
+
+
+class TestTimelineMaterialization:
+    """Test materialization on first miss and its invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_first_query_materializes_once(self):
+        """Test that later queries are served without touching Neo4j."""
+        service, client, _ = make_service(
+            MEDIEVAL_ROWS,
+            [{
+                "concept_id": "nominalism", "concept_name": "Nominalism",
+                "related_id": "ockham", "related_name": "William of Ockham",
+                "related_type": "person", "date_string": "1287 CE",
+                "relationship_type": "DEVELOPED",
+            }],
+        )
+
+        await service.analyze_period(TimePeriod.MEDIEVAL)
+        queries_after_materialization = client.queries
+
+        timeline = await service.construct_historical_timeline()
+        development = await service.trace_concept_development("nominalism")
+
+        assert client.queries == queries_after_materialization == 2
+        assert len(timeline.events) == 4
+        assert development.concept_name == "Nominalism"
+
+    @pytest.mark.asyncio
+    async def test_materialization_rebuilt_when_graph_changes(self):
+        """Test that a new graph version is materialized on its first query."""
+        service, client, tracker = make_service(MEDIEVAL_ROWS[:1])
+
+        assert len((await service.construct_historical_timeline()).events) == 1
+
+        client.event_rows = MEDIEVAL_ROWS
+        assert len((await service.construct_historical_timeline()).events) == 1
+
+        tracker.bump()
+        assert len((await service.construct_historical_timeline()).events) == 4
+        assert client.queries == 4
+
+    @pytest.mark.asyncio
+    async def test_period_analysis_is_chronological(self):
+        """Test that key figures come out in date order, not record order."""
+        service, _, _ = make_service(MEDIEVAL_ROWS)
+
+        analysis = await service.analyze_period(TimePeriod.MEDIEVAL)
+
+        assert [name for _, name in analysis.key_figures] == [
+            "Anselm", "Thomas Aquinas", "William of Ockham"
+        ]
+        assert analysis.dominant_concepts == [("nominalism", "Nominalism")]
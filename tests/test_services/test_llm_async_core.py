@@ -0,0 +1,133 @@
+"""
+Tests for cancellation tokens, deadlines and pooled HTTP clients.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from arete.services.llm_async_core import (
+    CancellationToken,
+    get_http_client,
+    run_with_deadline,
+    stream_with_deadline,
+)
+from arete.services.llm_provider import DeadlineExceededError, RequestCancelledError
+
+
+class SlowCall:
+    """Provider call that records whether it was cancelled."""
+
+    def __init__(self):
+        self.cancelled = False
+
+    async def __call__(self, delay=5.0):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return "done"
+
+    async def stream(self, chunks=100):
+        try:
+            for i in range(chunks):
+                await asyncio.sleep(0.01)
+                yield i
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+class TestCancellation:
+    """Test that tokens and deadlines stop in-flight provider calls."""
+
+    def test_token_cancelled_from_another_thread(self):
+        """Test that cancelling from a UI thread stops the call immediately."""
+        call = SlowCall()
+        parent = CancellationToken()
+        token = CancellationToken.linked(parent)
+
+        async def scenario():
+            threading.Timer(0.05, parent.cancel, args=("user left",)).start()
+            await run_with_deadline(call(), token, timeout=5)
+
+        with pytest.raises(RequestCancelledError, match="user left"):
+            asyncio.run(scenario())
+        assert call.cancelled
+        assert token.cancelled
+
+        token.detach()
+        assert not parent._callbacks
+
+    def test_deadline_cancels_call(self):
+        """Test that a call past its deadline is cancelled and reported."""
+        call = SlowCall()
+
+        with pytest.raises(DeadlineExceededError):
+            asyncio.run(run_with_deadline(call(), timeout=0.05))
+        assert call.cancelled
+        assert asyncio.run(run_with_deadline(call(0.01), timeout=1)) == "done"
+
+    def test_stream_stops_on_cancel_and_on_early_close(self):
+        """Test that cancelling or abandoning a stream stops the provider stream."""
+        cancelled_call = SlowCall()
+        abandoned_call = SlowCall()
+
+        async def cancel_midway():
+            token = CancellationToken()
+            received = []
+            with pytest.raises(RequestCancelledError):
+                async for item in stream_with_deadline(cancelled_call.stream(), token, timeout=5):
+                    received.append(item)
+                    if item == 2:
+                        token.cancel()
+            return received
+
+        async def abandon_midway():
+            stream = stream_with_deadline(abandoned_call.stream(), timeout=5)
+            async for item in stream:
+                if item == 1:
+                    break
+            await stream.aclose()
+            await asyncio.sleep(0)
+
+        assert asyncio.run(cancel_midway())[:3] == [0, 1, 2]
+        asyncio.run(abandon_midway())
+        assert cancelled_call.cancelled
+        assert abandoned_call.cancelled
+
+    def test_idle_timeout_bounds_each_chunk_not_the_stream(self):
+        """Test that a steady stream outlives the idle timeout and a stalled one does not."""
+        steady_call = SlowCall()
+        stalled_call = SlowCall()
+
+        async def stalled_stream():
+            await stalled_call(delay=5.0)
+            yield "late"
+
+        async def consume(stream):
+            return [item async for item in stream_with_deadline(stream, idle_timeout=0.1)]
+
+        assert asyncio.run(consume(steady_call.stream(chunks=20))) == list(range(20))
+        with pytest.raises(DeadlineExceededError):
+            asyncio.run(consume(stalled_stream()))
+        assert stalled_call.cancelled
+
+
+class TestHttpPool:
+    """Test sharing of pooled HTTP clients."""
+
+    def test_client_shared_within_loop(self):
+        """Test that a loop reuses its client and a new loop gets its own."""
+
+        async def clients():
+            return get_http_client(30), get_http_client(30.0), get_http_client(5)
+
+        first, same, other_timeout = asyncio.run(clients())
+        next_loop, _, _ = asyncio.run(clients())
+
+        assert first is same
+        assert first is not other_timeout
+        assert next_loop is not first
@@ -0,0 +1,81 @@
+"""
+Tests for early-exit consensus generation.
+"""
+
+import asyncio
+
+import pytest
+
+from arete.services.llm_consensus import claim_agreement, extract_claims
+from arete.services.llm_provider import (
+    LLMMessage,
+    MessageRole,
+    MultiProviderLLMService,
+)
+
+AGREED = (
+    "Socrates held that virtue is a kind of knowledge. "
+    "Nobody does wrong willingly, because wrongdoing comes from ignorance."
+)
+
+
+@pytest.fixture
+def make_service(make_llm_settings):
+    def make(*providers):
+        service = MultiProviderLLMService(make_llm_settings())
+        for provider in providers:
+            service.add_provider(provider)
+        return service
+    return make
+
+
+def ask():
+    return [LLMMessage(role=MessageRole.USER, content="What did Socrates think about virtue?")]
+
+
+class TestConsensus:
+    """Test incremental agreement and early exit."""
+
+    def test_claim_agreement(self):
+        """Test that shared claims agree and unrelated answers do not."""
+        paraphrase = (
+            "For Socrates, virtue is a kind of knowledge! "
+            "Wrongdoing comes from ignorance, so nobody does wrong willingly."
+        )
+        unrelated = "Aristotle grounds ethics in habituation and the doctrine of the mean."
+
+        assert claim_agreement(extract_claims(AGREED), extract_claims(paraphrase)) == 1.0
+        assert claim_agreement(extract_claims(AGREED), extract_claims(unrelated)) == 0.0
+
+    def test_quorum_cancels_slow_provider(self, make_service, make_provider):
+        """Test that agreeing fast providers end consensus before the slow one answers."""
+        slow = make_provider("slow", AGREED, delay=5)
+        service = make_service(
+            make_provider("fast", AGREED, delay=0.01),
+            make_provider("dissent", "Plato says the soul has three parts that must be balanced.", delay=0.02),
+            make_provider("second", AGREED, delay=0.03),
+            slow,
+        )
+
+        result = asyncio.run(service.generate_consensus(ask(), consensus_count=4))
+
+        assert result.quorum_reached
+        assert sorted(result.agreeing_providers) == ["fast", "second"]
+        assert result.answer.provider in ("fast", "second")
+        assert result.cancelled_providers == ["slow"]
+        assert slow.cancelled
+        assert result.agreement_scores["dissent"] == 0.0
+        assert set(result.latencies) == {"fast", "dissent", "second"}
+        assert result.answer.metadata["consensus"]["quorum_reached"] is True
+
+    def test_without_quorum_all_responses_are_returned(self, make_service, make_provider):
+        """Test that disagreement waits for every provider."""
+        service = make_service(
+            make_provider("a", AGREED, delay=0.01),
+            make_provider("b", "Plato says the soul has three parts that must be balanced.", delay=0.02),
+        )
+
+        responses = asyncio.run(service.generate_with_consensus(ask(), consensus_count=2))
+
+        assert [response.provider for response in responses] == ["a", "b"]
+        assert all(response.metadata["consensus"]["quorum_reached"] is False for response in responses)
@@ -0,0 +1,73 @@
+"""
+Tests for hedged, deadline-aware LLM requests.
+"""
+
+import asyncio
+
+import pytest
+
+from arete.services.llm_provider import DeadlineExceededError, MultiProviderLLMService
+from arete.services.llm_telemetry import LatencyWindow
+
+
+@pytest.fixture
+def make_service(make_llm_settings):
+    def make(budget_ratio=1.0, deadline=5.0):
+        settings = make_llm_settings(
+            llm_request_deadline_seconds=deadline, llm_hedging_enabled=True,
+            llm_hedge_budget_ratio=budget_ratio,
+        )
+        service = MultiProviderLLMService(settings)
+        service.hedging_policy.initial_delay_seconds = 0.05
+        return service
+    return make
+
+
+class TestHedgedRequests:
+    """Test hedging and deadlines in MultiProviderLLMService."""
+
+    def test_slow_primary_is_hedged_and_cancelled(self, make_service, make_provider):
+        """Test that a backup wins over a slow primary, which is cancelled."""
+        service = make_service()
+        slow, fast = make_provider("slow", delay=1.0), make_provider("fast", delay=0.01)
+        service.add_provider(slow)
+        service.add_provider(fast)
+
+        response = asyncio.run(service.generate_response([]))
+
+        assert response.content == "fast"
+        assert response.metadata["hedged"] is True
+        assert slow.cancelled
+        assert service.hedge_stats["hedge_wins"] == 1
+
+    def test_hedge_budget_limits_backups(self, make_service, make_provider):
+        """Test that without budget the primary is awaited alone."""
+        service = make_service(budget_ratio=0.0)
+        slow, fast = make_provider("slow", delay=0.1), make_provider("fast", delay=0.01)
+        service.add_provider(slow)
+        service.add_provider(fast)
+
+        response = asyncio.run(service.generate_response([]))
+
+        assert response.content == "slow"
+        assert service.hedge_stats["hedged"] == 0
+
+    def test_deadline_cancels_outstanding_requests(self, make_service, make_provider):
+        """Test that the request deadline abandons every in-flight call."""
+        service = make_service(budget_ratio=0.0)
+        provider = make_provider("slow", delay=1.0)
+        service.add_provider(provider)
+
+        with pytest.raises(DeadlineExceededError):
+            asyncio.run(service.generate_response([], deadline=0.05))
+
+        assert provider.cancelled
+
+    def test_latency_percentile(self):
+        """Test nearest-rank latency percentiles."""
+        window = LatencyWindow()
+        for seconds in range(1, 101):
+            window.record(float(seconds))
+
+        assert window.percentile(0.95) == 95.0
+        assert LatencyWindow().percentile(0.5) is None
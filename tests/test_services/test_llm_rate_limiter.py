@@ -0,0 +1,98 @@
+"""
+Tests for rate-aware LLM request scheduling.
+"""
+
+import asyncio
+
+import pytest
+
+from arete.services.llm_provider import LLMResponse, RateLimitError
+from arete.services.llm_rate_limiter import (
+    LLMRequestScheduler,
+    ProviderRateLimiter,
+    TokenBucket,
+    TrafficClass,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket:
+    """Test token bucket refill and reserve accounting."""
+
+    def test_refill_and_reserve(self):
+        """Test that waits follow the refill rate and honour the kept reserve."""
+        clock = FakeClock()
+        bucket = TokenBucket(capacity=60, refill_per_second=1, clock=clock)
+
+        assert bucket.wait_time(60) == 0.0
+        bucket.consume(50)
+        assert bucket.wait_time(20) == 10.0
+        assert bucket.wait_time(5, keep=10) == 5.0
+        assert bucket.wait_time(1000) == 50.0
+
+        clock.now = 100.0
+        assert bucket.level == 60
+
+
+class TestLLMRequestScheduler:
+    """Test priority admission and retry-after requeueing."""
+
+    def test_interactive_requests_overtake_queued_batch(self):
+        """Test that an interactive request is admitted before earlier batch requests."""
+        limiter = ProviderRateLimiter("openai", requests_per_minute=600, interactive_reserve_ratio=0.0)
+        limiter.requests.consume(600)
+        order = []
+
+        async def request(name, traffic):
+            await limiter.acquire(1, traffic)
+            order.append(name)
+
+        async def scenario():
+            batch = [asyncio.create_task(request(f"batch-{i}", TrafficClass.BATCH)) for i in range(2)]
+            await asyncio.sleep(0.01)
+            interactive = asyncio.create_task(request("interactive", TrafficClass.INTERACTIVE))
+            await asyncio.gather(*batch, interactive)
+
+        asyncio.run(scenario())
+
+        assert order[0] == "interactive"
+        assert order[1:] == ["batch-0", "batch-1"]
+        assert limiter.snapshot()["granted_batch"] == 2
+
+    def test_rate_limited_request_is_requeued_after_retry_after(self):
+        """Test that a 429 blocks the provider and the request is retried."""
+        scheduler = LLMRequestScheduler(tokens_per_minute=100000, max_retries=2)
+        calls = []
+
+        async def call():
+            calls.append(len(calls))
+            if len(calls) == 1:
+                raise RateLimitError("slow down", retry_after=0)
+            return LLMResponse(content="ok", provider="openai", usage_tokens=10)
+
+        response = asyncio.run(scheduler.run("openai", call, estimated_tokens=500))
+
+        assert response.content == "ok"
+        assert len(calls) == 2
+        stats = scheduler.get_stats()["openai"]
+        assert stats["throttled"] == 1
+        assert stats["available_tokens"] > 100000 - 500
+
+    def test_retries_are_bounded(self):
+        """Test that persistent rate limiting is eventually raised."""
+        scheduler = LLMRequestScheduler(max_retries=1)
+
+        async def call():
+            raise RateLimitError("slow down", retry_after=0)
+
+        with pytest.raises(RateLimitError):
+            asyncio.run(scheduler.run("anthropic", call, estimated_tokens=10))
@@ -0,0 +1,79 @@
+"""
+Tests for LLM response caching.
+"""
+
+import asyncio
+
+import pytest
+
+from arete.services.llm_provider import (
+    LLMMessage,
+    MessageRole,
+    MultiProviderLLMService,
+)
+from arete.services.llm_response_cache import LLMResponseCache
+
+
+@pytest.fixture
+def make_service(make_llm_settings, make_provider):
+    def make():
+        service = MultiProviderLLMService(make_llm_settings(llm_response_cache_enabled=True))
+        provider = make_provider("counting")
+        service.add_provider(provider)
+        return service, provider
+    return make
+
+
+def ask(content):
+    return [LLMMessage(role=MessageRole.USER, content=content)]
+
+
+class TestLLMResponseCache:
+    """Test deterministic-only response caching."""
+
+    def test_deterministic_requests_are_replayed(self, make_service):
+        """Test that identical temperature 0 requests call the provider once."""
+        service, provider = make_service()
+
+        first = asyncio.run(service.generate_response(ask("What is virtue?"), temperature=0))
+        second = asyncio.run(service.generate_response(ask("What is virtue?  \r\n"), temperature=0))
+
+        assert provider.calls == 1
+        assert second.content == first.content
+        assert second.metadata["cache_hit"] is True
+        assert "cache_hit" not in first.metadata
+
+    def test_sampled_requests_are_not_cached_unless_opted_in(self, make_service):
+        """Test that non-zero temperatures bypass the cache by default."""
+        service, provider = make_service()
+
+        for _ in range(2):
+            asyncio.run(service.generate_response(ask("Define justice"), temperature=0.7))
+        assert provider.calls == 2
+
+        for _ in range(2):
+            asyncio.run(service.generate_response(ask("Define justice"), temperature=0.7, cache=True))
+        assert provider.calls == 3
+
+    def test_replay_drops_failover_metadata(self, make_llm_settings, make_provider):
+        """Test that a replay does not repeat the failures of the original call."""
+        service = MultiProviderLLMService(make_llm_settings(llm_response_cache_enabled=True))
+        service.add_provider(make_provider("down", fail=True))
+        service.add_provider(make_provider("backup"))
+
+        first = asyncio.run(service.generate_response(ask("What is virtue?"), temperature=0))
+        second = asyncio.run(service.generate_response(ask("What is virtue?"), temperature=0))
+
+        assert first.metadata["failed_providers"] == ["down"]
+        assert second.metadata["cache_hit"] is True
+        assert "failed_providers" not in second.metadata
+        assert "hedged" not in second.metadata
+
+    def test_key_covers_generation_parameters(self):
+        """Test that different parameters or models never share an entry."""
+        messages = ask("What is the Good?")
+        key = LLMResponseCache.make_key("openai", "gpt-4", messages, max_tokens=100, temperature=0)
+
+        assert key == LLMResponseCache.make_key("openai", "gpt-4", messages, temperature=0, max_tokens=100)
+        assert key != LLMResponseCache.make_key("openai", "gpt-4", messages, max_tokens=200, temperature=0)
+        assert key != LLMResponseCache.make_key("openai", "gpt-3.5", messages, max_tokens=100, temperature=0)
@@ -0,0 +1,119 @@
+"""
+Tests for telemetry-driven routing in IntelligentLLMRouter.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from arete.services.llm_provider import LLMMessage, LLMProviderError, LLMResponse, MessageRole
+from arete.services.llm_router import (
+    IntelligentLLMRouter,
+    RequestPriority,
+    RoutingRequest,
+)
+from arete.services.llm_telemetry import LLMTelemetry, response_cost
+
+
+def make_router(exploration_rate=0.0):
+    service = SimpleNamespace(
+        _providers=[SimpleNamespace(name="openai"), SimpleNamespace(name="anthropic")],
+        is_provider_healthy=lambda provider: True,
+        telemetry=LLMTelemetry(),
+    )
+    settings = SimpleNamespace(
+        llm_routing_exploration_rate=exploration_rate,
+        llm_routing_min_samples=5,
+    )
+    return IntelligentLLMRouter(service, settings)
+
+
+def make_request(**kwargs):
+    return RoutingRequest(messages=[LLMMessage(role=MessageRole.USER, content="x" * 400)], **kwargs)
+
+
+class TestAdaptiveRouting:
+    """Test that live telemetry and exploration shape provider ranking."""
+
+    def test_static_scores_without_telemetry(self):
+        """Test that the cheaper, faster static priors win without observations."""
+        router = make_router()
+        scores = router._score_providers(make_request(), ["openai", "anthropic"])
+
+        assert scores["openai"] > scores["anthropic"]
+
+    def test_slow_failing_provider_is_demoted(self):
+        """Test that observed latency and errors override the static priors."""
+        router = make_router()
+        telemetry = router.llm_service.telemetry
+        for _ in range(50):
+            telemetry.record_success("anthropic", None, 0.5, tokens=500, cost=0.001)
+            telemetry.record_failure("openai", None, 10.0)
+
+        scores = router._score_providers(
+            make_request(deadline_seconds=5.0), ["openai", "anthropic"]
+        )
+
+        assert scores["anthropic"] > scores["openai"]
+
+    def test_observed_cost_enforces_budget(self):
+        """Test that providers too expensive for the prompt alone are skipped."""
+        router = make_router()
+        router.llm_service.telemetry.record_success("anthropic", None, 1.0, tokens=1000, cost=1.0)
+
+        scores = router._score_providers(make_request(max_cost=0.01), ["openai", "anthropic"])
+
+        assert list(scores) == ["openai"]
+
+    def test_exploration_promotes_least_observed_runner_up(self):
+        """Test that exploration moves an under-sampled provider to the front."""
+        router = make_router(exploration_rate=1.0)
+        order = ["anthropic", "openai", "gemini"]
+        router.llm_service.telemetry.record_success("openai", None, 1.0)
+
+        assert router._explore(order, make_request()) == ["gemini", "anthropic", "openai"]
+        assert router._explore(order, make_request(priority=RequestPriority.CRITICAL)) == order
+        assert router.routing_stats["explorations"] == 1
+
+    def test_response_cost_from_model_pricing(self):
+        """Test that cost is computed from usage and per-1k pricing."""
+        response = LLMResponse(content="", provider="anthropic", metadata={
+            "usage": {"input_tokens": 1000, "output_tokens": 500},
+            "model_info": {"cost_per_1k_input": 0.003, "cost_per_1k_output": 0.015},
+        })
+
+        assert abs(response_cost(response) - 0.0105) < 1e-9
+        assert response_cost(LLMResponse(content="", provider="ollama")) == 0.0
+
+    def test_failed_route_records_only_attempted_providers(self):
+        """Test that providers never called are not penalized when routing fails."""
+        router = make_router()
+
+        async def fail(**kwargs):
+            raise LLMProviderError("All providers failed", details={"failed_providers": ["openai"]})
+
+        router.llm_service.generate_response = fail
+
+        with pytest.raises(LLMProviderError):
+            asyncio.run(router.route_request(make_request()))
+
+        assert router.performance_history["openai"]["success_rate"] == 0.0
+        assert "anthropic" not in router.performance_history
+
+    def test_cache_hit_skips_provider_accounting(self):
+        """Test that replayed responses neither reward nor penalize providers."""
+        router = make_router()
+
+        async def replay(**kwargs):
+            return LLMResponse(content="cached", provider="openai", metadata={
+                "provider_name": "openai", "failed_providers": ["anthropic"], "cache_hit": True,
+            })
+
+        router.llm_service.generate_response = replay
+
+        asyncio.run(router.route_request(make_request()))
+
+        assert router.performance_history == {}
+        assert router.routing_stats["provider_failovers"] == 0
+        assert router.routing_stats["cache_hits"] == 1
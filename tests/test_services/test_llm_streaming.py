@@ -0,0 +1,323 @@
+"""
+Tests for streamed LLM responses.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from arete.services import (
+    anthropic_provider,
+    gemini_provider,
+    ollama_provider,
+    openai_provider,
+    openrouter_provider,
+)
+from arete.services.context_composition_service import CompositionStrategy, ContextResult
+from arete.services.llm_provider import (
+    LLMMessage,
+    LLMProvider,
+    LLMResponse,
+    LLMStreamChunk,
+    MessageRole,
+    RequestCancelledError,
+    collect_stream,
+    merge_stream_chunks,
+)
+from arete.services.response_generation_service import (
+    ResponseGenerationConfig,
+    ResponseGenerationError,
+    ResponseGenerationService,
+)
+
+PROVIDER_SETTINGS = SimpleNamespace(
+    llm_timeout=5, llm_max_tokens=100, llm_temperature=0.7,
+    anthropic_api_key="key", openai_api_key="key", gemini_api_key="key",
+    openrouter_api_key="key", ollama_base_url="http://localhost:11434",
+)
+
+# Wire captures of "Virtue is knowledge." streamed by each provider
+RECORDED_STREAMS = {
+    "anthropic": """\
+event: message_start
+data: {"type":"message_start","message":{"id":"msg_1","type":"message","role":"assistant","model":"claude-3-haiku-20240307","usage":{"input_tokens":9,"output_tokens":1}}}
+
+event: content_block_start
+data: {"type":"content_block_start","index":0,"content_block":{"type":"text","text":""}}
+
+event: ping
+data: {"type": "ping"}
+
+event: content_block_delta
+data: {"type":"content_block_delta","index":0,"delta":{"type":"text_delta","text":"Virtue is"}}
+
+event: content_block_delta
+data: {"type":"content_block_delta","index":0,"delta":{"type":"text_delta","text":" knowledge."}}
+
+event: content_block_stop
+data: {"type":"content_block_stop","index":0}
+
+event: message_delta
+data: {"type":"message_delta","delta":{"stop_reason":"end_turn","stop_sequence":null},"usage":{"output_tokens":4}}
+
+event: message_stop
+data: {"type":"message_stop"}
+""",
+    "openai": """\
+data: {"id":"chatcmpl-1","object":"chat.completion.chunk","created":1718000000,"model":"gpt-4o","choices":[{"index":0,"delta":{"role":"assistant","content":""},"finish_reason":null}]}
+
+data: {"id":"chatcmpl-1","object":"chat.completion.chunk","created":1718000000,"model":"gpt-4o","choices":[{"index":0,"delta":{"content":"Virtue is"},"finish_reason":null}]}
+
+data: {"id":"chatcmpl-1","object":"chat.completion.chunk","created":1718000000,"model":"gpt-4o","choices":[{"index":0,"delta":{"content":" knowledge."},"finish_reason":null}]}
+
+data: {"id":"chatcmpl-1","object":"chat.completion.chunk","created":1718000000,"model":"gpt-4o","choices":[{"index":0,"delta":{},"finish_reason":"stop"}]}
+
+data: {"id":"chatcmpl-1","object":"chat.completion.chunk","created":1718000000,"model":"gpt-4o","choices":[],"usage":{"prompt_tokens":9,"completion_tokens":4,"total_tokens":13}}
+
+data: [DONE]
+""",
+    "gemini": """\
+data: {"candidates": [{"content": {"parts": [{"text": "Virtue is"}],"role": "model"},"index": 0}],"usageMetadata": {"promptTokenCount": 9,"candidatesTokenCount": 2,"totalTokenCount": 11}}
+
+data: {"candidates": [{"content": {"parts": [{"text": " knowledge."}],"role": "model"},"finishReason": "STOP","index": 0,"safetyRatings": [{"category": "HARM_CATEGORY_HARASSMENT","probability": "NEGLIGIBLE"}]}],"usageMetadata": {"promptTokenCount": 9,"candidatesTokenCount": 4,"totalTokenCount": 13}}
+""",
+    "ollama": """\
+{"model":"llama3","created_at":"2024-06-10T12:00:00Z","message":{"role":"assistant","content":"Virtue is"},"done":false}
+{"model":"llama3","created_at":"2024-06-10T12:00:00Z","message":{"role":"assistant","content":" knowledge."},"done":false}
+{"model":"llama3","created_at":"2024-06-10T12:00:01Z","message":{"role":"assistant","content":""},"done_reason":"stop","done":true,"total_duration":5000000,"prompt_eval_count":9,"eval_count":13,"eval_duration":300000}
+""",
+    "openrouter": """\
+: OPENROUTER PROCESSING
+
+data: {"id":"gen-1","model":"anthropic/claude-3-haiku","choices":[{"index":0,"delta":{"role":"assistant","content":"Virtue is"},"finish_reason":null}]}
+
+data: {"id":"gen-1","model":"anthropic/claude-3-haiku","choices":[{"index":0,"delta":{"content":" knowledge."},"finish_reason":null}]}
+
+data: {"id":"gen-1","model":"anthropic/claude-3-haiku","choices":[{"index":0,"delta":{"content":""},"finish_reason":"stop"}],"usage":{"prompt_tokens":9,"completion_tokens":4,"total_tokens":13}}
+
+data: [DONE]
+""",
+}
+
+
+class NonStreamingProvider(LLMProvider):
+    """Provider without incremental output."""
+
+    def __init__(self):
+        super().__init__("plain")
+
+    @property
+    def is_available(self):
+        return True
+
+    @property
+    def supported_models(self):
+        return []
+
+    def initialize(self):
+        pass
+
+    async def generate_response(self, messages, **kwargs):
+        return LLMResponse(
+            content="Virtue is knowledge.", provider=self.name, usage_tokens=7,
+            model=kwargs.get("model"), finish_reason="stop"
+        )
+
+    def get_health_status(self):
+        return {"provider": self.name, "status": "healthy"}
+
+
+async def stream_of(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def recorded_client(body, base_url=""):
+    return httpx.AsyncClient(base_url=base_url, transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, content=body.encode())
+    ))
+
+
+def make_recorded_provider(name, monkeypatch):
+    """Create a provider whose HTTP calls replay the recorded stream."""
+    body = RECORDED_STREAMS[name]
+    if name == "openai":
+        provider = openai_provider.OpenAIProvider(PROVIDER_SETTINGS)
+        provider.initialize()
+        provider.client = recorded_client(body, provider.base_url)
+        return provider
+
+    @asynccontextmanager
+    async def pooled_http_client(timeout):
+        async with recorded_client(body) as client:
+            yield client
+
+    module, provider_class = {
+        "anthropic": (anthropic_provider, anthropic_provider.AnthropicProvider),
+        "gemini": (gemini_provider, gemini_provider.GeminiProvider),
+        "ollama": (ollama_provider, ollama_provider.OllamaProvider),
+        "openrouter": (openrouter_provider, openrouter_provider.OpenRouterProvider),
+    }[name]
+    monkeypatch.setattr(module, "pooled_http_client", pooled_http_client)
+    provider = provider_class(PROVIDER_SETTINGS)
+    provider._initialized = True
+    return provider
+
+
+class TestLLMStreaming:
+    """Test assembling and falling back for streamed responses."""
+
+    def test_merge_concatenates_deltas_and_keeps_final_metadata(self):
+        """Test that the final chunk's finish reason and usage are kept."""
+        chunks = [
+            LLMStreamChunk(delta="The unexamined ", provider="openai", model="gpt-4"),
+            LLMStreamChunk(delta="life", provider="openai"),
+            LLMStreamChunk(delta="", provider="openai", finish_reason="stop",
+                           usage_tokens=12, metadata={"usage": {"total_tokens": 12}}),
+        ]
+
+        response = merge_stream_chunks(chunks, "openai")
+
+        assert response.content == "The unexamined life"
+        assert response.model == "gpt-4"
+        assert response.finish_reason == "stop"
+        assert response.usage_tokens == 12
+        assert response.metadata == {"streaming": True, "usage": {"total_tokens": 12}}
+
+    def test_collect_empty_stream(self):
+        """Test that an empty stream yields an empty response for the provider."""
+        response = asyncio.run(collect_stream(stream_of([]), "anthropic", "claude"))
+
+        assert response.content == ""
+        assert response.provider == "anthropic"
+        assert response.model == "claude"
+
+    def test_non_streaming_provider_yields_single_chunk(self):
+        """Test the base provider's fallback to one complete chunk."""
+        provider = NonStreamingProvider()
+        messages = [LLMMessage(role=MessageRole.USER, content="What is virtue?")]
+
+        async def consume():
+            return [chunk async for chunk in provider.stream_response(messages, model="m")]
+
+        chunks = asyncio.run(consume())
+
+        assert len(chunks) == 1
+        assert chunks[0].delta == "Virtue is knowledge."
+        assert chunks[0].finish_reason == "stop"
+        assert chunks[0].usage_tokens == 7
+
+    @pytest.mark.parametrize("name", sorted(RECORDED_STREAMS))
+    def test_provider_parses_recorded_stream(self, name, monkeypatch):
+        """Test each provider's stream parser against its recorded wire format."""
+        provider = make_recorded_provider(name, monkeypatch)
+        messages = [LLMMessage(role=MessageRole.USER, content="What is virtue?")]
+
+        async def consume():
+            return [chunk async for chunk in provider.stream_response(messages, model="m")]
+
+        chunks = asyncio.run(consume())
+
+        assert [chunk.delta for chunk in chunks[:-1]] == ["Virtue is", " knowledge."]
+        assert chunks[-1].delta == ""
+        assert chunks[-1].finish_reason == "stop"
+        assert chunks[-1].usage_tokens == 13
+
+
+class FailingStreamLLMService:
+    """LLM service whose stream fails after a given number of deltas."""
+
+    def __init__(self, deltas, error=None):
+        self.deltas = deltas
+        self.error = error or ConnectionError("stream dropped")
+        self.generate_calls = 0
+
+    def get_active_provider_name(self):
+        return "openai"
+
+    async def stream_response(self, **kwargs):
+        for delta in self.deltas:
+            yield LLMStreamChunk(delta=delta, provider="openai")
+        raise self.error
+
+    async def generate_response(self, **kwargs):
+        self.generate_calls += 1
+        return LLMResponse(content="Virtue is knowledge.", provider="openai", usage_tokens=13)
+
+
+class PassThroughScheduler:
+    """Request scheduler admitting every request immediately."""
+
+    async def acquire(self, provider, tokens):
+        pass
+
+    def reconcile(self, provider, estimated, actual):
+        pass
+
+    async def run(self, provider, request_factory, tokens, traffic):
+        return await request_factory()
+
+
+def make_generation_service(llm_service):
+    service = ResponseGenerationService(
+        llm_service=llm_service,
+        citation_extraction_service=SimpleNamespace(),
+        citation_validation_service=SimpleNamespace(),
+        citation_tracking_service=SimpleNamespace(),
+        config=ResponseGenerationConfig(enable_caching=False, enable_validation=False),
+        settings=SimpleNamespace(llm_context_window_tokens=8000),
+        request_scheduler=PassThroughScheduler(),
+    )
+
+    async def finalize(llm_response, *args, **kwargs):
+        return llm_response
+
+    service._finalize_response = finalize
+    return service
+
+
+def stream_events(service):
+    context = ContextResult(
+        composed_text="Virtue is knowledge (Meno 87c).", total_tokens=10, query="What is virtue?",
+        passage_groups=[], citations=[], strategy_used=CompositionStrategy.INTELLIGENT_STITCHING,
+    )
+
+    async def consume():
+        return [event async for event in service.stream_response(context, "What is virtue?")]
+
+    return asyncio.run(consume())
+
+
+class TestStreamingFallback:
+    """Test ResponseGenerationService when the LLM stream fails."""
+
+    def test_failure_before_first_token_falls_back(self):
+        """Test that a stream failing before any text is regenerated without streaming."""
+        llm_service = FailingStreamLLMService([])
+
+        events = stream_events(make_generation_service(llm_service))
+
+        assert llm_service.generate_calls == 1
+        assert [event.delta for event in events[:-1]] == ["Virtue is knowledge."]
+        assert events[-1].result.content == "Virtue is knowledge."
+
+    def test_failure_mid_stream_is_not_retried(self):
+        """Test that text already shown is never followed by a second answer."""
+        llm_service = FailingStreamLLMService(["Virtue is"])
+
+        with pytest.raises(ResponseGenerationError):
+            stream_events(make_generation_service(llm_service))
+
+        assert llm_service.generate_calls == 0
+
+    def test_cancelled_stream_is_not_regenerated(self):
+        """Test that a stream stopped by the user does not fall back to a new request."""
+        llm_service = FailingStreamLLMService([], RequestCancelledError("stopped"))
+
+        with pytest.raises(RequestCancelledError):
+            stream_events(make_generation_service(llm_service))
+
+        assert llm_service.generate_calls == 0
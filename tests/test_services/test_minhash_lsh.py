@@ -0,0 +1,78 @@
+"""
+Tests for MinHash signatures and LSH candidate generation.
+"""
+
+from arete.services.data_quality.minhash_lsh import (
+    LSHIndex,
+    MinHasher,
+    choose_lsh_bands,
+    shingle_text,
+)
+
+
+PASSAGE = (
+    "Socrates argues that no one does wrong willingly, since wrongdoing "
+    "stems from ignorance of what is truly good for the soul."
+)
+
+
+class TestShingling:
+    """Test text shingling."""
+
+    def test_ignores_case_and_whitespace(self):
+        """Test that formatting differences do not change shingles."""
+        assert shingle_text("The  Good\nLife") == shingle_text("the good life")
+
+    def test_short_text_is_single_shingle(self):
+        """Test that text shorter than a shingle is kept whole."""
+        assert shingle_text("Arete", shingle_size=10) == {"arete"}
+        assert shingle_text("   ") == set()
+
+
+class TestMinHasher:
+    """Test MinHash signatures."""
+
+    def test_signatures_are_deterministic(self):
+        """Test that separate hashers with the same seed agree."""
+        assert (MinHasher().signature(PASSAGE) == MinHasher().signature(PASSAGE)).all()
+
+    def test_estimate_tracks_similarity(self):
+        """Test that near-duplicates score higher than unrelated text."""
+        hasher = MinHasher(num_perm=256)
+        original = hasher.signature(PASSAGE)
+        edited = hasher.signature(PASSAGE.replace("willingly", "voluntarily"))
+        unrelated = hasher.signature("Aristotle classifies the virtues as means between extremes.")
+
+        assert MinHasher.estimate_jaccard(original, edited) > 0.6
+        assert MinHasher.estimate_jaccard(original, unrelated) < 0.2
+
+
+class TestLSHIndex:
+    """Test banded LSH."""
+
+    def test_band_choice_matches_threshold(self):
+        """Test that the S-curve midpoint is close to the requested threshold."""
+        bands, rows = choose_lsh_bands(128, 0.5)
+        assert bands * rows <= 128
+        assert abs((1.0 / bands) ** (1.0 / rows) - 0.5) < 0.1
+
+    def test_only_similar_items_collide(self):
+        """Test that candidate pairs contain near-duplicates only."""
+        hasher = MinHasher()
+        index = LSHIndex(threshold=0.4)
+        index.insert("a", hasher.signature(PASSAGE))
+        index.insert("b", hasher.signature(PASSAGE + " So he claims."))
+        index.insert("c", hasher.signature("Epicurus locates the highest good in tranquillity."))
+
+        assert list(index.candidate_pairs()) in ([("a", "b")], [("b", "a")])
+        assert index.query(hasher.signature(PASSAGE)) == {"a", "b"}
+
+    def test_remove(self):
+        """Test that removed keys are no longer returned."""
+        hasher = MinHasher()
+        index = LSHIndex()
+        index.insert("a", hasher.signature(PASSAGE))
+        index.remove("a")
+
+        assert "a" not in index
+        assert index.query(hasher.signature(PASSAGE)) == set()
@@ -0,0 +1,169 @@
+"""
+Tests for the pipeline scheduler.
+
+Covers global and per-stage concurrency limits, fair interleaving between
+callers, and load shedding.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from arete.services.pipeline_scheduler import (
+    PipelineScheduler,
+    SchedulerOverloadedError,
+)
+from arete.services.rag_pipeline_service import RAGPipelineConfig, RAGPipelineService
+
+
+class TestPipelineScheduler:
+    """Test admission control and bounded concurrency."""
+
+    @pytest.mark.asyncio
+    async def test_respects_global_and_stage_limits(self):
+        """Test that neither limit is exceeded."""
+        scheduler = PipelineScheduler(max_concurrency=3, stage_limits={"generation": 1})
+        running = {"jobs": 0, "generation": 0}
+        peak = {"jobs": 0, "generation": 0}
+
+        async def job():
+            running["jobs"] += 1
+            peak["jobs"] = max(peak["jobs"], running["jobs"])
+            async with scheduler.stage("generation"):
+                running["generation"] += 1
+                peak["generation"] = max(peak["generation"], running["generation"])
+                await asyncio.sleep(0.01)
+                running["generation"] -= 1
+            running["jobs"] -= 1
+
+        await asyncio.gather(*[scheduler.submit(job) for _ in range(10)])
+
+        assert peak["jobs"] == 3
+        assert peak["generation"] == 1
+        assert scheduler.metrics.completed == 10
+
+    @pytest.mark.asyncio
+    async def test_interleaves_callers(self):
+        """Test that a second caller is not starved by a large batch."""
+        scheduler = PipelineScheduler(max_concurrency=1)
+        order = []
+
+        async def job(tag):
+            order.append(tag)
+            await asyncio.sleep(0)
+
+        batch = [scheduler.submit(lambda i=i: job(f"batch-{i}"), caller_id="batch") for i in range(5)]
+        interactive = scheduler.submit(lambda: job("interactive"), caller_id="chat")
+        await asyncio.gather(*batch, interactive)
+
+        assert order.index("interactive") <= 2
+
+    @pytest.mark.asyncio
+    async def test_sheds_when_queue_full(self):
+        """Test that jobs beyond the queue capacity are rejected."""
+        scheduler = PipelineScheduler(max_concurrency=1, max_queue_size=2)
+
+        async def job():
+            await asyncio.sleep(0.01)
+            return "done"
+
+        results = await asyncio.gather(
+            *[scheduler.submit(job) for _ in range(5)], return_exceptions=True
+        )
+
+        shed = [r for r in results if isinstance(r, SchedulerOverloadedError)]
+        assert len(shed) == 2
+        assert results.count("done") == 3
+        assert scheduler.get_stats()["shed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_sheds_after_queue_wait(self):
+        """Test that jobs waiting longer than max_queue_wait are shed."""
+        scheduler = PipelineScheduler(max_concurrency=1, max_queue_wait=0.01)
+
+        async def slow_job():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        results = await asyncio.gather(
+            scheduler.submit(slow_job), scheduler.submit(slow_job), return_exceptions=True
+        )
+
+        assert results[0] == "done"
+        assert isinstance(results[1], SchedulerOverloadedError)
+
+    @pytest.mark.asyncio
+    async def test_propagates_job_errors(self):
+        """Test that job exceptions reach the submitter."""
+        scheduler = PipelineScheduler(max_concurrency=1)
+
+        async def failing_job():
+            raise RuntimeError("backend down")
+
+        with pytest.raises(RuntimeError):
+            await scheduler.submit(failing_job)
+        assert scheduler.active == 0
+
+    @pytest.mark.asyncio
+    async def test_admit_holds_slot_for_block(self):
+        """Test that a job waits while a block holds the only slot."""
+        scheduler = PipelineScheduler(max_concurrency=1)
+        order = []
+
+        async def job():
+            order.append("job")
+
+        async with scheduler.admit("stream"):
+            pending = asyncio.ensure_future(scheduler.submit(job))
+            await asyncio.sleep(0.01)
+            order.append("block")
+        await pending
+
+        assert order == ["block", "job"]
+        assert scheduler.active == 0
+
+    @pytest.mark.asyncio
+    async def test_admit_sheds_when_queue_full(self):
+        """Test that a block is rejected when nothing can be queued."""
+        scheduler = PipelineScheduler(max_concurrency=1, max_queue_size=0)
+
+        with pytest.raises(SchedulerOverloadedError):
+            async with scheduler.admit():
+                pass
+
+
+class TestPipelineAdmission:
+    """Test that single pipeline queries go through the scheduler."""
+
+    def make_service(self, **config):
+        return RAGPipelineService(config=RAGPipelineConfig(**config), settings=SimpleNamespace())
+
+    @pytest.mark.asyncio
+    async def test_single_queries_respect_concurrency_limit(self):
+        """Test that concurrent single queries share the scheduler slots."""
+        service = self.make_service(max_concurrent_pipelines=1)
+        running = {"now": 0, "peak": 0}
+
+        async def run_pipeline(query, config, user_context):
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+            return query
+
+        service._run_pipeline = run_pipeline
+        results = await asyncio.gather(*[service.execute_pipeline(f"q{i}") for i in range(3)])
+
+        assert results == ["q0", "q1", "q2"]
+        assert running["peak"] == 1
+
+    @pytest.mark.asyncio
+    async def test_shed_single_query_returns_overloaded_result(self):
+        """Test that a shed query is reported instead of raised."""
+        service = self.make_service(max_queued_pipelines=0)
+
+        result = await service.execute_pipeline("What is virtue?")
+
+        assert result.overloaded
+        assert service.scheduler.get_stats()["shed"] == 1
@@ -0,0 +1,63 @@
+"""
+Tests for compiled, version-aware prompt templates.
+"""
+
+from arete.services.prompt_service import PromptTemplateFactory
+from arete.services.prompt_template import (
+    Citation,
+    PhilosophicalContext,
+    PromptContext,
+    PromptType,
+)
+from arete.services.prompt_versioning import PromptVersioningService, VersioningConfig, create_prompt_version
+
+
+def make_context(query, level="undergraduate"):
+    return PromptContext(
+        query=query,
+        citations=[Citation(text="The unexamined life is not worth living.", source="apology",
+                            reference="Apology 38a")],
+        philosophical_context=PhilosophicalContext.ANCIENT,
+        student_level=level,
+    )
+
+
+class TestPromptCompilation:
+    """Test compiled system prompts and versioned invalidation."""
+
+    def test_system_prompt_is_compiled_once_with_stable_prefix(self):
+        """Test that requests share the compiled prompt and levels share its prefix."""
+        template = PromptTemplateFactory().get_template("anthropic", PromptType.TUTORING)
+
+        first = template.generate(make_context("What is virtue?"))
+        second = template.generate(make_context("What is justice?"))
+        graduate = template.generate(make_context("What is virtue?", level="graduate"))
+
+        assert first.system_prompt is second.system_prompt
+        assert first.user_prompt != second.user_prompt
+        assert first.user_prompt.endswith("**Question:** What is virtue?")
+        assert "[1] The unexamined life is not worth living.\n    — Apology 38a" in first.user_prompt
+        prefix = template._config["response_guidelines"]
+        assert first.system_prompt.index(prefix) == graduate.system_prompt.index(prefix)
+        assert first.system_prompt.split(prefix)[0] == graduate.system_prompt.split(prefix)[0]
+
+    def test_new_version_invalidates_compiled_prompts(self, tmp_path):
+        """Test that publishing a version switches the template to its system prompt."""
+        versioning = PromptVersioningService(VersioningConfig(storage_path=str(tmp_path)))
+        factory = PromptTemplateFactory(versioning)
+        template = factory.get_template("openai", PromptType.TUTORING)
+        builtin = template.generate(make_context("What is virtue?"))
+        assert builtin.metadata["prompt_version"] is None
+
+        versioning.create_version(create_prompt_version(
+            "1.0.0", "openai:tutoring", "openai", PromptType.TUTORING,
+            "You are a Socratic tutor.", created_by="tester", description="Socratic role",
+        ))
+        versioned = factory.get_template("openai", PromptType.TUTORING).generate(make_context("What is virtue?"))
+
+        assert versioned.system_prompt.startswith("You are a Socratic tutor.")
+        assert versioned.metadata["prompt_version"] == "1.0.0"
+
+        versioning.delete_version("openai:tutoring", "1.0.0")
+        restored = factory.get_template("openai", PromptType.TUTORING).generate(make_context("What is virtue?"))
+        assert restored.system_prompt == builtin.system_prompt
@@ -0,0 +1,109 @@
+"""
+Tests for the exact and semantic tiers of the RAG pipeline cache.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from arete.services.rag_pipeline_service import (
+    PipelineMetrics, PipelineStage, RAGPipelineConfig, RAGPipelineService
+)
+
+
+class FakeEmbeddingService:
+    """Embedding service returning fixed vectors per query."""
+
+    def __init__(self, embeddings):
+        self.embeddings = embeddings
+        self.calls = []
+
+    def generate_embedding(self, text):
+        self.calls.append(text)
+        return self.embeddings[text]
+
+
+def make_service(embeddings):
+    config = RAGPipelineConfig(enable_semantic_cache=True, semantic_cache_threshold=0.9)
+    embedding_service = FakeEmbeddingService(embeddings)
+    service = RAGPipelineService(
+        config=config, settings=SimpleNamespace(), embedding_service=embedding_service
+    )
+    return service, embedding_service
+
+
+async def cache_answer(service, query, user_context=None):
+    """Run a cache lookup that misses, then cache a result as the pipeline would."""
+    cached, cache_key, embedding = await service._lookup_cached_result(
+        query, service.config, user_context
+    )
+    assert cached is None
+    result = service._create_empty_result(
+        query, service.config, PipelineMetrics(), PipelineStage.VALIDATION
+    )
+    service._cache_result(cache_key, result)
+    service._semantic_index.add(
+        cache_key, embedding, scope=service._generate_cache_scope(service.config, user_context)
+    )
+    return result
+
+
+class TestQueryNormalization:
+    """Test query normalization for the exact tier."""
+
+    def test_case_whitespace_and_punctuation_are_ignored(self):
+        """Test that trivially different spellings normalize alike."""
+        assert RAGPipelineService._normalize_query("  What is VIRTUE?! ") == "what is virtue"
+        assert RAGPipelineService._normalize_query("what-is\tvirtue") == "what is virtue"
+
+    def test_words_are_kept(self):
+        """Test that different wording does not normalize alike."""
+        assert (
+            RAGPipelineService._normalize_query("What is virtue?")
+            != RAGPipelineService._normalize_query("What is justice?")
+        )
+
+
+class TestCacheLookup:
+    """Test the exact-then-semantic cache lookup."""
+
+    @pytest.mark.asyncio
+    async def test_exact_hit_skips_embedding(self):
+        """Test that a normalized exact match is served without embedding the query."""
+        service, embedder = make_service({"What is virtue?": [1.0, 0.0]})
+        stored = await cache_answer(service, "What is virtue?")
+
+        cached, _, _ = await service._lookup_cached_result("what is VIRTUE", service.config, None)
+
+        assert cached is stored
+        assert embedder.calls == ["What is virtue?"]
+
+    @pytest.mark.asyncio
+    async def test_semantic_hit_after_exact_miss(self):
+        """Test that a similar question reuses the cached answer with a warning."""
+        service, embedder = make_service({
+            "What is virtue?": [1.0, 0.0],
+            "Define virtue": [0.99, 0.05],
+            "What is justice?": [0.0, 1.0],
+        })
+        await cache_answer(service, "What is virtue?")
+
+        cached, _, _ = await service._lookup_cached_result("Define virtue", service.config, None)
+        missed, _, _ = await service._lookup_cached_result("What is justice?", service.config, None)
+
+        assert cached.query == "What is virtue?"
+        assert "Answer reused from similar question" in cached.warnings[0]
+        assert missed is None
+        assert service._get_cache_stats()["semantic_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_semantic_tier_respects_scope(self):
+        """Test that answers cached for another user context are not reused."""
+        service, _ = make_service({"What is virtue?": [1.0, 0.0], "Define virtue": [0.99, 0.05]})
+        await cache_answer(service, "What is virtue?", {"student_level": "beginner"})
+
+        cached, _, _ = await service._lookup_cached_result(
+            "Define virtue", service.config, {"student_level": "advanced"}
+        )
+
+        assert cached is None
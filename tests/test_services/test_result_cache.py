@@ -0,0 +1,178 @@
+"""
+Tests for result caching utilities and graph version tracking.
+
+Covers LRU eviction, TTL expiry, shared SQLite stores across cache
+instances, and graph version propagation between trackers through the graph.
+"""
+
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from arete.services.result_cache import (
+    LRUCache,
+    SemanticCacheIndex,
+    SQLiteCacheStore,
+    make_cache_key,
+)
+from arete.database.graph_version import GraphVersionTracker
+
+
+class FakeGraphStore:
+    """Neo4j client holding the version node that every process shares."""
+
+    def __init__(self):
+        self.version = None
+        self.is_connected = True
+        self.reads = 0
+
+    @contextmanager
+    def session(self):
+        yield self
+
+    def run(self, query, **parameters):
+        if "SET v.version" in query:
+            self.version = (self.version or 0) + 1
+        else:
+            self.reads += 1
+        record = None if self.version is None else {"version": self.version}
+        return SimpleNamespace(single=lambda: record)
+
+
+class TestMakeCacheKey:
+    """Test cache key generation."""
+
+    def test_key_ignores_dict_ordering(self):
+        """Test that logically equal inputs produce the same key."""
+        assert make_cache_key("q", {"a": 1, "b": 2}) == make_cache_key("q", {"b": 2, "a": 1})
+
+    def test_key_distinguishes_values(self):
+        """Test that different inputs produce different keys."""
+        assert make_cache_key("q", 1) != make_cache_key("q", 2)
+
+
+class TestLRUCache:
+    """Test in-memory LRU cache behaviour."""
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = LRUCache(max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1  # 'b' is now least recently used
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats.evictions == 1
+
+    def test_expired_entries_are_not_served(self):
+        """Test TTL expiry."""
+        cache = LRUCache(max_size=10, ttl_seconds=0.05)
+        cache.set("a", 1)
+        time.sleep(0.1)
+
+        assert cache.get("a") is None
+        assert cache.stats.expirations == 1
+        assert len(cache) == 0
+
+    def test_hit_rate(self):
+        """Test hit rate accounting."""
+        cache = LRUCache(max_size=10)
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_invalid_size(self):
+        """Test that a non-positive size is rejected."""
+        with pytest.raises(ValueError):
+            LRUCache(max_size=0)
+
+
+class TestSharedStore:
+    """Test caches sharing a SQLite store."""
+
+    def test_entries_visible_across_caches(self, tmp_path):
+        """Test that one cache's inserts are served to another."""
+        path = str(tmp_path / "cache.db")
+        writer = LRUCache(max_size=10, ttl_seconds=60, shared_store=SQLiteCacheStore(path, "test"))
+        reader = LRUCache(max_size=10, ttl_seconds=60, shared_store=SQLiteCacheStore(path, "test"))
+
+        writer.set("key", ["Plato", "Forms"])
+
+        assert reader.get("key") == ["Plato", "Forms"]
+        assert reader.stats.shared_hits == 1
+
+    def test_namespaces_are_isolated(self, tmp_path):
+        """Test that namespaces do not leak into each other."""
+        path = str(tmp_path / "cache.db")
+        first = LRUCache(max_size=10, shared_store=SQLiteCacheStore(path, "first"))
+        second = LRUCache(max_size=10, shared_store=SQLiteCacheStore(path, "second"))
+
+        first.set("key", 1)
+
+        assert second.get("key") is None
+
+
+class TestGraphVersionTracker:
+    """Test graph version tracking."""
+
+    def test_in_memory_bump(self):
+        """Test that bumping increments the version."""
+        tracker = GraphVersionTracker()
+        assert tracker.current == 0
+        assert tracker.bump() == 1
+        assert tracker.current == 1
+
+    def test_version_shared_through_graph(self):
+        """Test that a tracker in another process observes bumps stored in the graph."""
+        graph = FakeGraphStore()
+        writer = GraphVersionTracker(neo4j_client=graph)
+        reader = GraphVersionTracker(neo4j_client=graph, refresh_interval=60.0)
+
+        assert reader.current == 0
+        writer.bump()
+        writer.bump()
+        assert reader.current == 0  # Within the refresh interval
+
+        reader.refresh_interval = 0.0
+        assert reader.current == 2
+        assert graph.reads == 2
+
+
+class TestSemanticCacheIndex:
+    """Test near-duplicate lookups by embedding."""
+
+    def test_finds_similar_embedding(self):
+        """Test that a close embedding matches the cached entry."""
+        index = SemanticCacheIndex(similarity_threshold=0.95)
+        index.add("virtue", [1.0, 0.0, 0.1])
+
+        match = index.find([1.0, 0.0, 0.12])
+
+        assert match is not None
+        assert match[0] == "virtue"
+        assert match[1] > 0.95
+
+    def test_rejects_distant_embedding(self):
+        """Test that dissimilar embeddings do not match."""
+        index = SemanticCacheIndex(similarity_threshold=0.95)
+        index.add("virtue", [1.0, 0.0])
+
+        assert index.find([0.0, 1.0]) is None
+
+    def test_scopes_are_isolated(self):
+        """Test that matches are restricted to the same scope."""
+        index = SemanticCacheIndex()
+        index.add("virtue", [1.0, 0.0], scope="beginner")
+
+        assert index.find([1.0, 0.0], scope="advanced") is None
+        assert index.find([1.0, 0.0], scope="beginner")[0] == "virtue"
@@ -0,0 +1,67 @@
+"""
+Tests for the persistent duplicate-signature store.
+"""
+
+from arete.services.data_quality.signature_store import DuplicateSignatureStore
+
+
+PASSAGE = (
+    "Aristotle holds that virtue is a settled disposition to choose the mean, "
+    "relative to us, as a person of practical wisdom would determine it."
+)
+
+
+class TestDuplicateSignatureStore:
+    """Test signature persistence and duplicate queries."""
+
+    def test_exact_and_near_matches(self):
+        """Test that identical and lightly edited texts are found."""
+        store = DuplicateSignatureStore()
+        store.add("c1", PASSAGE)
+        store.add("c2", "Epicurus identifies pleasure as the absence of pain.")
+
+        exact = store.query(PASSAGE)
+        near = store.query(PASSAGE.replace("would determine it", "would define it"), near_threshold=0.7)
+
+        assert exact.exact == ["c1"]
+        assert [item_id for item_id, _ in near.near] == ["c1"]
+        assert not store.query("Plotinus on the One.")
+
+    def test_semantic_matches(self):
+        """Test that embeddings above the threshold are matched."""
+        store = DuplicateSignatureStore()
+        store.add("c1", "first text", embedding=[1.0, 0.0, 0.0])
+        store.add("c2", "second text", embedding=[0.0, 1.0, 0.0])
+
+        matches = store.query("third text", embedding=[0.9, 0.1, 0.0], semantic_threshold=0.9)
+
+        assert [item_id for item_id, _ in matches.semantic] == ["c1"]
+
+    def test_excludes_probe_itself(self):
+        """Test that an item does not match its own stored signature."""
+        store = DuplicateSignatureStore()
+        store.add("c1", PASSAGE)
+
+        assert not store.query(PASSAGE, exclude="c1")
+
+    def test_signatures_persist_across_instances(self, tmp_path):
+        """Test that a reopened store serves previously added items."""
+        path = str(tmp_path / "signatures.db")
+        writer = DuplicateSignatureStore(path)
+        writer.add("c1", PASSAGE, embedding=[0.5, 0.5])
+        writer.close()
+
+        reader = DuplicateSignatureStore(path)
+
+        assert "c1" in reader
+        assert reader.query(PASSAGE).exact == ["c1"]
+        assert reader.query("other", embedding=[1.0, 1.0]).semantic[0][0] == "c1"
+
+    def test_remove(self):
+        """Test that removed items no longer match."""
+        store = DuplicateSignatureStore()
+        store.add("c1", PASSAGE)
+        store.remove("c1")
+
+        assert len(store) == 0
+        assert not store.query(PASSAGE)
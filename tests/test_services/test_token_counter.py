@@ -0,0 +1,125 @@
+"""
+Tests for token counting and budget packing.
+"""
+
+from types import SimpleNamespace
+
+from arete.services import token_counter
+from arete.services.token_counter import (
+    EstimatingTokenizer,
+    TokenCounter,
+    pack_passages,
+)
+
+GREEK = "ἀρετή καὶ σοφία ἐπιστήμη ἐστίν"
+CHINESE = "美德即知识，未经审视的人生不值得过。"
+
+PASSAGE = (
+    "Socrates argues in the Meno that virtue cannot be taught, because there "
+    "are no teachers of it, yet the well-born are not virtuous by nature either."
+)
+
+
+def make_counter():
+    return TokenCounter(EstimatingTokenizer("anthropic", 3.3), cache_size=16)
+
+
+class TestTokenCounter:
+    """Test cached counting and token-boundary truncation."""
+
+    def test_counts_are_cached(self):
+        """Test that a repeated passage is tokenized once."""
+        counter = make_counter()
+
+        first = counter.count(PASSAGE)
+        assert counter.count(PASSAGE) == first
+        assert counter.get_stats()["hits"] == 1
+        assert counter.count("") == 0
+
+    def test_estimate_is_not_below_word_count(self):
+        """Test that every word costs at least one token and long words more."""
+        counter = make_counter()
+
+        assert counter.count("the cave") == 2
+        assert counter.count(" incommensurability") == 5
+        assert counter.count(PASSAGE) >= len(PASSAGE.split())
+
+    def test_non_latin_text_is_charged_per_character(self):
+        """Test that Greek and CJK text cost at least a token per character."""
+        counter = make_counter()
+
+        assert counter.count(GREEK) >= len(GREEK.replace(" ", ""))
+        assert counter.count("ἀρετή") >= len("ἀρετή")
+        assert counter.count(CHINESE) >= len(CHINESE)
+        assert counter.count("café") == 2
+
+    def test_truncate_greek_fits_budget(self):
+        """Test that Greek text is cut at a token boundary within budget."""
+        counter = make_counter()
+
+        truncated = counter.truncate(GREEK, 12, "...")
+
+        assert truncated.endswith("...")
+        assert GREEK.startswith(truncated[:-3])
+        assert counter.count(truncated) <= 12
+
+    def test_truncate_fits_budget_with_suffix(self):
+        """Test that truncation cuts at a boundary and keeps the suffix in budget."""
+        counter = make_counter()
+
+        truncated = counter.truncate(PASSAGE, 10, "...")
+
+        assert truncated.endswith("...")
+        assert PASSAGE.startswith(truncated[:-3])
+        assert counter.count(truncated) <= 10
+        assert counter.truncate(PASSAGE, 1000) == PASSAGE
+
+
+class FakeTiktoken:
+    """tiktoken module knowing only the gpt-4o encoding."""
+
+    @staticmethod
+    def encoding_for_model(model):
+        if model != "gpt-4o":
+            raise KeyError(model)
+        return SimpleNamespace(name="o200k_base")
+
+    @staticmethod
+    def get_encoding(name):
+        return SimpleNamespace(name=name)
+
+
+class TestTokenizerSelection:
+    """Test that only a model's own encoding is treated as exact."""
+
+    def test_fallback_encoding_keeps_safety_margin(self, monkeypatch):
+        """Test that OpenRouter models of other vendors are not counted as exact."""
+        monkeypatch.setattr(token_counter, "TIKTOKEN_AVAILABLE", True)
+        monkeypatch.setattr(token_counter, "tiktoken", FakeTiktoken, raising=False)
+
+        own = token_counter._load_tokenizer("openrouter", "openai/gpt-4o")
+        claude = token_counter._load_tokenizer("openrouter", "anthropic/gpt-4o")
+        llama = token_counter._load_tokenizer("openrouter", "meta-llama/llama-3-70b")
+
+        assert (own.name, own.exact) == ("tiktoken:o200k_base", True)
+        assert (claude.name, claude.exact) == ("tiktoken:cl100k_base", False)
+        assert not llama.exact
+        assert TokenCounter(llama).usable(1000) < 1000
+
+
+class TestPackPassages:
+    """Test exact packing of passages into a budget."""
+
+    def test_packs_whole_passages_then_a_partial_one(self):
+        """Test that the budget is filled exactly and never exceeded."""
+        counter = make_counter()
+        passages = [PASSAGE, PASSAGE.upper(), PASSAGE[::-1]]
+        budget = counter.count(PASSAGE) + counter.count("\n\n") + 20
+
+        packed, tokens = pack_passages(counter, passages, budget, min_partial_tokens=10)
+
+        assert packed[0] == PASSAGE
+        assert len(packed) == 2
+        assert packed[1].endswith("...")
+        assert tokens == counter.count("\n\n".join(packed))
+        assert budget - 5 <= tokens <= budget